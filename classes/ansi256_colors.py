@@ -30,7 +30,26 @@
 #_______________________________________________________________________
 class Ansi256Colors:
 
-  rgb_list: list[int] = 16 * [0]
+  # Standard xterm values for the 16 system colors. Terminals usually
+  # override these with the theme palette.
+  rgb_list: list[int] =\
+    [ 0x000000
+    , 0x800000
+    , 0x008000
+    , 0x808000
+    , 0x000080
+    , 0x800080
+    , 0x008080
+    , 0xc0c0c0
+    , 0x808080
+    , 0xff0000
+    , 0x00ff00
+    , 0xffff00
+    , 0x0000ff
+    , 0xff00ff
+    , 0x00ffff
+    , 0xffffff
+    ]
   rgb_list = rgb_list +\
     [ 0x000000
     , 0x00005f
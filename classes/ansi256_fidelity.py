@@ -0,0 +1,215 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Measures how far the ANSI 256 colors that terminal Vim falls back
+#   to are from the GUI colors of a theme, and snaps GUI colors onto
+#   their ANSI 256 colors so both look identical.
+#_______________________________________________________________________
+
+from classes.ansi256_colors import Ansi256Colors
+from classes.ansi256_lookup import Ansi256Lookup
+from classes.color_space import ColorSpace
+from classes.theme_library import ThemeLibrary
+from classes.theme_library import ThemeLibraryConst
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class Ansi256FidelityConst:
+
+  # CIEDE2000 difference above which a mapping is flagged
+  MAX_DELTA_E: float = 5.0
+
+  # Theme attributes with a cterm color in the Vim template, before
+  # the 16 palette colors
+  ATTRS: list[str] =\
+    [ 'bg_norm_color_'
+    , 'fg_norm_color_'
+    , 'bg_bold_color_'
+    , 'fg_bold_color_'
+    ]
+
+  # Vim template labels of ATTRS followed by the palette
+  COLOR_LABELS: list[str] =\
+    [ 'BG__NORM', 'FG__NORM', 'BG__BOLD', 'FG__BOLD' ]\
+    + ThemeLibraryConst.SLOT_LABELS
+
+  REPORT_LINE: str = 76 * '-'
+
+
+#_______________________________________________________________________
+class Ansi256Fidelity:
+  """
+  Colors are compared in the order of Ansi256FidelityConst.COLOR_LABELS.
+  """
+
+  #_____________________________________________________________________
+  def theme_colors(scheme) -> list[int]:
+    """
+    GUI colors of a theme that Vim maps to cterm colors.
+    """
+
+    return [ getattr(scheme, attr) for attr in Ansi256FidelityConst.ATTRS ]\
+      + list(scheme.palette_[:ThemeLibraryConst.PALETTE_SIZE])
+
+  #_____________________________________________________________________
+  def snap(rgb_color: int) -> int:
+    """
+    ANSI 256 color that terminal Vim shows for a GUI color.
+    """
+
+    return Ansi256Colors.rgb_list[Ansi256Lookup.rgb_to_ansi256(rgb_color)]
+
+  #_____________________________________________________________________
+  def errors_array(packed):
+    """
+    cterm indices and CIEDE2000 errors of packed GUI colors. Requires
+    NumPy.
+
+    Parameters
+      packed : Integer array of 24 bit RGB colors
+
+    Returns
+      Tuple of (indices, delta E) arrays shaped like packed
+    """
+
+    indices = Ansi256Lookup.rgb_to_ansi256_array(packed)
+
+    snapped = np.asarray(Ansi256Colors.rgb_list, dtype=np.uint32)[indices]
+
+    delta_e = ColorSpace.delta_e_2000_array(
+      ColorSpace.rgb_to_lab_array(packed)
+      , ColorSpace.rgb_to_lab_array(snapped))
+
+    return indices, delta_e
+
+  #_____________________________________________________________________
+  def errors_list(colors: list[int]) -> tuple:
+    """
+    Scalar errors_array of a list of colors, used without NumPy.
+    """
+
+    indices: list[int] = [ Ansi256Lookup.rgb_to_ansi256(c) for c in colors ]
+
+    delta_e: list[float] =\
+      [ ColorSpace.delta_e_2000(ColorSpace.rgb_to_lab(c)
+        , ColorSpace.rgb_to_lab(Ansi256Colors.rgb_list[i]))
+        for c, i in zip(colors, indices) ]
+
+    return indices, delta_e
+
+  #_____________________________________________________________________
+  def library_errors(library: ThemeLibrary) -> tuple:
+    """
+    cterm indices and errors of every theme, looked up in one batch.
+
+    Returns
+      Tuple of (indices, delta E) nested lists, one row per theme
+    """
+
+    colors: list = [ Ansi256Fidelity.theme_colors(s) for s in library.schemes_ ]
+
+    if (np is None):
+      rows: list = [ Ansi256Fidelity.errors_list(c) for c in colors ]
+
+      return [ r[0] for r in rows ], [ r[1] for r in rows ]
+
+    packed = np.asarray(colors, dtype=np.uint32)\
+      .reshape(len(library), len(Ansi256FidelityConst.COLOR_LABELS))
+
+    indices, delta_e = Ansi256Fidelity.errors_array(packed)
+
+    return indices.tolist(), delta_e.tolist()
+
+  #_____________________________________________________________________
+  def create_report_str(library: ThemeLibrary
+    , max_delta_e: float = Ansi256FidelityConst.MAX_DELTA_E
+    ) -> str:
+    """
+    Lists the flagged mappings of each theme, then the worst and mean
+    error over the library.
+    """
+
+    Const = Ansi256FidelityConst
+
+    indices, delta_e = Ansi256Fidelity.library_errors(library)
+
+    lines: list[str] =\
+      [ f'\nVim cterm fidelity report, maximum delta E {max_delta_e:g}'
+      , Const.REPORT_LINE
+      ]
+
+    flagged_themes: int = 0
+    worst: float = 0.0
+    total: float = 0.0
+    count: int = 0
+
+    for t, scheme in enumerate(library.schemes_):
+      colors: list[int] = Ansi256Fidelity.theme_colors(scheme)
+
+      flagged: list[int] =\
+        [ i for i, d in enumerate(delta_e[t]) if (d > max_delta_e) ]
+
+      flagged_themes += bool(flagged)
+
+      worst = max([worst] + delta_e[t])
+      total += sum(delta_e[t])
+      count += len(delta_e[t])
+
+      lines.append(f'{library.names_[t]}: {len(flagged)} flagged')
+
+      for i in flagged:
+        cterm: int = indices[t][i]
+
+        lines.append(
+          f'  {Const.COLOR_LABELS[i]:8s}  #{colors[i]:06x}'
+          f'  -> {cterm:3d} #{Ansi256Colors.rgb_list[cterm]:06x}'
+          f'  {delta_e[t][i]:5.1f}')
+
+    lines +=\
+      [ Const.REPORT_LINE
+      , f'{flagged_themes:6d} of {len(library)} themes with flagged colors'
+      , f'Worst delta E {worst:5.1f}, mean {total / max(count, 1):5.1f}'
+      ]
+
+    return '\n'.join(lines)
+
+  #_____________________________________________________________________
+  def run(args) -> str:
+    """
+    Report entry point for the command line.
+    """
+
+    max_delta_e: float = args.max_delta_e
+
+    if (max_delta_e is None):
+      max_delta_e = Ansi256FidelityConst.MAX_DELTA_E
+
+    return Ansi256Fidelity.create_report_str(
+      ThemeLibrary.from_args(args), max_delta_e)
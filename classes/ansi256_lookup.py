@@ -0,0 +1,339 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Lookup engine for converting 24 bit RGB colors to ANSI 256 color
+#   indices. Uses closed form index arithmetic by default. A full 16M
+#   entry table can be generated once, cached on disk and memory mapped
+#   so that each conversion is a single indexed read.
+#_______________________________________________________________________
+
+import mmap
+import os
+
+from classes.ansi256_colors import Ansi256Colors
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class Ansi256LookupConst:
+
+  SYSTEM_COLOR_COUNT: int = 16
+  CUBE_START        : int = 16
+  GREY_START        : int = 232
+
+  CUBE_LEVELS: list[int] =\
+  [0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff]
+
+  # Greyscale ramp runs from 0x08 to 0xee in steps of 10
+  GREY_FIRST: int = 0x08
+  GREY_STEP : int = 10
+  GREY_COUNT: int = 24
+
+  TABLE_SIZE     : int = 1 << 24
+  TABLE_FILE_NAME: str = 'ansi256-lut-v1.bin'
+
+  # Returned by the inverse index for colors not in the ANSI 256 table
+  NOT_FOUND: int = -1
+
+
+#_______________________________________________________________________
+class Ansi256Lookup:
+  """
+  Converts 24 bit RGB colors to ANSI 256 color indices. Returns the
+  same indices as the original nearest level search in
+  RgbColor.rgb_to_ansi256: each channel snaps to its nearest cube level
+  with ties going to the lower level, and greys that are not cube
+  levels snap to the greyscale ramp.
+  """
+
+  # Memory mapped 16M entry table, None until load_table is called
+  table_ = None
+
+  #_____________________________________________________________________
+  def cube_coord(value: int) -> int:
+    """
+    Closed form nearest cube coordinate [0-5] of a channel value.
+
+    Cube levels are 0x00, 0x5f and then every 40 up to 0xff, so the
+    midpoints between levels are 47.5 and then 115, 155, 195 and 235.
+    """
+
+    if (value < 48):
+      return 0
+
+    if (value <= 115):
+      return 1
+
+    return (value - 36) // 40
+
+  #_____________________________________________________________________
+  def grey_offset(value: int) -> int:
+    """
+    Closed form nearest greyscale ramp offset [0-23] of a channel value.
+    """
+
+    Const = Ansi256LookupConst
+
+    offset: int = (value - Const.GREY_FIRST + 4) // Const.GREY_STEP
+
+    return min(Const.GREY_COUNT - 1, max(0, offset))
+
+  #_____________________________________________________________________
+  def build_inverse_index(rgb_list: list[int]) -> dict:
+    """
+    Builds the exact map from RGB color to ANSI 256 color index. Cube
+    and greyscale entries take precedence over the 16 system colors,
+    since terminals usually remap the system colors.
+    """
+
+    Const = Ansi256LookupConst
+
+    inverse: dict = {}
+
+    for i in range(Const.CUBE_START, len(rgb_list)):
+      inverse.setdefault(rgb_list[i], i)
+
+    for i in range(Const.SYSTEM_COLOR_COUNT):
+      inverse.setdefault(rgb_list[i], i)
+
+    return inverse
+
+  CUBE_LUT     : list[int]  = list(map(cube_coord, range(256)))
+  GREY_LUT     : list[int]  = list(map(grey_offset, range(256)))
+  IS_CUBE_LEVEL: list[bool] =\
+    list(map(Ansi256LookupConst.CUBE_LEVELS.__contains__, range(256)))
+
+  INVERSE_INDEX: dict = build_inverse_index(Ansi256Colors.rgb_list)
+
+  #_____________________________________________________________________
+  def rgb_to_ansi256(rgb_color: int) -> int:
+    """
+    Converts a 24 bit RGB color to its nearest ANSI 256 color index.
+    Input is not validated; see RgbColor.rgb_to_ansi256.
+
+    Parameters
+      rgb_color : 24 bit RGB color as integer
+
+    Returns
+      ANSI 256 color index as integer
+    """
+
+    table = Ansi256Lookup.table_
+
+    if (table is not None):
+      return int(table[rgb_color])
+
+    red: int = (rgb_color >> 16) & 0xFF
+    grn: int = (rgb_color >>  8) & 0xFF
+    blu: int =  rgb_color        & 0xFF
+
+    is_cube_level: bool = Ansi256Lookup.IS_CUBE_LEVEL[red]
+
+    if (red == grn and red == blu and not is_cube_level):
+      return Ansi256LookupConst.GREY_START + Ansi256Lookup.GREY_LUT[red]
+
+    cube = Ansi256Lookup.CUBE_LUT
+
+    return Ansi256LookupConst.CUBE_START\
+      + 36 * cube[red]\
+      +  6 * cube[grn]\
+      +      cube[blu]
+
+  #_____________________________________________________________________
+  def rgb_to_ansi256_array(packed):
+    """
+    Converts a NumPy array of packed 24 bit RGB colors to ANSI 256
+    color indices. Requires NumPy.
+
+    Parameters
+      packed : Integer array of 24 bit RGB colors
+
+    Returns
+      uint8 array of ANSI 256 color indices
+    """
+
+    Const = Ansi256LookupConst
+
+    table = Ansi256Lookup.table_
+
+    if (table is not None):
+      return np.asarray(table)[packed]
+
+    cube_lut = np.asarray(Ansi256Lookup.CUBE_LUT, dtype=np.uint8)
+    grey_lut = np.asarray(Ansi256Lookup.GREY_LUT, dtype=np.uint8)
+    is_cube  = np.asarray(Ansi256Lookup.IS_CUBE_LEVEL, dtype=bool)
+
+    red = ((packed >> 16) & 0xFF).astype(np.uint8)
+    grn = ((packed >>  8) & 0xFF).astype(np.uint8)
+    blu = ( packed        & 0xFF).astype(np.uint8)
+
+    ansi_index = Const.CUBE_START\
+      + 36 * cube_lut[red].astype(np.uint16)\
+      +  6 * cube_lut[grn].astype(np.uint16)\
+      +      cube_lut[blu].astype(np.uint16)
+
+    is_grey = (red == grn) & (red == blu) & ~is_cube[red]
+    ansi_index[is_grey] = Const.GREY_START + grey_lut[red[is_grey]]
+
+    return ansi_index.astype(np.uint8)
+
+  #_____________________________________________________________________
+  def rgb_to_ansi256_exact(rgb_color: int) -> int:
+    """
+    Exact inverse of Ansi256Colors.rgb_list.
+
+    Parameters
+      rgb_color : 24 bit RGB color as integer
+
+    Returns
+      ANSI 256 color index whose color is exactly rgb_color, or -1 if
+      the color is not in the ANSI 256 table
+    """
+
+    return Ansi256Lookup.INVERSE_INDEX.get(
+      rgb_color, Ansi256LookupConst.NOT_FOUND)
+
+  #_____________________________________________________________________
+  def build_table() -> bytes:
+    """
+    Generates the full table of ANSI 256 indices for every 24 bit RGB
+    color, indexed by the color itself.
+
+    Returns
+      Table of 2^24 bytes
+    """
+
+    Const = Ansi256LookupConst
+    Lookup = Ansi256Lookup
+
+    greys: list[int] =\
+      [ v for v in range(256) if not Lookup.IS_CUBE_LEVEL[v] ]
+
+    if (np is not None):
+      cube = np.asarray(Lookup.CUBE_LUT, dtype=np.uint16)
+
+      table = Const.CUBE_START\
+        + 36 * cube[:, None, None]\
+        +  6 * cube[None, :, None]\
+        +      cube[None, None, :]
+
+      table = table.astype(np.uint8)
+
+      v = np.asarray(greys)
+      table[v, v, v] = Const.GREY_START\
+        + np.asarray(Lookup.GREY_LUT, dtype=np.uint8)[v]
+
+      return table.tobytes()
+
+    # One 256 byte row per red and green cube coordinate pair
+    rows: dict = {}
+    for base in range(Const.CUBE_START, Const.GREY_START, 6):
+      rows[base] = bytes(base + c for c in Lookup.CUBE_LUT)
+
+    table: bytearray = bytearray(Const.TABLE_SIZE)
+
+    for red in range(256):
+      for grn in range(256):
+        start: int = (red << 16) | (grn << 8)
+        base: int = Const.CUBE_START\
+          + 36 * Lookup.CUBE_LUT[red]\
+          +  6 * Lookup.CUBE_LUT[grn]
+
+        table[start:start + 256] = rows[base]
+
+    for v in greys:
+      table[(v << 16) | (v << 8) | v] =\
+        Const.GREY_START + Lookup.GREY_LUT[v]
+
+    return bytes(table)
+
+  #_____________________________________________________________________
+  def write_table(file_path: str) -> None:
+    """
+    Generates the table and writes it to file. The file is replaced
+    atomically so concurrent readers never see a partial table.
+
+    Parameters
+      file_path : path of table file
+    """
+
+    tmp_path: str = f'{file_path}.{os.getpid()}.tmp'
+
+    with open(tmp_path, 'wb') as file:
+      file.write(Ansi256Lookup.build_table())
+
+    os.replace(tmp_path, file_path)
+
+    return
+
+  #_____________________________________________________________________
+  def load_table(file_path: str = None):
+    """
+    Memory maps the full table, generating it first if the cache file
+    is missing or the wrong size. Once loaded, every conversion in this
+    module is a single read from the table.
+
+    Parameters
+      file_path : path of table file, defaults to the cache directory
+
+    Returns
+      Memory mapped table
+    """
+
+    Const = Ansi256LookupConst
+
+    if (file_path is None):
+      file_path = os.path.join(Utils.get_cache_dir(), Const.TABLE_FILE_NAME)
+
+    if (not os.path.isfile(file_path)
+      or os.path.getsize(file_path) != Const.TABLE_SIZE):
+      Ansi256Lookup.write_table(file_path)
+
+    if (np is not None):
+      table = np.memmap(file_path, dtype=np.uint8, mode='r'
+        , shape=(Const.TABLE_SIZE,))
+
+    else:
+      with open(file_path, 'rb') as file:
+        table = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    Ansi256Lookup.table_ = table
+
+    return table
+
+  #_____________________________________________________________________
+  def unload_table() -> None:
+    """
+    Stops using the table. Conversions fall back to index arithmetic.
+    """
+
+    Ansi256Lookup.table_ = None
+
+    return
@@ -0,0 +1,78 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   24 bit RGB color value, validated once where it enters the program
+#   and used as a plain int everywhere else.
+#_______________________________________________________________________
+
+from classes.rgb_color import RgbColor
+from flux_bunny_utils.string_utils import StringUtils
+
+
+#_______________________________________________________________________
+class Color(int):
+  """
+  int subclass, so a Color works anywhere a packed 24 bit color does,
+  including formatting, arithmetic, hashing and NumPy arrays. Adds no
+  per instance storage. Channels come from
+  RgbColor.get_channels_unchecked, as for any packed color.
+  """
+
+  __slots__ = ()
+
+  #_____________________________________________________________________
+  def __new__(cls, value):
+    """
+    Parameters
+      value : 24 bit RGB color as int or hex string
+
+    Raises
+      TypeError or ValueError as RgbColor.validate_rgb
+    """
+
+    if (isinstance(value, Color)):
+      return value
+
+    if (isinstance(value, str)):
+      value = StringUtils.str_hex_to_int(value)
+
+    RgbColor.validate_rgb(value)
+
+    return int.__new__(cls, value)
+
+  #_____________________________________________________________________
+  def from_list(values: list) -> list['Color']:
+    """
+    Validates a list of ints or hex strings.
+    """
+
+    return [ Color(v) for v in values ]
+
+  #_____________________________________________________________________
+  def __repr__(self) -> str:
+    return f'Color(0x{self:06x})'
+
+  # Printing a Color prints the number, as for any int
+  __str__ = int.__repr__
@@ -0,0 +1,449 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Batch versions of the RgbColor operations. Colors are stored packed
+#   in a single uint32 array instead of one dictionary per color.
+#   NumPy is used when installed, otherwise the standard library array
+#   module is used.
+#_______________________________________________________________________
+
+from array import array
+
+from classes.ansi256_lookup import Ansi256Lookup
+from classes.rgb_color import RgbConst
+
+from flux_bunny_utils.error_utils import ErrorUtils
+from flux_bunny_utils.string_utils import StringUtils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class ColorArrayConst:
+
+  # array module type codes
+  PACKED_TYPE : str = 'I'
+  CHANNEL_TYPE: str = 'B'
+
+
+#_______________________________________________________________________
+class ColorArray:
+  """
+  Array of 24 bit RGB colors. Exposes the RgbColor operations over the
+  whole array at once and returns the same values as the scalar
+  functions for each element.
+  """
+
+  #_____________________________________________________________________
+  def __init__(self, colors = ()):
+    """
+    Parameters
+      colors : Iterable of 24 bit RGB colors as ints or hex strings,
+               another ColorArray, or a NumPy integer array
+    """
+
+    if (isinstance(colors, ColorArray)):
+      self.colors_ = colors.colors_
+      return
+
+    if (np is not None):
+      self.colors_ = ColorArray.pack_numpy(colors)
+
+    else:
+      self.colors_ = ColorArray.pack_array(colors)
+
+    return
+
+  #_____________________________________________________________________
+  def pack_numpy(colors):
+    """
+    Validates input and converts it to a NumPy uint32 array.
+    """
+
+    if (isinstance(colors, np.ndarray)):
+      if (not np.issubdtype(colors.dtype, np.integer)):
+        desc: str =\
+          f'{ErrorUtils.WRONG_TYPE} dtype = {str(colors.dtype)}'
+        ErrorUtils.raise_exception_with_desc(err=TypeError(), desc=desc)
+
+      values = colors.astype(np.int64, copy=False).ravel()
+
+    else:
+      values = np.fromiter(
+        (ColorArray.to_int(c) for c in colors), dtype=np.int64)
+
+    if (values.size and (values.min() < 0 or values.max() > 0xFFFFFF)):
+      bad = values[(values < 0) | (values > 0xFFFFFF)][0]
+      desc: str = f'{ErrorUtils.INVALID_VALUE} {int(bad)}'
+      ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+    return values.astype(np.uint32)
+
+  #_____________________________________________________________________
+  def pack_array(colors) -> array:
+    """
+    Validates input and converts it to an array module uint32 array.
+    """
+
+    packed: array = array(ColorArrayConst.PACKED_TYPE)
+
+    for c in colors:
+      value: int = ColorArray.to_int(c)
+
+      if (value < 0 or value > 0xFFFFFF):
+        desc: str = f'{ErrorUtils.INVALID_VALUE} {value}'
+        ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+      packed.append(value)
+
+    return packed
+
+  #_____________________________________________________________________
+  def to_int(color) -> int:
+    """
+    Converts a single color given as an int or hex string to an int.
+    """
+
+    if (isinstance(color, str)):
+      return StringUtils.str_hex_to_int(color)
+
+    if (np is not None and isinstance(color, np.integer)):
+      return int(color)
+
+    if (not isinstance(color, int)):
+      desc: str =\
+        f'{ErrorUtils.WRONG_TYPE} type(color) = {str(type(color))}'
+      ErrorUtils.raise_exception_with_desc(err=TypeError(), desc=desc)
+
+    return color
+
+  #_____________________________________________________________________
+  def from_packed(packed) -> 'ColorArray':
+    """
+    Wraps an already validated packed array without copying it.
+    """
+
+    out: ColorArray = ColorArray.__new__(ColorArray)
+    out.colors_ = packed
+
+    return out
+
+  #_____________________________________________________________________
+  def __len__(self) -> int:
+    return len(self.colors_)
+
+  #_____________________________________________________________________
+  def __getitem__(self, i) -> int:
+    return int(self.colors_[i])
+
+  #_____________________________________________________________________
+  def __iter__(self):
+    return (int(c) for c in self.colors_)
+
+  #_____________________________________________________________________
+  def tolist(self) -> list[int]:
+    """
+    Returns the colors as a list of ints.
+    """
+
+    return [int(c) for c in self.colors_]
+
+  #_____________________________________________________________________
+  def get_rgb_from_hex(self) -> dict:
+    """
+    Batch version of RgbColor.get_rgb_from_hex.
+
+    Returns
+      Dictionary with 'RED', 'GRN', and 'BLU' keys. Each value is a
+      uint8 array holding that channel for every color.
+    """
+
+    if (np is not None):
+      c = self.colors_
+
+      return\
+      { RgbConst.RED_STR:
+          ((c >> RgbConst.RED_RIGHT_SHIFT) & 0xFF).astype(np.uint8)
+      , RgbConst.GRN_STR:
+          ((c >> RgbConst.GRN_RIGHT_SHIFT) & 0xFF).astype(np.uint8)
+      , RgbConst.BLU_STR:
+          ((c >> RgbConst.BLU_RIGHT_SHIFT) & 0xFF).astype(np.uint8)
+      }
+
+    red: array = array(ColorArrayConst.CHANNEL_TYPE)
+    grn: array = array(ColorArrayConst.CHANNEL_TYPE)
+    blu: array = array(ColorArrayConst.CHANNEL_TYPE)
+
+    for c in self.colors_:
+      red.append((c >> RgbConst.RED_RIGHT_SHIFT) & 0xFF)
+      grn.append((c >> RgbConst.GRN_RIGHT_SHIFT) & 0xFF)
+      blu.append((c >> RgbConst.BLU_RIGHT_SHIFT) & 0xFF)
+
+    return\
+    { RgbConst.RED_STR: red
+    , RgbConst.GRN_STR: grn
+    , RgbConst.BLU_STR: blu
+    }
+
+  #_____________________________________________________________________
+  def channels(self):
+    """
+    Returns the colors as an (N, 3) uint8 NumPy array. Requires NumPy.
+    """
+
+    c = self.colors_
+
+    rgb = np.empty((len(c), 3), dtype=np.uint8)
+    rgb[:, 0] = (c >> RgbConst.RED_RIGHT_SHIFT) & 0xFF
+    rgb[:, 1] = (c >> RgbConst.GRN_RIGHT_SHIFT) & 0xFF
+    rgb[:, 2] = (c >> RgbConst.BLU_RIGHT_SHIFT) & 0xFF
+
+    return rgb
+
+  #_____________________________________________________________________
+  def from_channels(rgb) -> 'ColorArray':
+    """
+    Packs an (N, 3) array of channel values into a ColorArray. Float
+    values are rounded the same way RgbColor.get_int_from_rgb_dict
+    rounds them. Requires NumPy.
+    """
+
+    rgb = np.asarray(rgb)
+
+    if (not np.issubdtype(rgb.dtype, np.integer)):
+      rgb = np.round(rgb)
+
+    rgb = rgb.astype(np.uint32)
+
+    packed =\
+      (rgb[:, 0] << RgbConst.RED_RIGHT_SHIFT) |\
+      (rgb[:, 1] << RgbConst.GRN_RIGHT_SHIFT) |\
+      (rgb[:, 2] << RgbConst.BLU_RIGHT_SHIFT)
+
+    return ColorArray.from_packed(packed.astype(np.uint32))
+
+  #_____________________________________________________________________
+  def scale_color\
+    ( self
+    , lo_cutoff: int = RgbConst.MIN_COLOR_VALUE
+    , hi_cutoff: int = RgbConst.MAX_COLOR_VALUE
+    ) -> 'ColorArray':
+    """
+    Batch version of RgbColor.scale_color.
+
+    Colors already within [lo_cutoff, hi_cutoff] are returned
+    unchanged. Black with a nonzero lo_cutoff, which makes the scalar
+    function divide by zero, maps to a grey at lo_cutoff.
+
+    Parameters
+      lo_cutoff : Minimum allowed channel value used to clamp brightness
+      hi_cutoff : Maximum allowed channel value used to clamp brightness
+
+    Returns
+      ColorArray holding the scaled colors
+    """
+
+    if (np is None):
+      return ColorArray.from_packed(array(ColorArrayConst.PACKED_TYPE
+        , (ColorArray.scale_one(c, lo_cutoff, hi_cutoff)
+            for c in self.colors_)))
+
+    rgb = self.channels().astype(np.float64)
+
+    min_val = rgb.min(axis=1)
+    max_val = rgb.max(axis=1)
+
+    in_range = (min_val >= lo_cutoff) & (max_val <= hi_cutoff)
+
+    # Same order of float operations as the scalar version
+    clamped = np.maximum(0, rgb - lo_cutoff)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+      norm = clamped / max_val[:, None]
+
+    norm[max_val == 0] = 0
+
+    scaled = norm * (hi_cutoff - lo_cutoff) + lo_cutoff
+
+    out = ColorArray.from_channels(scaled).colors_
+    out[in_range] = self.colors_[in_range]
+
+    return ColorArray.from_packed(out)
+
+  #_____________________________________________________________________
+  def scale_one(color: int, lo_cutoff: int, hi_cutoff: int) -> int:
+    """
+    Scalar fallback of scale_color that does not allocate a dictionary.
+    """
+
+    red: int = (color >> RgbConst.RED_RIGHT_SHIFT) & 0xFF
+    grn: int = (color >> RgbConst.GRN_RIGHT_SHIFT) & 0xFF
+    blu: int = (color >> RgbConst.BLU_RIGHT_SHIFT) & 0xFF
+
+    min_val: int = min(red, grn, blu)
+    max_val: int = max(red, grn, blu)
+
+    if (min_val >= lo_cutoff and max_val <= hi_cutoff):
+      return color
+
+    if (max_val == 0):
+      red = grn = blu = lo_cutoff
+
+    else:
+      cutoff_range: int = hi_cutoff - lo_cutoff
+
+      red = int(round(
+        max(0, red - lo_cutoff) / max_val * cutoff_range + lo_cutoff))
+      grn = int(round(
+        max(0, grn - lo_cutoff) / max_val * cutoff_range + lo_cutoff))
+      blu = int(round(
+        max(0, blu - lo_cutoff) / max_val * cutoff_range + lo_cutoff))
+
+    return\
+      (red << RgbConst.RED_RIGHT_SHIFT) |\
+      (grn << RgbConst.GRN_RIGHT_SHIFT) |\
+      (blu << RgbConst.BLU_RIGHT_SHIFT)
+
+  #_____________________________________________________________________
+  def make_background_color_dark\
+    ( self
+    , cutoff: int = RgbConst.MAX_CUTOFF_DARK
+    ) -> 'ColorArray':
+    """
+    Batch version of RgbColor.make_background_color_dark. Colors that
+    are already dark enough come back as ints, where the scalar
+    function returns them as dictionaries.
+
+    Parameters
+      cutoff: Maximum allowed channel value used to clamp brightness
+
+    Returns
+      ColorArray holding the darkened colors
+    """
+
+    if (np is None):
+      return ColorArray.from_packed(array(ColorArrayConst.PACKED_TYPE
+        , (ColorArray.darken_one(c, cutoff) for c in self.colors_)))
+
+    rgb = self.channels().astype(np.float64)
+    max_val = rgb.max(axis=1)
+
+    too_bright = max_val > cutoff
+
+    multiplier = np.ones_like(max_val)
+    multiplier[too_bright] = cutoff / max_val[too_bright]
+
+    # int() truncates, as in the scalar version
+    darkened = np.trunc(rgb * multiplier[:, None])
+
+    out = ColorArray.from_channels(darkened.astype(np.uint32)).colors_
+    out[~too_bright] = self.colors_[~too_bright]
+
+    return ColorArray.from_packed(out)
+
+  #_____________________________________________________________________
+  def darken_one(color: int, cutoff: int) -> int:
+    """
+    Scalar fallback of make_background_color_dark that does not
+    allocate a dictionary.
+    """
+
+    red: int = (color >> RgbConst.RED_RIGHT_SHIFT) & 0xFF
+    grn: int = (color >> RgbConst.GRN_RIGHT_SHIFT) & 0xFF
+    blu: int = (color >> RgbConst.BLU_RIGHT_SHIFT) & 0xFF
+
+    max_val: int = max(red, grn, blu)
+
+    if (max_val <= cutoff):
+      return color
+
+    multiplier: float = cutoff / max_val
+
+    return\
+      (int(red * multiplier) << RgbConst.RED_RIGHT_SHIFT) |\
+      (int(grn * multiplier) << RgbConst.GRN_RIGHT_SHIFT) |\
+      (int(blu * multiplier) << RgbConst.BLU_RIGHT_SHIFT)
+
+  #_____________________________________________________________________
+  def make_color_dark(self) -> 'ColorArray':
+    """
+    Batch version of RgbColor.make_color_dark.
+    """
+
+    return self.scale_color\
+      ( lo_cutoff=RgbConst.MIN_CUTOFF_DARK
+      , hi_cutoff=RgbConst.MAX_CUTOFF_DARK)
+
+  #_____________________________________________________________________
+  def make_color_lite(self) -> 'ColorArray':
+    """
+    Batch version of RgbColor.make_color_lite.
+    """
+
+    return self.scale_color\
+      ( lo_cutoff=RgbConst.MIN_CUTOFF_LITE
+      , hi_cutoff=RgbConst.MAX_CUTOFF_LITE)
+
+  #_____________________________________________________________________
+  def make_background_color(self, is_dark: bool = True) -> 'ColorArray':
+    """
+    Batch version of RgbColor.make_background_color.
+    """
+
+    if (is_dark):
+      return self.make_color_dark()
+
+    else:
+      return self.make_color_lite()
+
+  #_____________________________________________________________________
+  def make_foreground_color(self, is_dark: bool = True) -> 'ColorArray':
+    """
+    Batch version of RgbColor.make_foreground_color.
+    """
+
+    if (is_dark):
+      return self.make_color_lite()
+
+    else:
+      return self.make_color_dark()
+
+  #_____________________________________________________________________
+  def rgb_to_ansi256(self):
+    """
+    Batch version of RgbColor.rgb_to_ansi256.
+
+    Returns
+      uint8 array of ANSI 256 color indices
+    """
+
+    if (np is None):
+      return array(ColorArrayConst.CHANNEL_TYPE
+        , (Ansi256Lookup.rgb_to_ansi256(c) for c in self.colors_))
+
+    return Ansi256Lookup.rgb_to_ansi256_array(self.colors_)
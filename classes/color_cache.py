@@ -0,0 +1,252 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Opt-in memoization of the pure RgbColor functions. Libraries reuse
+#   the same few thousand colors heavily, so each function gets a
+#   bounded LRU cache with hit, miss and eviction counters.
+#_______________________________________________________________________
+
+import threading
+
+from collections import OrderedDict
+
+from classes.rgb_color import RgbColor
+from flux_bunny_utils.error_utils import ErrorUtils
+
+
+#_______________________________________________________________________
+class ColorCacheConst:
+
+  MAX_SIZE: int = 4096
+
+  # RgbColor functions replaced by cached versions while enabled
+  FUNCTION_NAMES: list[str] =\
+    [ 'get_rgb_from_hex'
+    , 'rgb_to_ansi256'
+    , 'scale_color'
+    , 'make_background_color_dark'
+    , 'make_color_dark'
+    , 'make_color_lite'
+    , 'make_background_color'
+    , 'make_foreground_color'
+    ]
+
+  HITS     : str = 'hits'
+  MISSES   : str = 'misses'
+  EVICTIONS: str = 'evictions'
+  SIZE     : str = 'size'
+
+  REPORT_LINE: str = 76 * '-'
+
+
+#_______________________________________________________________________
+class ColorCache:
+  """
+  Calls with a dict argument are not cached, since scale_color and
+  make_background_color_dark modify and return dict inputs. Cached dict
+  results are copied on the way in and out, so callers may modify them
+  as before. Calls with unhashable arguments go straight to the
+  original function.
+
+  Only the outermost call is cached and counted. Cached functions that
+  call each other, e.g. make_background_color calling make_color_dark,
+  run their inner calls uncached.
+  """
+
+  # Depth of cached calls in progress, per thread
+  local_ = threading.local()
+
+  # Original RgbColor functions while enabled, keyed by name
+  originals_: dict = {}
+
+  # LRU cache and counters of each function, keyed by name
+  caches_: dict = {}
+  stats_ : dict = {}
+
+  max_size_: int = ColorCacheConst.MAX_SIZE
+
+  #_____________________________________________________________________
+  def is_enabled() -> bool:
+    return bool(ColorCache.originals_)
+
+  #_____________________________________________________________________
+  def memoize(name: str, func):
+    """
+    Wraps a function with the LRU cache and counters of name.
+    """
+
+    Const = ColorCacheConst
+
+    cache: OrderedDict = ColorCache.caches_[name]
+    stats: dict = ColorCache.stats_[name]
+
+    def cached(*args, **kwargs):
+      if (any(isinstance(a, dict) for a in args)
+        or any(isinstance(v, dict) for v in kwargs.values())):
+        return func(*args, **kwargs)
+
+      local = ColorCache.local_
+
+      if (getattr(local, 'depth', 0)):
+        return func(*args, **kwargs)
+
+      # Types are part of the key so that, e.g., 1.0 still fails
+      # validation instead of hitting the entry of 1
+      key: tuple =\
+        ( args
+        , tuple(map(type, args))
+        , tuple(sorted(kwargs.items()))
+        )
+
+      try:
+        hit: bool = key in cache
+      except TypeError:
+        return func(*args, **kwargs)
+
+      if (hit):
+        cache.move_to_end(key)
+        stats[Const.HITS] += 1
+        result = cache[key]
+
+      else:
+        stats[Const.MISSES] += 1
+
+        local.depth = 1
+        try:
+          result = func(*args, **kwargs)
+        finally:
+          local.depth = 0
+
+        cache[key] = dict(result) if (isinstance(result, dict)) else result
+
+        if (len(cache) > ColorCache.max_size_):
+          cache.popitem(last=False)
+          stats[Const.EVICTIONS] += 1
+
+      return dict(result) if (isinstance(result, dict)) else result
+
+    cached.__doc__ = func.__doc__
+    cached.__name__ = func.__name__
+
+    return cached
+
+  #_____________________________________________________________________
+  def enable(max_size: int = ColorCacheConst.MAX_SIZE) -> None:
+    """
+    Replaces the RgbColor functions with cached versions. Counters and
+    cached values start empty.
+
+    Parameters
+      max_size : Maximum entries cached per function
+    """
+
+    if (max_size < 1):
+      desc: str = f'{ErrorUtils.INVALID_VALUE} cache size = {max_size}'
+      ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+    ColorCache.disable()
+
+    ColorCache.max_size_ = max_size
+
+    for name in ColorCacheConst.FUNCTION_NAMES:
+      func = getattr(RgbColor, name)
+
+      ColorCache.originals_[name] = func
+      ColorCache.caches_[name] = OrderedDict()
+      ColorCache.stats_[name] =\
+        { ColorCacheConst.HITS: 0
+        , ColorCacheConst.MISSES: 0
+        , ColorCacheConst.EVICTIONS: 0
+        }
+
+      setattr(RgbColor, name, ColorCache.memoize(name, func))
+
+    return
+
+  #_____________________________________________________________________
+  def disable() -> None:
+    """
+    Restores the original RgbColor functions. Counters stay readable
+    until the cache is enabled again.
+    """
+
+    for name, func in ColorCache.originals_.items():
+      setattr(RgbColor, name, func)
+
+    ColorCache.originals_ = {}
+
+    return
+
+  #_____________________________________________________________________
+  def clear() -> None:
+    """
+    Empties every cache and resets the counters.
+    """
+
+    for name in ColorCache.caches_:
+      ColorCache.caches_[name].clear()
+
+      for counter in ColorCache.stats_[name]:
+        ColorCache.stats_[name][counter] = 0
+
+    return
+
+  #_____________________________________________________________________
+  def stats() -> dict:
+    """
+    Returns
+      Dictionary of {function name: {hits, misses, evictions, size}}
+    """
+
+    return\
+      { name: dict(counters, **{ ColorCacheConst.SIZE:
+          len(ColorCache.caches_[name]) })
+        for name, counters in ColorCache.stats_.items() }
+
+  #_____________________________________________________________________
+  def create_report_str() -> str:
+    """
+    Table of the counters of every cached function.
+    """
+
+    Const = ColorCacheConst
+
+    lines: list[str] =\
+      [ f'\nColor cache statistics, maximum {ColorCache.max_size_} entries'
+        ' per function'
+      , Const.REPORT_LINE
+      , f'{"function":28s}{"hits":>10s}{"misses":>10s}'
+        f'{"evictions":>11s}{"size":>8s}{"hit rate":>9s}'
+      ]
+
+    for name, counters in ColorCache.stats().items():
+      calls: int = counters[Const.HITS] + counters[Const.MISSES]
+
+      lines.append(f'{name:28s}{counters[Const.HITS]:10d}'
+        f'{counters[Const.MISSES]:10d}{counters[Const.EVICTIONS]:11d}'
+        f'{counters[Const.SIZE]:8d}'
+        f'{counters[Const.HITS] / max(calls, 1):9.1%}')
+
+    return '\n'.join(lines)
@@ -0,0 +1,384 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Color expressions in input json, e.g.
+#     "foreground-color-intense": "lighten(foreground-color, 10%)"
+#     "cursor-color": "mix(palette[1], background-color, 0.3)"
+#   Amounts and weights are 0-1 fractions or percents.
+#   Each distinct expression is parsed once into a Python closure and
+#   cached, so a batch of themes sharing expressions only evaluates
+#   them.
+#_______________________________________________________________________
+
+import re
+
+from classes.color_space import ColorSpace
+from classes.perceptual_color import PerceptualColor
+from flux_bunny_utils.error_utils import ErrorUtils
+
+
+#_______________________________________________________________________
+class ColorExpressionConst:
+
+  # Same as ColorScheme.PALETTE, palette entries are referenced as
+  # palette[0] to palette[15]
+  PALETTE_KEY   : str = 'palette'
+  PALETTE_FORMAT: str = 'palette[{}]'
+
+  # Plain color values, which are not parsed as expressions
+  LITERAL_RE = re.compile(r'\s*(0[xX])?[0-9a-fA-F]+\s*$')
+
+  TOKEN_RE = re.compile(r'\s*(?:'
+    r'(?P<hex>0[xX][0-9a-fA-F]+|#[0-9a-fA-F]{6})'
+    r'|(?P<number>\d+(?:\.\d*)?|\.\d+)(?P<percent>%?)'
+    r'|(?P<name>[A-Za-z][A-Za-z0-9_-]*)'
+    r'|(?P<punct>[()\[\],])'
+    r')')
+
+  COLOR : str = 'color'
+  NUMBER: str = 'number'
+
+  # Argument kinds and default values of trailing arguments
+  FUNCTIONS: dict =\
+    { 'mix'    : ([COLOR, COLOR, NUMBER], [0.5])
+    , 'lighten': ([COLOR, NUMBER], [])
+    , 'darken' : ([COLOR, NUMBER], [])
+    }
+
+
+#_______________________________________________________________________
+class ColorExpression:
+  """
+  A compiled expression is a tuple of (function, references). The
+  function takes a dict of resolved colors, keyed by json key or
+  palette[i], that contains every reference.
+  """
+
+  # Compiled expressions, keyed by expression text
+  cache_: dict = {}
+
+  #_____________________________________________________________________
+  def raise_invalid(text: str, reason: str) -> None:
+    desc: str = f'{ErrorUtils.INVALID_VALUE} {reason} in expression {text!r}'
+    ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+  #_____________________________________________________________________
+  def is_expression(value) -> bool:
+    """
+    True if an input json value is an expression rather than a plain
+    hex color.
+    """
+
+    return isinstance(value, str)\
+      and not ColorExpressionConst.LITERAL_RE.match(value)
+
+  #_____________________________________________________________________
+  def tokenize(text: str) -> list[tuple]:
+    """
+    Returns
+      List of (kind, value) tuples, kind is hex, number, percent, name
+      or punct
+    """
+
+    tokens: list[tuple] = []
+    pos: int = 0
+
+    text = text.rstrip()
+
+    while (pos < len(text)):
+      match = ColorExpressionConst.TOKEN_RE.match(text, pos)
+
+      if (match is None or match.end() == pos):
+        ColorExpression.raise_invalid(text, f'character {text[pos]!r}')
+
+      kind: str = match.lastgroup
+
+      if (match.group('number') is not None):
+        number: float = float(match.group('number'))
+
+        if (match.group('percent')):
+          tokens.append(('percent', number / 100))
+
+        else:
+          tokens.append(('number', number))
+
+      elif (kind == 'hex'):
+        tokens.append(('hex', int(match.group(kind).lstrip('#'), 16)))
+
+      else:
+        tokens.append((kind, match.group(kind)))
+
+      pos = match.end()
+
+    return tokens
+
+  #_____________________________________________________________________
+  def mix(color0: int, color1: int, t: float) -> int:
+    """
+    Blends two colors in OKLab, t is the weight of color1.
+    """
+
+    lab0: tuple = ColorSpace.rgb_to_oklab(color0)
+    lab1: tuple = ColorSpace.rgb_to_oklab(color1)
+
+    return ColorSpace.oklab_to_rgb(
+      tuple(a + t * (b - a) for a, b in zip(lab0, lab1)))
+
+  #_____________________________________________________________________
+  def lighten(color: int, amount: float) -> int:
+    """
+    Moves OKLCH lightness up by amount, keeping hue and reducing chroma
+    only as needed to stay in gamut.
+    """
+
+    lch: tuple = ColorSpace.rgb_to_oklch(color)
+
+    lightness: float = min(1.0, max(0.0, lch[0] + amount))
+
+    chroma: float = PerceptualColor.gamut_chroma(lightness, lch[1], lch[2])
+
+    return ColorSpace.oklch_to_rgb((lightness, chroma, lch[2]))
+
+  #_____________________________________________________________________
+  def darken(color: int, amount: float) -> int:
+    return ColorExpression.lighten(color, -amount)
+
+  #_____________________________________________________________________
+  def parse(text: str, tokens: list[tuple], pos: int, refs: set) -> tuple:
+    """
+    Parses one argument starting at tokens[pos].
+
+    Returns
+      Tuple of (kind, function, next position), kind is
+      ColorExpressionConst.COLOR or NUMBER
+    """
+
+    Const = ColorExpressionConst
+    Expr = ColorExpression
+
+    if (pos >= len(tokens)):
+      Expr.raise_invalid(text, 'unexpected end')
+
+    kind, value = tokens[pos]
+    pos += 1
+
+    if (kind == 'hex'):
+      return Const.COLOR, (lambda env: value), pos
+
+    if (kind in ('number', 'percent')):
+      return Const.NUMBER, (lambda env: value), pos
+
+    if (kind != 'name'):
+      Expr.raise_invalid(text, f'token {value!r}')
+
+    next_token: tuple = tokens[pos] if (pos < len(tokens)) else (None, None)
+
+    #___________________________________________________________________
+    # Function call
+    #___________________________________________________________________
+    if (next_token == ('punct', '(')):
+      if (value not in Const.FUNCTIONS):
+        Expr.raise_invalid(text, f'function {value!r}')
+
+      kinds, defaults = Const.FUNCTIONS[value]
+      args: list = []
+      pos += 1
+
+      while (tokens[pos:pos + 1] != [('punct', ')')]):
+        if (pos >= len(tokens)):
+          Expr.raise_invalid(text, "missing ')'")
+
+        if (args):
+          if (tokens[pos:pos + 1] != [('punct', ',')]):
+            Expr.raise_invalid(text, 'missing comma')
+
+          pos += 1
+
+        # Amounts and weights are fractions, 10 is most likely 10%
+        if (pos < len(tokens) and tokens[pos][0] == 'number'
+          and abs(tokens[pos][1]) > 1):
+          Expr.raise_invalid(text
+            , f'number {tokens[pos][1]:g}, use a 0-1 fraction or percent')
+
+        arg_kind, arg, pos = Expr.parse(text, tokens, pos, refs)
+
+        if (len(args) >= len(kinds) or arg_kind != kinds[len(args)]):
+          Expr.raise_invalid(text, f'argument {len(args) + 1} of {value}')
+
+        args.append(arg)
+
+      missing: int = len(kinds) - len(args)
+
+      if (missing > len(defaults)):
+        Expr.raise_invalid(text, f'too few arguments to {value}')
+
+      for default in defaults[len(defaults) - missing:]:
+        args.append(lambda env, default=default: default)
+
+      func = getattr(Expr, value)
+
+      return Const.COLOR, (lambda env: func(*[a(env) for a in args])), pos + 1
+
+    #___________________________________________________________________
+    # Reference to another key or palette entry
+    #___________________________________________________________________
+    ref: str = value
+
+    if (next_token == ('punct', '[')):
+      index: tuple = tokens[pos + 1] if (pos + 1 < len(tokens)) else None
+
+      if (value != Const.PALETTE_KEY or index is None
+        or index[0] != 'number' or not index[1].is_integer()
+        or tokens[pos + 2:pos + 3] != [('punct', ']')]):
+        Expr.raise_invalid(text, f'index of {value!r}')
+
+      ref = Const.PALETTE_FORMAT.format(int(index[1]))
+      pos += 3
+
+    refs.add(ref)
+
+    return Const.COLOR, (lambda env: env[ref]), pos
+
+  #_____________________________________________________________________
+  def compile(text: str) -> tuple:
+    """
+    Compiles an expression, or returns it from the cache.
+
+    Returns
+      Tuple of (function, frozenset of references)
+    """
+
+    compiled: tuple = ColorExpression.cache_.get(text)
+
+    if (compiled is None):
+      tokens: list[tuple] = ColorExpression.tokenize(text)
+      refs: set = set()
+
+      kind, func, pos =\
+        ColorExpression.parse(text, tokens, 0, refs)
+
+      if (kind != ColorExpressionConst.COLOR):
+        ColorExpression.raise_invalid(text, 'number instead of color')
+
+      if (pos != len(tokens)):
+        ColorExpression.raise_invalid(text, 'trailing tokens')
+
+      compiled = (func, frozenset(refs))
+      ColorExpression.cache_[text] = compiled
+
+    return compiled
+
+  #_____________________________________________________________________
+  def has_expressions(input_dict: dict, keys: list[str]) -> bool:
+    """
+    True if any color value of an input dict is an expression.
+    """
+
+    Expr = ColorExpression
+
+    palette = input_dict.get(ColorExpressionConst.PALETTE_KEY)
+
+    return any(Expr.is_expression(input_dict.get(k)) for k in keys)\
+      or (isinstance(palette, list) and any(map(Expr.is_expression, palette)))
+
+  #_____________________________________________________________________
+  def resolve(input_dict: dict, defaults: dict) -> dict:
+    """
+    Evaluates every expression of an input dict in dependency order.
+
+    Parameters
+      input_dict : Dictionary created from json, not modified
+      defaults   : Colors used for references to keys missing from
+                   input_dict, keyed by json key or palette[i]
+
+    Returns
+      Copy of input_dict with expressions replaced by hex strings
+    """
+
+    Const = ColorExpressionConst
+    Expr = ColorExpression
+
+    values: dict =\
+      { k: input_dict[k] for k in defaults if (k in input_dict) }
+
+    palette = input_dict.get(Const.PALETTE_KEY)
+
+    if (isinstance(palette, list)):
+      for i, value in enumerate(palette):
+        values[Const.PALETTE_FORMAT.format(i)] = value
+
+    resolved: dict = {}
+
+    #___________________________________________________________________
+    # Depth first, so references resolve before the keys using them
+    #___________________________________________________________________
+    def visit(key: str, path: tuple) -> int:
+      if (key in resolved):
+        return resolved[key]
+
+      if (key in path):
+        desc: str = f'{ErrorUtils.INVALID_VALUE} circular reference '\
+          + ' -> '.join(path[path.index(key):] + (key,))
+        ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+      value = values.get(key)
+
+      if (value is None):
+        if (key not in defaults):
+          desc: str = f'{ErrorUtils.INVALID_VALUE} unknown reference {key}'
+          ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+        value = defaults[key]
+
+      elif (Expr.is_expression(value)):
+        func, refs = Expr.compile(value)
+
+        for ref in refs:
+          visit(ref, path + (key,))
+
+        value = func(resolved)
+
+      elif (isinstance(value, str)):
+        value = int(value, 16)
+
+      resolved[key] = value
+
+      return value
+
+    for key in values:
+      visit(key, ())
+
+    out: dict = dict(input_dict)
+
+    for key in values:
+      if (key in input_dict):
+        out[key] = f'0x{resolved[key]:06x}'
+
+    if (isinstance(palette, list)):
+      out[Const.PALETTE_KEY] =\
+        [ f'0x{resolved[Const.PALETTE_FORMAT.format(i)]:06x}'
+          for i in range(len(palette)) ]
+
+    return out
@@ -30,6 +30,10 @@ import argparse
 from os import getcwd
 
 from classes.color_scheme_strings import ColorSchemeStrings
+from classes.cutoff_sweep import CutoffSweep
+from classes.cutoff_sweep import CutoffSweepConst
+from classes.palette_optimizer import PaletteOptimizerConst
+from classes.theme_interpolator import ThemeInterpolatorConst
 
 
 #_______________________________________________________________________
@@ -54,6 +58,7 @@ class ParserStrings:
   VSCODE_INPUT      : str = 'vscode-scheme'
   MINTTY_INPUT      : str = 'mintty'
   VIM_INPUT         : str = 'vim'
+  XRESOURCES_INPUT  : str = 'xresources'
   ALL_INPUT         : str = 'all'
 
   SCHEME_TYPES: list =\
@@ -63,6 +68,7 @@ class ParserStrings:
     , VSCODE_INPUT
     , MINTTY_INPUT
     , VIM_INPUT
+    , XRESOURCES_INPUT
     , ALL_INPUT
     ]
 
@@ -103,6 +109,128 @@ class ParserStrings:
 
   DEFAULT_NAME: str = ColorSchemeStrings.DEFAULT_NAME
 
+  CONTRAST_REPORT: str = 'contrast'
+  AUDIT_REPORT   : str = 'audit'
+  CVD_REPORT     : str = 'cvd'
+  FIDELITY_REPORT: str = 'fidelity'
+
+  REPORT_TYPES: list =\
+    [ CONTRAST_REPORT
+    , AUDIT_REPORT
+    , CVD_REPORT
+    , FIDELITY_REPORT
+    ]
+
+  REPORT_GROUP_TITLE: str =\
+    'Reports'
+
+  REPORT_GROUP_DESC: str = str(
+    'Analyze themes instead of exporting them. Reports cover the '
+    '--file theme, or every theme input below --theme_dir.'
+  )
+
+  REPORT_HELP_DESC: str =\
+    'Type of report to print.'
+
+  THEME_DIR_HELP_DESC: str =\
+    'Directory searched recursively for json theme inputs.'
+
+  OPTIMIZER_GROUP_TITLE: str =\
+    'Palette Optimizer'
+
+  OPTIMIZER_GROUP_DESC: str = str(
+    'Search for a theme close to the --file theme, or the default '
+    'theme, that meets --min_contrast, hue spacing and bold lightness '
+    'constraints. Writes an input json file to --out_dir.'
+  )
+
+  OPTIMIZE_HELP_DESC: str =\
+    'Select to optimize the theme instead of exporting it.'
+
+  RESTARTS_HELP_DESC: str =\
+    'Number of independent optimizer restarts.'
+
+  ITERATIONS_HELP_DESC: str =\
+    'Optimizer steps per restart.'
+
+  JOBS_HELP_DESC: str =\
+    'Worker processes for restarts. Defaults to one per CPU.'
+
+  MIN_DELTA_E_HELP_DESC: str =\
+    'CIEDE2000 difference below which the cvd report treats two colors '\
+    'as confusable.'
+
+  MAX_DELTA_E_HELP_DESC: str =\
+    'CIEDE2000 difference above which the fidelity report flags a Vim '\
+    'GUI color whose cterm color is too far off.'
+
+  CACHE_STATS_HELP_DESC: str =\
+    'Select to cache RGB color conversions and print color and template '\
+    'cache statistics on exit.'
+
+  CTERM_SNAP_HELP_DESC: str =\
+    'Select to replace Vim GUI colors with their cterm colors so GUI '\
+    'and terminal Vim look identical.'
+
+  REPAIR_GROUP_TITLE: str =\
+    'Contrast Repair'
+
+  REPAIR_GROUP_DESC: str = str(
+    'Move only the palette colors that fail --min_contrast against the '
+    'background, by the smallest OKLCH lightness change that passes. '
+    'Repairs the --file theme, or every theme input below --theme_dir, '
+    'and writes corrected input json files to --out_dir.'
+  )
+
+  REPAIR_HELP_DESC: str =\
+    'Select to repair the theme instead of exporting it.'
+
+  INTERPOLATE_GROUP_TITLE: str =\
+    'Theme Interpolation'
+
+  INTERPOLATE_GROUP_DESC: str = str(
+    'Blend the --file theme, or the default theme, into another theme '
+    'in OKLab. Writes each intermediate theme, exported with every '
+    'scheme type, to its own directory below --out_dir.'
+  )
+
+  INTERPOLATE_HELP_DESC: str =\
+    'Path to json file of the theme to blend into.'
+
+  STEPS_HELP_DESC: str =\
+    'Number of intermediate themes.'
+
+  SWEEP_GROUP_TITLE: str =\
+    'Cutoff Sweep'
+
+  SWEEP_GROUP_DESC: str = str(
+    'Rank combinations of the brightness cutoffs that derive VS Code '
+    'accent colors by the contrast of the derived colors, over the '
+    '--file theme or every theme input below --theme_dir. Ranges are '
+    'start:stop:step with stop included, e.g. 0x37:0x87:0x08.'
+  )
+
+  SWEEP_HELP_DESC: str =\
+    'Select to sweep the cutoffs instead of exporting the theme.'
+
+  MAX_CUTOFF_DARK_HELP_DESC: str =\
+    'Range of the maximum channel value of dark derived colors.'
+
+  MIN_CUTOFF_LITE_HELP_DESC: str =\
+    'Range of the minimum channel value of light derived colors.'
+
+  MAX_CUTOFF_LITE_HELP_DESC: str =\
+    'Range of the maximum channel value of light derived colors.'
+
+  FROM_IMAGE_HELP_DESC: str = str(
+    'Path to a PNG or binary PPM image. Writes an input json file with '
+    'colors taken from the image to --out_dir instead of exporting.'
+  )
+
+  MIN_CONTRAST_HELP_DESC: str =\
+    'Minimum WCAG contrast ratio a color needs to pass. Overrides '\
+    'the per pair minimums of the audit report.'
+
 
 #_______________________________________________________________________
 class ColorSchemeParser:
@@ -134,6 +262,13 @@ class ColorSchemeParser:
       , required=False
     )
 
+    parser.add_argument('--from_image'
+      , help=ParserStrings.FROM_IMAGE_HELP_DESC
+      , action='store'
+      , type=str
+      , required=False
+    )
+
     parser.add_argument('--out_dir'
       , '-o'
       , help=ParserStrings.OUT_DIR_HELP_DESC
@@ -142,6 +277,18 @@ class ColorSchemeParser:
       , default=getcwd()
     )
 
+    parser.add_argument('--cterm_snap'
+      , help=ParserStrings.CTERM_SNAP_HELP_DESC
+      , action='store_true'
+      , required=False
+    )
+
+    parser.add_argument('--cache_stats'
+      , help=ParserStrings.CACHE_STATS_HELP_DESC
+      , action='store_true'
+      , required=False
+    )
+
     parser.add_argument('--default'
       , '-d'
       , help=ParserStrings.DEFAULT_DESC
@@ -149,6 +296,137 @@ class ColorSchemeParser:
       , required=False
     )
 
+    report_group = parser.add_argument_group(
+      ParserStrings.REPORT_GROUP_TITLE
+      , ParserStrings.REPORT_GROUP_DESC)
+
+    report_group.add_argument('--report'
+      , '-r'
+      , help=ParserStrings.REPORT_HELP_DESC
+      , action='store'
+      , type=str
+      , required=False
+      , choices=ParserStrings.REPORT_TYPES
+    )
+
+    report_group.add_argument('--theme_dir'
+      , help=ParserStrings.THEME_DIR_HELP_DESC
+      , action='store'
+      , type=str
+      , required=False
+    )
+
+    report_group.add_argument('--min_contrast'
+      , help=ParserStrings.MIN_CONTRAST_HELP_DESC
+      , action='store'
+      , type=float
+      , required=False
+    )
+
+    report_group.add_argument('--min_delta_e'
+      , help=ParserStrings.MIN_DELTA_E_HELP_DESC
+      , action='store'
+      , type=float
+      , required=False
+    )
+
+    report_group.add_argument('--max_delta_e'
+      , help=ParserStrings.MAX_DELTA_E_HELP_DESC
+      , action='store'
+      , type=float
+      , required=False
+    )
+
+    optimizer_group = parser.add_argument_group(
+      ParserStrings.OPTIMIZER_GROUP_TITLE
+      , ParserStrings.OPTIMIZER_GROUP_DESC)
+
+    optimizer_group.add_argument('--optimize'
+      , help=ParserStrings.OPTIMIZE_HELP_DESC
+      , action='store_true'
+      , required=False
+    )
+
+    optimizer_group.add_argument('--restarts'
+      , help=ParserStrings.RESTARTS_HELP_DESC
+      , action='store'
+      , type=int
+      , default=PaletteOptimizerConst.RESTARTS
+    )
+
+    optimizer_group.add_argument('--iterations'
+      , help=ParserStrings.ITERATIONS_HELP_DESC
+      , action='store'
+      , type=int
+      , default=PaletteOptimizerConst.ITERATIONS
+    )
+
+    optimizer_group.add_argument('--jobs'
+      , help=ParserStrings.JOBS_HELP_DESC
+      , action='store'
+      , type=int
+      , required=False
+    )
+
+    repair_group = parser.add_argument_group(
+      ParserStrings.REPAIR_GROUP_TITLE
+      , ParserStrings.REPAIR_GROUP_DESC)
+
+    repair_group.add_argument('--repair'
+      , help=ParserStrings.REPAIR_HELP_DESC
+      , action='store_true'
+      , required=False
+    )
+
+    sweep_group = parser.add_argument_group(
+      ParserStrings.SWEEP_GROUP_TITLE
+      , ParserStrings.SWEEP_GROUP_DESC)
+
+    sweep_group.add_argument('--sweep'
+      , help=ParserStrings.SWEEP_HELP_DESC
+      , action='store_true'
+      , required=False
+    )
+
+    sweep_group.add_argument('--max_cutoff_dark'
+      , help=ParserStrings.MAX_CUTOFF_DARK_HELP_DESC
+      , action='store'
+      , type=CutoffSweep.parse_range
+      , default=CutoffSweepConst.MAX_CUTOFF_DARK
+    )
+
+    sweep_group.add_argument('--min_cutoff_lite'
+      , help=ParserStrings.MIN_CUTOFF_LITE_HELP_DESC
+      , action='store'
+      , type=CutoffSweep.parse_range
+      , default=CutoffSweepConst.MIN_CUTOFF_LITE
+    )
+
+    sweep_group.add_argument('--max_cutoff_lite'
+      , help=ParserStrings.MAX_CUTOFF_LITE_HELP_DESC
+      , action='store'
+      , type=CutoffSweep.parse_range
+      , default=CutoffSweepConst.MAX_CUTOFF_LITE
+    )
+
+    interpolate_group = parser.add_argument_group(
+      ParserStrings.INTERPOLATE_GROUP_TITLE
+      , ParserStrings.INTERPOLATE_GROUP_DESC)
+
+    interpolate_group.add_argument('--interpolate'
+      , help=ParserStrings.INTERPOLATE_HELP_DESC
+      , action='store'
+      , type=str
+      , required=False
+    )
+
+    interpolate_group.add_argument('--steps'
+      , help=ParserStrings.STEPS_HELP_DESC
+      , action='store'
+      , type=int
+      , default=ThemeInterpolatorConst.STEPS
+    )
+
     return
 
 
@@ -0,0 +1,788 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Color space conversions between 24 bit sRGB, linear sRGB, OKLab,
+#   OKLCH and CIELAB, and perceptual color differences. sRGB decoding
+#   uses a 256 entry gamma table instead of evaluating pow() per
+#   channel.
+#_______________________________________________________________________
+
+from math import atan2, cos, degrees, exp, hypot, radians, sin, sqrt
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class ColorSpaceConst:
+
+  SRGB_SPACE  : str = 'srgb'
+  LINEAR_SPACE: str = 'linear'
+  OKLAB_SPACE : str = 'oklab'
+  OKLCH_SPACE : str = 'oklch'
+  LAB_SPACE   : str = 'lab'
+
+  SPACES: list[str] =\
+    [ SRGB_SPACE
+    , LINEAR_SPACE
+    , OKLAB_SPACE
+    , OKLCH_SPACE
+    , LAB_SPACE
+    ]
+
+  # sRGB transfer function
+  SRGB_THRESHOLD  : float = 0.04045
+  LINEAR_THRESHOLD: float = 0.0031308
+  SRGB_SLOPE      : float = 12.92
+  SRGB_OFFSET     : float = 0.055
+  SRGB_GAMMA      : float = 2.4
+
+  # Linear sRGB to cone response, then to OKLab (Ottosson 2020)
+  OKLAB_M1: list =\
+  [ [0.4122214708, 0.5363325363, 0.0514459929]
+  , [0.2119034982, 0.6806995451, 0.1073969566]
+  , [0.0883024619, 0.2817188376, 0.6299787005]
+  ]
+
+  OKLAB_M2: list =\
+  [ [0.2104542553,  0.7936177850, -0.0040720468]
+  , [1.9779984951, -2.4285922050,  0.4505937099]
+  , [0.0259040371,  0.7827717662, -0.8086757660]
+  ]
+
+  OKLAB_M1_INV: list =\
+  [ [ 4.0767416621, -3.3077115913,  0.2309699292]
+  , [-1.2684380046,  2.6097574011, -0.3413193965]
+  , [-0.0041960863, -0.7034186147,  1.7076147010]
+  ]
+
+  OKLAB_M2_INV: list =\
+  [ [1.0,  0.3963377774,  0.2158037573]
+  , [1.0, -0.1055613458, -0.0638541728]
+  , [1.0, -0.0894841775, -1.2914855480]
+  ]
+
+  # Linear sRGB to CIE XYZ, D65 white point
+  XYZ_M: list =\
+  [ [0.4124564, 0.3575761, 0.1804375]
+  , [0.2126729, 0.7151522, 0.0721750]
+  , [0.0193339, 0.1191920, 0.9503041]
+  ]
+
+  XYZ_M_INV: list =\
+  [ [ 3.2404542, -1.5371385, -0.4985314]
+  , [-0.9692660,  1.8760108,  0.0415560]
+  , [ 0.0556434, -0.2040259,  1.0572252]
+  ]
+
+  D65_WHITE: tuple = (0.95047, 1.0, 1.08883)
+
+  LAB_EPSILON: float = 216 / 24389
+  LAB_KAPPA  : float = 24389 / 27
+
+
+#_______________________________________________________________________
+class ColorSpace:
+  """
+  Functions without the _array suffix work on a single color: a 24 bit
+  RGB int or a 3 tuple. Functions with the _array suffix take a NumPy
+  array of packed colors or an (..., 3) float array, and require NumPy.
+
+  Linear sRGB channels are in range [0-1]. OKLab L is in range [0-1],
+  CIELAB L* in range [0-100]. OKLCH hue is in degrees.
+  """
+
+  # Results of convert_constant, keyed by (space, colors)
+  constant_cache_: dict = {}
+
+  # NumPy copies of the constant tables, keyed by name, see const_array
+  arrays_: dict = {}
+
+  #_____________________________________________________________________
+  def srgb_to_linear(value: float) -> float:
+    """
+    Converts an sRGB channel value in range [0-1] to linear light.
+    """
+
+    Const = ColorSpaceConst
+
+    if (value <= Const.SRGB_THRESHOLD):
+      return value / Const.SRGB_SLOPE
+
+    return ((value + Const.SRGB_OFFSET) / (1 + Const.SRGB_OFFSET))\
+      ** Const.SRGB_GAMMA
+
+  #_____________________________________________________________________
+  def linear_to_srgb(value: float) -> float:
+    """
+    Converts a linear light channel value in range [0-1] to sRGB.
+    """
+
+    Const = ColorSpaceConst
+
+    if (value <= Const.LINEAR_THRESHOLD):
+      return value * Const.SRGB_SLOPE
+
+    return (1 + Const.SRGB_OFFSET) * value ** (1 / Const.SRGB_GAMMA)\
+      - Const.SRGB_OFFSET
+
+  # Linear value of every 8 bit sRGB channel value
+  GAMMA_TABLE: list[float] =\
+    list(map(srgb_to_linear, [ v / 255 for v in range(256) ]))
+
+  #_____________________________________________________________________
+  def mat_vec(m: list, v: tuple) -> tuple:
+    """
+    Multiplies a 3x3 matrix by a 3 element vector.
+    """
+
+    return\
+      ( m[0][0] * v[0] + m[0][1] * v[1] + m[0][2] * v[2]
+      , m[1][0] * v[0] + m[1][1] * v[1] + m[1][2] * v[2]
+      , m[2][0] * v[0] + m[2][1] * v[1] + m[2][2] * v[2]
+      )
+
+  #_____________________________________________________________________
+  def cbrt(x: float) -> float:
+    """
+    Real cube root, defined for negative input.
+    """
+
+    return x ** (1 / 3) if (x >= 0) else -((-x) ** (1 / 3))
+
+  #_____________________________________________________________________
+  def rgb_to_linear(rgb_color: int) -> tuple:
+    """
+    Converts a 24 bit RGB color to linear sRGB.
+    """
+
+    table: list[float] = ColorSpace.GAMMA_TABLE
+
+    return\
+      ( table[(rgb_color >> 16) & 0xFF]
+      , table[(rgb_color >>  8) & 0xFF]
+      , table[ rgb_color        & 0xFF]
+      )
+
+  #_____________________________________________________________________
+  def linear_to_rgb(linear: tuple) -> int:
+    """
+    Converts linear sRGB to a 24 bit RGB color. Channels outside the
+    sRGB gamut are clipped.
+    """
+
+    out: int = 0
+
+    for value in linear:
+      value = min(1.0, max(0.0, value))
+      out = (out << 8) | int(round(ColorSpace.linear_to_srgb(value) * 255))
+
+    return out
+
+  #_____________________________________________________________________
+  def linear_to_oklab(linear: tuple) -> tuple:
+    """
+    Converts linear sRGB to OKLab (L, a, b).
+    """
+
+    Const = ColorSpaceConst
+
+    lms: tuple = ColorSpace.mat_vec(Const.OKLAB_M1, linear)
+
+    return ColorSpace.mat_vec(Const.OKLAB_M2
+      , tuple(ColorSpace.cbrt(x) for x in lms))
+
+  #_____________________________________________________________________
+  def oklab_to_linear(oklab: tuple) -> tuple:
+    """
+    Converts OKLab (L, a, b) to linear sRGB.
+    """
+
+    Const = ColorSpaceConst
+
+    lms: tuple = ColorSpace.mat_vec(Const.OKLAB_M2_INV, oklab)
+
+    return ColorSpace.mat_vec(Const.OKLAB_M1_INV
+      , tuple(x * x * x for x in lms))
+
+  #_____________________________________________________________________
+  def oklab_to_oklch(oklab: tuple) -> tuple:
+    """
+    Converts OKLab (L, a, b) to OKLCH (L, C, h).
+    """
+
+    l, a, b = oklab
+
+    return (l, hypot(a, b), degrees(atan2(b, a)) % 360)
+
+  #_____________________________________________________________________
+  def oklch_to_oklab(oklch: tuple) -> tuple:
+    """
+    Converts OKLCH (L, C, h) to OKLab (L, a, b).
+    """
+
+    l, c, h = oklch
+
+    return (l, c * cos(radians(h)), c * sin(radians(h)))
+
+  #_____________________________________________________________________
+  def lab_f(t: float) -> float:
+    """
+    CIELAB companding function.
+    """
+
+    Const = ColorSpaceConst
+
+    if (t > Const.LAB_EPSILON):
+      return t ** (1 / 3)
+
+    return (Const.LAB_KAPPA * t + 16) / 116
+
+  #_____________________________________________________________________
+  def lab_f_inv(f: float) -> float:
+    """
+    Inverse of the CIELAB companding function.
+    """
+
+    Const = ColorSpaceConst
+
+    if (f * f * f > Const.LAB_EPSILON):
+      return f * f * f
+
+    return (116 * f - 16) / Const.LAB_KAPPA
+
+  #_____________________________________________________________________
+  def linear_to_lab(linear: tuple) -> tuple:
+    """
+    Converts linear sRGB to CIELAB (L*, a*, b*), D65 white.
+    """
+
+    Const = ColorSpaceConst
+
+    xyz: tuple = ColorSpace.mat_vec(Const.XYZ_M, linear)
+
+    fx: float = ColorSpace.lab_f(xyz[0] / Const.D65_WHITE[0])
+    fy: float = ColorSpace.lab_f(xyz[1] / Const.D65_WHITE[1])
+    fz: float = ColorSpace.lab_f(xyz[2] / Const.D65_WHITE[2])
+
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+  #_____________________________________________________________________
+  def lab_to_linear(lab: tuple) -> tuple:
+    """
+    Converts CIELAB (L*, a*, b*), D65 white, to linear sRGB.
+    """
+
+    Const = ColorSpaceConst
+
+    fy: float = (lab[0] + 16) / 116
+    fx: float = fy + lab[1] / 500
+    fz: float = fy - lab[2] / 200
+
+    xyz: tuple =\
+      ( ColorSpace.lab_f_inv(fx) * Const.D65_WHITE[0]
+      , ColorSpace.lab_f_inv(fy) * Const.D65_WHITE[1]
+      , ColorSpace.lab_f_inv(fz) * Const.D65_WHITE[2]
+      )
+
+    return ColorSpace.mat_vec(Const.XYZ_M_INV, xyz)
+
+  #_____________________________________________________________________
+  def rgb_to_oklab(rgb_color: int) -> tuple:
+    """
+    Converts a 24 bit RGB color to OKLab (L, a, b).
+    """
+
+    return ColorSpace.linear_to_oklab(ColorSpace.rgb_to_linear(rgb_color))
+
+  #_____________________________________________________________________
+  def oklab_to_rgb(oklab: tuple) -> int:
+    """
+    Converts OKLab (L, a, b) to a 24 bit RGB color, clipped to gamut.
+    """
+
+    return ColorSpace.linear_to_rgb(ColorSpace.oklab_to_linear(oklab))
+
+  #_____________________________________________________________________
+  def rgb_to_oklch(rgb_color: int) -> tuple:
+    """
+    Converts a 24 bit RGB color to OKLCH (L, C, h).
+    """
+
+    return ColorSpace.oklab_to_oklch(ColorSpace.rgb_to_oklab(rgb_color))
+
+  #_____________________________________________________________________
+  def oklch_to_rgb(oklch: tuple) -> int:
+    """
+    Converts OKLCH (L, C, h) to a 24 bit RGB color, clipped to gamut.
+    """
+
+    return ColorSpace.oklab_to_rgb(ColorSpace.oklch_to_oklab(oklch))
+
+  #_____________________________________________________________________
+  def rgb_to_lab(rgb_color: int) -> tuple:
+    """
+    Converts a 24 bit RGB color to CIELAB (L*, a*, b*), D65 white.
+    """
+
+    return ColorSpace.linear_to_lab(ColorSpace.rgb_to_linear(rgb_color))
+
+  #_____________________________________________________________________
+  def lab_to_rgb(lab: tuple) -> int:
+    """
+    Converts CIELAB (L*, a*, b*) to a 24 bit RGB color, clipped to gamut.
+    """
+
+    return ColorSpace.linear_to_rgb(ColorSpace.lab_to_linear(lab))
+
+  #_____________________________________________________________________
+  def convert(rgb_color: int, space: str) -> tuple:
+    """
+    Converts a 24 bit RGB color to the named color space.
+
+    Parameters
+      rgb_color : 24 bit RGB color as integer
+      space     : One of 'srgb', 'linear', 'oklab', 'oklch' or 'lab'.
+                  'srgb' gives channel values in range [0-255].
+
+    Returns
+      Color as a 3 tuple
+    """
+
+    Const = ColorSpaceConst
+
+    if (space == Const.SRGB_SPACE):
+      return ((rgb_color >> 16) & 0xFF
+        , (rgb_color >> 8) & 0xFF
+        , rgb_color & 0xFF)
+
+    if (space == Const.LINEAR_SPACE):
+      return ColorSpace.rgb_to_linear(rgb_color)
+
+    if (space == Const.OKLAB_SPACE):
+      return ColorSpace.rgb_to_oklab(rgb_color)
+
+    if (space == Const.OKLCH_SPACE):
+      return ColorSpace.rgb_to_oklch(rgb_color)
+
+    if (space == Const.LAB_SPACE):
+      return ColorSpace.rgb_to_lab(rgb_color)
+
+    raise ValueError(f'Unknown color space: {space}')
+
+  #_____________________________________________________________________
+  def delta_e_2000(lab1: tuple, lab2: tuple) -> float:
+    """
+    CIEDE2000 color difference between two CIELAB colors.
+    """
+
+    l1, a1, b1 = lab1
+    l2, a2, b2 = lab2
+
+    c_bar: float = (sqrt(a1 * a1 + b1 * b1) + sqrt(a2 * a2 + b2 * b2)) / 2
+    c_bar7: float = c_bar ** 7
+    g: float = 0.5 * (1 - sqrt(c_bar7 / (c_bar7 + 25 ** 7)))
+
+    a1p: float = (1 + g) * a1
+    a2p: float = (1 + g) * a2
+    c1p: float = sqrt(a1p * a1p + b1 * b1)
+    c2p: float = sqrt(a2p * a2p + b2 * b2)
+    h1p: float = degrees(atan2(b1, a1p)) % 360
+    h2p: float = degrees(atan2(b2, a2p)) % 360
+
+    dlp: float = l2 - l1
+    dcp: float = c2p - c1p
+
+    dhp: float = h2p - h1p
+    if (c1p * c2p == 0):
+      dhp = 0
+    elif (dhp > 180):
+      dhp -= 360
+    elif (dhp < -180):
+      dhp += 360
+
+    dhp_big: float = 2 * sqrt(c1p * c2p) * sin(radians(dhp / 2))
+
+    l_bar: float = (l1 + l2) / 2
+    c_bar_p: float = (c1p + c2p) / 2
+
+    h_bar: float = h1p + h2p
+    if (c1p * c2p != 0):
+      if (abs(h1p - h2p) <= 180):
+        h_bar /= 2
+      elif (h_bar < 360):
+        h_bar = (h_bar + 360) / 2
+      else:
+        h_bar = (h_bar - 360) / 2
+
+    t: float = 1\
+      - 0.17 * cos(radians(h_bar - 30))\
+      + 0.24 * cos(radians(2 * h_bar))\
+      + 0.32 * cos(radians(3 * h_bar + 6))\
+      - 0.20 * cos(radians(4 * h_bar - 63))
+
+    l_bar50_sq: float = (l_bar - 50) ** 2
+    s_l: float = 1 + 0.015 * l_bar50_sq / sqrt(20 + l_bar50_sq)
+    s_c: float = 1 + 0.045 * c_bar_p
+    s_h: float = 1 + 0.015 * c_bar_p * t
+
+    c_bar_p7: float = c_bar_p ** 7
+    r_t: float = -2 * sqrt(c_bar_p7 / (c_bar_p7 + 25 ** 7))\
+      * sin(radians(60 * exp(-(((h_bar - 275) / 25) ** 2))))
+
+    return sqrt(
+      (dlp / s_l) ** 2
+      + (dcp / s_c) ** 2
+      + (dhp_big / s_h) ** 2
+      + r_t * (dcp / s_c) * (dhp_big / s_h))
+
+  #_____________________________________________________________________
+  def const_array(name: str):
+    """
+    NumPy copy of a table of ColorSpace or ColorSpaceConst, e.g.
+    'OKLAB_M1', converted on first use. Converting the lists on every
+    call costs more than the math for a few colors.
+    """
+
+    arrays: dict = ColorSpace.arrays_
+
+    if (name not in arrays):
+      owner = ColorSpace if (hasattr(ColorSpace, name)) else ColorSpaceConst
+      arrays[name] = np.asarray(getattr(owner, name))
+
+    return arrays[name]
+
+  #_____________________________________________________________________
+  def rgb_to_linear_array(packed):
+    """
+    Converts packed 24 bit RGB colors to linear sRGB.
+    """
+
+    packed = np.asarray(packed, dtype=np.uint32)
+    table = ColorSpace.const_array('GAMMA_TABLE')
+
+    return np.stack(
+      [ table[(packed >> 16) & 0xFF]
+      , table[(packed >>  8) & 0xFF]
+      , table[ packed        & 0xFF]
+      ], axis=-1)
+
+  #_____________________________________________________________________
+  def linear_to_rgb_array(linear):
+    """
+    Converts linear sRGB to packed 24 bit RGB colors. Channels outside
+    the sRGB gamut are clipped.
+    """
+
+    Const = ColorSpaceConst
+
+    linear = np.clip(linear, 0.0, 1.0)
+
+    srgb = np.where(linear <= Const.LINEAR_THRESHOLD
+      , linear * Const.SRGB_SLOPE
+      , (1 + Const.SRGB_OFFSET) * linear ** (1 / Const.SRGB_GAMMA)
+        - Const.SRGB_OFFSET)
+
+    rgb = np.round(srgb * 255).astype(np.uint32)
+
+    return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+  #_____________________________________________________________________
+  def linear_to_oklab_array(linear):
+    """
+    Converts linear sRGB to OKLab.
+    """
+
+    Const = ColorSpaceConst
+
+    lms = linear @ ColorSpace.const_array('OKLAB_M1').T
+
+    return np.cbrt(lms) @ ColorSpace.const_array('OKLAB_M2').T
+
+  #_____________________________________________________________________
+  def oklab_to_linear_array(oklab):
+    """
+    Converts OKLab to linear sRGB.
+    """
+
+    Const = ColorSpaceConst
+
+    lms = oklab @ ColorSpace.const_array('OKLAB_M2_INV').T
+
+    return (lms ** 3) @ ColorSpace.const_array('OKLAB_M1_INV').T
+
+  #_____________________________________________________________________
+  def oklab_to_oklch_array(oklab):
+    """
+    Converts OKLab to OKLCH.
+    """
+
+    return np.stack(
+      [ oklab[..., 0]
+      , np.hypot(oklab[..., 1], oklab[..., 2])
+      , np.degrees(np.arctan2(oklab[..., 2], oklab[..., 1])) % 360
+      ], axis=-1)
+
+  #_____________________________________________________________________
+  def oklch_to_oklab_array(oklch):
+    """
+    Converts OKLCH to OKLab.
+    """
+
+    h = np.radians(oklch[..., 2])
+
+    return np.stack(
+      [ oklch[..., 0]
+      , oklch[..., 1] * np.cos(h)
+      , oklch[..., 1] * np.sin(h)
+      ], axis=-1)
+
+  #_____________________________________________________________________
+  def linear_to_lab_array(linear):
+    """
+    Converts linear sRGB to CIELAB.
+    """
+
+    Const = ColorSpaceConst
+
+    xyz = linear @ ColorSpace.const_array('XYZ_M').T
+
+    t = xyz / ColorSpace.const_array('D65_WHITE')
+
+    f = np.where(t > Const.LAB_EPSILON
+      , np.cbrt(t)
+      , (Const.LAB_KAPPA * t + 16) / 116)
+
+    return np.stack(
+      [ 116 * f[..., 1] - 16
+      , 500 * (f[..., 0] - f[..., 1])
+      , 200 * (f[..., 1] - f[..., 2])
+      ], axis=-1)
+
+  #_____________________________________________________________________
+  def lab_to_linear_array(lab):
+    """
+    Converts CIELAB to linear sRGB.
+    """
+
+    Const = ColorSpaceConst
+
+    fy = (lab[..., 0] + 16) / 116
+    f = np.stack([fy + lab[..., 1] / 500, fy, fy - lab[..., 2] / 200]
+      , axis=-1)
+
+    t = np.where(f ** 3 > Const.LAB_EPSILON
+      , f ** 3
+      , (116 * f - 16) / Const.LAB_KAPPA)
+
+    xyz = t * ColorSpace.const_array('D65_WHITE')
+
+    return xyz @ ColorSpace.const_array('XYZ_M_INV').T
+
+  #_____________________________________________________________________
+  def rgb_to_oklab_array(packed):
+    """
+    Converts packed 24 bit RGB colors to OKLab.
+    """
+
+    return ColorSpace.linear_to_oklab_array(
+      ColorSpace.rgb_to_linear_array(packed))
+
+  #_____________________________________________________________________
+  def oklab_to_rgb_array(oklab):
+    """
+    Converts OKLab to packed 24 bit RGB colors, clipped to gamut.
+    """
+
+    return ColorSpace.linear_to_rgb_array(
+      ColorSpace.oklab_to_linear_array(oklab))
+
+  #_____________________________________________________________________
+  def rgb_to_oklch_array(packed):
+    """
+    Converts packed 24 bit RGB colors to OKLCH.
+    """
+
+    return ColorSpace.oklab_to_oklch_array(
+      ColorSpace.rgb_to_oklab_array(packed))
+
+  #_____________________________________________________________________
+  def oklch_to_rgb_array(oklch):
+    """
+    Converts OKLCH to packed 24 bit RGB colors, clipped to gamut.
+    """
+
+    return ColorSpace.oklab_to_rgb_array(
+      ColorSpace.oklch_to_oklab_array(oklch))
+
+  #_____________________________________________________________________
+  def rgb_to_lab_array(packed):
+    """
+    Converts packed 24 bit RGB colors to CIELAB.
+    """
+
+    return ColorSpace.linear_to_lab_array(
+      ColorSpace.rgb_to_linear_array(packed))
+
+  #_____________________________________________________________________
+  def lab_to_rgb_array(lab):
+    """
+    Converts CIELAB to packed 24 bit RGB colors, clipped to gamut.
+    """
+
+    return ColorSpace.linear_to_rgb_array(
+      ColorSpace.lab_to_linear_array(lab))
+
+  #_____________________________________________________________________
+  def convert_array(packed, space: str):
+    """
+    Converts packed 24 bit RGB colors to the named color space. See
+    convert for the list of spaces.
+
+    Returns
+      (..., 3) float array
+    """
+
+    Const = ColorSpaceConst
+
+    if (space == Const.SRGB_SPACE):
+      packed = np.asarray(packed, dtype=np.uint32)
+
+      return np.stack(
+        [ (packed >> 16) & 0xFF
+        , (packed >>  8) & 0xFF
+        ,  packed        & 0xFF
+        ], axis=-1).astype(np.float64)
+
+    if (space == Const.LINEAR_SPACE):
+      return ColorSpace.rgb_to_linear_array(packed)
+
+    if (space == Const.OKLAB_SPACE):
+      return ColorSpace.rgb_to_oklab_array(packed)
+
+    if (space == Const.OKLCH_SPACE):
+      return ColorSpace.rgb_to_oklch_array(packed)
+
+    if (space == Const.LAB_SPACE):
+      return ColorSpace.rgb_to_lab_array(packed)
+
+    raise ValueError(f'Unknown color space: {space}')
+
+  #_____________________________________________________________________
+  def convert_constant(colors, space: str):
+    """
+    Cached conversion of a fixed list of colors, such as
+    RgbConst.ANSI_256_DARK_GREYS or Ansi256Colors.rgb_list. Each list
+    is converted once per color space.
+
+    Parameters
+      colors : List or tuple of 24 bit RGB colors as ints
+      space  : Color space name, see convert
+
+    Returns
+      Read only (N, 3) NumPy array, or a tuple of 3 tuples without
+      NumPy
+    """
+
+    key: tuple = (space, tuple(colors))
+
+    cache: dict = ColorSpace.constant_cache_
+
+    if (key not in cache):
+      if (np is not None):
+        converted = ColorSpace.convert_array(
+          np.asarray(key[1], dtype=np.uint32), space)
+        converted.flags.writeable = False
+
+      else:
+        converted = tuple(ColorSpace.convert(c, space) for c in key[1])
+
+      cache[key] = converted
+
+    return cache[key]
+
+  #_____________________________________________________________________
+  def delta_e_2000_array(lab1, lab2):
+    """
+    CIEDE2000 color difference between broadcastable arrays of CIELAB
+    colors with the channels on the last axis. Requires NumPy.
+    """
+
+    l1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    l2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    c_bar = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2
+    c_bar7 = c_bar ** 7
+    g = 0.5 * (1 - np.sqrt(c_bar7 / (c_bar7 + 25 ** 7)))
+
+    a1p = (1 + g) * a1
+    a2p = (1 + g) * a2
+    c1p = np.hypot(a1p, b1)
+    c2p = np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+
+    dlp = l2 - l1
+    dcp = c2p - c1p
+
+    c_prod = c1p * c2p
+
+    dhp = h2p - h1p
+    dhp = np.where(dhp > 180, dhp - 360, dhp)
+    dhp = np.where(dhp < -180, dhp + 360, dhp)
+    dhp = np.where(c_prod == 0, 0, dhp)
+
+    dhp_big = 2 * np.sqrt(c_prod) * np.sin(np.radians(dhp / 2))
+
+    l_bar = (l1 + l2) / 2
+    c_bar_p = (c1p + c2p) / 2
+
+    h_sum = h1p + h2p
+    h_bar = np.where(np.abs(h1p - h2p) <= 180, h_sum / 2
+      , np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2))
+    h_bar = np.where(c_prod == 0, h_sum, h_bar)
+
+    t = 1\
+      - 0.17 * np.cos(np.radians(h_bar - 30))\
+      + 0.24 * np.cos(np.radians(2 * h_bar))\
+      + 0.32 * np.cos(np.radians(3 * h_bar + 6))\
+      - 0.20 * np.cos(np.radians(4 * h_bar - 63))
+
+    l_bar50_sq = (l_bar - 50) ** 2
+    s_l = 1 + 0.015 * l_bar50_sq / np.sqrt(20 + l_bar50_sq)
+    s_c = 1 + 0.045 * c_bar_p
+    s_h = 1 + 0.015 * c_bar_p * t
+
+    c_bar_p7 = c_bar_p ** 7
+    r_t = -2 * np.sqrt(c_bar_p7 / (c_bar_p7 + 25 ** 7))\
+      * np.sin(np.radians(60 * np.exp(-(((h_bar - 275) / 25) ** 2))))
+
+    return np.sqrt(
+      (dlp / s_l) ** 2
+      + (dcp / s_c) ** 2
+      + (dhp_big / s_h) ** 2
+      + r_t * (dcp / s_c) * (dhp_big / s_h))
@@ -0,0 +1,233 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   WCAG 2.x contrast ratio and APCA lightness contrast, for single
+#   color pairs and as full foreground x background matrices.
+#_______________________________________________________________________
+
+from classes.color_space import ColorSpace
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class ContrastConst:
+
+  # Rec. 709 luminance coefficients used by WCAG
+  WCAG_COEFFS: tuple = (0.2126, 0.7152, 0.0722)
+  WCAG_OFFSET: float = 0.05
+
+  # APCA 0.0.98G-4g constants
+  APCA_COEFFS      : tuple = (0.2126729, 0.7151522, 0.0721750)
+  APCA_GAMMA       : float = 2.4
+  APCA_BLACK_THRESH: float = 0.022
+  APCA_BLACK_CLAMP : float = 1.414
+  APCA_NORM_BG     : float = 0.56
+  APCA_NORM_TXT    : float = 0.57
+  APCA_REV_TXT     : float = 0.62
+  APCA_REV_BG      : float = 0.65
+  APCA_SCALE       : float = 1.14
+  APCA_OFFSET      : float = 0.027
+  APCA_LO_CLIP     : float = 0.1
+  APCA_DELTA_Y_MIN : float = 0.0005
+
+  # WCAG AA minimum for normal text
+  WCAG_AA: float = 4.5
+
+
+#_______________________________________________________________________
+class Contrast:
+  """
+  Luminance uses 256 entry tables, so each color costs three reads.
+  Functions with the _array suffix require NumPy and take packed 24 bit
+  RGB integer arrays.
+  """
+
+  #_____________________________________________________________________
+  def apca_channel(value: int) -> float:
+    """
+    APCA linearization of an 8 bit channel value. APCA uses a plain
+    power curve instead of the piecewise sRGB transfer function.
+    """
+
+    return (value / 255) ** ContrastConst.APCA_GAMMA
+
+  APCA_TABLE: list[float] = list(map(apca_channel, range(256)))
+
+  #_____________________________________________________________________
+  def luminance(rgb_color: int) -> float:
+    """
+    WCAG relative luminance of a 24 bit RGB color.
+    """
+
+    coeffs: tuple = ContrastConst.WCAG_COEFFS
+
+    red, grn, blu = ColorSpace.rgb_to_linear(rgb_color)
+
+    return coeffs[0] * red + coeffs[1] * grn + coeffs[2] * blu
+
+  #_____________________________________________________________________
+  def apca_luminance(rgb_color: int) -> float:
+    """
+    APCA screen luminance of a 24 bit RGB color, soft clamped near
+    black.
+    """
+
+    Const = ContrastConst
+
+    table: list[float] = Contrast.APCA_TABLE
+    coeffs: tuple = Const.APCA_COEFFS
+
+    y: float =\
+        coeffs[0] * table[(rgb_color >> 16) & 0xFF]\
+      + coeffs[1] * table[(rgb_color >>  8) & 0xFF]\
+      + coeffs[2] * table[ rgb_color        & 0xFF]
+
+    if (y > Const.APCA_BLACK_THRESH):
+      return y
+
+    return y + (Const.APCA_BLACK_THRESH - y) ** Const.APCA_BLACK_CLAMP
+
+  #_____________________________________________________________________
+  def wcag_contrast(fg: int, bg: int) -> float:
+    """
+    WCAG 2.x contrast ratio in range [1-21]. Symmetric in fg and bg.
+    """
+
+    offset: float = ContrastConst.WCAG_OFFSET
+
+    fg_y: float = Contrast.luminance(fg)
+    bg_y: float = Contrast.luminance(bg)
+
+    return (max(fg_y, bg_y) + offset) / (min(fg_y, bg_y) + offset)
+
+  #_____________________________________________________________________
+  def apca_contrast(fg: int, bg: int) -> float:
+    """
+    APCA lightness contrast Lc of text color fg on background bg.
+    Positive for dark text on light backgrounds, negative for light
+    text on dark backgrounds.
+    """
+
+    Const = ContrastConst
+
+    txt_y: float = Contrast.apca_luminance(fg)
+    bg_y: float = Contrast.apca_luminance(bg)
+
+    if (abs(bg_y - txt_y) < Const.APCA_DELTA_Y_MIN):
+      return 0.0
+
+    if (bg_y > txt_y):
+      sapc: float = (bg_y ** Const.APCA_NORM_BG - txt_y ** Const.APCA_NORM_TXT)\
+        * Const.APCA_SCALE
+
+      return 0.0 if (sapc < Const.APCA_LO_CLIP)\
+        else (sapc - Const.APCA_OFFSET) * 100
+
+    sapc: float = (bg_y ** Const.APCA_REV_BG - txt_y ** Const.APCA_REV_TXT)\
+      * Const.APCA_SCALE
+
+    return 0.0 if (sapc > -Const.APCA_LO_CLIP)\
+      else (sapc + Const.APCA_OFFSET) * 100
+
+  #_____________________________________________________________________
+  def luminance_array(packed):
+    """
+    Vectorized luminance.
+    """
+
+    return ColorSpace.rgb_to_linear_array(packed)\
+      @ np.asarray(ContrastConst.WCAG_COEFFS)
+
+  #_____________________________________________________________________
+  def apca_luminance_array(packed):
+    """
+    Vectorized apca_luminance.
+    """
+
+    Const = ContrastConst
+
+    packed = np.asarray(packed, dtype=np.uint32)
+    table = np.asarray(Contrast.APCA_TABLE)
+
+    y = Const.APCA_COEFFS[0] * table[(packed >> 16) & 0xFF]\
+      + Const.APCA_COEFFS[1] * table[(packed >>  8) & 0xFF]\
+      + Const.APCA_COEFFS[2] * table[ packed        & 0xFF]
+
+    return np.where(y > Const.APCA_BLACK_THRESH, y
+      , y + np.abs(Const.APCA_BLACK_THRESH - y) ** Const.APCA_BLACK_CLAMP)
+
+  #_____________________________________________________________________
+  def wcag_matrix(fg, bg):
+    """
+    WCAG contrast of every foreground against every background.
+
+    Parameters
+      fg : Packed colors of shape (..., P)
+      bg : Packed colors of shape (..., B), leading dimensions
+           broadcast against fg
+
+    Returns
+      Float array of shape (..., P, B)
+    """
+
+    offset: float = ContrastConst.WCAG_OFFSET
+
+    fg_y = Contrast.luminance_array(fg)[..., :, None]
+    bg_y = Contrast.luminance_array(bg)[..., None, :]
+
+    return (np.maximum(fg_y, bg_y) + offset)\
+      / (np.minimum(fg_y, bg_y) + offset)
+
+  #_____________________________________________________________________
+  def apca_matrix(fg, bg):
+    """
+    APCA contrast of every foreground as text on every background. See
+    wcag_matrix for shapes.
+    """
+
+    Const = ContrastConst
+
+    txt_y = Contrast.apca_luminance_array(fg)[..., :, None]
+    bg_y = Contrast.apca_luminance_array(bg)[..., None, :]
+
+    normal = (bg_y ** Const.APCA_NORM_BG - txt_y ** Const.APCA_NORM_TXT)\
+      * Const.APCA_SCALE
+
+    reverse = (bg_y ** Const.APCA_REV_BG - txt_y ** Const.APCA_REV_TXT)\
+      * Const.APCA_SCALE
+
+    lc = np.where(bg_y > txt_y
+      , np.where(normal < Const.APCA_LO_CLIP, 0.0
+        , normal - Const.APCA_OFFSET)
+      , np.where(reverse > -Const.APCA_LO_CLIP, 0.0
+        , reverse + Const.APCA_OFFSET))
+
+    lc = np.where(np.abs(bg_y - txt_y) < Const.APCA_DELTA_Y_MIN, 0.0, lc)
+
+    return lc * 100
@@ -0,0 +1,344 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Repairs palette colors that miss a contrast threshold against the
+#   background, moving each one the smallest OKLCH lightness distance
+#   that makes it pass. Chroma is reduced only where the new lightness
+#   is out of gamut.
+#_______________________________________________________________________
+
+import json
+
+from os import path
+
+from classes.color_space import ColorSpace
+from classes.contrast import Contrast
+from classes.contrast import ContrastConst
+from classes.perceptual_color import PerceptualColor
+from classes.theme_library import ThemeLibrary
+from classes.theme_library import ThemeLibraryConst
+from flux_bunny_utils.file_utils import FileUtils
+from flux_bunny_utils.string_utils import StringUtils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class ContrastRepairConst:
+
+  # Bisection steps on the lightness offset
+  SEARCH_STEPS: int = 14
+
+  DIRECTIONS: tuple = (1, -1)
+
+
+#_______________________________________________________________________
+class ContrastRepair:
+  """
+  Colors in the exempt slots of ThemeLibraryConst are never changed.
+  """
+
+  #_____________________________________________________________________
+  def move_lightness(lch: tuple, offset: float) -> int:
+    """
+    24 bit RGB color with OKLCH lightness moved by offset.
+    """
+
+    lightness: float = min(1.0, max(0.0, lch[0] + offset))
+
+    chroma: float = PerceptualColor.gamut_chroma(lightness, lch[1], lch[2])
+
+    return ColorSpace.oklch_to_rgb((lightness, chroma, lch[2]))
+
+  #_____________________________________________________________________
+  def repair_color(color: int, bg: int, min_contrast: float) -> int:
+    """
+    Nearest color, moving only OKLCH lightness, with at least
+    min_contrast against bg. If no lightness passes, returns the color
+    with the highest contrast reachable.
+    """
+
+    Repair = ContrastRepair
+
+    if (Contrast.wcag_contrast(color, bg) >= min_contrast):
+      return color
+
+    lch: tuple = ColorSpace.rgb_to_oklch(color)
+    lab: tuple = ColorSpace.rgb_to_oklab(color)
+
+    best: int = None
+    best_dist: float = None
+    fallback: int = color
+
+    for direction in ContrastRepairConst.DIRECTIONS:
+      limit: float = (1 - lch[0]) if (direction > 0) else lch[0]
+      end: int = Repair.move_lightness(lch, direction * limit)
+
+      if (Contrast.wcag_contrast(end, bg) > Contrast.wcag_contrast(fallback, bg)):
+        fallback = end
+
+      if (Contrast.wcag_contrast(end, bg) < min_contrast):
+        continue
+
+      lo: float = 0.0
+      hi: float = limit
+
+      for _ in range(ContrastRepairConst.SEARCH_STEPS):
+        mid: float = (lo + hi) / 2
+        moved: int = Repair.move_lightness(lch, direction * mid)
+
+        if (Contrast.wcag_contrast(moved, bg) >= min_contrast):
+          hi = mid
+
+        else:
+          lo = mid
+
+      moved: int = Repair.move_lightness(lch, direction * hi)
+
+      moved_lab: tuple = ColorSpace.rgb_to_oklab(moved)
+      dist: float = sum((a - b) ** 2 for a, b in zip(lab, moved_lab))
+
+      if (best is None or dist < best_dist):
+        best = moved
+        best_dist = dist
+
+    return fallback if (best is None) else best
+
+  #_____________________________________________________________________
+  def contrast_array(packed, bg_y):
+    """
+    WCAG contrast of packed colors against precomputed background
+    luminances.
+    """
+
+    offset: float = ContrastConst.WCAG_OFFSET
+
+    y = Contrast.luminance_array(packed)
+
+    return (np.maximum(y, bg_y) + offset) / (np.minimum(y, bg_y) + offset)
+
+  #_____________________________________________________________________
+  def repair_array(colors, bgs, min_contrast: float):
+    """
+    Vectorized repair_color.
+
+    Parameters
+      colors : (M,) packed colors
+      bgs    : (M,) packed backgrounds
+
+    Returns
+      (M,) packed repaired colors
+    """
+
+    colors = np.asarray(colors, dtype=np.uint32)
+    bgs = np.asarray(bgs, dtype=np.uint32)
+
+    # Only failing colors are searched
+    failing = ContrastRepair.contrast_array(
+      colors, Contrast.luminance_array(bgs)) < min_contrast
+
+    repaired = colors.copy()
+    repaired[failing] = ContrastRepair.search_array(
+      colors[failing], bgs[failing], min_contrast)
+
+    return repaired
+
+  #_____________________________________________________________________
+  def search_array(colors, bgs, min_contrast: float):
+    """
+    Lightness search of repair_array over failing colors only.
+    """
+
+    bg_y = Contrast.luminance_array(bgs)
+
+    contrast = lambda packed: ContrastRepair.contrast_array(packed, bg_y)
+
+    def move(offsets):
+      lightness = np.clip(lch[:, 0] + offsets, 0.0, 1.0)
+      return PerceptualColor.gamut_fit_array(lightness, lch[:, 1], lch[:, 2])
+
+    lch = ColorSpace.rgb_to_oklch_array(colors)
+    lab = ColorSpace.rgb_to_oklab_array(colors)
+
+    best = colors.copy()
+    best_dist = np.full(len(colors), np.inf)
+    best_contrast = contrast(colors)
+
+    for direction in ContrastRepairConst.DIRECTIONS:
+      limit = (1 - lch[:, 0]) if (direction > 0) else lch[:, 0]
+
+      end = move(direction * limit)
+      end_contrast = contrast(end)
+
+      # Highest contrast reachable, used where nothing passes
+      better = ~np.isfinite(best_dist) & (end_contrast > best_contrast)
+      best = np.where(better, end, best)
+      best_contrast = np.where(better, end_contrast, best_contrast)
+
+      feasible = end_contrast >= min_contrast
+
+      lo = np.zeros_like(limit)
+      hi = limit.copy()
+
+      for _ in range(ContrastRepairConst.SEARCH_STEPS):
+        mid = (lo + hi) / 2
+        ok = contrast(move(direction * mid)) >= min_contrast
+        hi = np.where(ok, mid, hi)
+        lo = np.where(ok, lo, mid)
+
+      moved = move(direction * hi)
+
+      dist = ((ColorSpace.rgb_to_oklab_array(moved) - lab) ** 2).sum(axis=1)
+      dist = np.where(feasible, dist, np.inf)
+
+      closer = dist < best_dist
+      best = np.where(closer, moved, best)
+      best_dist = np.where(closer, dist, best_dist)
+
+    return best.astype(np.uint32)
+
+  #_____________________________________________________________________
+  def repair_library(library: ThemeLibrary, min_contrast: float) -> list:
+    """
+    Repairs the failing palette colors of every theme. All failing
+    colors of all themes are repaired in one vectorized call.
+
+    Returns
+      List with one repaired palette per theme
+    """
+
+    Const = ThemeLibraryConst
+
+    size: int = Const.PALETTE_SIZE
+
+    palettes: list = [ list(s.palette_[:size]) for s in library.schemes_ ]
+
+    # Indices of every (theme, slot) that may be changed
+    targets: list = []
+
+    for t, scheme in enumerate(library.schemes_):
+      exempt: list[int] = Const.DARK_EXEMPT_SLOTS if (scheme.is_dark_)\
+        else Const.LITE_EXEMPT_SLOTS
+
+      targets += [ (t, i) for i in range(size) if (i not in exempt) ]
+
+    colors: list[int] = [ palettes[t][i] for t, i in targets ]
+    bgs: list[int] =\
+      [ library.schemes_[t].bg_norm_color_ for t, _ in targets ]
+
+    if (np is not None):
+      repaired: list[int] =\
+        ContrastRepair.repair_array(colors, bgs, min_contrast).tolist()
+
+    else:
+      repaired: list[int] =\
+        [ ContrastRepair.repair_color(c, bg, min_contrast)
+          for c, bg in zip(colors, bgs) ]
+
+    for (t, i), color in zip(targets, repaired):
+      palettes[t][i] = color
+
+    return palettes
+
+  #_____________________________________________________________________
+  def out_path(file_path: str, theme_dir: str, out_dir: str) -> str:
+    """
+    Output path of a repaired theme. Paths below theme_dir keep their
+    relative path under out_dir.
+    """
+
+    if (theme_dir):
+      rel_path: str = path.relpath(file_path, theme_dir)
+
+    else:
+      rel_path: str = path.basename(file_path)
+
+    if (not rel_path.endswith(ThemeLibraryConst.JSON_EXT)):
+      rel_path += ThemeLibraryConst.JSON_EXT
+
+    return path.abspath(path.join(out_dir, rel_path))
+
+  #_____________________________________________________________________
+  def run(args) -> str:
+    """
+    Command line entry point. Repairs the --file theme, or every theme
+    below --theme_dir, and writes corrected input json files to
+    --out_dir.
+
+    Returns
+      Summary of the changes
+    """
+
+    min_contrast: float = args.min_contrast or ContrastConst.WCAG_AA
+
+    library: ThemeLibrary = ThemeLibrary.from_args(args)
+
+    palettes: list = ContrastRepair.repair_library(library, min_contrast)
+
+    out_str: str = f'\nContrast repair, minimum WCAG contrast {min_contrast:g}'
+
+    color_count: int = 0
+    theme_count: int = 0
+
+    for t, palette in enumerate(palettes):
+      scheme = library.schemes_[t]
+
+      changed: list[int] =\
+        [ i for i in range(len(palette)) if (palette[i] != scheme.palette_[i]) ]
+
+      if (not changed):
+        continue
+
+      theme_count += 1
+      color_count += len(changed)
+
+      cfg: dict = dict(library.configs_[t])
+      cfg[scheme.PALETTE] =\
+        [ f'0x{StringUtils.int_to_hex6(c)}' for c in palette ]\
+        + list(cfg.get(scheme.PALETTE, [])[len(palette):])
+
+      file_path: str = ContrastRepair.out_path(
+        library.names_[t], args.theme_dir, args.out_dir)
+
+      FileUtils.verify_dir(path.dirname(file_path))
+
+      with open(file_path, 'w') as file:
+        json.dump(cfg, file, indent=2)
+
+      out_str += f'\n{file_path}'
+
+      for i in changed:
+        out_str += str(
+          f'\n  {ThemeLibraryConst.SLOT_LABELS[i]}'
+          f'  0x{scheme.palette_[i]:06x} -> 0x{palette[i]:06x}'
+          f'  {Contrast.wcag_contrast(palette[i], scheme.bg_norm_color_):5.2f}'
+        )
+
+    out_str += f'\nRepaired {color_count} colors in {theme_count} themes'
+
+    return out_str
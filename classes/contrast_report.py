@@ -0,0 +1,261 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Contrast of every palette color against each theme's backgrounds
+#   and the ANSI 256 greys, for one theme or a whole library.
+#_______________________________________________________________________
+
+from classes.contrast import Contrast
+from classes.contrast import ContrastConst
+from classes.rgb_color import RgbConst
+from classes.theme_library import ThemeLibrary
+from classes.theme_library import ThemeLibraryConst
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class ContrastReportConst:
+
+  # Column order of the background axis
+  BG_NORM_COL: int = 0
+  BG_BOLD_COL: int = 1
+  GREYS_COL  : int = 2
+
+  GREYS: list[int] =\
+    RgbConst.ANSI_256_DARK_GREYS + RgbConst.ANSI_256_LITE_GREYS
+
+  # Themes per vectorized block, bounds memory for large libraries
+  CHUNK_THEMES: int = 2048
+
+  HEADER: str = str(
+    ' Fails  Fails  Min WCAG         Min |Lc|  Grey'
+    '\n  Norm   Bold  Norm (slot)        Norm    Pass  Theme'
+  )
+
+  LINE: str = 76 * '-'
+
+
+#_______________________________________________________________________
+class ContrastReport:
+  """
+  The background axis of every matrix is
+    [bg_norm_color_, bg_bold_color_] + ANSI_256_DARK_GREYS
+    + ANSI_256_LITE_GREYS
+  """
+
+  #_____________________________________________________________________
+  def backgrounds(library: ThemeLibrary):
+    """
+    Returns
+      (T, B) packed background array
+    """
+
+    T: int = len(library)
+
+    greys = np.broadcast_to(
+      np.asarray(ContrastReportConst.GREYS, dtype=np.uint32)
+      , (T, len(ContrastReportConst.GREYS)))
+
+    return np.concatenate(
+      [ library.field('bg_norm_color_')[:, None]
+      , library.field('bg_bold_color_')[:, None]
+      , greys
+      ], axis=1)
+
+  #_____________________________________________________________________
+  def contrast_matrices(library: ThemeLibrary) -> tuple:
+    """
+    Full contrast matrices of every palette color against every
+    background, for all themes at once.
+
+    Returns
+      (wcag, apca) float arrays of shape (T, 16, B)
+    """
+
+    palettes = library.palettes()
+    backgrounds = ContrastReport.backgrounds(library)
+
+    return\
+      ( Contrast.wcag_matrix(palettes, backgrounds)
+      , Contrast.apca_matrix(palettes, backgrounds)
+      )
+
+  #_____________________________________________________________________
+  def contrast_lists(palette: list[int], backgrounds: list[int]) -> tuple:
+    """
+    Scalar version of contrast_matrices for a single theme.
+
+    Returns
+      (wcag, apca) nested lists of shape (16, B)
+    """
+
+    wcag: list = [ [ Contrast.wcag_contrast(fg, bg) for bg in backgrounds ]
+      for fg in palette ]
+
+    apca: list = [ [ Contrast.apca_contrast(fg, bg) for bg in backgrounds ]
+      for fg in palette ]
+
+    return (wcag, apca)
+
+  #_____________________________________________________________________
+  def summarize(wcag, apca, min_contrast: float) -> list[tuple]:
+    """
+    Reduces (T, 16, B) matrices to one summary row per theme.
+
+    Returns
+      List of (norm fails, bold fails, min norm WCAG, worst slot,
+      min norm |Lc|, fraction of grey pairs passing)
+    """
+
+    Const = ContrastReportConst
+
+    wcag = np.asarray(wcag).reshape(-1, *np.shape(wcag)[-2:])
+    apca = np.asarray(apca).reshape(wcag.shape)
+
+    passing = wcag >= min_contrast
+
+    norm = wcag[:, :, Const.BG_NORM_COL]
+
+    return list(zip
+      ( (~passing[:, :, Const.BG_NORM_COL]).sum(axis=1).tolist()
+      , (~passing[:, :, Const.BG_BOLD_COL]).sum(axis=1).tolist()
+      , norm.min(axis=1).tolist()
+      , norm.argmin(axis=1).tolist()
+      , np.abs(apca[:, :, Const.BG_NORM_COL]).min(axis=1).tolist()
+      , passing[:, :, Const.GREYS_COL:].mean(axis=(1, 2)).tolist()
+      ))
+
+  #_____________________________________________________________________
+  def summarize_lists(wcag: list, apca: list, min_contrast: float) -> tuple:
+    """
+    Scalar version of summarize for a single theme.
+    """
+
+    Const = ContrastReportConst
+
+    norm: list[float] = [ row[Const.BG_NORM_COL] for row in wcag ]
+    bold: list[float] = [ row[Const.BG_BOLD_COL] for row in wcag ]
+    greys: list[float] = [ v for row in wcag for v in row[Const.GREYS_COL:] ]
+
+    return\
+      ( sum(v < min_contrast for v in norm)
+      , sum(v < min_contrast for v in bold)
+      , min(norm)
+      , norm.index(min(norm))
+      , min(abs(row[Const.BG_NORM_COL]) for row in apca)
+      , sum(v >= min_contrast for v in greys) / len(greys)
+      )
+
+  #_____________________________________________________________________
+  def summary_rows(library: ThemeLibrary, min_contrast: float) -> list:
+    """
+    Summary row of every theme in the library, computed in blocks of
+    CHUNK_THEMES themes.
+    """
+
+    Const = ContrastReportConst
+
+    if (np is None):
+      rows: list = []
+
+      for scheme in library.schemes_:
+        backgrounds: list[int] =\
+          [scheme.bg_norm_color_, scheme.bg_bold_color_] + Const.GREYS
+
+        rows.append(ContrastReport.summarize_lists(
+          *ContrastReport.contrast_lists(
+            scheme.palette_[:ThemeLibraryConst.PALETTE_SIZE], backgrounds)
+          , min_contrast))
+
+      return rows
+
+    rows: list = []
+
+    for start in range(0, len(library), Const.CHUNK_THEMES):
+      chunk: ThemeLibrary = library.slice(start, start + Const.CHUNK_THEMES)
+
+      rows += ContrastReport.summarize(
+        *ContrastReport.contrast_matrices(chunk), min_contrast)
+
+    return rows
+
+  #_____________________________________________________________________
+  def create_report_str(library: ThemeLibrary, min_contrast: float) -> str:
+    """
+    Creates the report table, themes with the most failures first.
+    """
+
+    Const = ContrastReportConst
+
+    rows: list = ContrastReport.summary_rows(library, min_contrast)
+
+    order: list[int] = sorted(range(len(rows))
+      , key=lambda i: (-rows[i][0], -rows[i][1], rows[i][2]))
+
+    out_str: str = str(
+      f'\nContrast report, minimum WCAG contrast {min_contrast:g}'
+      f'\n{Const.LINE}'
+      f'\n{Const.HEADER}'
+      f'\n{Const.LINE}'
+    )
+
+    for i in order:
+      norm_fails, bold_fails, min_norm, slot, min_lc, grey_pass = rows[i]
+
+      out_str += str(
+        f'\n {norm_fails:5d}  {bold_fails:5d}'
+        f'  {min_norm:5.2f} ({ThemeLibraryConst.SLOT_LABELS[slot]})'
+        f'  {min_lc:6.1f}'
+        f'  {100 * grey_pass:5.1f}%'
+        f'  {library.names_[i]}'
+      )
+
+    failing: int = sum(1 for row in rows if (row[0]))
+
+    out_str += str(
+      f'\n{Const.LINE}'
+      f'\n{len(rows)} themes, {failing} with palette colors below '
+      f'{min_contrast:g}:1 on the normal background'
+    )
+
+    return out_str
+
+  #_____________________________________________________________________
+  def run(args) -> str:
+    """
+    Report entry point for the command line.
+    """
+
+    min_contrast: float = args.min_contrast
+
+    if (min_contrast is None):
+      min_contrast = ContrastConst.WCAG_AA
+
+    return ContrastReport.create_report_str(
+      ThemeLibrary.from_args(args), min_contrast)
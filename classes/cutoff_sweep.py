@@ -0,0 +1,354 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Sweeps the RgbConst brightness cutoffs that derive the VS Code
+#   accent backgrounds and foregrounds, and ranks every grid point by
+#   the contrast of the derived colors over a library of themes.
+#_______________________________________________________________________
+
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+
+from classes.contrast import Contrast
+from classes.contrast import ContrastConst
+from classes.rgb_color import RgbConst
+from classes.theme_library import ThemeLibrary
+from flux_bunny_utils.error_utils import ErrorUtils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class CutoffSweepConst:
+
+  # Default ranges around the RgbConst values, start:stop:step with
+  # stop included
+  MAX_CUTOFF_DARK: str = '0x37:0x87:0x08'
+  MIN_CUTOFF_LITE: str = '0x37:0x87:0x08'
+  MAX_CUTOFF_LITE: str = '0xb7:0xff:0x08'
+
+  RANGE_SEPARATOR: str = ':'
+
+  ACCENT_ATTRS: list[str] =\
+    [ 'accent_color0_'
+    , 'accent_color1_'
+    , 'accent_color2_'
+    ]
+
+  # Rows of the ranked table printed by run
+  REPORT_ROWS: int = 20
+
+  HEADER: str = str(
+    '            Dark  Lite  Lite   Text    Key   Pair         Worst'
+    '\n Rank       Max   Min   Max   Pass   Pass   Pass  Score   WCAG'
+  )
+
+  LINE: str = 66 * '-'
+
+
+#_______________________________________________________________________
+class CutoffSweep:
+  """
+  Dark themes derive accent backgrounds with scale_color(0,
+  MAX_CUTOFF_DARK) and accent foregrounds with scale_color(
+  MIN_CUTOFF_LITE, MAX_CUTOFF_LITE); light themes swap the two. A grid
+  point is scored by the fraction of
+    text : fg_norm_color_ on each accent background
+    key  : each accent foreground on bg_norm_color_
+    pair : each accent foreground on its accent background
+  that meet the minimum contrast. Requires NumPy.
+
+  Each derived color depends on either the dark cutoff or the light
+  cutoff pair, never both, so colors are scaled once per cutoff value
+  and only the contrast is evaluated over the full grid.
+  """
+
+  #_____________________________________________________________________
+  def parse_range(text: str) -> list[int]:
+    """
+    Parses a start:stop:step range, stop included, or a single value.
+    Values may be decimal or 0x prefixed hex. Used as an argparse type.
+    """
+
+    parts: list[int] =\
+      [ int(p, 0) for p in text.split(CutoffSweepConst.RANGE_SEPARATOR) ]
+
+    if (len(parts) == 1):
+      parts += [parts[0], 1]
+
+    if (len(parts) != 3 or parts[2] <= 0 or parts[0] > parts[1]
+      or parts[0] < RgbConst.MIN_COLOR_VALUE
+      or parts[1] > RgbConst.MAX_COLOR_VALUE):
+
+      desc: str = f'{ErrorUtils.INVALID_VALUE} range = {text}'
+      ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+    return list(range(parts[0], parts[1] + 1, parts[2]))
+
+  #_____________________________________________________________________
+  def scale_grid(rgb, lo_cutoffs, hi_cutoffs):
+    """
+    ColorArray.scale_color for many cutoff pairs at once.
+
+    Parameters
+      rgb        : (N, 3) channel values
+      lo_cutoffs : (G,) lower cutoffs
+      hi_cutoffs : (G,) upper cutoffs
+
+    Returns
+      (G, N) packed scaled colors
+    """
+
+    rgb = np.asarray(rgb, dtype=np.float64)
+    lo = np.asarray(lo_cutoffs, dtype=np.float64)[:, None, None]
+    hi = np.asarray(hi_cutoffs, dtype=np.float64)[:, None, None]
+
+    min_val = rgb.min(axis=-1)
+    max_val = rgb.max(axis=-1)
+
+    in_range = (min_val >= lo[..., 0]) & (max_val <= hi[..., 0])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+      norm = np.maximum(0, rgb - lo) / max_val[:, None]
+
+    norm[:, max_val == 0] = 0
+
+    scaled = np.round(norm * (hi - lo) + lo).astype(np.uint32)
+    scaled = np.where(in_range[..., None], rgb.astype(np.uint32), scaled)
+
+    return (scaled[..., 0] << RgbConst.RED_RIGHT_SHIFT)\
+      | (scaled[..., 1] << RgbConst.GRN_RIGHT_SHIFT)\
+      | (scaled[..., 2] << RgbConst.BLU_RIGHT_SHIFT)
+
+  #_____________________________________________________________________
+  def ratio(y1, y2):
+    """
+    WCAG contrast of broadcastable luminance arrays.
+    """
+
+    offset: float = ContrastConst.WCAG_OFFSET
+
+    return (np.maximum(y1, y2) + offset) / (np.minimum(y1, y2) + offset)
+
+  #_____________________________________________________________________
+  def theme_arrays(library: ThemeLibrary) -> dict:
+    """
+    Arrays of the theme colors the sweep depends on.
+    """
+
+    accents = np.asarray(
+      [ [ getattr(s, attr) for attr in CutoffSweepConst.ACCENT_ATTRS ]
+        for s in library.schemes_ ], dtype=np.uint32)
+
+    return\
+    { 'accents': accents
+    , 'fg_norm': library.field('fg_norm_color_')
+    , 'bg_norm': library.field('bg_norm_color_')
+    , 'is_dark': library.is_dark()
+    }
+
+  #_____________________________________________________________________
+  def evaluate(themes: dict
+    , dark_cutoffs: list[int]
+    , lite_cutoffs: list[tuple]
+    , min_contrast: float
+    ) -> list[tuple]:
+    """
+    Scores every combination of dark cutoff and light cutoff pair.
+
+    Parameters
+      themes       : Arrays from theme_arrays
+      dark_cutoffs : MAX_CUTOFF_DARK values
+      lite_cutoffs : (MIN_CUTOFF_LITE, MAX_CUTOFF_LITE) pairs
+
+    Returns
+      List of (dark max, lite min, lite max, text pass, key pass,
+      pair pass, score, worst contrast)
+    """
+
+    Sweep = CutoffSweep
+
+    accents = themes['accents']
+
+    rgb = np.stack(
+      [ (accents >> RgbConst.RED_RIGHT_SHIFT) & 0xFF
+      , (accents >> RgbConst.GRN_RIGHT_SHIFT) & 0xFF
+      , (accents >> RgbConst.BLU_RIGHT_SHIFT) & 0xFF
+      ], axis=-1).reshape(-1, 3)
+
+    lite_lo = [ lo for lo, _ in lite_cutoffs ]
+    lite_hi = [ hi for _, hi in lite_cutoffs ]
+
+    shape: tuple = accents.shape
+
+    # (D, T, 3) and (L, T, 3) luminance of the derived colors
+    dark_y = Contrast.luminance_array(Sweep.scale_grid(rgb
+      , [RgbConst.MIN_CUTOFF_DARK] * len(dark_cutoffs), dark_cutoffs))\
+      .reshape(len(dark_cutoffs), *shape)
+
+    lite_y = Contrast.luminance_array(Sweep.scale_grid(rgb, lite_lo, lite_hi))\
+      .reshape(len(lite_cutoffs), *shape)
+
+    fg_norm_y = Contrast.luminance_array(themes['fg_norm'])[:, None]
+    bg_norm_y = Contrast.luminance_array(themes['bg_norm'])[:, None]
+
+    is_dark = themes['is_dark'][:, None]
+
+    axes: tuple = (1, 2)
+
+    rows: list[tuple] = []
+
+    # One dark cutoff at a time bounds memory to (L, T, 3)
+    for d in range(len(dark_cutoffs)):
+
+      # Dark themes use dark backgrounds and light foregrounds
+      bg_y = np.where(is_dark, dark_y[d], lite_y)
+      fg_y = np.where(is_dark, lite_y, dark_y[d])
+
+      text = Sweep.ratio(fg_norm_y, bg_y)
+      key = Sweep.ratio(fg_y, bg_norm_y)
+      pair = Sweep.ratio(fg_y, bg_y)
+
+      text_pass = (text >= min_contrast).mean(axis=axes)
+      key_pass = (key >= min_contrast).mean(axis=axes)
+      pair_pass = (pair >= min_contrast).mean(axis=axes)
+
+      worst = np.minimum(np.minimum(text.min(axis=axes), key.min(axis=axes))
+        , pair.min(axis=axes))
+
+      score = (text_pass + key_pass + pair_pass) / 3
+
+      rows +=\
+        [ ( dark_cutoffs[d], lite_lo[l], lite_hi[l]
+          , float(text_pass[l]), float(key_pass[l]), float(pair_pass[l])
+          , float(score[l]), float(worst[l]) )
+          for l in range(len(lite_cutoffs)) ]
+
+    return rows
+
+  #_____________________________________________________________________
+  def sweep(library: ThemeLibrary
+    , dark_cutoffs: list[int]
+    , lite_mins: list[int]
+    , lite_maxs: list[int]
+    , min_contrast: float = ContrastConst.WCAG_AA
+    , jobs: int = None
+    ) -> list[tuple]:
+    """
+    Evaluates the grid and ranks it, best first. Blocks of light
+    cutoff pairs are evaluated in a process pool when jobs is not 1.
+
+    Returns
+      Rows of evaluate, ranked by score, then worst contrast, then
+      cutoffs
+    """
+
+    if (np is None):
+      raise ImportError('CutoffSweep requires NumPy')
+
+    lite_cutoffs: list[tuple] =\
+      [ (lo, hi) for lo in lite_mins for hi in lite_maxs if (lo < hi) ]
+
+    themes: dict = CutoffSweep.theme_arrays(library)
+
+    workers: int = jobs or os.cpu_count() or 1
+
+    blocks: list =\
+      [ lite_cutoffs[b::workers] for b in range(workers)
+        if (lite_cutoffs[b::workers]) ]
+
+    if (len(blocks) <= 1):
+      rows: list = CutoffSweep.evaluate(
+        themes, dark_cutoffs, lite_cutoffs, min_contrast)
+
+    else:
+      count: int = len(blocks)
+
+      with ProcessPoolExecutor(max_workers=count) as pool:
+        rows: list = sum(pool.map(CutoffSweep.evaluate
+          , [themes] * count, [dark_cutoffs] * count, blocks
+          , [min_contrast] * count), [])
+
+    return sorted(rows, key=lambda r: (-r[6], -r[7], r[:3]))
+
+  #_____________________________________________________________________
+  def create_report_str(rows: list[tuple], theme_count: int
+    , min_contrast: float) -> str:
+    """
+    Ranked table of the best grid points. The current RgbConst cutoffs
+    are marked with an asterisk.
+    """
+
+    Const = CutoffSweepConst
+
+    current: tuple =\
+      ( RgbConst.MAX_CUTOFF_DARK
+      , RgbConst.MIN_CUTOFF_LITE
+      , RgbConst.MAX_CUTOFF_LITE
+      )
+
+    lines: list[str] =\
+      [ f'\nCutoff sweep, {len(rows)} grid points, {theme_count} themes'
+        f', minimum WCAG contrast {min_contrast:g}'
+      , Const.LINE
+      , Const.HEADER
+      , Const.LINE
+      ]
+
+    for rank, row in enumerate(rows):
+      if (rank >= Const.REPORT_ROWS and row[:3] != current):
+        continue
+
+      mark: str = '*' if (row[:3] == current) else ' '
+
+      lines.append(
+        f'{mark}{rank + 1:4d}  0x{row[0]:02x}  0x{row[1]:02x}  0x{row[2]:02x}'
+        f'  {100 * row[3]:5.1f}  {100 * row[4]:5.1f}  {100 * row[5]:5.1f}'
+        f'  {100 * row[6]:5.1f}  {row[7]:5.2f}')
+
+    lines.append(Const.LINE)
+
+    return '\n'.join(lines)
+
+  #_____________________________________________________________________
+  def run(args) -> str:
+    """
+    Command line entry point. Sweeps the --file theme, or every theme
+    below --theme_dir.
+    """
+
+    min_contrast: float = args.min_contrast or ContrastConst.WCAG_AA
+
+    library: ThemeLibrary = ThemeLibrary.from_args(args)
+
+    rows: list = CutoffSweep.sweep(library
+      , args.max_cutoff_dark, args.min_cutoff_lite, args.max_cutoff_lite
+      , min_contrast=min_contrast, jobs=args.jobs)
+
+    return CutoffSweep.create_report_str(rows, len(library), min_contrast)
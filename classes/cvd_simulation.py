@@ -0,0 +1,308 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Color vision deficiency simulation with the Machado, Oliveira and
+#   Fernandes (2009) matrices at full severity, applied in linear sRGB,
+#   and a report of the palette and accent pairs that stop being
+#   distinguishable under each deficiency.
+#_______________________________________________________________________
+
+from classes.color_space import ColorSpace
+from classes.theme_library import ThemeLibrary
+from classes.theme_library import ThemeLibraryConst
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class CvdSimulationConst:
+
+  PROTANOPIA  : str = 'protanopia'
+  DEUTERANOPIA: str = 'deuteranopia'
+  TRITANOPIA  : str = 'tritanopia'
+
+  DEFICIENCIES: list[str] =\
+    [ PROTANOPIA
+    , DEUTERANOPIA
+    , TRITANOPIA
+    ]
+
+  # Linear sRGB simulation matrices, severity 1.0
+  MATRICES: dict =\
+  { PROTANOPIA:
+    [ [ 0.152286,  1.052583, -0.204868]
+    , [ 0.114503,  0.786281,  0.099216]
+    , [-0.003882, -0.048116,  1.051998]
+    ]
+  , DEUTERANOPIA:
+    [ [ 0.367322,  0.860646, -0.227968]
+    , [ 0.280085,  0.672501,  0.047413]
+    , [-0.011820,  0.042940,  0.968881]
+    ]
+  , TRITANOPIA:
+    [ [ 1.255528, -0.076749, -0.178779]
+    , [-0.078411,  0.930809,  0.147602]
+    , [ 0.004733,  0.691367,  0.303900]
+    ]
+  }
+
+  # CIEDE2000 difference below which two colors are confusable
+  MIN_DELTA_E: float = 5.0
+
+  ACCENT_ATTRS: list[str] =\
+    [ 'accent_color0_'
+    , 'accent_color1_'
+    , 'accent_color2_'
+    ]
+
+  COLOR_LABELS: list[str] =\
+    ThemeLibraryConst.SLOT_LABELS + [ 'ACCENT0', 'ACCENT1', 'ACCENT2' ]
+
+  # Themes per vectorized block, bounds memory for large libraries
+  CHUNK_THEMES: int = 2048
+
+  REPORT_LINE: str = 76 * '-'
+
+
+#_______________________________________________________________________
+class CvdSimulation:
+  """
+  Colors of a theme are its 16 palette colors followed by its 3 accent
+  colors, labeled by CvdSimulationConst.COLOR_LABELS.
+  """
+
+  #_____________________________________________________________________
+  def theme_colors(scheme) -> list[int]:
+    """
+    Palette and accent colors of one theme.
+    """
+
+    return list(scheme.palette_[:ThemeLibraryConst.PALETTE_SIZE])\
+      + [ getattr(scheme, attr) for attr in CvdSimulationConst.ACCENT_ATTRS ]
+
+  #_____________________________________________________________________
+  def simulate(rgb_color: int, deficiency: str) -> int:
+    """
+    Simulates how a color appears under a deficiency.
+
+    Parameters
+      rgb_color  : 24 bit RGB color as integer
+      deficiency : One of CvdSimulationConst.DEFICIENCIES
+
+    Returns
+      Simulated 24 bit RGB color
+    """
+
+    matrix: list = CvdSimulationConst.MATRICES[deficiency]
+
+    return ColorSpace.linear_to_rgb(
+      ColorSpace.mat_vec(matrix, ColorSpace.rgb_to_linear(rgb_color)))
+
+  #_____________________________________________________________________
+  def simulate_array(packed):
+    """
+    Simulates every deficiency at once.
+
+    Parameters
+      packed : (...,) packed colors
+
+    Returns
+      (D, ..., 3) simulated linear sRGB, D in DEFICIENCIES order
+    """
+
+    Const = CvdSimulationConst
+
+    matrices = np.asarray(
+      [ Const.MATRICES[d] for d in Const.DEFICIENCIES ])
+
+    linear = ColorSpace.rgb_to_linear_array(packed)
+
+    return np.clip(
+      np.einsum('dij,...j->d...i', matrices, linear), 0.0, 1.0)
+
+  #_____________________________________________________________________
+  def pair_distances(lab):
+    """
+    CIEDE2000 difference of every color pair i < j.
+
+    Parameters
+      lab : (..., C, 3) CIELAB colors
+
+    Returns
+      (..., P) differences, pairs in np.triu_indices(C, 1) order
+    """
+
+    i, j = np.triu_indices(lab.shape[-2], 1)
+
+    return ColorSpace.delta_e_2000_array(lab[..., i, :], lab[..., j, :])
+
+  #_____________________________________________________________________
+  def collapsed_pairs(colors, min_delta_e: float) -> list:
+    """
+    Pairs distinguishable with normal vision, at least min_delta_e
+    apart, that fall below min_delta_e under a deficiency.
+
+    Parameters
+      colors : (T, C) packed colors of T themes
+
+    Returns
+      Per theme, list of (deficiency, i, j, simulated delta E) with
+      i < j
+    """
+
+    Const = CvdSimulationConst
+
+    colors = np.asarray(colors, dtype=np.uint32)
+
+    normal = CvdSimulation.pair_distances(ColorSpace.rgb_to_lab_array(colors))
+
+    # Simulated colors are quantized to 24 bit like the scalar path
+    simulated = CvdSimulation.pair_distances(
+      ColorSpace.rgb_to_lab_array(ColorSpace.linear_to_rgb_array(
+        CvdSimulation.simulate_array(colors))))
+
+    first, second = np.triu_indices(colors.shape[-1], 1)
+
+    collapsed = (normal >= min_delta_e) & (simulated < min_delta_e)
+
+    pairs: list = [ [] for _ in range(len(colors)) ]
+
+    for d, t, p in zip(*np.nonzero(collapsed)):
+      pairs[t].append((Const.DEFICIENCIES[d], int(first[p]), int(second[p])
+        , float(simulated[d, t, p])))
+
+    return pairs
+
+  #_____________________________________________________________________
+  def collapsed_pairs_lists(colors: list[int], min_delta_e: float) -> list:
+    """
+    Scalar collapsed_pairs for a single theme, used without NumPy.
+    """
+
+    Const = CvdSimulationConst
+
+    lab: list = [ ColorSpace.rgb_to_lab(c) for c in colors ]
+
+    pairs: list = []
+
+    for deficiency in Const.DEFICIENCIES:
+      sim_lab: list =\
+        [ ColorSpace.rgb_to_lab(CvdSimulation.simulate(c, deficiency))
+          for c in colors ]
+
+      for i in range(len(colors)):
+        for j in range(i + 1, len(colors)):
+          if (ColorSpace.delta_e_2000(lab[i], lab[j]) < min_delta_e):
+            continue
+
+          delta_e: float = ColorSpace.delta_e_2000(sim_lab[i], sim_lab[j])
+
+          if (delta_e < min_delta_e):
+            pairs.append((deficiency, i, j, delta_e))
+
+    return pairs
+
+  #_____________________________________________________________________
+  def library_pairs(library: ThemeLibrary, min_delta_e: float) -> list:
+    """
+    collapsed_pairs of every theme in the library, computed in blocks
+    of CHUNK_THEMES themes.
+    """
+
+    Const = CvdSimulationConst
+
+    colors: list = [ CvdSimulation.theme_colors(s) for s in library.schemes_ ]
+
+    if (np is None):
+      return [ CvdSimulation.collapsed_pairs_lists(c, min_delta_e)
+        for c in colors ]
+
+    pairs: list = []
+
+    for start in range(0, len(colors), Const.CHUNK_THEMES):
+      pairs += CvdSimulation.collapsed_pairs(
+        colors[start:start + Const.CHUNK_THEMES], min_delta_e)
+
+    return pairs
+
+  #_____________________________________________________________________
+  def create_report_str(library: ThemeLibrary
+    , min_delta_e: float = CvdSimulationConst.MIN_DELTA_E
+    ) -> str:
+    """
+    Lists the collapsed pairs of each theme, then the number of themes
+    affected by each deficiency.
+    """
+
+    Const = CvdSimulationConst
+
+    pairs: list = CvdSimulation.library_pairs(library, min_delta_e)
+
+    counts: dict = { d: 0 for d in Const.DEFICIENCIES }
+
+    lines: list[str] =\
+      [ f'\nColor vision deficiency report, minimum delta E {min_delta_e:g}'
+      , Const.REPORT_LINE
+      ]
+
+    for t, theme_pairs in enumerate(pairs):
+      lines.append(f'{library.names_[t]}: {len(theme_pairs)} pairs')
+
+      for deficiency in Const.DEFICIENCIES:
+        found: list = [ p for p in theme_pairs if (p[0] == deficiency) ]
+
+        if (found):
+          counts[deficiency] += 1
+
+        for _, i, j, delta_e in found:
+          lines.append(
+            f'  {deficiency:12s}  {Const.COLOR_LABELS[i]:8s}'
+            f'  {Const.COLOR_LABELS[j]:8s}  {delta_e:5.1f}')
+
+    lines.append(Const.REPORT_LINE)
+
+    for deficiency in Const.DEFICIENCIES:
+      lines.append(
+        f'{counts[deficiency]:6d} of {len(pairs)} themes'
+        f' with confusable pairs under {deficiency}')
+
+    return '\n'.join(lines)
+
+  #_____________________________________________________________________
+  def run(args) -> str:
+    """
+    Report entry point for the command line.
+    """
+
+    min_delta_e: float = args.min_delta_e
+
+    if (min_delta_e is None):
+      min_delta_e = CvdSimulationConst.MIN_DELTA_E
+
+    return CvdSimulation.create_report_str(
+      ThemeLibrary.from_args(args), min_delta_e)
@@ -0,0 +1,242 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Derives ANSI 256 colors 16-255 from a theme instead of the fixed
+#   xterm table. The 6x6x6 cube is blended in OKLab between eight
+#   corners, the background, the six normal hue colors and the
+#   foreground; the 24 step grey ramp is blended from background to
+#   foreground.
+#_______________________________________________________________________
+
+from classes.color_space import ColorSpace
+from flux_bunny_utils.string_utils import StringUtils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class ExtendedPaletteConst:
+
+  SYSTEM_COLOR_COUNT: int = 16
+  CUBE_SIDE         : int = 6
+  GREY_COUNT        : int = 24
+  COLOR_COUNT       : int = 256
+
+  # Palette slots of the cube corners, indexed 4 * red + 2 * green +
+  # blue with each axis 0 or 1. None marks the background (black
+  # corner) and foreground (white corner).
+  CORNER_SLOTS: list =\
+    [ None, 4, 2, 6
+    , 1, 5, 3, None
+    ]
+
+  BG_CORNER: int = 0
+  FG_CORNER: int = 7
+
+  TOKEN_FORMAT: str = 'ANSI_{:03d}'
+
+
+#_______________________________________________________________________
+class ExtendedPalette:
+  """
+  Colors are in ANSI 256 order: cube entries 16-231, then greys
+  232-255.
+  """
+
+  #_____________________________________________________________________
+  def cube_weights() -> list[list[float]]:
+    """
+    Trilinear weights of the eight corners for each cube entry.
+
+    Returns
+      216 rows of 8 weights
+    """
+
+    side: int = ExtendedPaletteConst.CUBE_SIDE
+    last: int = side - 1
+
+    weights: list = []
+
+    for i in range(side ** 3):
+      red, grn, blu = i // (side * side), (i // side) % side, i % side
+
+      row: list[float] = []
+
+      for corner in range(8):
+        weight: float = 1.0
+
+        for value, bit in [(red, 4), (grn, 2), (blu, 1)]:
+          t: float = value / last
+          weight *= t if (corner & bit) else 1 - t
+
+        row.append(weight)
+
+      weights.append(row)
+
+    return weights
+
+  #_____________________________________________________________________
+  def grey_weights() -> list[float]:
+    """
+    Foreground weight of each grey, the background weight is one minus
+    it. Both ends are excluded.
+    """
+
+    count: int = ExtendedPaletteConst.GREY_COUNT
+
+    return [ (k + 1) / (count + 1) for k in range(count) ]
+
+  CUBE_WEIGHTS: list = cube_weights()
+  GREY_WEIGHTS: list = grey_weights()
+
+  # NumPy copies of the weights, converted on first use by
+  # generate_array
+  weight_arrays_: tuple = None
+
+  #_____________________________________________________________________
+  def corners(scheme) -> list[int]:
+    """
+    The eight cube corner colors of a theme.
+    """
+
+    Const = ExtendedPaletteConst
+
+    out: list[int] = []
+
+    for corner, slot in enumerate(Const.CORNER_SLOTS):
+      if (corner == Const.BG_CORNER):
+        out.append(scheme.bg_norm_color_)
+
+      elif (corner == Const.FG_CORNER):
+        out.append(scheme.fg_norm_color_)
+
+      else:
+        out.append(scheme.palette_[slot])
+
+    return out
+
+  #_____________________________________________________________________
+  def generate_array(corners):
+    """
+    Generates colors 16-255 of many themes at once.
+
+    Parameters
+      corners : (T, 8) packed corner colors
+
+    Returns
+      (T, 240) packed colors
+    """
+
+    Const = ExtendedPaletteConst
+    Palette = ExtendedPalette
+
+    if (Palette.weight_arrays_ is None):
+      Palette.weight_arrays_ =\
+        ( np.asarray(Palette.CUBE_WEIGHTS)
+        , np.asarray(Palette.GREY_WEIGHTS)[None, :, None]
+        )
+
+    cube_weights, t = Palette.weight_arrays_
+
+    lab = ColorSpace.rgb_to_oklab_array(np.asarray(corners, dtype=np.uint32))
+
+    cube = np.einsum('ck,tkd->tcd', cube_weights, lab)
+
+    greys = (1 - t) * lab[:, None, Const.BG_CORNER]\
+      + t * lab[:, None, Const.FG_CORNER]
+
+    return ColorSpace.oklab_to_rgb_array(np.concatenate([cube, greys], axis=1))
+
+  #_____________________________________________________________________
+  def generate_list(corners: list[int]) -> list[int]:
+    """
+    Scalar generate_array for one theme, used without NumPy.
+    """
+
+    Const = ExtendedPaletteConst
+    Palette = ExtendedPalette
+
+    lab: list = [ ColorSpace.rgb_to_oklab(c) for c in corners ]
+
+    blend = lambda weights, points:\
+      ColorSpace.oklab_to_rgb(tuple(
+        sum(w * p[d] for w, p in zip(weights, points)) for d in range(3)))
+
+    cube: list[int] = [ blend(w, lab) for w in Palette.CUBE_WEIGHTS ]
+
+    ends: list = [ lab[Const.BG_CORNER], lab[Const.FG_CORNER] ]
+
+    greys: list[int] = [ blend([1 - t, t], ends) for t in Palette.GREY_WEIGHTS ]
+
+    return cube + greys
+
+  #_____________________________________________________________________
+  def extended_palette(scheme) -> list[int]:
+    """
+    All 256 colors of a theme, its 16 palette colors followed by the
+    generated colors.
+    """
+
+    corners: list[int] = ExtendedPalette.corners(scheme)
+
+    if (np is not None):
+      generated: list[int] = ExtendedPalette.generate_array([corners])[0].tolist()
+
+    else:
+      generated: list[int] = ExtendedPalette.generate_list(corners)
+
+    return list(scheme.palette_[:ExtendedPaletteConst.SYSTEM_COLOR_COUNT])\
+      + generated
+
+  #_____________________________________________________________________
+  def extended_palettes(schemes: list) -> list[list[int]]:
+    """
+    extended_palette of many themes, generated in one vectorized step.
+    """
+
+    if (np is None):
+      return [ ExtendedPalette.extended_palette(s) for s in schemes ]
+
+    size: int = ExtendedPaletteConst.SYSTEM_COLOR_COUNT
+
+    generated = ExtendedPalette.generate_array(
+      [ ExtendedPalette.corners(s) for s in schemes ]).tolist()
+
+    return [ list(s.palette_[:size]) + g for s, g in zip(schemes, generated) ]
+
+  #_____________________________________________________________________
+  def token_map(palette: list[int]) -> dict:
+    """
+    Template tokens ANSI_016 to ANSI_255 of a 256 color palette.
+    """
+
+    Const = ExtendedPaletteConst
+
+    return\
+      { Const.TOKEN_FORMAT.format(i): StringUtils.int_to_hex6(palette[i])
+        for i in range(Const.SYSTEM_COLOR_COUNT, len(palette)) }
@@ -0,0 +1,397 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Creates an input json theme from an image. Pixels are subsampled,
+#   clustered with k-means in OKLab, and the clusters are assigned to
+#   the background, foreground, accent and ANSI palette colors by hue.
+#_______________________________________________________________________
+
+import json
+
+from os import path
+
+from classes.color_space import ColorSpace
+from classes.contrast import ContrastConst
+from classes.contrast_repair import ContrastRepair
+from classes.image_reader import ImageReader
+from classes.image_reader import ImageReaderConst
+from classes.perceptual_color import PerceptualColor
+from classes.scheme_types.base_scheme import ColorScheme
+from classes.theme_library import ThemeLibraryConst
+from flux_bunny_utils.file_utils import FileUtils
+from flux_bunny_utils.string_utils import StringUtils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class ImagePaletteConst:
+
+  CLUSTERS  : int   = 16
+  ITERATIONS: int   = 25
+  TOLERANCE : float = 1e-7
+  SEED      : int   = 0
+
+  # Clusters below this OKLCH chroma count as greys
+  MIN_CHROMA: float = 0.03
+
+  # Chroma of greys, tinted with the dominant hue
+  GREY_CHROMA: float = 0.015
+
+  # Chroma of hue slots no cluster is close to
+  FALLBACK_CHROMA: float = 0.12
+
+  # Largest hue difference, in degrees, of a cluster used for a slot
+  HUE_TOLERANCE: float = 45.0
+
+  # Palette slots of the six hues, with the primary defining each hue
+  HUE_SLOTS: list[tuple] =\
+    [ (1, 0xff0000)
+    , (2, 0x00ff00)
+    , (3, 0xffff00)
+    , (4, 0x0000ff)
+    , (5, 0xff00ff)
+    , (6, 0x00ffff)
+    ]
+
+  BOLD_OFFSET: int = 8
+
+  # Smallest hue difference, in degrees, between two accents
+  ACCENT_HUE_SPACING: float = 30.0
+
+  # Slots used for accents when the image has too few hues
+  ACCENT_SLOTS: list[int] = [6, 5, 4]
+
+  # OKLab lightness of each role, for dark and light themes
+  LIGHTNESS: dict =\
+  { True:
+    { 'bg_norm': 0.22, 'bg_bold': 0.18, 'fg_norm': 0.84, 'fg_bold': 0.93
+    , 'norm': 0.72, 'bold': 0.80
+    , 'greys': { 0: 0.18, 7: 0.84, 8: 0.45, 15: 0.93 }
+    }
+  , False:
+    { 'bg_norm': 0.96, 'bg_bold': 0.92, 'fg_norm': 0.32, 'fg_bold': 0.22
+    , 'norm': 0.52, 'bold': 0.44
+    , 'greys': { 0: 0.22, 7: 0.62, 8: 0.62, 15: 0.76 }
+    }
+  }
+
+  MODES: dict = { True: 'dark', False: 'light' }
+
+  OUT_SUFFIX: str = '-input.json'
+
+
+#_______________________________________________________________________
+class ImagePalette:
+  """
+  Requires NumPy.
+  """
+
+  #_____________________________________________________________________
+  def kmeans(lab
+    , clusters: int = ImagePaletteConst.CLUSTERS
+    , iterations: int = ImagePaletteConst.ITERATIONS
+    , seed: int = ImagePaletteConst.SEED
+    ) -> tuple:
+    """
+    k-means with k-means++ seeding.
+
+    Parameters
+      lab : (N, 3) OKLab colors
+
+    Returns
+      (centers (k, 3), counts (k,)), k at most clusters
+    """
+
+    rng = np.random.default_rng(seed)
+
+    lab = np.asarray(lab, dtype=np.float64)
+    clusters = min(clusters, len(lab))
+
+    # k-means++ seeding, each center chosen with probability
+    # proportional to the squared distance to the nearest center
+    centers = [ lab[rng.integers(len(lab))] ]
+    nearest = ((lab - centers[0]) ** 2).sum(axis=1)
+
+    for _ in range(1, clusters):
+      total: float = nearest.sum()
+
+      if (total <= 0):
+        break
+
+      center = lab[rng.choice(len(lab), p=nearest / total)]
+      centers.append(center)
+      nearest = np.minimum(nearest, ((lab - center) ** 2).sum(axis=1))
+
+    centers = np.asarray(centers)
+    k: int = len(centers)
+
+    for _ in range(iterations):
+      dist = (lab ** 2).sum(axis=1)[:, None] - 2 * lab @ centers.T\
+        + (centers ** 2).sum(axis=1)[None, :]
+
+      labels = dist.argmin(axis=1)
+      counts = np.bincount(labels, minlength=k)
+
+      sums = np.stack(
+        [ np.bincount(labels, weights=lab[:, ch], minlength=k)
+          for ch in range(3) ], axis=1)
+
+      # Empty clusters keep their center
+      moved = np.where(counts[:, None] > 0
+        , sums / np.maximum(counts, 1)[:, None], centers)
+
+      shift: float = ((moved - centers) ** 2).sum()
+      centers = moved
+
+      if (shift < ImagePaletteConst.TOLERANCE):
+        break
+
+    labels = (((lab[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2))\
+      .argmin(axis=1)
+
+    return centers, np.bincount(labels, minlength=k)
+
+  #_____________________________________________________________________
+  def hue_distance(h1, h2):
+    """
+    Absolute difference of hues in degrees, in [0-180].
+    """
+
+    diff = np.abs(np.asarray(h1) - np.asarray(h2)) % 360
+
+    return np.minimum(diff, 360 - diff)
+
+  #_____________________________________________________________________
+  def make_colors(lightness, chroma, hue) -> list[int]:
+    """
+    Packed colors from OKLCH values, with chroma reduced into gamut.
+    """
+
+    return PerceptualColor.gamut_fit_array(
+      np.asarray(lightness, dtype=np.float64)
+      , np.asarray(chroma, dtype=np.float64)
+      , np.asarray(hue, dtype=np.float64)).tolist()
+
+  #_____________________________________________________________________
+  def assign(centers, counts, min_contrast: float) -> dict:
+    """
+    Assigns cluster hues and chromas to theme colors.
+
+    Parameters
+      centers : (k, 3) OKLab cluster centers
+      counts  : (k,) pixels in each cluster
+
+    Returns
+      Input json dictionary without a name
+    """
+
+    Const = ImagePaletteConst
+    Scheme = ColorScheme
+    Palette = ImagePalette
+
+    lch = ColorSpace.oklab_to_oklch_array(centers)
+    weights = counts / counts.sum()
+
+    is_dark: bool =\
+      float((weights * lch[:, 0]).sum()) <= PerceptualColor.grey_lightness(0x80)
+
+    levels: dict = Const.LIGHTNESS[is_dark]
+
+    chromatic = (lch[:, 1] >= Const.MIN_CHROMA) & (counts > 0)
+
+    # Greys take the hue of the largest cluster
+    grey_hue: float = float(lch[np.argmax(counts), 2])
+
+    fallback_chroma: float = float(np.median(lch[chromatic, 1]))\
+      if (chromatic.any()) else Const.FALLBACK_CHROMA
+
+    #___________________________________________________________________
+    # Hue slots take the most prominent cluster close to their hue
+    #___________________________________________________________________
+    slot_hues: list[float] = []
+    slot_chromas: list[float] = []
+
+    for slot, primary in Const.HUE_SLOTS:
+      primary_hue: float = ColorSpace.rgb_to_oklch(primary)[2]
+
+      close = chromatic\
+        & (Palette.hue_distance(lch[:, 2], primary_hue) <= Const.HUE_TOLERANCE)
+
+      if (close.any()):
+        best: int = int(np.argmax(np.where(close, weights * lch[:, 1], -1)))
+        slot_hues.append(float(lch[best, 2]))
+        slot_chromas.append(float(lch[best, 1]))
+
+      else:
+        slot_hues.append(primary_hue)
+        slot_chromas.append(fallback_chroma)
+
+    norm: list[int] = Palette.make_colors(
+      [levels['norm']] * len(slot_hues), slot_chromas, slot_hues)
+
+    bold: list[int] = Palette.make_colors(
+      [levels['bold']] * len(slot_hues), slot_chromas, slot_hues)
+
+    grey_slots: list[int] = list(levels['greys'])
+
+    greys: list[int] = Palette.make_colors(
+      [ levels['greys'][s] for s in grey_slots ]
+      , [Const.GREY_CHROMA] * len(grey_slots)
+      , [grey_hue] * len(grey_slots))
+
+    palette: list[int] = [0] * ThemeLibraryConst.PALETTE_SIZE
+
+    for (slot, _), n, b in zip(Const.HUE_SLOTS, norm, bold):
+      palette[slot] = n
+      palette[slot + Const.BOLD_OFFSET] = b
+
+    for slot, grey in zip(grey_slots, greys):
+      palette[slot] = grey
+
+    bg_norm, bg_bold, fg_norm, fg_bold = Palette.make_colors(
+      [ levels[key] for key in ['bg_norm', 'bg_bold', 'fg_norm', 'fg_bold'] ]
+      , [Const.GREY_CHROMA] * 4
+      , [grey_hue] * 4)
+
+    #___________________________________________________________________
+    # Accents are the largest chromatic clusters of distinct hues, the
+    # cursor the most chromatic cluster
+    #___________________________________________________________________
+    by_count: list[int] =\
+      [ int(i) for i in np.argsort(-counts, kind='stable') if (chromatic[i]) ]
+
+    picked: list[int] = []
+
+    for i in by_count:
+      if (len(picked) < 3 and all(
+        Palette.hue_distance(lch[i, 2], lch[j, 2]) >= Const.ACCENT_HUE_SPACING
+        for j in picked)):
+        picked.append(i)
+
+    accents: list[int] = Palette.make_colors(
+      [levels['norm']] * len(picked), lch[picked, 1], lch[picked, 2])
+
+    accents += [ palette[s] for s in Const.ACCENT_SLOTS[len(accents):] ]
+
+    if (by_count):
+      vivid: int = max(by_count, key=lambda i: lch[i, 1])
+      cursor: int = Palette.make_colors(
+        [levels['bold']], [lch[vivid, 1]], [lch[vivid, 2]])[0]
+
+    else:
+      cursor: int = palette[1 + Const.BOLD_OFFSET]
+
+    #___________________________________________________________________
+    # Make the palette readable on the background
+    #___________________________________________________________________
+    exempt: list[int] = ThemeLibraryConst.DARK_EXEMPT_SLOTS if (is_dark)\
+      else ThemeLibraryConst.LITE_EXEMPT_SLOTS
+
+    slots: list[int] =\
+      [ s for s in range(len(palette)) if (s not in exempt) ]
+
+    repaired: list[int] = ContrastRepair.repair_array(
+      [ palette[s] for s in slots ], [bg_norm] * len(slots)
+      , min_contrast).tolist()
+
+    for s, color in zip(slots, repaired):
+      palette[s] = color
+
+    hex_str = lambda c: f'0x{StringUtils.int_to_hex6(c)}'
+
+    return\
+    { Scheme.MODE       : Const.MODES[is_dark]
+    , Scheme.BG_NORM_KEY : hex_str(bg_norm)
+    , Scheme.BG_BOLD_KEY : hex_str(bg_bold)
+    , Scheme.FG_NORM_KEY : hex_str(fg_norm)
+    , Scheme.FG_BOLD_KEY : hex_str(fg_bold)
+    , Scheme.CURSOR_COLOR: hex_str(cursor)
+    , Scheme.KEY_BG0_KEY : hex_str(accents[0])
+    , Scheme.KEY_BG1_KEY : hex_str(accents[1])
+    , Scheme.KEY_BG2_KEY : hex_str(accents[2])
+    , Scheme.PALETTE     : [ hex_str(c) for c in palette ]
+    }
+
+  #_____________________________________________________________________
+  def from_samples(samples, name: str
+    , min_contrast: float = ContrastConst.WCAG_AA) -> dict:
+    """
+    Creates an input json dictionary from (N, 3) uint8 RGB samples.
+    """
+
+    samples = np.asarray(samples, dtype=np.uint32)
+
+    packed = (samples[:, 0] << 16) | (samples[:, 1] << 8) | samples[:, 2]
+
+    centers, counts = ImagePalette.kmeans(ColorSpace.rgb_to_oklab_array(packed))
+
+    cfg: dict = { ColorScheme.NAME: name }
+    cfg.update(ImagePalette.assign(centers, counts, min_contrast))
+
+    return cfg
+
+  #_____________________________________________________________________
+  def from_image(file_path: str
+    , min_contrast: float = ContrastConst.WCAG_AA
+    , max_samples: int = ImageReaderConst.MAX_SAMPLES) -> dict:
+    """
+    Creates an input json dictionary from a PNG or binary PPM image,
+    named after the image file.
+    """
+
+    if (np is None):
+      raise ImportError('ImagePalette requires NumPy')
+
+    name: str = path.splitext(path.basename(file_path))[0]
+
+    return ImagePalette.from_samples(
+      ImageReader.read(file_path, max_samples), name, min_contrast)
+
+  #_____________________________________________________________________
+  def run(args) -> str:
+    """
+    Command line entry point. Writes the theme of the --from_image
+    image to --out_dir.
+
+    Returns
+      Path of the written json file
+    """
+
+    cfg: dict = ImagePalette.from_image(args.from_image
+      , args.min_contrast or ContrastConst.WCAG_AA)
+
+    FileUtils.verify_dir(path.abspath(args.out_dir))
+
+    out_path: str = path.abspath(path.join(args.out_dir
+      , f'{cfg[ColorScheme.NAME]}{ImagePaletteConst.OUT_SUFFIX}'))
+
+    with open(out_path, 'w') as file:
+      json.dump(cfg, file, indent=2)
+
+    return out_path
@@ -0,0 +1,500 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Streaming readers for PNG and binary PPM images that return an
+#   evenly spaced subsample of the pixels. Rows are decoded one at a
+#   time, so memory is bounded by the row width and the sample size,
+#   not the image size. PNG data is inflated with zlib.
+#_______________________________________________________________________
+
+import math
+import struct
+import zlib
+
+from flux_bunny_utils.error_utils import ErrorUtils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class ImageReaderConst:
+
+  PNG_SIGNATURE: bytes = b'\x89PNG\r\n\x1a\n'
+  PPM_MAGIC    : bytes = b'P6'
+
+  # Pixels kept by the subsample
+  MAX_SAMPLES: int = 1 << 16
+
+  # PNG rows unfiltered together
+  BLOCK_ROWS: int = 256
+
+  # PNG color types
+  GREY      : int = 0
+  RGB       : int = 2
+  INDEXED   : int = 3
+  GREY_ALPHA: int = 4
+  RGB_ALPHA : int = 6
+
+  CHANNELS: dict =\
+  { GREY      : 1
+  , RGB       : 3
+  , INDEXED   : 1
+  , GREY_ALPHA: 2
+  , RGB_ALPHA : 4
+  }
+
+  # PNG row filter types
+  FILTER_NONE : int = 0
+  FILTER_SUB  : int = 1
+  FILTER_UP   : int = 2
+  FILTER_AVG  : int = 3
+  FILTER_PAETH: int = 4
+
+
+#_______________________________________________________________________
+class ImageReader:
+  """
+  Readers return a (N, 3) uint8 NumPy array of RGB samples, taking
+  every stride-th pixel of every stride-th row, with stride chosen so
+  N is at most MAX_SAMPLES. Alpha is ignored. Requires NumPy.
+  """
+
+  #_____________________________________________________________________
+  def stride(width: int, height: int, max_samples: int) -> int:
+    """
+    Row and column step that keeps at most max_samples pixels.
+    """
+
+    return max(1, math.ceil(math.sqrt(width * height / max_samples)))
+
+  #_____________________________________________________________________
+  def raise_invalid(file_path: str, desc: str) -> None:
+    """
+    Raises ValueError for an unreadable image.
+    """
+
+    ErrorUtils.raise_exception_with_desc(err=ValueError()
+      , desc=f'{ErrorUtils.INVALID_VALUE} {file_path}: {desc}')
+
+  #_____________________________________________________________________
+  def png_chunks(file):
+    """
+    Yields (type, data) of each PNG chunk after the signature.
+    """
+
+    while (True):
+      header: bytes = file.read(8)
+
+      if (len(header) < 8):
+        return
+
+      length, chunk_type = struct.unpack('>I4s', header)
+
+      data: bytes = file.read(length)
+      file.read(4)
+
+      yield chunk_type, data
+
+      if (chunk_type == b'IEND'):
+        return
+
+  #_____________________________________________________________________
+  def unfilter(filter_type: int, row: bytearray, prev: bytearray
+    , bpp: int) -> bytearray:
+    """
+    Reverses a PNG row filter.
+
+    Parameters
+      row  : Filtered row, without the filter type byte
+      prev : Unfiltered previous row, zeros for the first row
+      bpp  : Bytes per complete pixel, at least one
+
+    Returns
+      Unfiltered row
+    """
+
+    Const = ImageReaderConst
+
+    if (filter_type == Const.FILTER_NONE):
+      return row
+
+    if (filter_type == Const.FILTER_SUB):
+      # Running sum per channel, wrapping at 256
+      out = np.cumsum(np.frombuffer(bytes(row), dtype=np.uint8)
+        .reshape(-1, bpp), axis=0, dtype=np.uint8)
+
+      return bytearray(out.tobytes())
+
+    if (filter_type == Const.FILTER_UP):
+      out = np.frombuffer(bytes(row), dtype=np.uint8)\
+        + np.frombuffer(bytes(prev), dtype=np.uint8)
+
+      return bytearray(out.tobytes())
+
+    # Average and Paeth depend on the unfiltered left neighbor, one
+    # byte at a time
+    if (filter_type == Const.FILTER_AVG):
+      for i in range(bpp):
+        row[i] = (row[i] + (prev[i] >> 1)) & 0xFF
+
+      for i in range(bpp, len(row)):
+        row[i] = (row[i] + ((row[i - bpp] + prev[i]) >> 1)) & 0xFF
+
+      return row
+
+    if (filter_type == Const.FILTER_PAETH):
+      for i in range(bpp):
+        row[i] = (row[i] + prev[i]) & 0xFF
+
+      for i in range(bpp, len(row)):
+        a: int = row[i - bpp]
+        b: int = prev[i]
+        c: int = prev[i - bpp]
+
+        pa: int = abs(b - c)
+        pb: int = abs(a - c)
+        pc: int = abs(a + b - c - c)
+
+        if (pa <= pb and pa <= pc):
+          row[i] = (row[i] + a) & 0xFF
+
+        elif (pb <= pc):
+          row[i] = (row[i] + b) & 0xFF
+
+        else:
+          row[i] = (row[i] + c) & 0xFF
+
+      return row
+
+    raise ValueError(f'{ErrorUtils.INVALID_VALUE} filter = {filter_type}')
+
+  #_____________________________________________________________________
+  def unfilter_block(filters, raw, prev: bytes, bpp: int):
+    """
+    Reverses the PNG row filters of a block of consecutive rows.
+
+    Average and Paeth predict each byte from its unfiltered left, upper
+    and upper left neighbors, so a row cannot be vectorized along its
+    length. Instead the block is skewed so that each anti-diagonal of
+    pixels is one column, and all pixels of an anti-diagonal, whose
+    neighbors are all on the previous two, are unfiltered at once.
+
+    Parameters
+      filters : (n,) filter type of each row
+      raw     : (n, row_bytes) filtered rows, without filter type bytes
+      prev    : Unfiltered row above the block, zeros for the first
+      bpp     : Bytes per complete pixel, at least one
+
+    Returns
+      (n, row_bytes) uint8 unfiltered rows
+    """
+
+    Const = ImageReaderConst
+
+    n, row_bytes = raw.shape
+
+    if (np.all(filters <= Const.FILTER_UP)):
+      out = np.empty_like(raw)
+
+      for r in range(n):
+        prev = ImageReader.unfilter(int(filters[r])
+          , bytearray(raw[r].tobytes()), prev, bpp)
+
+        out[r] = np.frombuffer(bytes(prev), dtype=np.uint8)
+
+      return out
+
+    npix: int = row_bytes // bpp
+
+    # Skewed row i holds pixel x of block row i - 1 at column x + i + 1;
+    # row 0 holds prev, and cells outside the image stay zero
+    width: int = npix + n + 2
+
+    done = np.zeros((n + 1, width, bpp), dtype=np.int16)
+    todo = np.zeros((n + 1, width, bpp), dtype=np.int16)
+
+    done[0, 1:npix + 1] =\
+      np.frombuffer(bytes(prev), dtype=np.uint8).reshape(npix, bpp)
+
+    pixels = raw.reshape(n, npix, bpp)
+
+    for i in range(1, n + 1):
+      todo[i, i + 1:i + 1 + npix] = pixels[i - 1]
+
+    row_filters = np.concatenate([[Const.FILTER_NONE], filters])[:, None]
+
+    is_sub   = (row_filters == Const.FILTER_SUB).astype(np.int16)
+    is_up    = (row_filters == Const.FILTER_UP).astype(np.int16)
+    is_avg   = (row_filters == Const.FILTER_AVG).astype(np.int16)
+    is_paeth =  row_filters == Const.FILTER_PAETH
+
+    for d in range(2, npix + n + 1):
+      rows = slice(max(1, d - npix), min(n, d - 1) + 1)
+      above = slice(rows.start - 1, rows.stop - 1)
+
+      a = done[rows, d - 1]
+      b = done[above, d - 1]
+      c = done[above, d - 2]
+
+      pa = np.abs(b - c)
+      pb = np.abs(a - c)
+      pc = np.abs(a + b - c - c)
+
+      paeth = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+
+      predicted = a * is_sub[rows] + b * is_up[rows]\
+        + ((a + b) >> 1) * is_avg[rows]
+
+      predicted = np.where(is_paeth[rows], paeth, predicted)
+
+      done[rows, d] = (todo[rows, d] + predicted) & 0xFF
+
+    out = np.empty((n, npix, bpp), dtype=np.uint8)
+
+    for i in range(1, n + 1):
+      out[i - 1] = done[i, i + 1:i + 1 + npix]
+
+    return out.reshape(n, row_bytes)
+
+  #_____________________________________________________________________
+  def png_row_to_rgb(row: bytes, header: dict, palette, columns):
+    """
+    Converts the sampled columns of an unfiltered PNG row to RGB.
+
+    Returns
+      (len(columns), 3) uint8 array
+    """
+
+    Const = ImageReaderConst
+
+    depth: int = header['depth']
+    channels: int = Const.CHANNELS[header['color_type']]
+
+    data = np.frombuffer(row, dtype=np.uint8)
+
+    if (depth < 8):
+      values = np.unpackbits(data).reshape(-1, depth)
+      weights = 1 << np.arange(depth - 1, -1, -1)
+      samples = (values * weights).sum(axis=1)[:header['width']][columns]
+
+      if (header['color_type'] == Const.INDEXED):
+        return palette[samples]
+
+      grey = (samples * 255 // ((1 << depth) - 1)).astype(np.uint8)
+
+      return np.repeat(grey[:, None], 3, axis=1)
+
+    # 16 bit samples keep the high byte
+    pixels = data.reshape(header['width'], channels, depth // 8)[columns, :, 0]
+
+    if (header['color_type'] == Const.INDEXED):
+      return palette[pixels[:, 0]]
+
+    if (channels < 3):
+      return np.repeat(pixels[:, :1], 3, axis=1)
+
+    return pixels[:, :3]
+
+  #_____________________________________________________________________
+  def read_png(file_path: str
+    , max_samples: int = ImageReaderConst.MAX_SAMPLES):
+    """
+    Streams a PNG file and returns a subsample of its pixels.
+    Interlaced images are not supported.
+    """
+
+    Const = ImageReaderConst
+    Reader = ImageReader
+
+    with open(file_path, 'rb') as file:
+      if (file.read(8) != Const.PNG_SIGNATURE):
+        Reader.raise_invalid(file_path, 'not a PNG file')
+
+      chunks = Reader.png_chunks(file)
+
+      chunk_type, data = next(chunks)
+
+      if (chunk_type != b'IHDR'):
+        Reader.raise_invalid(file_path, 'missing IHDR')
+
+      width, height, depth, color_type, _, _, interlace =\
+        struct.unpack('>IIBBBBB', data)
+
+      if (interlace or color_type not in Const.CHANNELS):
+        Reader.raise_invalid(file_path, 'interlaced or unknown color type')
+
+      header: dict =\
+      { 'width'     : width
+      , 'depth'     : depth
+      , 'color_type': color_type
+      }
+
+      bits: int = depth * Const.CHANNELS[color_type]
+      bpp: int = max(1, bits // 8)
+      row_bytes: int = (width * bits + 7) // 8
+
+      stride: int = Reader.stride(width, height, max_samples)
+      columns = np.arange(0, width, stride)
+
+      palette = None
+      samples: list = []
+
+      inflater = zlib.decompressobj()
+      pending: bytearray = bytearray()
+      prev: bytes = bytes(row_bytes)
+      y: int = 0
+
+      block_bytes: int = Const.BLOCK_ROWS * (row_bytes + 1)
+
+      for chunk_type, data in chunks:
+        if (chunk_type == b'PLTE'):
+          palette = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+
+        if (chunk_type == b'IDAT'):
+          pending += inflater.decompress(data)
+
+        is_end: bool = chunk_type == b'IEND'
+
+        # Unfilter whole blocks, and the remaining rows at the end
+        while (len(pending) >= block_bytes
+          or (is_end and len(pending) > row_bytes)):
+
+          count: int = min(len(pending) // (row_bytes + 1)
+            , Const.BLOCK_ROWS, height - y)
+
+          if (count <= 0):
+            break
+
+          block = np.frombuffer(bytes(pending[:count * (row_bytes + 1)])
+            , dtype=np.uint8).reshape(count, row_bytes + 1)
+
+          del pending[:count * (row_bytes + 1)]
+
+          rows = Reader.unfilter_block(block[:, 0], block[:, 1:], prev, bpp)
+
+          prev = rows[-1].tobytes()
+
+          for r in range(-y % stride, count, stride):
+            samples.append(
+              Reader.png_row_to_rgb(rows[r].tobytes(), header, palette, columns))
+
+          y += count
+
+    if (color_type == Const.INDEXED and palette is None):
+      Reader.raise_invalid(file_path, 'missing PLTE')
+
+    if (not samples):
+      Reader.raise_invalid(file_path, 'no image data')
+
+    return np.concatenate(samples)
+
+  #_____________________________________________________________________
+  def read_ppm_token(file) -> bytes:
+    """
+    Reads one whitespace separated PPM header token, skipping comments.
+    """
+
+    token: bytearray = bytearray()
+
+    while (True):
+      char: bytes = file.read(1)
+
+      if (char == b'#'):
+        file.readline()
+        continue
+
+      if (not char or char.isspace()):
+        if (token):
+          return bytes(token)
+
+        if (not char):
+          return b''
+
+        continue
+
+      token += char
+
+  #_____________________________________________________________________
+  def read_ppm(file_path: str
+    , max_samples: int = ImageReaderConst.MAX_SAMPLES):
+    """
+    Streams a binary (P6) PPM file and returns a subsample of its
+    pixels.
+    """
+
+    Reader = ImageReader
+
+    with open(file_path, 'rb') as file:
+      if (Reader.read_ppm_token(file) != ImageReaderConst.PPM_MAGIC):
+        Reader.raise_invalid(file_path, 'not a binary PPM file')
+
+      width, height, max_val =\
+        [ int(Reader.read_ppm_token(file)) for _ in range(3) ]
+
+      dtype = np.uint8 if (max_val < 256) else np.dtype('>u2')
+      row_bytes: int = width * 3 * np.dtype(dtype).itemsize
+
+      stride: int = Reader.stride(width, height, max_samples)
+
+      samples: list = []
+
+      for y in range(0, height, stride):
+        row: bytes = file.read(row_bytes)
+
+        if (len(row) < row_bytes):
+          Reader.raise_invalid(file_path, 'truncated image data')
+
+        pixels = np.frombuffer(row, dtype=dtype).reshape(width, 3)[::stride]
+
+        if (max_val != 255):
+          pixels = pixels.astype(np.uint32) * 255 // max_val
+
+        samples.append(pixels.astype(np.uint8))
+
+        # Skip the rows between samples
+        file.seek(row_bytes * (stride - 1), 1)
+
+    return np.concatenate(samples)
+
+  #_____________________________________________________________________
+  def read(file_path: str
+    , max_samples: int = ImageReaderConst.MAX_SAMPLES):
+    """
+    Reads a PNG or binary PPM file, detected from its first bytes.
+    """
+
+    if (np is None):
+      raise ImportError('ImageReader requires NumPy')
+
+    with open(file_path, 'rb') as file:
+      magic: bytes = file.read(len(ImageReaderConst.PNG_SIGNATURE))
+
+    if (magic == ImageReaderConst.PNG_SIGNATURE):
+      return ImageReader.read_png(file_path, max_samples)
+
+    return ImageReader.read_ppm(file_path, max_samples)
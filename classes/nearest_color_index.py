@@ -0,0 +1,403 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Nearest color search over an arbitrary palette, e.g. the ANSI 256
+#   colors or a theme palette, using a uniform grid index.
+#_______________________________________________________________________
+
+from classes.color_array import ColorArray
+from classes.color_space import ColorSpace
+
+from flux_bunny_utils.error_utils import ErrorUtils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class NearestColorIndexConst:
+
+  RGB_METRIC      : str = 'rgb'
+  OKLAB_METRIC    : str = 'oklab'
+  CIEDE2000_METRIC: str = 'ciede2000'
+
+  METRICS: list[str] =\
+    [ RGB_METRIC
+    , OKLAB_METRIC
+    , CIEDE2000_METRIC
+    ]
+
+  # Cells per axis of the grid index
+  GRID_SIZE: int = 16
+
+  # Samples per axis of the sRGB cube used to find the gamut bounds of
+  # each metric space
+  GAMUT_SAMPLES: int = 33
+
+  # CIEDE2000 is not a Euclidean distance in CIELAB, so the candidate
+  # search radius derived in CIELAB is widened by this factor
+  CIEDE2000_SLACK: float = 3.0
+
+  # Bounds temporary memory: distances computed at a time
+  QUERY_BUDGET: int = 1 << 20
+  CELL_CHUNK  : int = 256
+
+
+#_______________________________________________________________________
+class NearestColorIndex:
+  """
+  Finds the nearest palette entry to any 24 bit RGB color.
+
+  The metric space is split into a uniform grid. For each cell only the
+  palette entries that can be nearest to some point in the cell are
+  kept, so a query compares against a few candidates instead of the
+  whole palette. Results are exact for the 'rgb' and 'oklab' metrics.
+  For 'ciede2000' candidates are found in CIELAB and ranked by
+  CIEDE2000.
+
+  Without NumPy every query is a linear scan over the palette.
+  """
+
+  # sRGB lattice in each metric space, computed on first use
+  gamut_samples_: dict = {}
+
+  #_____________________________________________________________________
+  def __init__(self
+    , palette
+    , metric: str = NearestColorIndexConst.RGB_METRIC
+    , grid_size: int = NearestColorIndexConst.GRID_SIZE
+    ):
+    """
+    Parameters
+      palette   : Iterable of 24 bit RGB colors as ints or hex strings
+      metric    : One of 'rgb', 'oklab' or 'ciede2000'
+      grid_size : Cells per axis of the grid index
+    """
+
+    Const = NearestColorIndexConst
+
+    if (metric not in Const.METRICS):
+      desc: str = f'{ErrorUtils.INVALID_VALUE} metric = {metric}'
+      ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+    self.palette_: list[int] = ColorArray(palette).tolist()
+    self.metric_ : str = metric
+
+    if (not len(self.palette_)):
+      desc: str = f'{ErrorUtils.INVALID_VALUE} empty palette'
+      ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+    if (np is None):
+      self.points_: list = [ NearestColorIndex.to_metric_space(c, metric)
+        for c in self.palette_ ]
+      return
+
+    self.points_ = NearestColorIndex.to_metric_space_array(
+      np.asarray(self.palette_, dtype=np.uint32), metric)
+
+    self.build_grid(grid_size)
+
+    return
+
+  #_____________________________________________________________________
+  def to_metric_space(rgb_color: int, metric: str) -> tuple:
+    """
+    Converts a single color to the coordinates used by the metric.
+    """
+
+    Const = NearestColorIndexConst
+
+    if (metric == Const.OKLAB_METRIC):
+      return ColorSpace.rgb_to_oklab(rgb_color)
+
+    if (metric == Const.CIEDE2000_METRIC):
+      return ColorSpace.rgb_to_lab(rgb_color)
+
+    return ((rgb_color >> 16) & 0xFF
+      , (rgb_color >> 8) & 0xFF
+      , rgb_color & 0xFF)
+
+  #_____________________________________________________________________
+  def to_metric_space_array(packed, metric: str):
+    """
+    Converts packed colors to the coordinates used by the metric.
+    """
+
+    Const = NearestColorIndexConst
+
+    if (metric == Const.OKLAB_METRIC):
+      return ColorSpace.rgb_to_oklab_array(packed)
+
+    if (metric == Const.CIEDE2000_METRIC):
+      return ColorSpace.rgb_to_lab_array(packed)
+
+    return ColorArray.from_packed(packed).channels().astype(np.float64)
+
+  #_____________________________________________________________________
+  def get_gamut_samples(metric: str):
+    """
+    Returns a lattice of sRGB colors converted to the metric space.
+    Used to find the part of the metric space that queries can reach.
+    """
+
+    samples: dict = NearestColorIndex.gamut_samples_
+
+    if (metric not in samples):
+      steps = np.linspace(0, 255
+        , NearestColorIndexConst.GAMUT_SAMPLES).round().astype(np.uint32)
+
+      red, grn, blu = np.meshgrid(steps, steps, steps, indexing='ij')
+      packed = ((red << 16) | (grn << 8) | blu).ravel()
+
+      samples[metric] =\
+        NearestColorIndex.to_metric_space_array(packed, metric)
+
+    return samples[metric]
+
+  #_____________________________________________________________________
+  def build_grid(self, grid_size: int) -> None:
+    """
+    Builds the table of candidate palette entries for each grid cell.
+    A palette entry is a candidate for a cell if its distance to the
+    nearest point of the cell does not exceed the smallest distance
+    from any entry to the farthest point of the cell.
+
+    Only cells near the sRGB gamut are indexed. Queries landing in any
+    other cell are checked against the whole palette.
+    """
+
+    Const = NearestColorIndexConst
+
+    gamut = NearestColorIndex.get_gamut_samples(self.metric_)
+
+    pts = self.points_
+
+    lo = np.minimum(gamut.min(axis=0), pts.min(axis=0))
+    hi = np.maximum(gamut.max(axis=0), pts.max(axis=0))
+
+    # Pad so points on the upper bound fall inside the last cell
+    pad = (hi - lo) * 1e-6 + 1e-9
+    lo = lo - pad
+    hi = hi + pad
+
+    self.grid_size_: int = grid_size
+    self.grid_lo_ = lo
+    self.cell_size_ = (hi - lo) / grid_size
+
+    #___________________________________________________________________
+    # Mark cells holding gamut samples and their neighbours
+    #___________________________________________________________________
+    G: int = grid_size
+
+    occupied = np.zeros((G + 2, G + 2, G + 2), dtype=bool)
+    cell = np.floor((gamut - lo) / self.cell_size_).astype(int) + 1
+    occupied[cell[:, 0], cell[:, 1], cell[:, 2]] = True
+
+    indexed = np.zeros((G, G, G), dtype=bool)
+    for di in range(3):
+      for dj in range(3):
+        for dk in range(3):
+          indexed |= occupied[di:di + G, dj:dj + G, dk:dk + G]
+
+    self.indexed_ = indexed.ravel()
+
+    #___________________________________________________________________
+    # Candidate search for indexed cells
+    #___________________________________________________________________
+    axis = np.arange(G)
+    cells = np.stack(np.meshgrid(axis, axis, axis, indexing='ij')
+      , axis=-1).reshape(-1, 3)[self.indexed_]
+
+    box_lo = lo + cells * self.cell_size_
+    box_hi = box_lo + self.cell_size_
+
+    slack: float = 1.0
+    if (self.metric_ == Const.CIEDE2000_METRIC):
+      slack = Const.CIEDE2000_SLACK ** 2
+
+    masks: list = []
+
+    for start in range(0, len(cells), Const.CELL_CHUNK):
+      c_lo = box_lo[start:start + Const.CELL_CHUNK, None, :]
+      c_hi = box_hi[start:start + Const.CELL_CHUNK, None, :]
+
+      d_min = np.maximum(0, np.maximum(c_lo - pts, pts - c_hi))
+      d_max = np.maximum(np.abs(pts - c_lo), np.abs(pts - c_hi))
+
+      d_min2 = (d_min ** 2).sum(axis=-1)
+      d_max2 = (d_max ** 2).sum(axis=-1)
+
+      bound = d_max2.min(axis=1, keepdims=True) * slack
+      masks.append(d_min2 <= bound)
+
+    mask = np.concatenate(masks)
+    counts = mask.sum(axis=1)
+
+    # Candidates first, in palette order. Unused slots repeat the first
+    # candidate so every row has the same length.
+    width: int = int(counts.max())
+    order = np.argsort(~mask, axis=1, kind='stable')[:, :width]
+
+    candidates = np.zeros((G * G * G, width), dtype=np.intp)
+    candidates[self.indexed_] = np.where(
+      np.arange(width) < counts[:, None], order, order[:, :1])
+
+    cell_counts = np.zeros(G * G * G, dtype=np.intp)
+    cell_counts[self.indexed_] = counts
+
+    self.candidates_ = candidates
+    self.cell_counts_ = cell_counts
+
+    return
+
+  #_____________________________________________________________________
+  def distances(self, query_pts, palette_pts):
+    """
+    Distance, or a monotonic function of it, between broadcastable
+    arrays of metric space points.
+    """
+
+    if (self.metric_ == NearestColorIndexConst.CIEDE2000_METRIC):
+      return ColorSpace.delta_e_2000_array(query_pts, palette_pts)
+
+    return ((query_pts - palette_pts) ** 2).sum(axis=-1)
+
+  #_____________________________________________________________________
+  def query_points(self, pts):
+    """
+    Returns the palette position nearest to each metric space point.
+    """
+
+    G: int = self.grid_size_
+
+    cell = np.floor((pts - self.grid_lo_) / self.cell_size_).astype(int)
+    inside = ((cell >= 0) & (cell < G)).all(axis=1)
+
+    cell = np.clip(cell, 0, G - 1)
+    flat = (cell[:, 0] * G + cell[:, 1]) * G + cell[:, 2]
+
+    inside &= self.indexed_[flat]
+
+    best = np.empty(len(pts), dtype=np.intp)
+
+    # Rows are grouped by candidate count in powers of two, so cells
+    # with few candidates are not padded out to the widest cell
+    counts = self.cell_counts_[flat]
+    width_class = np.ceil(np.log2(np.maximum(counts, 1))).astype(int)
+
+    for w in np.unique(width_class):
+      rows = np.nonzero(width_class == w)[0]
+      width: int = min(1 << int(w), self.candidates_.shape[1])
+
+      cand = self.candidates_[flat[rows], :width]
+
+      dist = self.distances(pts[rows, None, :], self.points_[cand])
+      best[rows] = cand[np.arange(len(rows)), dist.argmin(axis=1)]
+
+    # Points outside the indexed cells are checked against everything
+    if (not inside.all()):
+      out_pts = pts[~inside]
+      dist = self.distances(out_pts[:, None, :], self.points_[None, :, :])
+      best[~inside] = dist.argmin(axis=1)
+
+    return best
+
+  #_____________________________________________________________________
+  def query_array(self, colors):
+    """
+    Batch nearest palette search. Repeated colors are searched once.
+
+    Parameters
+      colors : ColorArray or iterable of 24 bit RGB colors
+
+    Returns
+      Array of palette positions, one per input color
+    """
+
+    colors = ColorArray(colors)
+
+    if (np is None):
+      return [self.query(c) for c in colors]
+
+    uniq, inverse = np.unique(colors.colors_, return_inverse=True)
+
+    result = np.empty(len(uniq), dtype=np.intp)
+
+    rows: int = max(1, NearestColorIndexConst.QUERY_BUDGET
+      // max(self.candidates_.shape[1], len(self.palette_) // 8))
+
+    for start in range(0, len(uniq), rows):
+      chunk = uniq[start:start + rows]
+      pts = NearestColorIndex.to_metric_space_array(chunk, self.metric_)
+      result[start:start + len(chunk)] = self.query_points(pts)
+
+    return result[inverse.ravel()]
+
+  #_____________________________________________________________________
+  def query(self, rgb_color: int) -> int:
+    """
+    Returns the position of the palette entry nearest to rgb_color.
+    """
+
+    if (np is not None):
+      return int(self.query_array([rgb_color])[0])
+
+    pt: tuple = NearestColorIndex.to_metric_space(
+      ColorArray.to_int(rgb_color), self.metric_)
+
+    if (self.metric_ == NearestColorIndexConst.CIEDE2000_METRIC):
+      dist: list = [ ColorSpace.delta_e_2000(pt, p) for p in self.points_ ]
+
+    else:
+      dist: list =\
+        [ sum((pt[i] - p[i]) ** 2 for i in range(3)) for p in self.points_ ]
+
+    return dist.index(min(dist))
+
+  #_____________________________________________________________________
+  def nearest_color(self, rgb_color: int) -> int:
+    """
+    Returns the palette color nearest to rgb_color.
+    """
+
+    return self.palette_[self.query(rgb_color)]
+
+  #_____________________________________________________________________
+  def nearest_colors(self, colors) -> ColorArray:
+    """
+    Quantizes colors to the palette.
+
+    Returns
+      ColorArray of the nearest palette color for each input color
+    """
+
+    if (np is None):
+      return ColorArray([ self.palette_[i] for i in self.query_array(colors) ])
+
+    palette = np.asarray(self.palette_, dtype=np.uint32)
+
+    return ColorArray.from_packed(palette[self.query_array(colors)])
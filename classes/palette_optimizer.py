@@ -0,0 +1,483 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Searches for a theme, i.e. background, foreground, accent and 16
+#   palette colors, that meets contrast, hue spacing and bold lightness
+#   constraints while staying close to a seed theme. Uses simulated
+#   annealing over many chains at once; restarts run in a process pool.
+#_______________________________________________________________________
+
+import json
+
+from concurrent.futures import ProcessPoolExecutor
+from os import path
+
+from classes.color_space import ColorSpace
+from classes.contrast import Contrast
+from classes.contrast import ContrastConst
+from classes.theme_inheritance import ThemeInheritance
+from classes.theme_library import ThemeColors
+from classes.theme_library import ThemeLibraryConst
+from flux_bunny_utils.file_utils import FileUtils
+from flux_bunny_utils.string_utils import StringUtils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class PaletteOptimizerConst:
+
+  # Color layout of an optimizer state
+  BG_NORM : int = 0
+  BG_BOLD : int = 1
+  FG_NORM : int = 2
+  FG_BOLD : int = 3
+  ACCENTS : list[int] = [4, 5, 6]
+  PALETTE : list[int] = list(range(7, 23))
+  COLOR_COUNT: int = 23
+
+  NORM_SLOTS: list[int] = list(range(0, 8))
+  BOLD_SLOTS: list[int] = list(range(8, 16))
+
+  # Constraint defaults
+  MIN_CONTRAST   : float = ContrastConst.WCAG_AA
+  FG_CONTRAST    : float = 7.0
+  ACCENT_CONTRAST: float = 3.0
+  MIN_SPACING    : float = 0.08
+  MIN_BOLD_DELTA : float = 0.02
+
+  # Palette colors keep their seed hue within this many degrees. Seed
+  # colors below MIN_HUE_CHROMA are greys and must stay below it.
+  HUE_TOLERANCE : float = 15.0
+  MIN_HUE_CHROMA: float = 0.04
+
+  # Penalty weights. Contrast is in ratio units, the others in OKLab
+  # distance units.
+  CONTRAST_WEIGHT: float = 1.0
+  SPACING_WEIGHT : float = 20.0
+  BOLD_WEIGHT    : float = 20.0
+  HUE_WEIGHT     : float = 0.2
+  GREY_WEIGHT    : float = 20.0
+  DRIFT_WEIGHT   : float = 1.0
+
+  # Annealing schedule
+  CHAINS    : int   = 64
+  ITERATIONS: int   = 3000
+  RESTARTS  : int   = 4
+  TEMP_START: float = 1.0
+  TEMP_END  : float = 1e-4
+  STEP_START: float = 0.08
+  STEP_END  : float = 0.004
+  SEED      : int   = 0
+
+  OUT_SUFFIX: str = '-input.json'
+
+
+#_______________________________________________________________________
+class PaletteOptimizer:
+  """
+  Scoring is vectorized over all chains, so requires NumPy. A score of
+  zero drift and zero violations is the seed theme already meeting
+  every constraint.
+  """
+
+  #_____________________________________________________________________
+  def __init__(self
+    , seed_cfg: dict = None
+    , min_contrast: float = PaletteOptimizerConst.MIN_CONTRAST
+    , min_spacing: float = PaletteOptimizerConst.MIN_SPACING
+    , min_bold_delta: float = PaletteOptimizerConst.MIN_BOLD_DELTA
+    ):
+    """
+    Parameters
+      seed_cfg       : Dictionary created from input json, the result
+                       stays close to this theme. None for the default.
+      min_contrast   : Minimum WCAG contrast of palette colors against
+                       the background
+      min_spacing    : Minimum OKLab distance between any two of the
+                       eight normal, or eight bold, palette colors
+      min_bold_delta : Minimum OKLab lightness a bold color is above its
+                       normal color
+    """
+
+    Const = PaletteOptimizerConst
+
+    if (np is None):
+      raise ImportError('PaletteOptimizer requires NumPy')
+
+    self.seed_cfg_: dict = dict(seed_cfg or {})
+    self.scheme_: ThemeColors = ThemeColors(self.seed_cfg_)
+
+    self.min_contrast_: float = min_contrast
+    self.min_spacing_: float = min_spacing
+    self.min_bold_delta_: float = min_bold_delta
+
+    scheme: ThemeColors = self.scheme_
+
+    self.seed_colors_ = np.asarray(
+      [ scheme.bg_norm_color_
+      , scheme.bg_bold_color_
+      , scheme.fg_norm_color_
+      , scheme.fg_bold_color_
+      , scheme.accent_color0_
+      , scheme.accent_color1_
+      , scheme.accent_color2_
+      ] + list(scheme.palette_[:len(Const.PALETTE)])
+      , dtype=np.uint32)
+
+    self.seed_lab_ = ColorSpace.rgb_to_oklab_array(self.seed_colors_)
+
+    seed_lch = ColorSpace.oklab_to_oklch_array(self.seed_lab_)
+
+    self.hue_slots_: list[int] =\
+      [ k for k in Const.PALETTE
+        if (seed_lch[k, 1] >= Const.MIN_HUE_CHROMA) ]
+
+    self.seed_hue_ = seed_lch[self.hue_slots_, 2]
+
+    self.grey_slots_: list[int] =\
+      [ k for k in Const.PALETTE if (k not in self.hue_slots_) ]
+
+    exempt: list[int] = ThemeLibraryConst.DARK_EXEMPT_SLOTS\
+      if (scheme.is_dark_) else ThemeLibraryConst.LITE_EXEMPT_SLOTS
+
+    self.contrast_slots_: list[int] =\
+      [ Const.PALETTE[i] for i in range(len(Const.PALETTE))
+        if (i not in exempt) ]
+
+    # Index pairs of the normal and of the bold colors
+    self.spacing_a_: list[int] = []
+    self.spacing_b_: list[int] = []
+
+    for slots in (Const.NORM_SLOTS, Const.BOLD_SLOTS):
+      for i in range(len(slots)):
+        for j in range(i + 1, len(slots)):
+          self.spacing_a_.append(Const.PALETTE[slots[i]])
+          self.spacing_b_.append(Const.PALETTE[slots[j]])
+
+    return
+
+  #_____________________________________________________________________
+  def violations(self, colors) -> dict:
+    """
+    Constraint violations of a batch of states.
+
+    Parameters
+      colors : (N, 23) packed colors
+
+    Returns
+      Dictionary of (N,) arrays, each the summed shortfall of one
+      constraint type
+    """
+
+    Const = PaletteOptimizerConst
+
+    lab = ColorSpace.rgb_to_oklab_array(colors)
+    lum = Contrast.luminance_array(colors)
+
+    offset: float = ContrastConst.WCAG_OFFSET
+
+    def contrast(a, b):
+      return (np.maximum(a, b) + offset) / (np.minimum(a, b) + offset)
+
+    bg = lum[:, Const.BG_NORM][:, None]
+
+    palette_contrast = contrast(lum[:, self.contrast_slots_], bg)
+    accent_contrast = contrast(lum[:, Const.ACCENTS], bg)
+
+    fg_contrast = np.stack(
+      [ contrast(lum[:, Const.FG_NORM], lum[:, Const.BG_NORM])
+      , contrast(lum[:, Const.FG_BOLD], lum[:, Const.BG_BOLD])
+      ], axis=1)
+
+    spacing = np.linalg.norm(
+      lab[:, self.spacing_a_] - lab[:, self.spacing_b_], axis=-1)
+
+    norm = [ Const.PALETTE[i] for i in Const.NORM_SLOTS ]
+    bold = [ Const.PALETTE[i] for i in Const.BOLD_SLOTS ]
+
+    bold_delta = lab[:, bold, 0] - lab[:, norm, 0]
+
+    hue = ColorSpace.oklab_to_oklch_array(lab[:, self.hue_slots_])[..., 2]
+    hue_shift = np.abs((hue - self.seed_hue_ + 180) % 360 - 180)
+
+    grey_chroma = np.hypot(
+      lab[:, self.grey_slots_, 1], lab[:, self.grey_slots_, 2])
+
+    return\
+      { 'contrast'        :
+          np.clip(self.min_contrast_ - palette_contrast, 0, None).sum(axis=1)
+      , 'fg-contrast'     :
+          np.clip(Const.FG_CONTRAST - fg_contrast, 0, None).sum(axis=1)
+      , 'accent-contrast' :
+          np.clip(Const.ACCENT_CONTRAST - accent_contrast, 0, None).sum(axis=1)
+      , 'spacing'         :
+          np.clip(self.min_spacing_ - spacing, 0, None).sum(axis=1)
+      , 'bold-delta'      :
+          np.clip(self.min_bold_delta_ - bold_delta, 0, None).sum(axis=1)
+      , 'hue'             :
+          np.clip(hue_shift - Const.HUE_TOLERANCE, 0, None).sum(axis=1)
+      , 'grey'            :
+          np.clip(grey_chroma - Const.MIN_HUE_CHROMA, 0, None).sum(axis=1)
+      , 'drift'           :
+          np.linalg.norm(lab - self.seed_lab_, axis=-1).sum(axis=1)
+      }
+
+  #_____________________________________________________________________
+  def score(self, colors):
+    """
+    Weighted penalty of a batch of states, lower is better.
+
+    Parameters
+      colors : (N, 23) packed colors
+
+    Returns
+      (N,) float array
+    """
+
+    Const = PaletteOptimizerConst
+
+    v: dict = self.violations(colors)
+
+    return Const.CONTRAST_WEIGHT\
+        * (v['contrast'] + v['fg-contrast'] + v['accent-contrast'])\
+      + Const.SPACING_WEIGHT * v['spacing']\
+      + Const.BOLD_WEIGHT * v['bold-delta']\
+      + Const.HUE_WEIGHT * v['hue']\
+      + Const.GREY_WEIGHT * v['grey']\
+      + Const.DRIFT_WEIGHT * v['drift']
+
+  #_____________________________________________________________________
+  def anneal(self
+    , seed: int
+    , chains: int = PaletteOptimizerConst.CHAINS
+    , iterations: int = PaletteOptimizerConst.ITERATIONS
+    ) -> tuple:
+    """
+    Runs one restart: many annealing chains stepped together. Each
+    step moves one random color per chain in OKLab, snapped to the
+    nearest 24 bit color.
+
+    Returns
+      (best score, (23,) packed colors of best state)
+    """
+
+    Const = PaletteOptimizerConst
+
+    rng = np.random.default_rng(seed)
+
+    state = np.tile(self.seed_colors_, (chains, 1))
+    state_lab = ColorSpace.rgb_to_oklab_array(state)
+    state_score = self.score(state)
+
+    best = state[0].copy()
+    best_score = float(state_score[0])
+
+    rows = np.arange(chains)
+
+    for i in range(iterations):
+      t: float = i / max(1, iterations - 1)
+
+      temp: float = Const.TEMP_START * (Const.TEMP_END / Const.TEMP_START) ** t
+      step: float = Const.STEP_START * (Const.STEP_END / Const.STEP_START) ** t
+
+      k = rng.integers(0, Const.COLOR_COUNT, chains)
+
+      moved_lab = state_lab[rows, k] + rng.normal(0, step, (chains, 3))
+      moved = ColorSpace.oklab_to_rgb_array(moved_lab)
+
+      candidate = state.copy()
+      candidate[rows, k] = moved
+
+      candidate_score = self.score(candidate)
+
+      delta = candidate_score - state_score
+      accept = (delta <= 0) | (rng.random(chains)
+        < np.exp(-np.clip(delta, 0, None) / temp))
+
+      state[accept] = candidate[accept]
+      state_score[accept] = candidate_score[accept]
+      state_lab[accept, k[accept]] =\
+        ColorSpace.rgb_to_oklab_array(moved[accept])
+
+      j: int = int(np.argmin(state_score))
+
+      if (state_score[j] < best_score):
+        best_score = float(state_score[j])
+        best = state[j].copy()
+
+    return (best_score, best)
+
+  #_____________________________________________________________________
+  def polish(self, colors):
+    """
+    Greedily reverts single colors to their seed value while that
+    lowers the score, removing changes the annealing noise left behind.
+
+    Parameters
+      colors : (23,) packed colors
+
+    Returns
+      (23,) packed colors
+    """
+
+    Const = PaletteOptimizerConst
+
+    colors = np.array(colors, dtype=np.uint32)
+    best_score = float(self.score(colors[None, :])[0])
+
+    diagonal = np.arange(Const.COLOR_COUNT)
+
+    while (True):
+      candidates = np.tile(colors, (Const.COLOR_COUNT, 1))
+      candidates[diagonal, diagonal] = self.seed_colors_
+
+      scores = self.score(candidates)
+      j: int = int(np.argmin(scores))
+
+      if (scores[j] >= best_score):
+        return colors
+
+      colors = candidates[j]
+      best_score = float(scores[j])
+
+  #_____________________________________________________________________
+  def run_restart(optimizer: 'PaletteOptimizer', seed: int, iterations: int)\
+    -> tuple:
+    """
+    Process pool entry point for one restart.
+    """
+
+    return optimizer.anneal(seed, iterations=iterations)
+
+  #_____________________________________________________________________
+  def optimize(self
+    , restarts: int = PaletteOptimizerConst.RESTARTS
+    , iterations: int = PaletteOptimizerConst.ITERATIONS
+    , jobs: int = None
+    , seed: int = PaletteOptimizerConst.SEED
+    ):
+    """
+    Runs independent restarts and keeps the best result. Restarts run
+    in a process pool when jobs is not 1.
+
+    Parameters
+      restarts   : Number of independent restarts
+      iterations : Annealing steps per restart
+      jobs       : Worker processes, None for one per CPU
+      seed       : Base random seed, restart r uses seed + r
+
+    Returns
+      (23,) packed colors of the best state
+    """
+
+    seeds: list[int] = [ seed + r for r in range(restarts) ]
+
+    if (jobs == 1 or restarts == 1):
+      results: list = [ self.anneal(s, iterations=iterations) for s in seeds ]
+
+    else:
+      with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results: list = list(pool.map(PaletteOptimizer.run_restart
+          , [self] * restarts, seeds, [iterations] * restarts))
+
+    return self.polish(min(results, key=lambda r: r[0])[1])
+
+  #_____________________________________________________________________
+  def to_json_dict(self, colors) -> dict:
+    """
+    Creates an input json dictionary from optimized colors. Keys not
+    produced by the optimizer, e.g. name and mode, are kept from the
+    seed.
+    """
+
+    Const = PaletteOptimizerConst
+    Scheme = ThemeColors
+
+    hex_str = lambda c: f'0x{StringUtils.int_to_hex6(int(c))}'
+
+    out: dict = dict(self.seed_cfg_)
+
+    out[Scheme.BG_NORM_KEY] = hex_str(colors[Const.BG_NORM])
+    out[Scheme.BG_BOLD_KEY] = hex_str(colors[Const.BG_BOLD])
+    out[Scheme.FG_NORM_KEY] = hex_str(colors[Const.FG_NORM])
+    out[Scheme.FG_BOLD_KEY] = hex_str(colors[Const.FG_BOLD])
+    out[Scheme.KEY_BG0_KEY] = hex_str(colors[Const.ACCENTS[0]])
+    out[Scheme.KEY_BG1_KEY] = hex_str(colors[Const.ACCENTS[1]])
+    out[Scheme.KEY_BG2_KEY] = hex_str(colors[Const.ACCENTS[2]])
+    out[Scheme.PALETTE] = [ hex_str(c) for c in colors[Const.PALETTE] ]
+
+    return out
+
+  #_____________________________________________________________________
+  def create_report_str(self, colors) -> str:
+    """
+    Summarizes remaining constraint violations of a result.
+    """
+
+    v: dict = self.violations(np.asarray(colors)[None, :])
+
+    out_str: str = '\nOptimized theme, remaining constraint shortfall:'
+
+    for key in v:
+      out_str += f'\n  {key:<16} {float(v[key][0]):8.4f}'
+
+    return out_str
+
+  #_____________________________________________________________________
+  def run(args) -> tuple:
+    """
+    Command line entry point. Optimizes the --file theme, or the
+    default theme, and writes the result to --out_dir.
+
+    Returns
+      (constraint report, path of the written json file)
+    """
+
+    Const = PaletteOptimizerConst
+
+    seed_cfg: dict = {}
+
+    if (args.file):
+      seed_cfg = ThemeInheritance.read_theme(args.file)
+
+    optimizer = PaletteOptimizer(seed_cfg
+      , min_contrast=args.min_contrast or Const.MIN_CONTRAST)
+
+    colors = optimizer.optimize(restarts=args.restarts
+      , iterations=args.iterations, jobs=args.jobs)
+
+    FileUtils.verify_dir(path.abspath(args.out_dir))
+
+    out_path: str = path.abspath(path.join(args.out_dir
+      , f'{optimizer.scheme_.name_}{Const.OUT_SUFFIX}'))
+
+    with open(out_path, 'w') as file:
+      json.dump(optimizer.to_json_dict(colors), file, indent=2)
+
+    return (optimizer.create_report_str(colors), out_path)
@@ -0,0 +1,297 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Hue preserving background and foreground color derivation. Colors
+#   are moved along OKLCH lightness only, instead of clamping sRGB
+#   channels.
+#_______________________________________________________________________
+
+from classes.color_array import ColorArray
+from classes.color_space import ColorSpace
+from classes.rgb_color import RgbConst
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class PerceptualColorConst:
+
+  RGB_MODE  : str = 'rgb'
+  OKLCH_MODE: str = 'oklch'
+
+  MODES: list[str] =\
+    [ RGB_MODE
+    , OKLCH_MODE
+    ]
+
+  # Bisection steps used to fit chroma into the sRGB gamut
+  GAMUT_STEPS: int = 20
+
+  # Allowed overshoot of linear channels before a color counts as out
+  # of gamut; rounding to 8 bit absorbs it
+  GAMUT_EPSILON: float = 1e-6
+
+
+#_______________________________________________________________________
+class PerceptualColor:
+  """
+  OKLCH versions of RgbColor.make_background_color and
+  make_foreground_color. Lightness is clamped to the range spanned by
+  the greys at the RgbConst cutoffs, so results fall in the same
+  brightness bands as the sRGB versions. Hue is kept and chroma is only
+  reduced as far as needed to stay inside the sRGB gamut.
+  """
+
+  #_____________________________________________________________________
+  def grey_lightness(value: int) -> float:
+    """
+    OKLab lightness of the grey with all channels equal to value.
+    """
+
+    return ColorSpace.rgb_to_oklab(value * 0x010101)[0]
+
+  DARK_RANGE: tuple =\
+    ( grey_lightness(RgbConst.MIN_CUTOFF_DARK)
+    , grey_lightness(RgbConst.MAX_CUTOFF_DARK)
+    )
+
+  LITE_RANGE: tuple =\
+    ( grey_lightness(RgbConst.MIN_CUTOFF_LITE)
+    , grey_lightness(RgbConst.MAX_CUTOFF_LITE)
+    )
+
+  #_____________________________________________________________________
+  def in_gamut(linear: tuple) -> bool:
+    """
+    True if all linear sRGB channels are within [0-1].
+    """
+
+    eps: float = PerceptualColorConst.GAMUT_EPSILON
+
+    return all(-eps <= v <= 1 + eps for v in linear)
+
+  #_____________________________________________________________________
+  def gamut_chroma(lightness: float, chroma: float, hue: float) -> float:
+    """
+    Largest chroma not above the input chroma for which the OKLCH color
+    is inside the sRGB gamut.
+    """
+
+    def fits(c: float) -> bool:
+      return PerceptualColor.in_gamut(ColorSpace.oklab_to_linear(
+        ColorSpace.oklch_to_oklab((lightness, c, hue))))
+
+    if (fits(chroma)):
+      return chroma
+
+    lo: float = 0.0
+    hi: float = chroma
+
+    for _ in range(PerceptualColorConst.GAMUT_STEPS):
+      mid: float = (lo + hi) / 2
+
+      if (fits(mid)):
+        lo = mid
+
+      else:
+        hi = mid
+
+    return lo
+
+  #_____________________________________________________________________
+  def fit_lightness(color: int, lightness_range: tuple) -> int:
+    """
+    Moves a color into an OKLCH lightness range, keeping its hue.
+    Colors already in range are returned unchanged.
+
+    Parameters
+      color           : 24 bit RGB color as integer
+      lightness_range : (min, max) OKLab lightness
+
+    Returns
+      24 bit RGB color as integer
+    """
+
+    lightness, chroma, hue = ColorSpace.rgb_to_oklch(color)
+
+    lo, hi = lightness_range
+
+    if (lo <= lightness <= hi):
+      return color
+
+    lightness = min(hi, max(lo, lightness))
+    chroma = PerceptualColor.gamut_chroma(lightness, chroma, hue)
+
+    return ColorSpace.oklch_to_rgb((lightness, chroma, hue))
+
+  #_____________________________________________________________________
+  def gamut_fit_array(lightness, chroma, hue):
+    """
+    Vectorized conversion of OKLCH to packed 24 bit RGB colors. Chroma
+    is reduced as in gamut_chroma where the color is out of gamut.
+    """
+
+    Const = PerceptualColorConst
+
+    def fits(lightness, chroma, hue):
+      linear = ColorSpace.oklab_to_linear_array(
+        ColorSpace.oklch_to_oklab_array(
+          np.stack([lightness, chroma, hue], axis=-1)))
+
+      return np.all((linear >= -Const.GAMUT_EPSILON)
+        & (linear <= 1 + Const.GAMUT_EPSILON), axis=-1)
+
+    lightness, chroma, hue = np.broadcast_arrays(lightness, chroma, hue)
+
+    # Bisect scale factor on chroma, only where full chroma is out of
+    # gamut
+    scale = np.ones(lightness.shape)
+    out = ~fits(lightness, chroma, hue)
+
+    if (out.any()):
+      l_out = lightness[out]
+      c_out = chroma[out]
+      h_out = hue[out]
+
+      lo_scale = np.zeros(l_out.shape)
+      hi_scale = np.ones(l_out.shape)
+
+      for _ in range(Const.GAMUT_STEPS):
+        mid = (lo_scale + hi_scale) / 2
+        ok = fits(l_out, c_out * mid, h_out)
+        lo_scale = np.where(ok, mid, lo_scale)
+        hi_scale = np.where(ok, hi_scale, mid)
+
+      scale[out] = lo_scale
+
+    return ColorSpace.oklch_to_rgb_array(
+      np.stack([lightness, chroma * scale, hue], axis=-1))
+
+  #_____________________________________________________________________
+  def fit_lightness_array(packed, lightness_range: tuple):
+    """
+    Vectorized fit_lightness over a NumPy array of packed colors.
+    """
+
+    lch = ColorSpace.rgb_to_oklch_array(packed)
+
+    lo, hi = lightness_range
+
+    lightness = np.clip(lch[..., 0], lo, hi)
+    chroma = lch[..., 1]
+    hue = lch[..., 2]
+
+    moved = lightness != lch[..., 0]
+
+    fitted = PerceptualColor.gamut_fit_array(lightness, chroma, hue)
+
+    return np.where(moved, fitted, packed).astype(np.uint32)
+
+  #_____________________________________________________________________
+  def fit_lightness_colors(colors, lightness_range: tuple) -> ColorArray:
+    """
+    Applies fit_lightness to every color, vectorized when NumPy is
+    available.
+    """
+
+    colors = ColorArray(colors)
+
+    if (np is not None):
+      return ColorArray.from_packed(PerceptualColor.fit_lightness_array(
+        np.asarray(colors.colors_, dtype=np.uint32), lightness_range))
+
+    return ColorArray(
+      [ PerceptualColor.fit_lightness(c, lightness_range) for c in colors ])
+
+  #_____________________________________________________________________
+  def make_background_color(color: int, is_dark: bool = True) -> int:
+    """
+    Hue preserving version of RgbColor.make_background_color.
+
+    Parameters
+      color   : 24 bit RGB color as integer
+      is_dark : If true, makes background dark. If false, makes lite.
+
+    Returns
+      24 bit RGB color as integer
+    """
+
+    return PerceptualColor.fit_lightness(color
+      , PerceptualColor.DARK_RANGE if (is_dark)
+        else PerceptualColor.LITE_RANGE)
+
+  #_____________________________________________________________________
+  def make_foreground_color(color: int, is_dark: bool = True) -> int:
+    """
+    Hue preserving version of RgbColor.make_foreground_color.
+
+    Parameters
+      color   : 24 bit RGB color as integer
+      is_dark : If true, makes foreground light. If false, makes dark.
+
+    Returns
+      24 bit RGB color as integer
+    """
+
+    return PerceptualColor.fit_lightness(color
+      , PerceptualColor.LITE_RANGE if (is_dark)
+        else PerceptualColor.DARK_RANGE)
+
+  #_____________________________________________________________________
+  def make_background_colors(colors, is_dark: bool = True) -> ColorArray:
+    """
+    Batch version of make_background_color.
+
+    Parameters
+      colors  : Iterable of 24 bit RGB colors, ColorArray or NumPy array
+      is_dark : If true, makes backgrounds dark. If false, makes lite.
+
+    Returns
+      ColorArray of derived colors
+    """
+
+    return PerceptualColor.fit_lightness_colors(colors
+      , PerceptualColor.DARK_RANGE if (is_dark)
+        else PerceptualColor.LITE_RANGE)
+
+  #_____________________________________________________________________
+  def make_foreground_colors(colors, is_dark: bool = True) -> ColorArray:
+    """
+    Batch version of make_foreground_color.
+
+    Parameters
+      colors  : Iterable of 24 bit RGB colors, ColorArray or NumPy array
+      is_dark : If true, makes foregrounds light. If false, makes dark.
+
+    Returns
+      ColorArray of derived colors
+    """
+
+    return PerceptualColor.fit_lightness_colors(colors
+      , PerceptualColor.LITE_RANGE if (is_dark)
+        else PerceptualColor.DARK_RANGE)
@@ -26,9 +26,8 @@
 #   Contains operations related to RGB colors
 #_______________________________________________________________________
 
-from math import floor
-
 from classes.ansi256_colors import Ansi256Colors
+from classes.ansi256_lookup import Ansi256Lookup
 from utilities.color_scheme_utils import GeneralUtils as Utils
 
 from flux_bunny_utils.dict_utils import DictUtils
@@ -129,13 +128,9 @@ class RgbConst:
 class RgbColor:
 
   #_____________________________________________________________________
-  def get_rgb_from_hex(rgb_color: int) -> dict:
+  def validate_rgb(rgb_color: int) -> None:
     """
-    Creates map of red, green, and blue values from a single number.
-
-    E.g.
-    input:  0xFFFF00
-    output: {'red': 255, 'grn': 255, blu: 0}
+    Raises an exception if input is not a 24 bit RGB color integer.
     """
 
     if (not isinstance(rgb_color, int)):
@@ -148,6 +143,20 @@ class RgbColor:
         f'{ErrorUtils.INVALID_VALUE} {rgb_color}'
       ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
 
+    return
+
+  #_____________________________________________________________________
+  def get_rgb_from_hex(rgb_color: int) -> dict:
+    """
+    Creates map of red, green, and blue values from a single number.
+
+    E.g.
+    input:  0xFFFF00
+    output: {'red': 255, 'grn': 255, blu: 0}
+    """
+
+    RgbColor.validate_rgb(rgb_color)
+
     rgb_map: dict = {}
 
     red: int = (rgb_color & RgbConst.RED_MASK) >> RgbConst.RED_RIGHT_SHIFT
@@ -160,6 +169,22 @@ class RgbColor:
 
     return rgb_map
 
+  #_____________________________________________________________________
+  def get_channels_unchecked(rgb_color: int) -> tuple:
+    """
+    Splits a color already known to be valid, e.g. a Color, into
+    channel values without validation or allocating a dict.
+
+    Returns
+      (red, green, blue) tuple
+    """
+
+    return\
+      ( (rgb_color >> RgbConst.RED_RIGHT_SHIFT) & 0xFF
+      , (rgb_color >> RgbConst.GRN_RIGHT_SHIFT) & 0xFF
+      ,  rgb_color & 0xFF
+      )
+
   #_____________________________________________________________________
   def get_int_from_rgb_dict(rgb_dict: dict) -> str:
     """
@@ -258,6 +283,27 @@ class RgbColor:
     , bg_blu=bg_blu
     )
 
+  #_____________________________________________________________________
+  def construct_color_print_str_unchecked(text: str
+    , fg: int = 0
+    , bg: int = 0xffffff
+  ) -> str:
+    """
+    construct_color_print_str for colors already known to be valid.
+    """
+
+    fg_red, fg_grn, fg_blu = RgbColor.get_channels_unchecked(fg)
+    bg_red, bg_grn, bg_blu = RgbColor.get_channels_unchecked(bg)
+
+    return Utils.construct_color_print_str(text=text
+    , fg_red=fg_red
+    , fg_grn=fg_grn
+    , fg_blu=fg_blu
+    , bg_red=bg_red
+    , bg_grn=bg_grn
+    , bg_blu=bg_blu
+    )
+
   #_____________________________________________________________________
   def rgb_to_ansi256(rgb_color: int) -> int:
     """
@@ -273,48 +319,9 @@ class RgbColor:
     if (isinstance(rgb_color, str)):
       rgb_color = StringUtils.str_hex_to_int(rgb_color)
 
-    valid_rgb_values: list[int] =\
-    [0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff]
-
-    # Get RGB components
-    rgb_map: dict = RgbColor.get_rgb_from_hex(rgb_color)
-
-    red: int = rgb_map[RgbConst.RED_STR]
-    grn: int = rgb_map[RgbConst.GRN_STR]
-    blu: int = rgb_map[RgbConst.BLU_STR]
-
-    # If greyscale, handle separately
-    if (red == blu and red == grn and red not in valid_rgb_values):
-
-      valid_greyscale_values: list[int] =\
-      [ 0x08, 0x12, 0x1c, 0x26, 0x30, 0x3a
-      , 0x44, 0x4e, 0x58, 0x62, 0x6c, 0x76
-      , 0x80, 0x8a, 0x94, 0x9e, 0xa8, 0xb2
-      , 0xbc, 0xc6, 0xd0, 0xda, 0xe4, 0xee
-      ]
-
-      grey_near: int = min(valid_greyscale_values
-        , key=lambda x: abs(x - red))
-
-      ansi_index = 232 + ((grey_near - 8) // 10)
-
-    else:
-      # Find nearest valid value for each component
-      red_near: int = min(valid_rgb_values
-        , key=lambda x: abs(x - red))
-      grn_near: int = min(valid_rgb_values
-        , key=lambda x: abs(x - grn))
-      blu_near: int = min(valid_rgb_values
-        , key=lambda x: abs(x - blu))
-
-      r_scaled = floor((red_near / 255.0) * 5)
-      g_scaled = floor((grn_near / 255.0) * 5)
-      b_scaled = floor((blu_near / 255.0) * 5)
-
-      # Compute ANSI 256 color value
-      ansi_index = 16 + (r_scaled * 36) + (g_scaled * 6) + b_scaled
+    RgbColor.validate_rgb(rgb_color)
 
-    return ansi_index
+    return Ansi256Lookup.rgb_to_ansi256(rgb_color)
 
   #_____________________________________________________________________
   def rgb_from_ansi_256(ansi_256_index: int) -> int:
@@ -376,7 +383,7 @@ class RgbColor:
     for key in color.keys():
       color[key] = int(color[key] * multiplier)
 
-    if (input_type == int):
+    if (issubclass(input_type, int)):
       return RgbColor.get_int_from_rgb_dict(color)
 
     return color
@@ -444,7 +451,7 @@ class RgbColor:
       color[key] = color[key] * cutoff_range + lo_cutoff
 
     # Return int type if input was int
-    if (input_type == int):
+    if (issubclass(input_type, int)):
       return RgbColor.get_int_from_rgb_dict(color)
 
     return color
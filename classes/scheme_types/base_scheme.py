@@ -28,12 +28,27 @@
 
 import re
 
+from functools import partial
+
 from os import path
 
+from classes.color import Color
+from classes.color_expression import ColorExpression
+from classes.color_expression import ColorExpressionConst
 from classes.color_scheme_strings import ColorSchemeStrings as Strings
+from classes.extended_palette import ExtendedPalette
+from classes.extended_palette import ExtendedPaletteConst
+from classes.perceptual_color import PerceptualColorConst
 from classes.rgb_color import RgbColor
 from classes.rgb_color import RgbConst
-from utilities.color_scheme_utils import GeneralUtils as Utils
+from classes.template_compiler import CompiledTemplate
+from classes.template_modifier import TemplateModifier
+from classes.template_registry import TemplateRegistry
+from classes.theme_inheritance import ThemeInheritance
+from classes.theme_model import RenderContext
+from classes.theme_model import RenderContextConst
+from classes.theme_model import ThemeModel
+from flux_bunny_utils.error_utils import ErrorUtils
 from flux_bunny_utils.file_utils import FileUtils
 from flux_bunny_utils.string_utils import StringUtils
 
@@ -56,8 +71,34 @@ class ColorScheme():
   PALETTE         : str = 'palette'
   NAME            : str = 'name'
   MODE            : str = 'mode'
+  UI_COLOR_MODE   : str = 'ui-color-mode'
   TEMPLATE_PATH   : str = None
 
+  # Colors the 256 color palette is generated from, see ExtendedPalette
+  EXTENDED_PALETTE_SOURCES: tuple =\
+    ( ('bg_norm_color', None)
+    , ('fg_norm_color', None)
+    ) + tuple(
+      ('palette', slot)
+      for slot in ExtendedPaletteConst.CORNER_SLOTS if (slot is not None))
+
+  # Json keys of single colors and the attributes they set. Their
+  # values, and palette entries, may be color expressions.
+  COLOR_ATTRS: dict =\
+    { CURSOR_COLOR : 'cursor_color_'
+    , BG_NORM_KEY  : 'bg_norm_color_'
+    , BG_BOLD_KEY  : 'bg_bold_color_'
+    , FG_NORM_KEY  : 'fg_norm_color_'
+    , FG_BOLD_KEY  : 'fg_bold_color_'
+    , KEY_BG0_KEY  : 'accent_color0_'
+    , KEY_BG1_KEY  : 'accent_color1_'
+    , KEY_BG2_KEY  : 'accent_color2_'
+    }
+
+  # True for exporters whose templates use the ANSI_016 to ANSI_255
+  # tokens of the generated 256 color palette
+  EXTENDED_PALETTE: bool = False
+
   PREVIEW: str = str(
     f'\n{Strings.LINE}'
     f'\n{Strings.LINE}'
@@ -74,6 +115,189 @@ class ColorScheme():
 
   #_____________________________________________________________________
   def __init__(self, out_dir: str = '.', cfg = None):
+    """
+    Parameters
+      out_dir : Directory the scheme is written to
+      cfg     : Dictionary created from json, or a RenderContext shared
+                with other scheme types rendering the same theme
+    """
+
+    self.init_colors(cfg)
+
+    self.out_dir_ = out_dir
+
+    FileUtils.verify_dir(path.abspath(out_dir))
+
+    self.set_out_file_path()
+
+    self.color_scheme_str_: str = self.create_color_scheme_str()
+
+    # Output changed since the file was last written
+    self.dirty_: bool = True
+
+    return
+
+  #_____________________________________________________________________
+  def set_out_file_path(self) -> None:
+    """
+    Sets the output file name and path from the theme name.
+    """
+
+    self.out_file_name_: str =\
+      f'{self.name_}.{self.OUT_EXT}'
+
+    self.out_file_path_ = path.join(self.out_dir_, self.out_file_name_)
+    self.out_file_path_ = path.abspath(self.out_file_path_)
+
+    return
+
+  #_____________________________________________________________________
+  def init_colors(self, cfg = None) -> None:
+    """
+    Sets colors from a RenderContext, parsing the dictionary created
+    from json into one first if needed.
+    """
+
+    if (not isinstance(cfg, RenderContext)):
+      cfg = ColorScheme.create_context(cfg)
+
+    self.set_context(cfg)
+
+    self.str_replace_map: dict = {}
+
+    # Template token values, each computed the first time it is needed
+    self.token_providers_: dict = None
+    self.token_dependants_: dict = None
+    self.token_values_: dict = {}
+
+    # Compiled template and its filled parts, kept for update_colors
+    self.template_: CompiledTemplate = None
+    self.rendered_parts_: list[str] = None
+
+    # Generated on demand, or set ahead of time by batch operations
+    self.extended_palette_: list[int] = None
+
+    return
+
+  #_____________________________________________________________________
+  def set_context(self, context: RenderContext) -> None:
+    """
+    Sets the color attributes from the model of a RenderContext.
+    """
+
+    self.context_: RenderContext = context
+
+    model: ThemeModel = context.model_
+
+    for field in ThemeModel._fields:
+      setattr(self, f'{field}_', getattr(model, field))
+
+    self.palette_ = list(model.palette)
+
+    return
+
+  #_____________________________________________________________________
+  def create_context(cfg = None) -> RenderContext:
+    """
+    Parses a dictionary created from json once, for any number of
+    scheme types.
+
+    Parameters
+      cfg : Dictionary created from json, None for the default theme
+    """
+
+    scheme: ColorScheme = ColorScheme.__new__(ColorScheme)
+    scheme.init_default_colors()
+
+    input_dict: dict = cfg
+
+    if (isinstance(cfg, dict)):
+      cfg = scheme.resolve_expressions(cfg)
+      scheme.construct_from_json(cfg)
+
+    return RenderContext(ThemeModel.from_scheme(scheme), cfg, input_dict)
+
+  #_____________________________________________________________________
+  def update_context(context: RenderContext, colors: dict) -> RenderContext:
+    """
+    Applies changed colors to the input of a RenderContext. Inputs
+    without expressions only have the changed colors set in the model,
+    others are parsed again. The context is not modified, so scheme
+    types still using it are unaffected.
+
+    Parameters
+      context : Current context
+      colors  : Keys of the json input to change. The palette may be
+                given as a dictionary of {index: color}.
+
+    Returns
+      Updated context
+    """
+
+    current: dict = context.input_
+
+    # A partial palette needs the full palette to apply to
+    if (isinstance(colors.get(ColorScheme.PALETTE), dict)
+      and ColorScheme.PALETTE not in current):
+      current = dict(current, **{ ColorScheme.PALETTE:
+        [ f'0x{c:06x}' for c in context.model_.palette ] })
+
+    merged: dict = ThemeInheritance.merge(current, colors)
+
+    model: ThemeModel = ColorScheme.update_model(context.model_, colors, merged)
+
+    # Expressions depending on changed colors are evaluated again
+    if (model is None):
+      return context.updated(ColorScheme.create_context(merged))
+
+    return context.updated(RenderContext(model, merged))
+
+  #_____________________________________________________________________
+  def update_model(model: ThemeModel, colors: dict, merged: dict)\
+    -> ThemeModel:
+    """
+    Sets changed colors in a model directly, as construct_from_json
+    would set them.
+
+    Parameters
+      model  : Current model
+      colors : Keys of the json input to change, see update_context
+      merged : Input with colors applied
+
+    Returns
+      Updated model, or None if the input must be parsed again because
+      it has expressions or a changed key is not a color
+    """
+
+    Scheme = ColorScheme
+
+    if (ColorExpression.has_expressions(merged, Scheme.COLOR_ATTRS)):
+      return None
+
+    fields: dict = {}
+
+    for key, value in colors.items():
+      if (key in Scheme.COLOR_ATTRS):
+        fields[Scheme.COLOR_ATTRS[key][:-1]] = Color(value)
+
+      elif (key == Scheme.PALETTE and isinstance(value, dict)):
+        palette: list = list(fields.get('palette', model.palette))
+
+        for index, color in value.items():
+          palette[int(index)] = Color(color)
+
+        fields['palette'] = tuple(palette)
+
+      else:
+        return None
+
+    return model._replace(**fields)
+
+  #_____________________________________________________________________
+  def init_default_colors(self) -> None:
+    """
+    Sets the colors used for keys missing from the json input.
+    """
 
     self.cursor_color_  = RgbConst.DEF_CRSR_BG
 
@@ -89,94 +313,108 @@ class ColorScheme():
     self.palette_       = RgbConst.DEFAULT_RGB_INT_LIST
     self.name_          = 'theme-name'
     self.is_dark_       = True
-    self.out_dir_       = out_dir
+    self.ui_color_mode_ = PerceptualColorConst.RGB_MODE
 
-    self.str_replace_map: dict = {}
+    return
 
-    #___________________________________________________________________
-    if (isinstance(cfg, dict)):
-      self.construct_from_json(cfg)
+  #_____________________________________________________________________
+  def resolve_expressions(self, input_dict: dict) -> dict:
+    """
+    Evaluates color expressions of a dictionary created from json, see
+    ColorExpression. References to keys missing from the dictionary use
+    the current colors.
 
-    self.out_file_name_: str =\
-      f'{self.name_}.{self.OUT_EXT}'
+    Returns
+      input_dict if it has no expressions, otherwise a resolved copy
+    """
 
-    FileUtils.verify_dir(path.abspath(out_dir))
+    if (not ColorExpression.has_expressions(input_dict, self.COLOR_ATTRS)):
+      return input_dict
 
-    self.out_file_path_ = path.join(out_dir, self.out_file_name_)
-    self.out_file_path_ = path.abspath(self.out_file_path_)
+    defaults: dict =\
+      { key: getattr(self, attr) for key, attr in self.COLOR_ATTRS.items() }
 
-    self.color_scheme_str_: str = self.create_color_scheme_str()
+    for i, color in enumerate(self.palette_):
+      defaults[ColorExpressionConst.PALETTE_FORMAT.format(i)] = color
 
-    return
+    return ColorExpression.resolve(input_dict, defaults)
 
   #_____________________________________________________________________
   def construct_from_json(self, input_dict: dict) -> None:
     """
-    Constructs color scheme from dictionary created from json.
+    Constructs color scheme from dictionary created from json, with
+    color expressions already resolved, see resolve_expressions.
     """
+
     if (self.MODE in input_dict):
       self.is_dark_ = True if input_dict['mode'] == 'dark' else False
 
+    #___________________________________________________________________
+    # How UI colors are derived from accent colors, see PerceptualColor
+    #___________________________________________________________________
+    if (self.UI_COLOR_MODE in input_dict):
+      ui_color_mode: str = input_dict[self.UI_COLOR_MODE]
+
+      if (ui_color_mode not in PerceptualColorConst.MODES):
+        desc: str =\
+          f'{ErrorUtils.INVALID_VALUE} {self.UI_COLOR_MODE} = {ui_color_mode}'
+        ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+      self.ui_color_mode_ = ui_color_mode
+
     #___________________________________________________________________
     if (self.NAME in input_dict):
       # Ensure file names have no spaces
       self.name_ = input_dict[self.NAME].replace(' ', '-').lower()
 
+    #___________________________________________________________________
+    if (self.CURSOR_COLOR in input_dict):
+      self.cursor_color_ = Color(input_dict[self.CURSOR_COLOR])
+
     #___________________________________________________________________
     # Set background
     #___________________________________________________________________
     if (self.BG_NORM_KEY in input_dict):
       self.bg_norm_color_ =\
-        StringUtils.str_hex_to_int(input_dict[self.BG_NORM_KEY])
+        Color(input_dict[self.BG_NORM_KEY])
 
     if (self.BG_BOLD_KEY in input_dict):
       self.bg_bold_color_ =\
-        StringUtils.str_hex_to_int(input_dict[self.BG_BOLD_KEY])
+        Color(input_dict[self.BG_BOLD_KEY])
 
     #___________________________________________________________________
     # Set foreground
     #___________________________________________________________________
     if (self.FG_NORM_KEY in input_dict):
       self.fg_norm_color_ =\
-        StringUtils.str_hex_to_int(input_dict[self.FG_NORM_KEY])
+        Color(input_dict[self.FG_NORM_KEY])
 
     if (self.FG_BOLD_KEY in input_dict):
       self.fg_bold_color_ =\
-        StringUtils.str_hex_to_int(input_dict[self.FG_BOLD_KEY])
+        Color(input_dict[self.FG_BOLD_KEY])
 
     #___________________________________________________________________
     # Set accent colors
     #___________________________________________________________________
     if (self.KEY_BG0_KEY in input_dict):
       self.accent_color0_ =\
-        StringUtils.str_hex_to_int(input_dict[self.KEY_BG0_KEY])
+        Color(input_dict[self.KEY_BG0_KEY])
 
     if (self.KEY_BG1_KEY in input_dict):
       self.accent_color1_ =\
-        StringUtils.str_hex_to_int(input_dict[self.KEY_BG1_KEY])
+        Color(input_dict[self.KEY_BG1_KEY])
 
     if (self.KEY_BG2_KEY in input_dict):
       self.accent_color2_ =\
-        StringUtils.str_hex_to_int(input_dict[self.KEY_BG2_KEY])
+        Color(input_dict[self.KEY_BG2_KEY])
 
     #___________________________________________________________________
     if (self.PALETTE in input_dict):
       color_palette: list = input_dict[self.PALETTE]
 
+      # Hex strings and ints alike, Color validates each entry
       if (len(color_palette)):
-
-        # Assumption that color palette is list of hex strings
-        if (isinstance(color_palette[0], str)):
-          self.palette_ =\
-          Utils.str_list_to_hex_list(color_palette)
-
-        #_______________________________________________________________
-        # TODO modify function to take other types of dicts
-        #      currently shouldn't ever enter this branch
-        #_______________________________________________________________
-        # Assumption that color palette is list of ints
-        elif (isinstance(color_palette[0], int)):
-          self.palette_ = color_palette
+        self.palette_ = Color.from_list(color_palette)
 
     return
 
@@ -193,8 +431,129 @@ class ColorScheme():
     f.write(self.color_scheme_str_)
     f.close()
 
+    self.dirty_ = False
+
     return
 
+  #_____________________________________________________________________
+  def write_file_if_dirty(self) -> bool:
+    """
+    Writes color scheme string to file if it changed since the file was
+    last written.
+
+    Returns
+      True if the file was written
+    """
+
+    if (not self.dirty_):
+      return False
+
+    self.write_file()
+
+    return True
+
+  #_____________________________________________________________________
+  def update_colors(self, colors) -> bool:
+    """
+    Changes some colors without rendering the template again. Only the
+    tokens computed from changed colors are computed again, and only
+    their slots in the output are replaced. Scheme types without a
+    template are rendered again.
+
+    Parameters
+      colors : Keys of the json input to change, the palette may be
+               given as a dictionary of {index: color}. Or a context
+               from ColorScheme.update_context, to share one update
+               between scheme types.
+
+    Returns
+      True if the output or its file path changed, which also marks it
+      dirty
+    """
+
+    if (isinstance(colors, RenderContext)):
+      context: RenderContext = colors
+    else:
+      context = ColorScheme.update_context(self.context_, colors)
+
+    changed: set = self.context_.changed_sources(context)
+
+    self.set_context(context)
+
+    if (not changed):
+      return False
+
+    #___________________________________________________________________
+    # A new name is a new file, which has not been written yet
+    #___________________________________________________________________
+    renamed: bool = ('name', None) in changed
+
+    if (renamed):
+      self.set_out_file_path()
+      self.dirty_ = True
+
+    if (not changed.isdisjoint(ColorScheme.EXTENDED_PALETTE_SOURCES)):
+      self.extended_palette_ = None
+
+    #___________________________________________________________________
+    # Scheme types without a template
+    #___________________________________________________________________
+    if (self.template_ is None):
+      out_str: str = self.create_color_scheme_str()
+
+      if (out_str == self.color_scheme_str_):
+        return renamed
+
+      self.color_scheme_str_ = out_str
+      self.dirty_ = True
+
+      return True
+
+    #___________________________________________________________________
+    # Forget stale values first, so dependant tokens such as the Vim
+    # CLI colors see the new values
+    #___________________________________________________________________
+    if (self.token_dependants_ is None):
+      self.token_dependants_ = self.token_dependants(
+        self.modifier_sources(self.token_sources()))
+
+    dependants: dict = self.token_dependants_
+    values: dict = self.token_values_
+
+    names: set = set(dependants[None]).union(
+      *(dependants.get(source, ()) for source in changed))
+
+    stale: dict =\
+      { name: values[name] for name in names if (name in values) }
+
+    for name in stale:
+      del values[name]
+
+    patched: bool = False
+    slot_indices: dict = self.template_.slot_indices_
+
+    for name, old_value in stale.items():
+      if (name not in slot_indices):
+        if (name in self.str_replace_map):
+          self.str_replace_map[name] = self.token(name)
+
+        continue
+
+      value: str = self.token(name)
+      self.str_replace_map[name] = value
+
+      if (value != old_value):
+        for i in slot_indices[name]:
+          self.rendered_parts_[i] = value
+
+        patched = True
+
+    if (patched):
+      self.color_scheme_str_ = ''.join(self.rendered_parts_)
+      self.dirty_ = True
+
+    return patched or renamed
+
   #_____________________________________________________________________
   def print_color_scheme(self) -> None:
     """
@@ -224,7 +583,7 @@ class ColorScheme():
       '\n RGB Vals |'
     )
 
-    header += RgbColor.construct_color_print_str\
+    header += RgbColor.construct_color_print_str_unchecked\
       ( text=f' 0x{self.bg_norm_color_:06x} '
       , fg=self.fg_norm_color_
       , bg=bg
@@ -239,7 +598,7 @@ class ColorScheme():
 
 
     for color in bg_color_list[1:len(bg_color_list)]:
-      header += '|' + RgbColor.construct_color_print_str\
+      header += '|' + RgbColor.construct_color_print_str_unchecked\
         ( text=f' 0x{color:06x} '
         , fg=self.fg_norm_color_
         , bg=color
@@ -257,7 +616,7 @@ class ColorScheme():
     for i in range(0, len(self.palette_)):
       crnt_color: int = self.palette_[i]
 
-      colored_text += RgbColor.construct_color_print_str\
+      colored_text += RgbColor.construct_color_print_str_unchecked\
         ( text=f' 0x{crnt_color:06x} '
         , fg=crnt_color
         )
@@ -265,7 +624,7 @@ class ColorScheme():
       for grey in bg_color_list:
         colored_text += '|'
 
-        colored_text += RgbColor.construct_color_print_str\
+        colored_text += RgbColor.construct_color_print_str_unchecked\
         ( text=f' Color {i:2d} '
         , fg=crnt_color
         , bg=grey
@@ -297,38 +656,181 @@ class ColorScheme():
     print(completion_text)
 
   #_____________________________________________________________________
-  def populate_replacement_map(self) -> str:
+  def token_providers(self) -> dict:
     """
-    Populate map of color labels in template with values from
-    color scheme. Used by classes that have template files.
+    Functions computing the value of each template token, keyed by
+    token. Derived classes add their own tokens. A provider only runs
+    when a template references its token.
+
+    Returns
+      Dictionary of {token: function with no arguments returning str}
     """
 
-    self.str_replace_map: dict=\
-    { 'BG__NORM' : StringUtils.int_to_hex6(self.bg_norm_color_)
-    }
+    Const = ExtendedPaletteConst
 
-    self.str_replace_map: dict=\
-    { 'BG__NORM' : StringUtils.int_to_hex6(self.bg_norm_color_)
-    , 'FG__NORM' : StringUtils.int_to_hex6(self.fg_norm_color_)
-    , 'BG__BOLD' : StringUtils.int_to_hex6(self.bg_bold_color_)
-    , 'FG__BOLD' : StringUtils.int_to_hex6(self.fg_bold_color_)
-    , 'BLK_NORM' : StringUtils.int_to_hex6(self.palette_[0])
-    , 'RED_NORM' : StringUtils.int_to_hex6(self.palette_[1])
-    , 'GRN_NORM' : StringUtils.int_to_hex6(self.palette_[2])
-    , 'YEL_NORM' : StringUtils.int_to_hex6(self.palette_[3])
-    , 'BLU_NORM' : StringUtils.int_to_hex6(self.palette_[4])
-    , 'VIO_NORM' : StringUtils.int_to_hex6(self.palette_[5])
-    , 'CYA_NORM' : StringUtils.int_to_hex6(self.palette_[6])
-    , 'WHT_NORM' : StringUtils.int_to_hex6(self.palette_[7])
-    , 'BLK_BOLD' : StringUtils.int_to_hex6(self.palette_[8])
-    , 'RED_BOLD' : StringUtils.int_to_hex6(self.palette_[9])
-    , 'GRN_BOLD' : StringUtils.int_to_hex6(self.palette_[10])
-    , 'YEL_BOLD' : StringUtils.int_to_hex6(self.palette_[11])
-    , 'BLU_BOLD' : StringUtils.int_to_hex6(self.palette_[12])
-    , 'VIO_BOLD' : StringUtils.int_to_hex6(self.palette_[13])
-    , 'CYA_BOLD' : StringUtils.int_to_hex6(self.palette_[14])
-    , 'WHT_BOLD' : StringUtils.int_to_hex6(self.palette_[15])
-    }
+    providers: dict =\
+      { label: partial(self.base_token, label)
+        for label in RenderContextConst.BASE_SOURCES }
+
+    if (self.EXTENDED_PALETTE):
+      for i in range(Const.SYSTEM_COLOR_COUNT, Const.COLOR_COUNT):
+        providers[Const.TOKEN_FORMAT.format(i)] =\
+          partial(self.extended_palette_token, i)
+
+    return providers
+
+  #_____________________________________________________________________
+  def token_sources(self) -> dict:
+    """
+    ThemeModel values each token is computed from, in the form of
+    RenderContextConst.BASE_SOURCES. Derived classes add their own
+    tokens. Tokens not listed here depend on every value.
+
+    Returns
+      Dictionary of {token: tuple of sources}
+    """
+
+    Const = ExtendedPaletteConst
+
+    sources: dict =\
+      { label: (source,)
+        for label, source in RenderContextConst.BASE_SOURCES.items() }
+
+    if (self.EXTENDED_PALETTE):
+      for i in range(Const.SYSTEM_COLOR_COUNT, Const.COLOR_COUNT):
+        sources[Const.TOKEN_FORMAT.format(i)] =\
+          ColorScheme.EXTENDED_PALETTE_SOURCES
+
+    return sources
+
+  #_____________________________________________________________________
+  def modifier_sources(self, sources: dict) -> dict:
+    """
+    Adds the modifier expressions of the template to token sources. An
+    expression depends on the sources of every token it references.
+    """
+
+    for slot, (token, chain) in self.template_.modifiers_.items():
+      names: list[str] = [token] + TemplateModifier.references(chain)
+
+      if (all(n in sources for n in names)):
+        sources[slot] = tuple(set().union(*(sources[n] for n in names)))
+
+    return sources
+
+  #_____________________________________________________________________
+  def token_dependants(self, sources: dict) -> dict:
+    """
+    Inverts token sources, so an update finds its stale tokens without
+    checking every token.
+
+    Returns
+      Dictionary of {source: tokens computed from it}. Tokens without
+      listed sources depend on every value and are under None.
+    """
+
+    dependants: dict = { None: [] }
+
+    for name, name_sources in sources.items():
+      for source in name_sources:
+        dependants.setdefault(source, []).append(name)
+
+    for name in list(self.token_providers_) + list(self.template_.modifiers_):
+      if (name not in sources):
+        dependants[None].append(name)
+
+    return dependants
+
+  #_____________________________________________________________________
+  def base_token(self, label: str) -> str:
+    """
+    Hex string of a background, foreground or palette color, shared by
+    every scheme type rendering the same theme.
+    """
+
+    return self.context_.base_token(label)
+
+  #_____________________________________________________________________
+  def extended_palette_token(self, index: int) -> str:
+    """
+    Hex string of one color of the 256 color palette.
+    """
+
+    if (self.extended_palette_ is None):
+      self.extended_palette_ = self.context_.derive('extended_palette'
+        , lambda: ExtendedPalette.extended_palette(self))
+
+    return StringUtils.int_to_hex6(self.extended_palette_[index])
+
+  #_____________________________________________________________________
+  def token(self, name: str) -> str:
+    """
+    Value of a template token, computed on first use.
+
+    Parameters
+      name : Template token, e.g. BG__NORM, or the slot name of a
+             modifier expression, e.g. BG__NORM|alpha(0.6)
+    """
+
+    values: dict = self.token_values_
+
+    if (name in values):
+      return values[name]
+
+    if (self.token_providers_ is None):
+      self.token_providers_ = self.token_providers()
+
+    provider = self.token_providers_.get(name)
+
+    if (provider is not None):
+      values[name] = provider()
+
+    else:
+      values[name] = self.modified_token(*TemplateModifier.from_slot(name))
+
+    return values[name]
+
+  #_____________________________________________________________________
+  def modified_token(self, token: str, chain: tuple) -> str:
+    """
+    Value of a modifier expression. Computed once per theme for each
+    distinct expression and input colors, and shared by every scheme
+    type rendering the theme.
+    """
+
+    names: list[str] = [token] + TemplateModifier.references(chain)
+    inputs: tuple = tuple(self.token(n) for n in names)
+
+    return self.context_.derive((chain, inputs)
+      , lambda: TemplateModifier.apply(chain, int(inputs[0], 16)
+        , { n: int(v, 16) for n, v in zip(names, inputs) }))
+
+  #_____________________________________________________________________
+  def resolve_tokens(self, tokens = None) -> dict:
+    """
+    Parameters
+      tokens : Tokens to compute, all tokens if None
+
+    Returns
+      Dictionary of {token: value}
+    """
+
+    if (self.token_providers_ is None):
+      self.token_providers_ = self.token_providers()
+
+    if (tokens is None):
+      tokens = self.token_providers_
+
+    return { name: self.token(name) for name in tokens }
+
+  #_____________________________________________________________________
+  def populate_replacement_map(self) -> str:
+    """
+    Populate map of every color label with values from color scheme,
+    whether or not the template uses it.
+    """
+
+    self.str_replace_map: dict = self.resolve_tokens()
 
     return
 
@@ -339,26 +841,21 @@ class ColorScheme():
     Used by classes that have template files.
     """
 
-    self.populate_replacement_map()
+    if (self.token_providers_ is None):
+      self.token_providers_ = self.token_providers()
 
     #_______________________________________________________________
-    # Load template file.
+    # Replace color labels in a single pass, longest label first.
+    # Templates are read once per process.
     #_______________________________________________________________
-    with open(self.TEMPLATE_PATH, 'r') as file:
-      text: str = file.read()
+    self.template_ =\
+      TemplateRegistry.compile(self.TEMPLATE_PATH, self.token_providers_)
 
-    #_______________________________________________________________
-    # Replace color labels.
-    #_______________________________________________________________
-    for key in self.str_replace_map:
-      value = self.str_replace_map[key]
-      text = text.replace(key, value)
-      # Replace whole word only
-      # Does not currently handle properties in vscode theme
-      #pattern = fr'\b{re.escape(key)}\b'
-      #text = re.sub(pattern, value, text)
+    # Only tokens the template references are computed
+    self.str_replace_map = self.resolve_tokens(self.template_.tokens())
 
-    out_str: str = text
+    self.rendered_parts_ = self.template_.fill(self.str_replace_map)
 
+    out_str: str = ''.join(self.rendered_parts_)
 
     return out_str
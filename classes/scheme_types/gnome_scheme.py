@@ -27,7 +27,7 @@
 #_______________________________________________________________________
 
 from classes.scheme_types.base_scheme import ColorScheme
-from classes.rgb_color import RgbConst, RgbColor
+from classes.rgb_color import RgbColor
 
 
 #_______________________________________________________________________
@@ -44,11 +44,13 @@ class GnomeScheme(ColorScheme):
   )
 
   #_____________________________________________________________________
-  def create_color_entry(rgb_map: dict) -> str:
+  def create_color_entry(rgb_color: int) -> str:
+    """
+    Creates entry for a color already validated when the theme was
+    read.
+    """
 
-    red: int = rgb_map[RgbConst.RED_STR]
-    grn: int = rgb_map[RgbConst.GRN_STR]
-    blu: int = rgb_map[RgbConst.BLU_STR]
+    red, grn, blu = RgbColor.get_channels_unchecked(rgb_color)
 
     out_str: str =\
       f"'rgb({red}, {grn}, {blu})'"
@@ -65,8 +67,8 @@ class GnomeScheme(ColorScheme):
     FOREGND: str = ColorScheme.FG_NORM_KEY
     PALETTE: str = ColorScheme.PALETTE
 
-    backgnd: dict = RgbColor.get_rgb_from_hex(self.bg_norm_color_)
-    foregnd: dict = RgbColor.get_rgb_from_hex(self.fg_norm_color_)
+    backgnd: int = self.bg_norm_color_
+    foregnd: int = self.fg_norm_color_
 
     out_str: str = \
       '[/]'\
@@ -88,8 +90,7 @@ class GnomeScheme(ColorScheme):
 
     for i in range(len(palette)):
       color: int = palette[i]
-      rgb_dict: dict = RgbColor.get_rgb_from_hex(color)
-      color_entry: str = GnomeScheme.create_color_entry(rgb_dict)
+      color_entry: str = GnomeScheme.create_color_entry(color)
 
       out_str = f'{out_str}{color_entry}'
 
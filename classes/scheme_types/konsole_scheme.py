@@ -28,6 +28,7 @@
 
 # TODO need to fix to work with base class
 
+from classes.color import Color
 from classes.rgb_color import RgbColor, RgbConst
 from classes.scheme_types.base_scheme import ColorScheme
 
@@ -77,8 +78,8 @@ class KonsoleScheme(ColorScheme):
     #___________________________________________________________________
     # Account for konsole specific parameters in json
     #___________________________________________________________________
-    if (len(arg) and isinstance(arg[0], dict)):
-      d: dict = arg[0]
+    if (self.context_.cfg_):
+      d: dict = self.context_.cfg_
 
       try:
         self.intense_bold_ = Utils.str_to_bool(d[self.INTENSE_BOLD])
@@ -87,17 +88,17 @@ class KonsoleScheme(ColorScheme):
 
       try:
         self.background_color_intense_ =\
-          Utils.str_hex_to_int(d[self.BACKGROUND_COLOR_INTENSE])
+          Color(d[self.BACKGROUND_COLOR_INTENSE])
       except:
         self.background_color_intense_ =\
-          d[self.BG_NORM_KEY]
+          self.bg_norm_color_
 
       try:
         self.foreground_color_intense_ =\
-          Utils.str_hex_to_int(d[self.FOREGROUND_COLOR_INTENSE])
+          Color(d[self.FOREGROUND_COLOR_INTENSE])
       except:
         self.foreground_color_intense_ =\
-          d[self.FG_NORM_KEY]
+          self.fg_norm_color_
     #___________________________________________________________________
 
     self.normal_colors_: list[int] = self.palette_[0:8]
@@ -143,11 +144,7 @@ class KonsoleScheme(ColorScheme):
     Color=215,0,0
     """
 
-    rgb_map: dict = RgbColor.get_rgb_from_hex(rgb_color)
-
-    red: int = rgb_map[RgbConst.RED_STR]
-    grn: int = rgb_map[RgbConst.GRN_STR]
-    blu: int = rgb_map[RgbConst.BLU_STR]
+    red, grn, blu = RgbColor.get_channels_unchecked(rgb_color)
 
     outstr = f'[{label}]'
 
@@ -120,15 +120,3 @@ class MinttyScheme(ColorScheme):
 
     return out_str
 
-  #_____________________________________________________________________
-  def construct_from_json(self, input_dict):
-    """
-    Constructs color scheme from JSON input. Extends base class with
-    additional variables for .minttyrc file.
-    """
-    super().construct_from_json(input_dict)
-
-    if (self.CURSOR_COLOR in input_dict):
-      self.cursor_color_ =\
-        StringUtils.str_hex_to_int(input_dict[self.CURSOR_COLOR])
-    return
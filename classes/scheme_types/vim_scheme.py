@@ -26,10 +26,14 @@
 #   Vim color scheme
 #_______________________________________________________________________
 
+from functools import partial
 from shutil import copy
+from classes.ansi256_fidelity import Ansi256Fidelity
+from classes.ansi256_fidelity import Ansi256FidelityConst
 from classes.scheme_types.base_scheme import ColorScheme
 from classes.rgb_color import RgbColor
 from flux_bunny_utils.file_utils import FileUtils
+from flux_bunny_utils.string_utils import StringUtils
 
 
 #_______________________________________________________________________
@@ -50,6 +54,9 @@ class VimScheme(ColorScheme):
   TEMPLATE_PATH : str = 'templates/vim/flux-bunny-template.vim'
   BASE_PATH     : str = 'templates/vim/flux-bunny-base.vim'
 
+  # Input key that moves GUI colors onto their cterm colors
+  CTERM_SNAP    : str = 'cterm-snap'
+
   #_____________________________________________________________________
   def __init__(self, out_dir: str = '.', cfg = None):
     super().__init__(out_dir, cfg)
@@ -61,47 +68,75 @@ class VimScheme(ColorScheme):
     return
 
   #_____________________________________________________________________
-  def populate_replacement_map(self) -> str:
+  def set_context(self, context) -> None:
+    """
+    Also reads whether GUI colors snap to their cterm colors.
     """
-    Populate map of color labels in template with values from
-    color scheme. Added additional CLI colors.
 
-    Side Effects:
-      Modifies self.str_replace_map to include CLI color mappings.
+    super().set_context(context)
+
+    self.cterm_snap_: bool =\
+      bool(self.context_.cfg_.get(self.CTERM_SNAP, False))
+
+    return
+
+  #_____________________________________________________________________
+  def token_providers(self) -> dict:
     """
+    Adds the theme name and mode, and a CLI color for every GUI color,
+    e.g. BG__CLI_NORM for BG__NORM.
+    """
+
+    providers: dict = super().token_providers()
 
-    Rgb = RgbColor
+    for label in Ansi256FidelityConst.COLOR_LABELS:
+      providers[label] = partial(self.gui_token, providers[label])
 
-    super().populate_replacement_map()
+      providers[f'{label[:4]}CLI_{label[4:]}'] =\
+        partial(self.cli_token, label)
 
-    is_dark_str: str = 'dark' if self.is_dark_ else 'light'
+    providers['NAME']         = lambda: self.name_
+    providers['LITE_OR_DARK'] = lambda: 'dark' if self.is_dark_ else 'light'
 
-    mappy: dict = self.str_replace_map
+    return providers
 
-    # Additional CLI colors
-    mappy['NAME']         = self.name_
-    mappy['LITE_OR_DARK'] = is_dark_str
+  #_____________________________________________________________________
+  def token_sources(self) -> dict:
+    """
+    GUI colors also depend on cterm snapping, and CLI colors depend on
+    the same values as their GUI colors.
+    """
 
-    mappy['BG__CLI_NORM'] = str(Rgb.rgb_to_ansi256(mappy['BG__NORM']))
-    mappy['FG__CLI_NORM'] = str(Rgb.rgb_to_ansi256(mappy['FG__NORM']))
-    mappy['BG__CLI_BOLD'] = str(Rgb.rgb_to_ansi256(mappy['BG__BOLD']))
-    mappy['FG__CLI_BOLD'] = str(Rgb.rgb_to_ansi256(mappy['FG__BOLD']))
+    sources: dict = super().token_sources()
 
-    mappy['BLK_CLI_NORM'] = str(Rgb.rgb_to_ansi256(mappy['BLK_NORM']))
-    mappy['RED_CLI_NORM'] = str(Rgb.rgb_to_ansi256(mappy['RED_NORM']))
-    mappy['GRN_CLI_NORM'] = str(Rgb.rgb_to_ansi256(mappy['GRN_NORM']))
-    mappy['YEL_CLI_NORM'] = str(Rgb.rgb_to_ansi256(mappy['YEL_NORM']))
-    mappy['BLU_CLI_NORM'] = str(Rgb.rgb_to_ansi256(mappy['BLU_NORM']))
-    mappy['VIO_CLI_NORM'] = str(Rgb.rgb_to_ansi256(mappy['VIO_NORM']))
-    mappy['CYA_CLI_NORM'] = str(Rgb.rgb_to_ansi256(mappy['CYA_NORM']))
-    mappy['WHT_CLI_NORM'] = str(Rgb.rgb_to_ansi256(mappy['WHT_NORM']))
-    mappy['BLK_CLI_BOLD'] = str(Rgb.rgb_to_ansi256(mappy['BLK_BOLD']))
-    mappy['RED_CLI_BOLD'] = str(Rgb.rgb_to_ansi256(mappy['RED_BOLD']))
-    mappy['GRN_CLI_BOLD'] = str(Rgb.rgb_to_ansi256(mappy['GRN_BOLD']))
-    mappy['YEL_CLI_BOLD'] = str(Rgb.rgb_to_ansi256(mappy['YEL_BOLD']))
-    mappy['BLU_CLI_BOLD'] = str(Rgb.rgb_to_ansi256(mappy['BLU_BOLD']))
-    mappy['VIO_CLI_BOLD'] = str(Rgb.rgb_to_ansi256(mappy['VIO_BOLD']))
-    mappy['CYA_CLI_BOLD'] = str(Rgb.rgb_to_ansi256(mappy['CYA_BOLD']))
-    mappy['WHT_CLI_BOLD'] = str(Rgb.rgb_to_ansi256(mappy['WHT_BOLD']))
+    for label in Ansi256FidelityConst.COLOR_LABELS:
+      sources[label] += (('cfg', self.CTERM_SNAP),)
+      sources[f'{label[:4]}CLI_{label[4:]}'] = sources[label]
 
-    return
+    sources['NAME']         = (('name', None),)
+    sources['LITE_OR_DARK'] = (('is_dark', None),)
+
+    return sources
+
+  #_____________________________________________________________________
+  def gui_token(self, provider) -> str:
+    """
+    GUI color, moved onto its cterm color so GUI and terminal Vim match
+    if cterm snapping is on.
+    """
+
+    hex_str: str = provider()
+
+    if (self.cterm_snap_):
+      hex_str = StringUtils.int_to_hex6(
+        Ansi256Fidelity.snap(StringUtils.str_hex_to_int(hex_str)))
+
+    return hex_str
+
+  #_____________________________________________________________________
+  def cli_token(self, label: str) -> str:
+    """
+    ANSI 256 color index of a GUI color.
+    """
+
+    return str(RgbColor.rgb_to_ansi256(self.token(label)))
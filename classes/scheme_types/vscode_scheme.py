@@ -26,7 +26,11 @@
 #   Visual Studio Code color scheme
 #_______________________________________________________________________
 
+from functools import partial
+
 from classes.scheme_types.base_scheme import ColorScheme
+from classes.perceptual_color import PerceptualColor
+from classes.perceptual_color import PerceptualColorConst
 from classes.rgb_color import RgbColor
 
 from flux_bunny_utils.string_utils import StringUtils
@@ -49,30 +53,84 @@ class VsCodeScheme(ColorScheme):
   #_____________________________________________________________________
   TEMPLATE_PATH: str = 'templates/vscode/flux-bunny-template.json'
 
+  # ThemeModel values the accent tokens are computed from
+  KEY_SOURCES: tuple =\
+    ( ('accent_color0', None)
+    , ('accent_color1', None)
+    , ('accent_color2', None)
+    , ('is_dark', None)
+    , ('ui_color_mode', None)
+    )
+
+  #_____________________________________________________________________
+  def token_providers(self) -> dict:
+    """
+    Adds the background and foreground colors made from each accent
+    color, KEY_BG_0 to KEY_FG_2.
+    """
+
+    providers: dict = super().token_providers()
+
+    for i in range(3):
+      providers[f'KEY_BG_{i}'] = partial(self.key_token, 0, i)
+      providers[f'KEY_FG_{i}'] = partial(self.key_token, 1, i)
+
+    return providers
+
+  #_____________________________________________________________________
+  def token_sources(self) -> dict:
+    """
+    Accent tokens are computed together from all three accent colors.
+    """
+
+    sources: dict = super().token_sources()
+
+    for i in range(3):
+      sources[f'KEY_BG_{i}'] = VsCodeScheme.KEY_SOURCES
+      sources[f'KEY_FG_{i}'] = VsCodeScheme.KEY_SOURCES
+
+    return sources
+
+  #_____________________________________________________________________
+  def key_token(self, kind: int, index: int) -> str:
+    """
+    Parameters
+      kind  : 0 for background, 1 for foreground
+      index : Accent color index
+    """
+
+    key_colors: tuple =\
+      self.context_.derive('key_colors', self.make_key_colors)
+
+    return StringUtils.int_to_hex6(key_colors[kind][index])
+
   #_____________________________________________________________________
-  def populate_replacement_map(self) -> str:
+  def make_key_colors(self) -> tuple:
     """
-    Populate map of color labels in template with values from
-    color scheme.
+    Returns
+      (backgrounds, foregrounds) made from the three accent colors
     """
 
-    super().populate_replacement_map()
+    accents: list =\
+      [ self.accent_color0_
+      , self.accent_color1_
+      , self.accent_color2_
+      ]
 
-    key_bg_0 = RgbColor.make_background_color(self.accent_color0_, is_dark=self.is_dark_)
-    key_bg_1 = RgbColor.make_background_color(self.accent_color1_, is_dark=self.is_dark_)
-    key_bg_2 = RgbColor.make_background_color(self.accent_color2_, is_dark=self.is_dark_)
+    if (self.ui_color_mode_ == PerceptualColorConst.OKLCH_MODE):
+      key_bgs: list =\
+        PerceptualColor.make_background_colors(accents, self.is_dark_)
 
-    key_fg_0 = RgbColor.make_foreground_color(self.accent_color0_, is_dark=self.is_dark_)
-    key_fg_1 = RgbColor.make_foreground_color(self.accent_color1_, is_dark=self.is_dark_)
-    key_fg_2 = RgbColor.make_foreground_color(self.accent_color2_, is_dark=self.is_dark_)
+      key_fgs: list =\
+        PerceptualColor.make_foreground_colors(accents, self.is_dark_)
 
-    color_map: dict = self.str_replace_map
+    else:
+      key_bgs: list =\
+        [ RgbColor.make_background_color(c, is_dark=self.is_dark_)
+          for c in accents ]
 
-    color_map['KEY_BG_0'] =  StringUtils.int_to_hex6(key_bg_0)
-    color_map['KEY_BG_1'] =  StringUtils.int_to_hex6(key_bg_1)
-    color_map['KEY_BG_2'] =  StringUtils.int_to_hex6(key_bg_2)
-    color_map['KEY_FG_0'] =  StringUtils.int_to_hex6(key_fg_0)
-    color_map['KEY_FG_1'] =  StringUtils.int_to_hex6(key_fg_1)
-    color_map['KEY_FG_2'] =  StringUtils.int_to_hex6(key_fg_2)
+      key_fgs: list =\
+        [ RgbColor.make_foreground_color(c, is_dark=self.is_dark_)
+          for c in accents ]
 
-    return
+    return (tuple(key_bgs), tuple(key_fgs))
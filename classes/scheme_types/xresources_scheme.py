@@ -0,0 +1,48 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   X resources color scheme with the full 256 color palette
+#_______________________________________________________________________
+
+from classes.scheme_types.base_scheme import ColorScheme
+
+
+#_______________________________________________________________________
+class XresourcesScheme(ColorScheme):
+  """
+  Used to generate an X resources file for xterm, urxvt and other X
+  terminals. Colors 16-255 are generated from the theme.
+  """
+
+  OUT_EXT: str = 'Xresources'
+
+  EXTENDED_PALETTE: bool = True
+
+  COMPLETION_TEXT: str =str (
+    '\nMerge the output file into your X resources:'
+    '\nxrdb -merge <output-file>'
+  )
+
+  TEMPLATE_PATH: str = 'templates/xresources/flux-bunny-template.Xresources'
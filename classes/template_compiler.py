@@ -0,0 +1,322 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Compiles templates into literal segments and token slots so a
+#   template is rendered with a single join instead of one replacement
+#   pass per token. Compiled templates are cached in memory and on disk,
+#   keyed by a hash of the template text and its tokens.
+#_______________________________________________________________________
+
+import hashlib
+import json
+import os
+import re
+
+from classes.template_modifier import TemplateModifier
+from classes.template_modifier import TemplateModifierConst
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+
+#_______________________________________________________________________
+class TemplateCompilerConst:
+
+  CACHE_VERSION    : int = 2
+  CACHE_SUB_DIR    : str = 'templates'
+  CACHE_FILE_FORMAT: str = 'template-v{}-{}.json'
+
+
+#_______________________________________________________________________
+class CompiledTemplate:
+  """
+  Template split into literal segments with a token slot between each
+  pair of segments.
+  """
+
+  #_____________________________________________________________________
+  def __init__(self, parts: list[str]):
+    """
+    Parameters
+      parts : Literal segments at even indices and token names at odd
+              indices, always an odd number of entries
+    """
+
+    self.parts_: tuple = tuple(parts)
+    self.slots_: tuple = self.parts_[1::2]
+
+    # Indices into parts of every slot of each token
+    self.slot_indices_: dict = {}
+
+    for i in range(1, len(self.parts_), 2):
+      self.slot_indices_.setdefault(self.parts_[i], []).append(i)
+
+    # Parsed modifier expressions, see TemplateModifier
+    self.modifiers_: dict =\
+      { slot: TemplateModifier.from_slot(slot)
+        for slot in self.slot_indices_
+        if (TemplateModifier.is_modified(slot)) }
+
+    return
+
+  #_____________________________________________________________________
+  def tokens(self) -> set:
+    """
+    Tokens the template references.
+    """
+
+    return set(self.slots_)
+
+  #_____________________________________________________________________
+  def render(self, values: dict) -> str:
+    """
+    Fills every slot with the value of its token. Tokens without a
+    value are left in the output as is.
+
+    Parameters
+      values : Replacement strings keyed by token
+
+    Returns
+      Rendered template
+    """
+
+    return ''.join(self.fill(values))
+
+  #_____________________________________________________________________
+  def fill(self, values: dict) -> list[str]:
+    """
+    Same as render, without joining the parts. Slots of a token can
+    later be changed in place through slot_indices_.
+    """
+
+    parts: list = list(self.parts_)
+    parts[1::2] = [ values.get(token, token) for token in self.slots_ ]
+
+    return parts
+
+
+#_______________________________________________________________________
+class TemplateCompiler:
+  """
+  Tokenizes templates once. At each position the longest token that
+  matches is taken, so tokens that are prefixes of other tokens cannot
+  replace part of a longer token. Modifier expressions such as
+  {{BG__NORM | alpha(0.6)}} become slots named by their canonical form.
+  """
+
+  # Compiled templates keyed by cache key
+  compiled_: dict = {}
+
+  # Directory of compiled template files, None for the cache directory
+  cache_dir_: str = None
+
+  #_____________________________________________________________________
+  def cache_key(text: str, tokens) -> str:
+    """
+    Hash of the template text and the set of tokens it is split on.
+    """
+
+    digest = hashlib.sha256(text.encode('utf-8'))
+
+    for token in sorted(set(tokens)):
+      digest.update(b'\0')
+      digest.update(token.encode('utf-8'))
+
+    return digest.hexdigest()
+
+  #_____________________________________________________________________
+  def tokenize(text: str, tokens) -> list[str]:
+    """
+    Splits the template text on tokens, longest match first.
+
+    Parameters
+      text   : Template text
+      tokens : Token names to split on
+
+    Returns
+      Literal segments at even indices and token names at odd indices
+    """
+
+    tokens = sorted([ t for t in set(tokens) if (t) ]
+      , key=lambda t: (-len(t), t))
+
+    if (not len(tokens)):
+      return [text]
+
+    # Alternation takes the first alternative that matches, so longer
+    # tokens are listed first
+    pattern = re.compile('|'.join(
+      [TemplateModifierConst.EXPRESSION_RE] + list(map(re.escape, tokens))))
+
+    parts: list[str] = []
+    start: int = 0
+
+    for match in pattern.finditer(text):
+      slot: str = match.group()
+
+      if (slot.startswith('{{')):
+        slot = TemplateModifier.parse(slot, tokens)[0]
+
+      parts.append(text[start:match.start()])
+      parts.append(slot)
+      start = match.end()
+
+    parts.append(text[start:])
+
+    return parts
+
+  #_____________________________________________________________________
+  def cache_file_path(key: str) -> str:
+
+    Const = TemplateCompilerConst
+
+    cache_dir: str = TemplateCompiler.cache_dir_
+
+    if (cache_dir is None):
+      cache_dir = os.path.join(Utils.get_cache_dir(), Const.CACHE_SUB_DIR)
+
+    os.makedirs(cache_dir, exist_ok=True)
+
+    return os.path.join(cache_dir
+      , Const.CACHE_FILE_FORMAT.format(Const.CACHE_VERSION, key))
+
+  #_____________________________________________________________________
+  def read_cache_file(file_path: str) -> list[str]:
+    """
+    Returns the parts stored in a compiled template file, or None if
+    the file is missing or not valid.
+    """
+
+    try:
+      with open(file_path, 'r') as file:
+        parts = json.load(file)
+
+    except (OSError, ValueError):
+      return None
+
+    if (not isinstance(parts, list)
+      or len(parts) % 2 != 1
+      or not all(isinstance(p, str) for p in parts)):
+      return None
+
+    return parts
+
+  #_____________________________________________________________________
+  def write_cache_file(file_path: str, parts: list[str]) -> None:
+    """
+    Writes the parts of a compiled template. The file is replaced
+    atomically so concurrent readers never see a partial file. Failing
+    to write only means the template is compiled again next time.
+    """
+
+    tmp_path: str = f'{file_path}.{os.getpid()}.tmp'
+
+    try:
+      with open(tmp_path, 'w') as file:
+        json.dump(parts, file)
+
+      os.replace(tmp_path, file_path)
+
+    except OSError:
+      pass
+
+    return
+
+  #_____________________________________________________________________
+  def is_valid_slots(slots: list[str], tokens: set) -> bool:
+    """
+    True if every slot read from a cache file is a token or a valid
+    modifier expression of tokens.
+    """
+
+    for slot in set(slots):
+      if (not TemplateModifier.is_modified(slot)):
+        if (slot not in tokens):
+          return False
+
+        continue
+
+      try:
+        TemplateModifier.from_slot(slot, tokens)
+      except ValueError:
+        return False
+
+    return True
+
+  #_____________________________________________________________________
+  def compile(text: str, tokens) -> CompiledTemplate:
+    """
+    Compiles a template, reusing an earlier compilation of the same
+    text and tokens from memory or disk.
+
+    Parameters
+      text   : Template text
+      tokens : Token names to split on
+
+    Returns
+      Compiled template
+    """
+
+    tokens = set(tokens)
+
+    key: str = TemplateCompiler.cache_key(text, tokens)
+
+    compiled: CompiledTemplate = TemplateCompiler.compiled_.get(key)
+
+    if (compiled is not None):
+      return compiled
+
+    try:
+      file_path: str = TemplateCompiler.cache_file_path(key)
+    except OSError:
+      file_path = None
+
+    parts: list[str] = None
+
+    if (file_path is not None):
+      parts = TemplateCompiler.read_cache_file(file_path)
+
+    if (parts is not None
+      and not TemplateCompiler.is_valid_slots(parts[1::2], tokens)):
+      parts = None
+
+    if (parts is None):
+      parts = TemplateCompiler.tokenize(text, tokens)
+
+      if (file_path is not None):
+        TemplateCompiler.write_cache_file(file_path, parts)
+
+    compiled = CompiledTemplate(parts)
+    TemplateCompiler.compiled_[key] = compiled
+
+    return compiled
+
+  #_____________________________________________________________________
+  def clear() -> None:
+    """
+    Empties the in memory cache. Files on disk are kept.
+    """
+
+    TemplateCompiler.compiled_.clear()
+
+    return
@@ -0,0 +1,306 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Color modifiers in templates, e.g.
+#     "editor.selectionBackground": "#{{YEL_BOLD | alpha(38%)}}"
+#     "editor.lineHighlightBackground": "#{{BLU_NORM | mix(0.85)}}"
+#     hi Comment ctermfg={{FG__NORM | darken(0.2) | ansi}}
+#   A modifier expression is parsed when its template is compiled and
+#   becomes a slot named by its canonical form, so equal expressions
+#   share one computed value per theme.
+#_______________________________________________________________________
+
+import re
+
+from classes.color_expression import ColorExpression
+from classes.rgb_color import RgbColor
+from classes.theme_model import RenderContextConst
+from flux_bunny_utils.error_utils import ErrorUtils
+
+
+#_______________________________________________________________________
+class TemplateModifierConst:
+
+  # Modifier expression in template text
+  EXPRESSION_RE: str = r'\{\{[^{}]*\}\}'
+
+  MODIFIER_RE = re.compile(
+    r'\s*(?P<name>[a-z_]+)\s*(?:\((?P<args>[^()]*)\))?\s*$')
+
+  NUMBER_RE = re.compile(r'\s*(?P<number>-?(?:\d+(?:\.\d*)?|\.\d+))'
+    r'(?P<percent>%?)\s*$')
+
+  # Tokens other than the base colors that hold a hex color, from
+  # VsCodeScheme.token_providers and ExtendedPalette.TOKEN_FORMAT
+  COLOR_TOKEN_RE = re.compile(r'(?:KEY_[BF]G_\d+|ANSI_\d{3})$')
+
+  # Separates the token and modifiers of a canonical slot name
+  SEPARATOR: str = '|'
+
+  # Color mixed in by mix when no token is given
+  MIX_TOKEN: str = 'BG__NORM'
+
+  NUMBER: str = 'number'
+  TOKEN : str = 'token'
+
+  # Argument kinds, default values of trailing arguments, and whether
+  # the modifier ends the expression since its result is not a color
+  MODIFIERS: dict =\
+    { 'alpha'  : ([NUMBER], [], True)
+    , 'lighten': ([NUMBER], [], False)
+    , 'darken' : ([NUMBER], [], False)
+    , 'mix'    : ([NUMBER, TOKEN], [MIX_TOKEN], False)
+    , 'ansi'   : ([], [], True)
+    }
+
+
+#_______________________________________________________________________
+class TemplateModifier:
+  """
+  A parsed expression is a tuple of (token, chain), chain being a tuple
+  of (modifier name, argument tuple) applied left to right.
+  """
+
+  # Parsed expressions keyed by canonical slot name
+  cache_: dict = {}
+
+  #_____________________________________________________________________
+  def raise_invalid(text: str, reason: str) -> None:
+    desc: str =\
+      f'{ErrorUtils.INVALID_VALUE} {reason} in template expression {text!r}'
+    ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+  #_____________________________________________________________________
+  def is_modified(slot: str) -> bool:
+    """
+    True if a slot name is a modifier expression rather than a token.
+    """
+
+    return TemplateModifierConst.SEPARATOR in slot
+
+  #_____________________________________________________________________
+  def is_color_token(token: str) -> bool:
+    """
+    True if a token holds a hex color and so may be modified. Tokens
+    such as NAME, LITE_OR_DARK or the cterm numbers of Vim may not.
+    """
+
+    return token in RenderContextConst.BASE_SOURCES\
+      or TemplateModifierConst.COLOR_TOKEN_RE.match(token) is not None
+
+  #_____________________________________________________________________
+  def check_token(text: str, token: str, tokens) -> None:
+    """
+    Raises ValueError unless a token in an expression is a color token
+    and, if tokens is given, one of tokens.
+    """
+
+    if (not TemplateModifier.is_color_token(token)):
+      TemplateModifier.raise_invalid(text, f'non color token {token!r}')
+
+    if (tokens is not None and token not in tokens):
+      TemplateModifier.raise_invalid(text, f'token {token!r}')
+
+  #_____________________________________________________________________
+  def parse_arg(text: str, kind: str, value: str, tokens):
+
+    Const = TemplateModifierConst
+
+    value = value.strip()
+
+    if (kind == Const.TOKEN):
+      TemplateModifier.check_token(text, value, tokens)
+
+      return value
+
+    match = Const.NUMBER_RE.match(value)
+
+    if (match is None):
+      TemplateModifier.raise_invalid(text, f'number {value!r}')
+
+    number: float = float(match.group('number'))
+
+    return number / 100 if (match.group('percent')) else number
+
+  #_____________________________________________________________________
+  def parse(text: str, tokens) -> tuple:
+    """
+    Parses a modifier expression.
+
+    Parameters
+      text   : Expression with or without the enclosing braces, e.g.
+               '{{BG__NORM | lighten(0.1) | alpha(60%)}}'
+      tokens : Tokens defined by the exporter, None to skip the check.
+               Only color tokens may be modified either way.
+
+    Returns
+      Tuple of (canonical slot name, token, chain)
+    """
+
+    Const = TemplateModifierConst
+    Modifier = TemplateModifier
+
+    body: str = text.strip()
+
+    if (body.startswith('{{') and body.endswith('}}')):
+      body = body[2:-2]
+
+    token, *modifiers = [ s.strip() for s in body.split(Const.SEPARATOR) ]
+
+    Modifier.check_token(text, token, tokens)
+
+    chain: list[tuple] = []
+
+    for modifier in modifiers:
+      match = Const.MODIFIER_RE.match(modifier)
+
+      if (match is None or match.group('name') not in Const.MODIFIERS):
+        Modifier.raise_invalid(text, f'modifier {modifier!r}')
+
+      if (chain and Const.MODIFIERS[chain[-1][0]][2]):
+        Modifier.raise_invalid(text, f'modifier after {chain[-1][0]!r}')
+
+      name: str = match.group('name')
+      kinds, defaults, _ = Const.MODIFIERS[name]
+
+      values: list[str] = []
+
+      if (match.group('args') is not None and match.group('args').strip()):
+        values = match.group('args').split(',')
+
+      if (not len(kinds) - len(defaults) <= len(values) <= len(kinds)):
+        Modifier.raise_invalid(text, f'arguments of {name!r}')
+
+      args: list = [ Modifier.parse_arg(text, kind, value, tokens)
+        for kind, value in zip(kinds, values) ]
+
+      # Defaults of the trailing arguments left out
+      args += defaults[len(args) - (len(kinds) - len(defaults)):]
+
+      if (name == 'alpha' and not 0.0 <= args[0] <= 1.0):
+        Modifier.raise_invalid(text, 'alpha outside 0 to 1')
+
+      chain.append((name, tuple(args)))
+
+    chain = tuple(chain)
+
+    return (Modifier.canonical(token, chain), token, chain)
+
+  #_____________________________________________________________________
+  def canonical(token: str, chain: tuple) -> str:
+    """
+    Slot name of a parsed expression. Equal expressions written with
+    different spacing or number formats have the same name.
+    """
+
+    Const = TemplateModifierConst
+
+    names: list[str] = [token]
+
+    for name, args in chain:
+      if (len(args)):
+        names.append(f'{name}('
+          + ','.join(a if (isinstance(a, str)) else f'{a:g}' for a in args)
+          + ')')
+
+      else:
+        names.append(name)
+
+    return Const.SEPARATOR.join(names)
+
+  #_____________________________________________________________________
+  def from_slot(slot: str, tokens = None) -> tuple:
+    """
+    Parsed expression of a canonical slot name, from the cache when
+    possible.
+
+    Parameters
+      slot   : Canonical slot name
+      tokens : Tokens defined by the exporter, None to skip the check
+
+    Returns
+      Tuple of (token, chain)
+    """
+
+    Modifier = TemplateModifier
+
+    parsed: tuple = Modifier.cache_.get(slot)
+
+    if (parsed is None):
+      _, token, chain = Modifier.parse(slot, None)
+
+      parsed = (token, chain)
+      Modifier.cache_[slot] = parsed
+
+    if (tokens is not None):
+      token, chain = parsed
+
+      for reference in [token] + Modifier.references(chain):
+        Modifier.check_token(slot, reference, tokens)
+
+    return parsed
+
+  #_____________________________________________________________________
+  def references(chain: tuple) -> list[str]:
+    """
+    Tokens used as modifier arguments, e.g. by mix.
+    """
+
+    return [ a for _, args in chain for a in args if (isinstance(a, str)) ]
+
+  #_____________________________________________________________________
+  def apply(chain: tuple, color: int, colors: dict) -> str:
+    """
+    Applies modifiers to a color.
+
+    Parameters
+      chain  : Parsed modifiers
+      color  : 24 bit RGB color of the modified token
+      colors : 24 bit RGB colors of the tokens in the arguments
+
+    Returns
+      Hex string, with alpha if the last modifier is alpha, or ANSI 256
+      color index for ansi
+    """
+
+    Expr = ColorExpression
+
+    for name, args in chain:
+      if (name == 'alpha'):
+        return f'{color:06x}{int(round(args[0] * 255)):02x}'
+
+      if (name == 'ansi'):
+        return str(RgbColor.rgb_to_ansi256(color))
+
+      if (name == 'lighten'):
+        color = Expr.lighten(color, args[0])
+
+      elif (name == 'darken'):
+        color = Expr.darken(color, args[0])
+
+      elif (name == 'mix'):
+        color = Expr.mix(color, colors[args[1]], args[0])
+
+    return f'{color:06x}'
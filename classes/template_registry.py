@@ -0,0 +1,205 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Process wide cache of template files. Each template is read once
+#   and checked against the mtime and size of the file on later uses,
+#   so batch runs do not read the same template for every theme.
+#_______________________________________________________________________
+
+import os
+import threading
+
+from classes.template_compiler import CompiledTemplate
+from classes.template_compiler import TemplateCompiler
+
+
+#_______________________________________________________________________
+class TemplateRegistryConst:
+
+  HITS   : str = 'hits'
+  LOADS  : str = 'loads'
+  RELOADS: str = 'reloads'
+
+  REPORT_LINE: str = 76 * '-'
+
+
+#_______________________________________________________________________
+class TemplateEntry:
+  """
+  Text of one template file, the stat signature it was read with, and
+  its compilations keyed by token set.
+  """
+
+  #_____________________________________________________________________
+  def __init__(self, signature: tuple, text: str):
+
+    self.signature_: tuple = signature
+    self.text_: str = text
+    self.compiled_: dict = {}
+
+    return
+
+
+#_______________________________________________________________________
+class TemplateRegistry:
+  """
+  Templates keyed by absolute path. Safe to share between threads: the
+  lock is held while an entry is checked or replaced, never while a
+  template is rendered.
+  """
+
+  entries_: dict = {}
+  lock_ = threading.Lock()
+
+  stats_: dict =\
+    { TemplateRegistryConst.HITS   : 0
+    , TemplateRegistryConst.LOADS  : 0
+    , TemplateRegistryConst.RELOADS: 0
+    }
+
+  #_____________________________________________________________________
+  def signature(file_path: str) -> tuple:
+    """
+    Modification time and size of a file, which change whenever the
+    file is rewritten.
+    """
+
+    stat = os.stat(file_path)
+
+    return (stat.st_mtime_ns, stat.st_size)
+
+  #_____________________________________________________________________
+  def entry(file_path: str) -> TemplateEntry:
+    """
+    Returns the entry of a template file, reading the file if it is
+    new or has changed since it was read.
+    """
+
+    Const = TemplateRegistryConst
+    Registry = TemplateRegistry
+
+    file_path = os.path.abspath(file_path)
+    signature: tuple = Registry.signature(file_path)
+
+    with Registry.lock_:
+      entry: TemplateEntry = Registry.entries_.get(file_path)
+
+      if (entry is not None and entry.signature_ == signature):
+        Registry.stats_[Const.HITS] += 1
+        return entry
+
+      with open(file_path, 'r') as file:
+        text: str = file.read()
+
+      counter: str = Const.LOADS if (entry is None) else Const.RELOADS
+      Registry.stats_[counter] += 1
+
+      entry = TemplateEntry(signature, text)
+      Registry.entries_[file_path] = entry
+
+    return entry
+
+  #_____________________________________________________________________
+  def load(file_path: str) -> str:
+    """
+    Parameters
+      file_path : Path of template file
+
+    Returns
+      Text of template file
+    """
+
+    return TemplateRegistry.entry(file_path).text_
+
+  #_____________________________________________________________________
+  def compile(file_path: str, tokens) -> CompiledTemplate:
+    """
+    Compiles a template file for a set of tokens. The compilation is
+    kept with the entry until the file changes.
+
+    Parameters
+      file_path : Path of template file
+      tokens    : Token names to split on
+
+    Returns
+      Compiled template
+    """
+
+    entry: TemplateEntry = TemplateRegistry.entry(file_path)
+    key: frozenset = frozenset(tokens)
+
+    compiled: CompiledTemplate = entry.compiled_.get(key)
+
+    if (compiled is None):
+      compiled = TemplateCompiler.compile(entry.text_, key)
+
+      # Threads compiling the same template at once get equal results
+      entry.compiled_.setdefault(key, compiled)
+
+    return compiled
+
+  #_____________________________________________________________________
+  def stats() -> dict:
+    """
+    Returns
+      Dictionary of {hits, loads, reloads, size}
+    """
+
+    with TemplateRegistry.lock_:
+      return dict(TemplateRegistry.stats_
+        , size=len(TemplateRegistry.entries_))
+
+  #_____________________________________________________________________
+  def clear() -> None:
+    """
+    Forgets every template and resets the counters.
+    """
+
+    with TemplateRegistry.lock_:
+      TemplateRegistry.entries_.clear()
+
+      for counter in TemplateRegistry.stats_:
+        TemplateRegistry.stats_[counter] = 0
+
+    return
+
+  #_____________________________________________________________________
+  def create_report_str() -> str:
+    """
+    Counters of the registry.
+    """
+
+    Const = TemplateRegistryConst
+
+    stats: dict = TemplateRegistry.stats()
+
+    return '\n'.join(
+      [ '\nTemplate cache statistics'
+      , Const.REPORT_LINE
+      , f'{"templates":28s}{stats["size"]:10d}'
+      , f'{"hits":28s}{stats[Const.HITS]:10d}'
+      , f'{"loads":28s}{stats[Const.LOADS]:10d}'
+      , f'{"reloads":28s}{stats[Const.RELOADS]:10d}'
+      ])
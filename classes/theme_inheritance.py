@@ -0,0 +1,169 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Layered input json. A theme may declare
+#     "extends": "<path of base theme json>"
+#   relative to its own file, and only list the keys it overrides.
+#   Resolved themes are memoized by content hash, so a batch of
+#   variants resolves each shared base once.
+#_______________________________________________________________________
+
+import hashlib
+import json
+import os
+
+from flux_bunny_utils.error_utils import ErrorUtils
+
+
+#_______________________________________________________________________
+class ThemeInheritanceConst:
+
+  EXTENDS_KEY: str = 'extends'
+
+  # Same as ColorScheme.PALETTE. An override palette may be a list,
+  # replacing the base palette, or a dict of {"index": color} entries
+  # replacing single base palette entries.
+  PALETTE_KEY: str = 'palette'
+
+
+#_______________________________________________________________________
+class ThemeInheritance:
+  """
+  Themes are keyed by the SHA-256 of their file content. A theme that
+  extends a base is keyed by its own hash combined with the key of the
+  resolved base, so editing any layer changes the key.
+  """
+
+  # Parsed json, keyed by content hash
+  parsed_: dict = {}
+
+  # Resolved themes, keyed by combined hash
+  resolved_: dict = {}
+
+  #_____________________________________________________________________
+  def merge(base: dict, override: dict) -> dict:
+    """
+    Applies the keys of override on top of base.
+    """
+
+    Const = ThemeInheritanceConst
+
+    out: dict = dict(base)
+
+    for key, value in override.items():
+      if (key == Const.EXTENDS_KEY):
+        continue
+
+      if (key == Const.PALETTE_KEY and isinstance(value, dict)):
+        palette: list = list(base.get(Const.PALETTE_KEY, []))
+
+        for index, color in value.items():
+          i: int = int(index)
+
+          if (not 0 <= i < len(palette)):
+            desc: str = f'{ErrorUtils.INVALID_VALUE} palette index {index}'
+            ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+          palette[i] = color
+
+        value = palette
+
+      out[key] = value
+
+    return out
+
+  #_____________________________________________________________________
+  def resolve_file(file_path: str, chain: tuple = ()) -> tuple:
+    """
+    Parameters
+      file_path : path of theme json file
+      chain     : files already being resolved, to detect cycles
+
+    Returns
+      Tuple of (key, resolved dict). The dict is shared, do not modify.
+    """
+
+    Inheritance = ThemeInheritance
+
+    file_path = os.path.abspath(file_path)
+
+    if (file_path in chain):
+      desc: str = f'{ErrorUtils.INVALID_VALUE} circular extends '\
+        + ' -> '.join(chain[chain.index(file_path):] + (file_path,))
+      ErrorUtils.raise_exception_with_desc(err=ValueError(), desc=desc)
+
+    with open(file_path, 'rb') as file:
+      data: bytes = file.read()
+
+    key: str = hashlib.sha256(data).hexdigest()
+
+    cfg: dict = Inheritance.parsed_.get(key)
+
+    if (cfg is None):
+      cfg = json.loads(data)
+      Inheritance.parsed_[key] = cfg
+
+    base_name = cfg.get(ThemeInheritanceConst.EXTENDS_KEY)\
+      if (isinstance(cfg, dict)) else None
+
+    if (base_name is None):
+      return key, cfg
+
+    base_key, base_cfg = Inheritance.resolve_file(
+      os.path.join(os.path.dirname(file_path), base_name)
+      , chain + (file_path,))
+
+    key = hashlib.sha256(f'{key}:{base_key}'.encode()).hexdigest()
+
+    resolved: dict = Inheritance.resolved_.get(key)
+
+    if (resolved is None):
+      resolved = Inheritance.merge(base_cfg, cfg)
+      Inheritance.resolved_[key] = resolved
+
+    return key, resolved
+
+  #_____________________________________________________________________
+  def read_theme(file_path: str) -> dict:
+    """
+    Reads a theme json file with its base themes applied.
+
+    Returns
+      Dictionary with key value pairs, safe to modify
+    """
+
+    cfg = ThemeInheritance.resolve_file(file_path)[1]
+
+    if (not isinstance(cfg, dict)):
+      return cfg
+
+    out: dict = dict(cfg)
+
+    # The only nested value callers modify in place
+    if (isinstance(out.get(ThemeInheritanceConst.PALETTE_KEY), list)):
+      out[ThemeInheritanceConst.PALETTE_KEY] =\
+        list(out[ThemeInheritanceConst.PALETTE_KEY])
+
+    return out
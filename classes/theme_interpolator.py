@@ -0,0 +1,256 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Blends two themes in OKLab to create a sequence of intermediate
+#   themes, e.g. for scheduled day to night transitions, and exports
+#   each of them with every scheme type.
+#_______________________________________________________________________
+
+import json
+
+from os import path
+
+from classes.color_space import ColorSpace
+from classes.scheme_types.base_scheme import ColorScheme
+from classes.theme_inheritance import ThemeInheritance
+from classes.theme_library import ThemeColors
+from classes.theme_library import ThemeLibraryConst
+from flux_bunny_utils.file_utils import FileUtils
+from flux_bunny_utils.string_utils import StringUtils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class ThemeInterpolatorConst:
+
+  # Json keys of the single colors, in the order of ATTRS
+  KEYS: list[str] =\
+    [ ColorScheme.CURSOR_COLOR
+    , ColorScheme.BG_NORM_KEY
+    , ColorScheme.BG_BOLD_KEY
+    , ColorScheme.FG_NORM_KEY
+    , ColorScheme.FG_BOLD_KEY
+    , ColorScheme.KEY_BG0_KEY
+    , ColorScheme.KEY_BG1_KEY
+    , ColorScheme.KEY_BG2_KEY
+    ]
+
+  ATTRS: list[str] =\
+    [ 'cursor_color_'
+    , 'bg_norm_color_'
+    , 'bg_bold_color_'
+    , 'fg_norm_color_'
+    , 'fg_bold_color_'
+    , 'accent_color0_'
+    , 'accent_color1_'
+    , 'accent_color2_'
+    ]
+
+  BG_NORM_INDEX: int = 1
+
+  STEPS: int = 5
+
+  # Themes with a background lighter than mid grey are light themes
+  DARK_MAX_LIGHTNESS: float = ColorSpace.rgb_to_oklab(0x808080)[0]
+
+  NAME_FORMAT: str = '{start} to {end} {index:02d}'
+
+  INPUT_SUFFIX: str = '-input.json'
+
+
+#_______________________________________________________________________
+class ThemeInterpolator:
+  """
+  A theme's colors are ThemeInterpolatorConst.ATTRS followed by the 16
+  palette colors. Json keys other than colors are taken from the
+  closer end theme.
+  """
+
+  #_____________________________________________________________________
+  def theme_colors(cfg: dict) -> list[int]:
+    """
+    Colors of a theme, with defaults for keys missing from cfg.
+    """
+
+    scheme = ThemeColors(cfg)
+
+    return [ getattr(scheme, attr) for attr in ThemeInterpolatorConst.ATTRS ]\
+      + list(scheme.palette_[:ThemeLibraryConst.PALETTE_SIZE])
+
+  #_____________________________________________________________________
+  def blend_weights(count: int) -> list[float]:
+    """
+    Weights of the end theme for count intermediate themes, excluding
+    both end themes.
+    """
+
+    return [ (k + 1) / (count + 1) for k in range(count) ]
+
+  #_____________________________________________________________________
+  def blend(start: list[int], end: list[int], count: int):
+    """
+    Blends every color of two themes in OKLab for all steps at once.
+
+    Parameters
+      start : (N,) packed colors of the first theme
+      end   : (N,) packed colors of the last theme
+      count : Number of intermediate themes
+
+    Returns
+      (count, N) packed colors
+    """
+
+    weights = np.asarray(ThemeInterpolator.blend_weights(count))[:, None, None]
+
+    start_lab = ColorSpace.rgb_to_oklab_array(start)
+    end_lab = ColorSpace.rgb_to_oklab_array(end)
+
+    return ColorSpace.oklab_to_rgb_array(
+      (1 - weights) * start_lab + weights * end_lab)
+
+  #_____________________________________________________________________
+  def blend_lists(start: list[int], end: list[int], count: int) -> list:
+    """
+    Scalar blend, used without NumPy.
+    """
+
+    start_lab: list = [ ColorSpace.rgb_to_oklab(c) for c in start ]
+    end_lab: list = [ ColorSpace.rgb_to_oklab(c) for c in end ]
+
+    return\
+      [ [ ColorSpace.oklab_to_rgb(
+            tuple((1 - w) * a + w * b for a, b in zip(lab0, lab1)))
+          for lab0, lab1 in zip(start_lab, end_lab) ]
+        for w in ThemeInterpolator.blend_weights(count) ]
+
+  #_____________________________________________________________________
+  def make_configs(start_cfg: dict, end_cfg: dict, count: int) -> list:
+    """
+    Creates the input json dictionaries of count intermediate themes.
+    """
+
+    Const = ThemeInterpolatorConst
+    Scheme = ColorScheme
+
+    start: list[int] = ThemeInterpolator.theme_colors(start_cfg)
+    end: list[int] = ThemeInterpolator.theme_colors(end_cfg)
+
+    if (np is not None):
+      blended: list = ThemeInterpolator.blend(start, end, count).tolist()
+
+    else:
+      blended: list = ThemeInterpolator.blend_lists(start, end, count)
+
+    start_name: str = start_cfg.get(Scheme.NAME, Scheme.NAME)
+    end_name: str = end_cfg.get(Scheme.NAME, Scheme.NAME)
+
+    hex_str = lambda c: f'0x{StringUtils.int_to_hex6(c)}'
+
+    cfgs: list[dict] = []
+
+    for k, weight in enumerate(ThemeInterpolator.blend_weights(count)):
+      colors: list[int] = blended[k]
+
+      cfg: dict = dict(start_cfg if (weight < 0.5) else end_cfg)
+
+      for key, color in zip(Const.KEYS, colors):
+        cfg[key] = hex_str(color)
+
+      cfg[Scheme.PALETTE] = [ hex_str(c) for c in colors[len(Const.KEYS):] ]
+
+      bg_lightness: float =\
+        ColorSpace.rgb_to_oklab(colors[Const.BG_NORM_INDEX])[0]
+
+      cfg[Scheme.MODE] =\
+        'dark' if (bg_lightness <= Const.DARK_MAX_LIGHTNESS) else 'light'
+
+      cfg[Scheme.NAME] = Const.NAME_FORMAT.format(
+        start=start_name, end=end_name, index=k + 1)
+
+      cfgs.append(cfg)
+
+    return cfgs
+
+  #_____________________________________________________________________
+  def render(cfgs: list[dict], scheme_types: list, out_dir: str) -> list:
+    """
+    Writes each theme's input json and its export for every scheme
+    type to its own directory below out_dir.
+
+    Returns
+      List of theme directories
+    """
+
+    theme_dirs: list[str] = []
+
+    for cfg in cfgs:
+      # Parsed once for every scheme type
+      scheme = ThemeColors(cfg)
+
+      theme_dir: str = path.abspath(path.join(out_dir, scheme.name_))
+      FileUtils.verify_dir(theme_dir)
+
+      input_path: str = path.join(
+        theme_dir, f'{scheme.name_}{ThemeInterpolatorConst.INPUT_SUFFIX}')
+
+      with open(input_path, 'w') as file:
+        json.dump(cfg, file, indent=2)
+
+      for SchemeType in scheme_types:
+        SchemeType(theme_dir, scheme.context_).write_file()
+
+      theme_dirs.append(theme_dir)
+
+    return theme_dirs
+
+  #_____________________________________________________________________
+  def run(args, scheme_types: list) -> str:
+    """
+    Command line entry point. Blends the --file theme, or the default
+    theme, into the --interpolate theme.
+
+    Returns
+      Summary of the written themes
+    """
+
+    start_cfg: dict = {}
+
+    if (args.file):
+      start_cfg = ThemeInheritance.read_theme(args.file)
+
+    end_cfg: dict = ThemeInheritance.read_theme(args.interpolate)
+
+    cfgs: list[dict] =\
+      ThemeInterpolator.make_configs(start_cfg, end_cfg, args.steps)
+
+    theme_dirs: list[str] =\
+      ThemeInterpolator.render(cfgs, scheme_types, args.out_dir)
+
+    return '\n'.join(
+      [ f'\nWrote {len(theme_dirs)} interpolated themes' ] + theme_dirs)
@@ -0,0 +1,243 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Loads collections of input json themes for batch analysis without
+#   rendering any exporter templates.
+#_______________________________________________________________________
+
+import os
+
+from classes.extended_palette import ExtendedPalette
+from classes.scheme_types.base_scheme import ColorScheme
+from classes.theme_inheritance import ThemeInheritance
+from classes.theme_model import RenderContextConst
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class ThemeLibraryConst:
+
+  JSON_EXT    : str = '.json'
+  PALETTE_SIZE: int = 16
+
+  # Template labels of the 16 palette slots, in palette order
+  SLOT_LABELS: list[str] = RenderContextConst.PALETTE_LABELS
+
+  # Palette slots meant to blend with the background, exempt from
+  # contrast requirements
+  DARK_EXEMPT_SLOTS: list[int] = [0]
+  LITE_EXEMPT_SLOTS: list[int] = [7, 15]
+
+  # Name used for the built in default theme
+  DEFAULT_NAME: str = 'default'
+
+
+#_______________________________________________________________________
+class ThemeColors(ColorScheme):
+  """
+  Color scheme that only parses colors. Nothing is rendered or written.
+  """
+
+  #_____________________________________________________________________
+  def __init__(self, cfg = None):
+    self.init_colors(cfg)
+
+    return
+
+
+#_______________________________________________________________________
+class ThemeLibrary:
+  """
+  A list of parsed themes plus their colors packed into arrays, one row
+  per theme.
+  """
+
+  #_____________________________________________________________________
+  def __init__(self, themes: list = None):
+    """
+    Parameters
+      themes : List of (name, dict created from json) tuples. An empty
+               dict gives the default theme.
+    """
+
+    if (themes is None):
+      themes = [(ThemeLibraryConst.DEFAULT_NAME, {})]
+
+    self.names_: list[str] = [ name for name, _ in themes ]
+    self.configs_: list[dict] = [ cfg for _, cfg in themes ]
+
+    self.schemes_: list[ThemeColors] =\
+      [ ThemeColors(cfg) for cfg in self.configs_ ]
+
+    for name, scheme in zip(self.names_, self.schemes_):
+      if (len(scheme.palette_) < ThemeLibraryConst.PALETTE_SIZE):
+        raise ValueError(f'Palette of {name} has fewer than '
+          f'{ThemeLibraryConst.PALETTE_SIZE} colors')
+
+    return
+
+  #_____________________________________________________________________
+  def __len__(self) -> int:
+    return len(self.schemes_)
+
+  #_____________________________________________________________________
+  def slice(self, start: int, stop: int) -> 'ThemeLibrary':
+    """
+    Returns the themes in [start, stop) without parsing them again.
+    """
+
+    out: ThemeLibrary = ThemeLibrary.__new__(ThemeLibrary)
+
+    out.names_ = self.names_[start:stop]
+    out.configs_ = self.configs_[start:stop]
+    out.schemes_ = self.schemes_[start:stop]
+
+    return out
+
+  #_____________________________________________________________________
+  def replacement_maps(self, SchemeType: type) -> list[dict]:
+    """
+    Template replacement map of every theme for an exporter type,
+    without rendering or writing the template.
+
+    Parameters
+      SchemeType : ColorScheme subclass, e.g. VsCodeScheme
+    """
+
+    maps: list[dict] = []
+
+    extended: list = [None] * len(self)
+
+    if (SchemeType.EXTENDED_PALETTE):
+      extended = ExtendedPalette.extended_palettes(self.schemes_)
+
+    for parsed, palette in zip(self.schemes_, extended):
+      # Skip __init__, which renders the template
+      scheme = SchemeType.__new__(SchemeType)
+      scheme.init_colors(parsed.context_)
+      scheme.extended_palette_ = palette
+      scheme.populate_replacement_map()
+
+      maps.append(scheme.str_replace_map)
+
+    return maps
+
+  #_____________________________________________________________________
+  def is_theme(cfg) -> bool:
+    """
+    True if a dictionary created from json looks like a theme input,
+    as opposed to an exported VS Code theme.
+    """
+
+    return isinstance(cfg, dict) and ColorScheme.PALETTE in cfg
+
+  #_____________________________________________________________________
+  def find_theme_files(theme_dir: str) -> list[str]:
+    """
+    Lists json files below a directory, sorted by path.
+    """
+
+    paths: list[str] = []
+
+    for root, _, files in os.walk(theme_dir):
+      for file_name in files:
+        if (file_name.endswith(ThemeLibraryConst.JSON_EXT)):
+          paths.append(os.path.join(root, file_name))
+
+    return sorted(paths)
+
+  #_____________________________________________________________________
+  def from_files(paths: list[str]) -> 'ThemeLibrary':
+    """
+    Loads theme inputs from json files. Files that are not theme inputs,
+    such as exported VS Code themes with comments, are skipped.
+    """
+
+    themes: list = []
+
+    for file_path in paths:
+      try:
+        cfg = ThemeInheritance.read_theme(file_path)
+
+      except ValueError:
+        continue
+
+      if (ThemeLibrary.is_theme(cfg)):
+        themes.append((file_path, cfg))
+
+    return ThemeLibrary(themes)
+
+  #_____________________________________________________________________
+  def from_args(args) -> 'ThemeLibrary':
+    """
+    Loads themes selected on the command line: every theme below
+    --theme_dir, else the --file theme, else the default theme.
+    """
+
+    if (getattr(args, 'theme_dir', None)):
+      return ThemeLibrary.from_files(
+        ThemeLibrary.find_theme_files(args.theme_dir))
+
+    if (getattr(args, 'file', None)):
+      return ThemeLibrary([(args.file, ThemeInheritance.read_theme(args.file))])
+
+    return ThemeLibrary()
+
+  #_____________________________________________________________________
+  def palettes(self):
+    """
+    Returns
+      (T, 16) packed palette array
+    """
+
+    size: int = ThemeLibraryConst.PALETTE_SIZE
+
+    return np.asarray(
+      [ s.palette_[:size] for s in self.schemes_ ]
+      , dtype=np.uint32).reshape(len(self), size)
+
+  #_____________________________________________________________________
+  def field(self, attr: str):
+    """
+    Returns
+      (T,) packed array of a single color attribute, e.g.
+      'bg_norm_color_'
+    """
+
+    return np.asarray([ getattr(s, attr) for s in self.schemes_ ]
+      , dtype=np.uint32)
+
+  #_____________________________________________________________________
+  def is_dark(self):
+    """
+    Returns
+      (T,) bool array of theme modes
+    """
+
+    return np.asarray([ s.is_dark_ for s in self.schemes_ ], dtype=bool)
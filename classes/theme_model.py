@@ -0,0 +1,234 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Parsed theme shared by every exporter. An input is parsed once into
+#   an immutable ThemeModel, and derived template values are computed
+#   once in a RenderContext that all scheme types render from.
+#_______________________________________________________________________
+
+from typing import NamedTuple
+
+from flux_bunny_utils.string_utils import StringUtils
+
+
+#_______________________________________________________________________
+class ThemeModel(NamedTuple):
+  """
+  Immutable and hashable colors and settings of one theme. Field names
+  are the ColorScheme attribute names without the trailing underscore.
+  """
+
+  name          : str
+  is_dark       : bool
+  ui_color_mode : str
+  cursor_color  : int
+  bg_norm_color : int
+  fg_norm_color : int
+  bg_bold_color : int
+  fg_bold_color : int
+  accent_color0 : int
+  accent_color1 : int
+  accent_color2 : int
+  palette       : tuple
+
+  #_____________________________________________________________________
+  def from_scheme(scheme) -> 'ThemeModel':
+    """
+    Model of the colors a ColorScheme parsed.
+    """
+
+    return ThemeModel(**
+      { field: getattr(scheme, f'{field}_')
+        for field in ThemeModel._fields if (field != 'palette') }
+      , palette=tuple(scheme.palette_))
+
+  #_____________________________________________________________________
+  def changed_sources(self, other: 'ThemeModel') -> set:
+    """
+    Values that differ from another model, as (field, None) or
+    ('palette', index), the form of RenderContextConst.BASE_SOURCES.
+    """
+
+    out: set = set()
+
+    for field in ThemeModel._fields:
+      old = getattr(self, field)
+      new = getattr(other, field)
+
+      if (field != 'palette'):
+        if (old != new):
+          out.add((field, None))
+
+      elif (len(old) != len(new)):
+        out.update(
+          ('palette', i) for i in range(max(len(old), len(new))))
+
+      else:
+        out.update(
+          ('palette', i) for i in range(len(old)) if (old[i] != new[i]))
+
+    return out
+
+
+#_______________________________________________________________________
+class RenderContextConst:
+
+  # Template labels of the single colors, in ThemeModel field order
+  COLOR_LABELS: dict =\
+    { 'bg_norm_color': 'BG__NORM'
+    , 'fg_norm_color': 'FG__NORM'
+    , 'bg_bold_color': 'BG__BOLD'
+    , 'fg_bold_color': 'FG__BOLD'
+    }
+
+  PALETTE_LABELS: list[str] =\
+    [ 'BLK_NORM', 'RED_NORM', 'GRN_NORM', 'YEL_NORM'
+    , 'BLU_NORM', 'VIO_NORM', 'CYA_NORM', 'WHT_NORM'
+    , 'BLK_BOLD', 'RED_BOLD', 'GRN_BOLD', 'YEL_BOLD'
+    , 'BLU_BOLD', 'VIO_BOLD', 'CYA_BOLD', 'WHT_BOLD'
+    ]
+
+  # ThemeModel field, and palette index, of each label
+  BASE_SOURCES: dict =\
+    { **{ label: (field, None) for field, label in COLOR_LABELS.items() }
+    , **{ label: ('palette', i) for i, label in enumerate(PALETTE_LABELS) }
+    }
+
+
+#_______________________________________________________________________
+class RenderContext:
+  """
+  A ThemeModel, the input dictionary it was parsed from for settings
+  specific to one scheme type, and template values derived from the
+  model. Each derived value is computed by the first scheme type that
+  needs it and reused by the rest.
+  """
+
+  #_____________________________________________________________________
+  def __init__(self, model: ThemeModel, cfg: dict = None
+    , input_dict: dict = None):
+    """
+    Parameters
+      model      : Parsed theme
+      cfg        : Dictionary created from json with expressions
+                   resolved, or None for the default theme
+      input_dict : Same dictionary before expressions were resolved,
+                   defaults to cfg
+    """
+
+    self.model_: ThemeModel = model
+    self.cfg_: dict = cfg if (isinstance(cfg, dict)) else {}
+
+    # Kept so that updates evaluate expressions again
+    self.input_: dict =\
+      input_dict if (isinstance(input_dict, dict)) else self.cfg_
+
+    self.derived_: dict = {}
+
+    return
+
+  #_____________________________________________________________________
+  def changed_sources(self, other: 'RenderContext') -> set:
+    """
+    Model values that differ from another context, see
+    ThemeModel.changed_sources, and input settings that differ, as
+    ('cfg', key).
+    """
+
+    out: set = self.model_.changed_sources(other.model_)
+
+    for key in self.cfg_.keys() | other.cfg_.keys():
+      if (self.cfg_.get(key) != other.cfg_.get(key)):
+        out.add(('cfg', key))
+
+    return out
+
+  #_____________________________________________________________________
+  def updated(self, context: 'RenderContext') -> 'RenderContext':
+    """
+    Reuses the base tokens of colors that did not change in a context
+    parsed from changed input. Other derived values are computed again
+    on demand.
+
+    Parameters
+      context : Context of the changed input, modified
+
+    Returns
+      context
+    """
+
+    changed: set = self.model_.changed_sources(context.model_)
+
+    for label, source in RenderContextConst.BASE_SOURCES.items():
+      if (label in self.derived_ and source not in changed):
+        context.derived_.setdefault(label, self.derived_[label])
+
+    return context
+
+  #_____________________________________________________________________
+  def derive(self, key, make):
+    """
+    Returns the derived value of a hashable key, calling make() the
+    first time. Values are shared, callers must copy before modifying.
+    """
+
+    if (key not in self.derived_):
+      self.derived_[key] = make()
+
+    return self.derived_[key]
+
+  #_____________________________________________________________________
+  def base_token(self, label: str) -> str:
+    """
+    Hex string of one background, foreground or palette color.
+
+    Parameters
+      label : Template label, e.g. BG__NORM or RED_BOLD
+    """
+
+    return self.derive(label, lambda: self.make_base_token(label))
+
+  #_____________________________________________________________________
+  def base_tokens(self) -> dict:
+    """
+    Hex strings of the background, foreground and palette colors, keyed
+    by template label.
+    """
+
+    return\
+      { label: self.base_token(label)
+        for label in RenderContextConst.BASE_SOURCES }
+
+  #_____________________________________________________________________
+  def make_base_token(self, label: str) -> str:
+
+    field, index = RenderContextConst.BASE_SOURCES[label]
+
+    color: int = getattr(self.model_, field)
+
+    if (index is not None):
+      color = color[index]
+
+    return StringUtils.int_to_hex6(color)
@@ -0,0 +1,572 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Contrast audit of the text on background pairs in the VS Code
+#   template. A declarative pairing table is matched against the
+#   template keys once; each theme then only resolves token colors.
+#_______________________________________________________________________
+
+import re
+
+from classes.contrast import Contrast
+from classes.contrast import ContrastConst
+from classes.scheme_types.vscode_scheme import VsCodeScheme
+from classes.template_modifier import TemplateModifier
+from classes.template_registry import TemplateRegistry
+from classes.theme_library import ThemeLibrary
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+#_______________________________________________________________________
+class VsCodeAuditConst:
+
+  TEXT    : float = 4.5
+  NON_TEXT: float = 3.0
+
+  # Translucent backgrounds are composited over this key
+  BASE_KEY: str = 'editor.background'
+
+  COLORS_KEY  : str = 'colors'
+  TOKENS_KEY  : str = 'tokenColors'
+  SEMANTIC_KEY: str = 'semanticTokenColors'
+  SETTINGS_KEY: str = 'settings'
+  FG_KEY      : str = 'foreground'
+  NAME_KEY    : str = 'name'
+
+  #_____________________________________________________________________
+  # Pairing table: (foreground key pattern, background key pattern,
+  # minimum WCAG contrast). '*' matches any text; each '*' in the
+  # background pattern is replaced by the text its counterpart matched
+  # in the foreground key. Each foreground key is paired by the first
+  # rule it matches, and only if the background key exists.
+  #_____________________________________________________________________
+  PAIRS: list =\
+  [ ('editorCursor.foreground'        , 'editor.background'           , NON_TEXT)
+  , ('terminalCursor.foreground'      , 'terminal.background'         , NON_TEXT)
+  , ('terminal.ansi*'                 , 'terminal.background'         , NON_TEXT)
+  , ('*.foreground'                   , '*.background'                , TEXT)
+  , ('*Foreground'                    , '*Background'                 , TEXT)
+  , ('foreground'                     , BASE_KEY                      , TEXT)
+  , ('errorForeground'                , BASE_KEY                      , TEXT)
+  , ('tokenColors.*'                  , BASE_KEY                      , TEXT)
+  , ('semanticTokenColors.*'          , BASE_KEY                      , TEXT)
+  , ('editorLineNumber.*'             , BASE_KEY                      , NON_TEXT)
+  , ('editor.placeholder.foreground'  , BASE_KEY                      , NON_TEXT)
+  , ('editorError.foreground'         , BASE_KEY                      , NON_TEXT)
+  , ('editorWarning.foreground'       , BASE_KEY                      , NON_TEXT)
+  , ('editorInfo.foreground'          , BASE_KEY                      , NON_TEXT)
+  , ('editorLightBulb.foreground'     , BASE_KEY                      , NON_TEXT)
+  , ('textLink.*'                     , BASE_KEY                      , TEXT)
+  , ('settings.headerForeground'      , BASE_KEY                      , TEXT)
+  , ('input.placeholderForeground'    , 'input.background'            , NON_TEXT)
+  , ('list.activeSelectionIconForeground'
+    , 'list.activeSelectionBackground', NON_TEXT)
+  , ('gitDecoration.*'                , 'sideBar.background'          , TEXT)
+  , ('list.*Foreground'               , 'sideBar.background'          , TEXT)
+  , ('icon.foreground'                , 'sideBar.background'          , NON_TEXT)
+  , ('panelTitle.*Foreground'         , 'panel.background'            , TEXT)
+  , ('problems*Icon.foreground'       , 'panel.background'            , NON_TEXT)
+  , ('debugConsole.*'                 , 'panel.background'            , TEXT)
+  , ('symbolIcon.*'                   , 'editorSuggestWidget.background', NON_TEXT)
+  , ('debugIcon.*'                    , 'debugToolBar.background'     , NON_TEXT)
+  , ('peekViewResult.*Foreground'     , 'peekViewEditor.background'   , TEXT)
+  , ('tab.unfocused*Foreground'       , 'tab.inactiveBackground'      , TEXT)
+  ]
+
+  REPORT_LINE: str = 76 * '-'
+
+
+#_______________________________________________________________________
+class VsCodeAuditTable:
+  """
+  Pairing table matched against one template. Template values are
+  deduplicated into slots; each slot is a replacement token, optionally
+  with modifiers, or a literal color, plus an alpha.
+  """
+
+  #_____________________________________________________________________
+  def __init__(self, template: dict, tokens: list[str]):
+    """
+    Parameters
+      template : Template key to template value, see template_colors
+      tokens   : Replacement map keys, e.g. 'BG__NORM'
+    """
+
+    # Longest token first so 'KEY_BG_0' wins over shorter prefixes
+    self.tokens_: list[str] = sorted(tokens, key=len, reverse=True)
+
+    self.slot_index_: dict = {}
+    self.slot_tokens_: list = []
+    self.slot_chains_: list[tuple] = []
+    self.slot_literals_: list[int] = []
+    self.slot_alphas_: list[float] = []
+
+    self.key_slots_: dict = {}
+
+    for key, value in template.items():
+      slot: int = self.add_slot(value)
+
+      if (slot is not None):
+        self.key_slots_[key] = slot
+
+    self.pairs_: list[tuple] = VsCodeAudit.expand_pairs(
+      list(self.key_slots_), VsCodeAuditConst.PAIRS)
+
+    self.fg_slots_: list[int] =\
+      [ self.key_slots_[fg] for fg, _, _ in self.pairs_ ]
+
+    self.bg_slots_: list[int] =\
+      [ self.key_slots_[bg] for _, bg, _ in self.pairs_ ]
+
+    self.min_contrast_: list[float] = [ m for _, _, m in self.pairs_ ]
+
+    self.base_slot_: int = self.key_slots_.get(VsCodeAuditConst.BASE_KEY)
+
+    return
+
+  #_____________________________________________________________________
+  def add_slot(self, value: str) -> int:
+    """
+    Parses a template value such as '#BG__BOLD60', '#ff0000' or
+    '#{{BLU_NORM | mix(0.85) | alpha(60%)}}' into a slot, reusing the
+    slot of an identical value.
+
+    Returns
+      Slot index, or None if the value is not a color
+    """
+
+    if (not isinstance(value, str) or not value.startswith('#')):
+      return None
+
+    if (value in self.slot_index_):
+      return self.slot_index_[value]
+
+    body: str = value[1:].strip()
+
+    token: str = None
+    chain: tuple = ()
+    literal: int = 0
+
+    if (body.startswith('{{') and body.endswith('}}')):
+      return self.add_modifier_slot(value, body)
+
+    for t in self.tokens_:
+      if (body.startswith(t)):
+        token = t
+        body = body[len(t):]
+        break
+
+    if (token is None):
+      if (len(body) not in (6, 8)):
+        return None
+
+      literal = VsCodeAudit.parse_hex(body[:6])
+      body = body[6:]
+
+    if (body and (len(body) != 2 or VsCodeAudit.parse_hex(body) is None)):
+      return None
+
+    if (literal is None):
+      return None
+
+    alpha: float = int(body, 16) / 255 if (body) else 1.0
+
+    return self.append_slot(value, token, chain, literal, alpha)
+
+  #_____________________________________________________________________
+  def add_modifier_slot(self, value: str, body: str) -> int:
+    """
+    Parses a modifier expression value. A final alpha becomes the slot
+    alpha; the other modifiers are applied per theme by resolve.
+
+    Returns
+      Slot index, or None if the expression is not valid for the tokens
+      or does not give a color, e.g. ends in ansi
+    """
+
+    try:
+      _, token, chain = TemplateModifier.parse(body, self.tokens_)
+
+    except ValueError:
+      return None
+
+    alpha: float = 1.0
+
+    if (chain and chain[-1][0] == 'alpha'):
+      alpha = chain[-1][1][0]
+      chain = chain[:-1]
+
+    if (any(name == 'ansi' for name, _ in chain)):
+      return None
+
+    return self.append_slot(value, token, chain, 0, alpha)
+
+  #_____________________________________________________________________
+  def append_slot(self, value: str, token: str, chain: tuple
+    , literal: int, alpha: float) -> int:
+
+    slot: int = len(self.slot_tokens_)
+
+    self.slot_index_[value] = slot
+    self.slot_tokens_.append(token)
+    self.slot_chains_.append(chain)
+    self.slot_literals_.append(literal)
+    self.slot_alphas_.append(alpha)
+
+    return slot
+
+  #_____________________________________________________________________
+  def resolve(self, replacement_map: dict) -> list[int]:
+    """
+    Opaque color of every slot for one theme, before compositing.
+    """
+
+    colors: list[int] = []
+
+    for token, chain, literal in zip(self.slot_tokens_, self.slot_chains_
+      , self.slot_literals_):
+
+      if (token is None):
+        colors.append(literal)
+        continue
+
+      color: int = int(replacement_map[token], 16)
+
+      if (chain):
+        references: dict =\
+          { r: int(replacement_map[r], 16)
+            for r in TemplateModifier.references(chain) }
+
+        color = int(TemplateModifier.apply(chain, color, references), 16)
+
+      colors.append(color)
+
+    return colors
+
+
+#_______________________________________________________________________
+class VsCodeAudit:
+  """
+  Audits every foreground/background pair of the VS Code template
+  after token substitution. Translucent colors are alpha composited,
+  backgrounds over editor.background and foregrounds over their
+  background, before contrast is computed.
+  """
+
+  # Compiled tables keyed by (template path, tokens)
+  tables_: dict = {}
+
+  #_____________________________________________________________________
+  def parse_hex(text: str) -> int:
+    """
+    Parses hex digits, returns None if text is not hex.
+    """
+
+    try:
+      return int(text, 16)
+
+    except ValueError:
+      return None
+
+  #_____________________________________________________________________
+  def compile_pattern(pattern: str):
+    """
+    Compiles a pairing table key pattern to a regex with one group per
+    '*'.
+    """
+
+    return re.compile(
+      '(.*)'.join(re.escape(part) for part in pattern.split('*')) + '$')
+
+  #_____________________________________________________________________
+  def expand_pairs(keys: list[str], rules: list) -> list[tuple]:
+    """
+    Matches the pairing rules against template keys.
+
+    Returns
+      List of (foreground key, background key, minimum contrast)
+    """
+
+    key_set: set = set(keys)
+
+    compiled: list =\
+      [ (VsCodeAudit.compile_pattern(fg), bg.split('*'), m)
+        for fg, bg, m in rules ]
+
+    pairs: list[tuple] = []
+
+    for key in keys:
+      for fg_re, bg_parts, min_contrast in compiled:
+        match = fg_re.match(key)
+
+        if (match is None):
+          continue
+
+        groups: tuple = match.groups()
+
+        bg_key: str = bg_parts[0]
+        for i in range(1, len(bg_parts)):
+          bg_key += groups[i - 1] + bg_parts[i]
+
+        if (bg_key in key_set and bg_key != key):
+          pairs.append((key, bg_key, min_contrast))
+          break
+
+    return pairs
+
+  #_____________________________________________________________________
+  def template_colors(template: dict) -> dict:
+    """
+    Flattens the color values of a parsed VS Code template into one
+    dictionary. Token colors are keyed 'tokenColors.<name or index>',
+    semantic token colors 'semanticTokenColors.<key>'.
+    """
+
+    Const = VsCodeAuditConst
+
+    colors: dict = dict(template.get(Const.COLORS_KEY, {}))
+
+    for i, entry in enumerate(template.get(Const.TOKENS_KEY, [])):
+      settings: dict = entry.get(Const.SETTINGS_KEY, {})
+
+      if (Const.FG_KEY in settings):
+        name: str = entry.get(Const.NAME_KEY, str(i))
+        colors[f'{Const.TOKENS_KEY}.{name}'] = settings[Const.FG_KEY]
+
+    for key, value in template.get(Const.SEMANTIC_KEY, {}).items():
+      if (isinstance(value, dict)):
+        value = value.get(Const.FG_KEY)
+
+      colors[f'{Const.SEMANTIC_KEY}.{key}'] = value
+
+    return colors
+
+  #_____________________________________________________________________
+  def get_table(template_path: str, tokens: list[str]) -> VsCodeAuditTable:
+    """
+    Returns the pairing table for a template, compiling it on first
+    use.
+    """
+
+    key: tuple = (template_path, tuple(sorted(tokens)))
+
+    if (key not in VsCodeAudit.tables_):
+      template: dict =\
+        Utils.parse_jsonc(TemplateRegistry.load(template_path))
+
+      VsCodeAudit.tables_[key] = VsCodeAuditTable(
+        VsCodeAudit.template_colors(template), tokens)
+
+    return VsCodeAudit.tables_[key]
+
+  #_____________________________________________________________________
+  def composite(fg: int, alpha: float, bg: int) -> int:
+    """
+    Alpha composites fg over an opaque bg in sRGB, as VS Code does.
+    """
+
+    out: int = 0
+
+    for shift in (16, 8, 0):
+      f: int = (fg >> shift) & 0xFF
+      b: int = (bg >> shift) & 0xFF
+      out |= int(round(alpha * f + (1 - alpha) * b)) << shift
+
+    return out
+
+  #_____________________________________________________________________
+  def composite_array(fg, alpha, bg):
+    """
+    Vectorized composite over packed color arrays.
+    """
+
+    out = np.zeros(np.shape(fg), dtype=np.uint32)
+
+    for shift in (16, 8, 0):
+      f = (fg >> shift) & 0xFF
+      b = (bg >> shift) & 0xFF
+      channel = np.round(alpha * f + (1 - alpha) * b).astype(np.uint32)
+      out |= channel << np.uint32(shift)
+
+    return out
+
+  #_____________________________________________________________________
+  def pair_contrast(table: VsCodeAuditTable, slot_colors: list[int])\
+    -> list[float]:
+    """
+    WCAG contrast of every pair for one theme.
+    """
+
+    alphas: list[float] = table.slot_alphas_
+    base: int = slot_colors[table.base_slot_]
+
+    out: list[float] = []
+
+    for fg_slot, bg_slot in zip(table.fg_slots_, table.bg_slots_):
+      bg: int = VsCodeAudit.composite(
+        slot_colors[bg_slot], alphas[bg_slot], base)
+
+      fg: int = VsCodeAudit.composite(
+        slot_colors[fg_slot], alphas[fg_slot], bg)
+
+      out.append(Contrast.wcag_contrast(fg, bg))
+
+    return out
+
+  #_____________________________________________________________________
+  def pair_contrast_array(table: VsCodeAuditTable, slot_colors):
+    """
+    Vectorized pair_contrast.
+
+    Parameters
+      slot_colors : (T, S) packed slot colors, one row per theme
+
+    Returns
+      (T, P) float array of WCAG contrast
+    """
+
+    alphas = np.asarray(table.slot_alphas_)
+    fg_slots = np.asarray(table.fg_slots_, dtype=np.intp)
+    bg_slots = np.asarray(table.bg_slots_, dtype=np.intp)
+
+    base = slot_colors[:, table.base_slot_][:, None]
+
+    bg = VsCodeAudit.composite_array(
+      slot_colors[:, bg_slots], alphas[bg_slots], base)
+
+    fg = VsCodeAudit.composite_array(
+      slot_colors[:, fg_slots], alphas[fg_slots], bg)
+
+    offset: float = ContrastConst.WCAG_OFFSET
+
+    fg_y = Contrast.luminance_array(fg)
+    bg_y = Contrast.luminance_array(bg)
+
+    return (np.maximum(fg_y, bg_y) + offset)\
+      / (np.minimum(fg_y, bg_y) + offset)
+
+  #_____________________________________________________________________
+  def audit(library: ThemeLibrary
+    , template_path: str = VsCodeScheme.TEMPLATE_PATH
+    ) -> tuple:
+    """
+    Computes contrast of every template pair for every theme.
+
+    Returns
+      (table, contrast) where contrast has one row of pair contrasts
+      per theme
+    """
+
+    maps: list[dict] = library.replacement_maps(VsCodeScheme)
+
+    table: VsCodeAuditTable = VsCodeAudit.get_table(template_path, list(maps[0]))
+
+    if (np is None):
+      return (table
+        , [ VsCodeAudit.pair_contrast(table, table.resolve(m)) for m in maps ])
+
+    slot_colors = np.asarray([ table.resolve(m) for m in maps ]
+      , dtype=np.uint32).reshape(len(maps), len(table.slot_tokens_))
+
+    return (table, VsCodeAudit.pair_contrast_array(table, slot_colors))
+
+  #_____________________________________________________________________
+  def create_report_str(library: ThemeLibrary
+    , min_contrast: float = None
+    , template_path: str = VsCodeScheme.TEMPLATE_PATH
+    ) -> str:
+    """
+    Lists failing pairs per theme, then the pairs failing most often.
+
+    Parameters
+      min_contrast : Overrides the minimum of every pair if given
+    """
+
+    Const = VsCodeAuditConst
+
+    table, contrast = VsCodeAudit.audit(library, template_path)
+
+    minimums: list[float] = table.min_contrast_
+
+    if (min_contrast is not None):
+      minimums = [min_contrast] * len(minimums)
+
+    fail_counts: list[int] = [0] * len(table.pairs_)
+
+    lines: list[str] =\
+      [ f'\nVS Code template contrast audit, {len(table.pairs_)} pairs'
+      , Const.REPORT_LINE
+      ]
+
+    if (np is not None):
+      failing = np.asarray(contrast) < np.asarray(minimums)
+      failure_lists: list = [ np.flatnonzero(f).tolist() for f in failing ]
+
+    else:
+      failure_lists: list =\
+        [ [ p for p in range(len(row)) if (row[p] < minimums[p]) ]
+          for row in contrast ]
+
+    for t, failures in enumerate(failure_lists):
+      row = contrast[t]
+
+      lines.append(f'{library.names_[t]}: {len(failures)} failing')
+
+      for p in failures:
+        fail_counts[p] += 1
+
+        fg_key, bg_key, _ = table.pairs_[p]
+
+        lines.append(
+          f'  {float(row[p]):5.2f} < {minimums[p]:g}  {fg_key} on {bg_key}')
+
+    lines.append(Const.REPORT_LINE)
+
+    ranked: list[int] = sorted(range(len(fail_counts))
+      , key=lambda p: -fail_counts[p])
+
+    for p in ranked:
+      if (not fail_counts[p]):
+        break
+
+      fg_key, bg_key, _ = table.pairs_[p]
+
+      lines.append(f'{fail_counts[p]:6d} themes  {fg_key} on {bg_key}')
+
+    return '\n'.join(lines)
+
+  #_____________________________________________________________________
+  def run(args) -> str:
+    """
+    Report entry point for the command line.
+    """
+
+    return VsCodeAudit.create_report_str(
+      ThemeLibrary.from_args(args), args.min_contrast)
@@ -27,18 +27,32 @@
 #_______________________________________________________________________
 
 import argparse
+import atexit
+import sys
 
+from classes.ansi256_fidelity import Ansi256Fidelity
+from classes.color_cache import ColorCache
 from classes.color_scheme_parser import ColorSchemeParser
 from classes.color_scheme_parser import ParserStrings
-
+from classes.contrast_repair import ContrastRepair
+from classes.contrast_report import ContrastReport
+from classes.cutoff_sweep import CutoffSweep
+from classes.cvd_simulation import CvdSimulation
+from classes.image_palette import ImagePalette
+from classes.palette_optimizer import PaletteOptimizer
+from classes.template_registry import TemplateRegistry
+from classes.theme_inheritance import ThemeInheritance
+from classes.theme_interpolator import ThemeInterpolator
+from classes.vscode_audit import VsCodeAudit
+
+from classes.scheme_types.base_scheme import ColorScheme
 from classes.scheme_types.gnome_scheme import GnomeScheme
 from classes.scheme_types.mintty_scheme import MinttyScheme
 from classes.scheme_types.konsole_scheme import KonsoleScheme
 from classes.scheme_types.vscode_term_scheme import VsCodeTermScheme
 from classes.scheme_types.vscode_scheme import VsCodeScheme
 from classes.scheme_types.vim_scheme import VimScheme
-
-from utilities.color_scheme_utils import GeneralUtils as Utils
+from classes.scheme_types.xresources_scheme import XresourcesScheme
 
 SCHEME_MAP: dict =\
 { ParserStrings.GNOME_INPUT       : GnomeScheme
@@ -46,9 +60,17 @@ SCHEME_MAP: dict =\
 , ParserStrings.VSCODE_INPUT      : VsCodeScheme
 , ParserStrings.MINTTY_INPUT      : MinttyScheme
 , ParserStrings.VIM_INPUT         : VimScheme
+, ParserStrings.XRESOURCES_INPUT  : XresourcesScheme
 #, ParserStrings.KONSOLE_INPUT     : KonsoleScheme
 }
 
+REPORT_MAP: dict =\
+{ ParserStrings.CONTRAST_REPORT   : ContrastReport
+, ParserStrings.AUDIT_REPORT      : VsCodeAudit
+, ParserStrings.CVD_REPORT        : CvdSimulation
+, ParserStrings.FIDELITY_REPORT   : Ansi256Fidelity
+}
+
 
 #_______________________________________________________________________
 def new_line (new_line_count: int = 1) -> None:
@@ -65,6 +87,38 @@ if __name__ == '__main__':
 
   args: argparse.Namespace = parser.parse_args()
 
+  # Printed after any mode, including those that call sys.exit
+  if (args.cache_stats):
+    ColorCache.enable()
+    atexit.register(lambda: print(ColorCache.create_report_str()
+      + '\n' + TemplateRegistry.create_report_str()))
+
+  if (args.report):
+    print(REPORT_MAP[args.report].run(args))
+    sys.exit()
+
+  if (args.from_image):
+    print(f'\nWrote image theme to {ImagePalette.run(args)}')
+    sys.exit()
+
+  if (args.optimize):
+    report_str, out_path = PaletteOptimizer.run(args)
+    print(report_str)
+    print(f'\nWrote optimized theme to {out_path}')
+    sys.exit()
+
+  if (args.repair):
+    print(ContrastRepair.run(args))
+    sys.exit()
+
+  if (args.sweep):
+    print(CutoffSweep.run(args))
+    sys.exit()
+
+  if (args.interpolate):
+    print(ThemeInterpolator.run(args, list(SCHEME_MAP.values())))
+    sys.exit()
+
   scheme_types: list = list(SCHEME_MAP.values())
 
   if (args.scheme_type != ParserStrings.ALL_INPUT):
@@ -76,15 +130,21 @@ if __name__ == '__main__':
   if (args.scheme_type != ParserStrings.ALL_INPUT):
     scheme_types = [SchemeType]
 
+  cfg = None
+
+  # Data in file overrides all other arguments
+  if (args.file):
+    cfg = ThemeInheritance.read_theme(args.file)
+
+  if (args.cterm_snap):
+    cfg = dict(cfg or {})
+    cfg[VimScheme.CTERM_SNAP] = True
+
+  # Parsed once for every scheme type
+  context = ColorScheme.create_context(cfg)
+
   for SchemeType in scheme_types:
-    # Data in file overrides all other arguments
-    if(args.file):
-      color_scheme = SchemeType(
-        args.out_dir, Utils.read_hex_color_json(args.file))
-
-    else:
-      color_scheme =\
-        SchemeType(out_dir=args.out_dir)
+    color_scheme = SchemeType(args.out_dir, context)
 
     color_scheme.write_file()
     color_scheme.on_completion()
@@ -0,0 +1,45 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Shared fixtures. Generated cache files go to a temporary directory
+#   instead of the user's cache directory.
+#_______________________________________________________________________
+
+import pytest
+
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+#_______________________________________________________________________
+@pytest.fixture(scope='session', autouse=True)
+def temp_cache_dir(tmp_path_factory):
+  """
+  Points the cache directory at a temporary directory for the session.
+  """
+
+  with pytest.MonkeyPatch.context() as monkeypatch:
+    monkeypatch.setenv(Utils.CACHE_DIR_ENV
+      , str(tmp_path_factory.mktemp('cache')))
+
+    yield
@@ -0,0 +1,137 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for the Vim cterm fidelity report and GUI color snapping.
+#_______________________________________________________________________
+
+import pytest
+
+import classes.ansi256_fidelity as ansi256_fidelity
+
+from classes.ansi256_colors import Ansi256Colors
+from classes.ansi256_fidelity import Ansi256Fidelity
+from classes.ansi256_fidelity import Ansi256FidelityConst
+from classes.rgb_color import RgbColor
+from classes.scheme_types.vim_scheme import VimScheme
+from classes.theme_library import ThemeLibrary
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  FILES: list[str] =\
+    [ 'sample-themes/flux-bunny-dark/flux-bunny-dark-input.json'
+    , 'sample-themes/flux-bunny-lite/flux-bunny-lite-input.json'
+    ]
+
+#_______________________________________________________________________
+def sample_library() -> ThemeLibrary:
+  """
+  Sample themes plus a copy of the dark theme moved off the cube.
+  """
+
+  themes = [ (f, Utils.read_hex_color_json(f)) for f in TestConst.FILES ]
+
+  off_cube = Utils.str_list_to_hex_list(themes[0][1]['palette'])
+
+  themes.append(('off-cube'
+    , dict(themes[0][1], palette=[ c ^ 0x0b1520 for c in off_cube ])))
+
+  return ThemeLibrary(themes)
+
+#_______________________________________________________________________
+@pytest.fixture(params=['numpy', 'scalar'])
+def backend(request, monkeypatch):
+  """
+  Runs each test with NumPy and with the scalar fallback.
+  """
+
+  if (request.param == 'scalar'):
+    monkeypatch.setattr(ansi256_fidelity, 'np', None)
+
+  elif (ansi256_fidelity.np is None):
+    pytest.skip('NumPy not installed')
+
+  return request.param
+
+#_______________________________________________________________________
+def test_library_errors(backend):
+  library = sample_library()
+
+  indices, delta_e = Ansi256Fidelity.library_errors(library)
+
+  for t, scheme in enumerate(library.schemes_):
+    colors = Ansi256Fidelity.theme_colors(scheme)
+
+    assert len(colors) == len(Ansi256FidelityConst.COLOR_LABELS)
+    assert indices[t] == [ RgbColor.rgb_to_ansi256(c) for c in colors ]
+
+    for c, i, d in zip(colors, indices[t], delta_e[t]):
+      assert d >= 0
+      assert (d < 1e-6) == (c == Ansi256Colors.rgb_list[i])
+
+#_______________________________________________________________________
+def test_array_matches_scalar():
+  pytest.importorskip('numpy')
+
+  library = sample_library()
+
+  indices, delta_e = Ansi256Fidelity.library_errors(library)
+
+  for t, scheme in enumerate(library.schemes_):
+    expected = Ansi256Fidelity.errors_list(Ansi256Fidelity.theme_colors(scheme))
+
+    assert indices[t] == expected[0]
+    assert delta_e[t] == pytest.approx(expected[1], abs=1e-6)
+
+#_______________________________________________________________________
+def test_report_flags(backend):
+  library = sample_library()
+
+  assert '0 of 3 themes' in Ansi256Fidelity.create_report_str(library, 1000)
+  assert '3 of 3 themes' in Ansi256Fidelity.create_report_str(library, -1)
+
+#_______________________________________________________________________
+def cli_key(key: str) -> str:
+  return f'{key[:4]}CLI_{key[4:]}'
+
+#_______________________________________________________________________
+def test_snap(tmp_path):
+  cfg = sample_library().configs_[-1]
+
+  plain = VimScheme(str(tmp_path), cfg)
+  snapped = VimScheme(str(tmp_path), dict(cfg, **{VimScheme.CTERM_SNAP: True}))
+
+  for key in Ansi256FidelityConst.COLOR_LABELS:
+    gui = int(snapped.str_replace_map[key], 16)
+    cli = int(snapped.str_replace_map[cli_key(key)])
+
+    assert gui == Ansi256Colors.rgb_list[cli]
+    assert cli == int(plain.str_replace_map[cli_key(key)])
+
+  assert plain.str_replace_map != snapped.str_replace_map
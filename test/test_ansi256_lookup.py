@@ -0,0 +1,158 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for the ANSI 256 lookup engine.
+#_______________________________________________________________________
+
+import random
+
+import pytest
+
+import classes.ansi256_lookup as ansi256_lookup
+
+from classes.ansi256_colors import Ansi256Colors
+from classes.ansi256_lookup import Ansi256Lookup
+from classes.ansi256_lookup import Ansi256LookupConst
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 232
+  SAMPLE_COUNT: int = 5000
+
+  VALID_RGB_VALUES: list[int] =\
+  [0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff]
+
+  VALID_GREYSCALE_VALUES: list[int] =\
+    list(range(0x08, 0xef, 10))
+
+#_______________________________________________________________________
+def reference_ansi256(rgb_color: int) -> int:
+  """
+  Nearest level search formerly used by RgbColor.rgb_to_ansi256.
+  """
+
+  red: int = (rgb_color >> 16) & 0xFF
+  grn: int = (rgb_color >>  8) & 0xFF
+  blu: int =  rgb_color        & 0xFF
+
+  levels: list[int] = TestConst.VALID_RGB_VALUES
+
+  if (red == blu and red == grn and red not in levels):
+    grey_near: int = min(TestConst.VALID_GREYSCALE_VALUES
+      , key=lambda x: abs(x - red))
+
+    return 232 + ((grey_near - 8) // 10)
+
+  red_near: int = min(levels, key=lambda x: abs(x - red))
+  grn_near: int = min(levels, key=lambda x: abs(x - grn))
+  blu_near: int = min(levels, key=lambda x: abs(x - blu))
+
+  return 16\
+    + 36 * levels.index(red_near)\
+    +  6 * levels.index(grn_near)\
+    +      levels.index(blu_near)
+
+#_______________________________________________________________________
+def sample_colors() -> list[int]:
+  rng = random.Random(TestConst.SEED)
+
+  greys: list[int] = [(v << 16) | (v << 8) | v for v in range(256)]
+  channels: list[int] =\
+    [ v << shift for v in range(256) for shift in [0, 8, 16] ]
+
+  return greys + channels\
+    + rng.sample(range(0x1000000), TestConst.SAMPLE_COUNT)
+
+#_______________________________________________________________________
+@pytest.fixture
+def lut_path(tmp_path):
+  path: str = str(tmp_path / Ansi256LookupConst.TABLE_FILE_NAME)
+
+  yield path
+
+  Ansi256Lookup.unload_table()
+
+#_______________________________________________________________________
+def test_closed_form():
+
+  for rgb_color in sample_colors():
+    assert Ansi256Lookup.rgb_to_ansi256(rgb_color) ==\
+      reference_ansi256(rgb_color)
+
+#_______________________________________________________________________
+def test_table(lut_path):
+  colors: list[int] = sample_colors()
+
+  table = Ansi256Lookup.load_table(lut_path)
+  assert len(table) == Ansi256LookupConst.TABLE_SIZE
+
+  for rgb_color in colors:
+    assert Ansi256Lookup.rgb_to_ansi256(rgb_color) ==\
+      reference_ansi256(rgb_color)
+
+  # Cached file is reused
+  Ansi256Lookup.unload_table()
+  assert Ansi256Lookup.load_table(lut_path)[0xffffff] == 231
+
+#_______________________________________________________________________
+def test_table_fallback(lut_path, monkeypatch):
+  monkeypatch.setattr(ansi256_lookup, 'np', None)
+
+  table = Ansi256Lookup.load_table(lut_path)
+
+  for rgb_color in sample_colors():
+    assert table[rgb_color] == reference_ansi256(rgb_color)
+
+#_______________________________________________________________________
+def test_rgb_to_ansi256_array(lut_path):
+  np = pytest.importorskip('numpy')
+
+  colors: list[int] = sample_colors()
+  expected: list[int] = [reference_ansi256(c) for c in colors]
+
+  packed = np.asarray(colors, dtype=np.uint32)
+
+  assert Ansi256Lookup.rgb_to_ansi256_array(packed).tolist() == expected
+
+  Ansi256Lookup.load_table(lut_path)
+  assert Ansi256Lookup.rgb_to_ansi256_array(packed).tolist() == expected
+
+#_______________________________________________________________________
+def test_rgb_to_ansi256_exact():
+
+  for i in range(16, len(Ansi256Colors.rgb_list)):
+    rgb_val: int = Ansi256Colors.rgb_list[i]
+    assert Ansi256Lookup.rgb_to_ansi256_exact(rgb_val) == i
+
+  # System colors that are not also cube or greyscale entries
+  assert Ansi256Lookup.rgb_to_ansi256_exact(0x800000) == 1
+  assert Ansi256Lookup.rgb_to_ansi256_exact(0xc0c0c0) == 7
+
+  assert Ansi256Lookup.rgb_to_ansi256_exact(0x123456) ==\
+    Ansi256LookupConst.NOT_FOUND
@@ -0,0 +1,114 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for the Color value type and the unchecked channel path.
+#_______________________________________________________________________
+
+import random
+
+import pytest
+
+from classes.color import Color
+from classes.rgb_color import RgbColor
+from classes.rgb_color import RgbConst
+from classes.scheme_types.gnome_scheme import GnomeScheme
+from classes.theme_library import ThemeColors
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 19
+  SAMPLE_COUNT: int = 500
+
+  COLORS: list[int] =\
+    [0x000000, 0xffffff, 0xff8700]\
+    + random.Random(SEED).sample(range(0x1000000), SAMPLE_COUNT)
+
+  DARK_FILE: str = 'sample-themes/flux-bunny-dark/flux-bunny-dark-input.json'
+
+#_______________________________________________________________________
+def test_channels():
+  for value in TestConst.COLORS:
+    color = Color(value)
+    rgb = RgbColor.get_rgb_from_hex(value)
+
+    expected = (rgb[RgbConst.RED_STR], rgb[RgbConst.GRN_STR]
+      , rgb[RgbConst.BLU_STR])
+
+    assert color == value
+    assert RgbColor.get_channels_unchecked(color) == expected
+
+#_______________________________________________________________________
+def test_behaves_as_int():
+  color = Color('0xff8700')
+
+  assert Color(color) is color
+  assert str(color) == str(0xff8700)
+  assert repr(color) == 'Color(0xff8700)'
+  assert { color: 1 }[0xff8700] == 1
+
+  # Int inputs still give int outputs
+  assert RgbColor.scale_color(color, 0x5f, 0xd7) ==\
+    RgbColor.scale_color(0xff8700, 0x5f, 0xd7)
+
+  assert RgbColor.make_background_color_dark(color) ==\
+    RgbColor.make_background_color_dark(0xff8700)
+
+#_______________________________________________________________________
+def test_invalid():
+
+  with pytest.raises(ValueError):
+    Color(0x1000000)
+
+  with pytest.raises(ValueError):
+    Color(-1)
+
+  with pytest.raises(TypeError):
+    Color(1.5)
+
+  with pytest.raises(ValueError):
+    ThemeColors({ 'background-color': '0x1000000' })
+
+#_______________________________________________________________________
+def test_parsed_colors():
+  scheme = ThemeColors(Utils.read_hex_color_json(TestConst.DARK_FILE))
+
+  assert isinstance(scheme.bg_norm_color_, Color)
+  assert all(isinstance(c, Color) for c in scheme.palette_)
+
+  # Unchecked entries match the validated dict path
+  for color in scheme.palette_:
+    rgb = RgbColor.get_rgb_from_hex(color)
+
+    assert GnomeScheme.create_color_entry(color) ==\
+      f"'rgb({rgb[RgbConst.RED_STR]}, {rgb[RgbConst.GRN_STR]}"\
+      f", {rgb[RgbConst.BLU_STR]})'"
+
+  assert RgbColor.construct_color_print_str_unchecked('x', 0x123456, 0xabcdef)\
+    == RgbColor.construct_color_print_str('x', 0x123456, 0xabcdef)
@@ -0,0 +1,144 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests that batch color operations match the scalar functions.
+#_______________________________________________________________________
+
+import random
+
+import pytest
+
+import classes.color_array as color_array
+
+from classes.color_array import ColorArray
+from classes.rgb_color import RgbColor
+from classes.rgb_color import RgbConst
+from classes.ansi256_colors import Ansi256Colors
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 256
+  SAMPLE_COUNT: int = 2000
+
+  # Non-black colors, black is undefined for the scalar scale_color
+  COLORS: list[int] =\
+    [0x80FF10, 0x804020, 0xff8010, 0xffffff, 0x010101, 0x5f5f5f]\
+    + Ansi256Colors.rgb_list[17:]\
+    + random.Random(SEED).sample(range(1, 0x1000000), SAMPLE_COUNT)
+
+#_______________________________________________________________________
+@pytest.fixture(params=['numpy', 'array'])
+def backend(request, monkeypatch):
+  """
+  Runs each test with NumPy and with the array module fallback.
+  """
+
+  if (request.param == 'array'):
+    monkeypatch.setattr(color_array, 'np', None)
+
+  elif (color_array.np is None):
+    pytest.skip('NumPy not installed')
+
+  return request.param
+
+#_______________________________________________________________________
+def test_get_rgb_from_hex(backend):
+  colors = ColorArray(TestConst.COLORS)
+  rgb_dict = colors.get_rgb_from_hex()
+
+  for i in range(len(TestConst.COLORS)):
+    expected = RgbColor.get_rgb_from_hex(TestConst.COLORS[i])
+
+    for key in expected:
+      assert rgb_dict[key][i] == expected[key]
+
+#_______________________________________________________________________
+def test_scale_color(backend):
+  colors = ColorArray(TestConst.COLORS)
+
+  for lo_cutoff, hi_cutoff in [(0x00, 0xe0), (0x10, 0xe0), (0x5f, 0xd7)]:
+    scaled = colors.scale_color(lo_cutoff, hi_cutoff)
+
+    expected =\
+      [ RgbColor.scale_color(c, lo_cutoff, hi_cutoff)
+        for c in TestConst.COLORS ]
+
+    assert scaled.tolist() == expected
+
+#_______________________________________________________________________
+def test_make_colors(backend):
+  colors = ColorArray(TestConst.COLORS)
+
+  for is_dark in [True, False]:
+    assert colors.make_background_color(is_dark).tolist() ==\
+      [ RgbColor.make_background_color(c, is_dark)
+        for c in TestConst.COLORS ]
+
+    assert colors.make_foreground_color(is_dark).tolist() ==\
+      [ RgbColor.make_foreground_color(c, is_dark)
+        for c in TestConst.COLORS ]
+
+  # Scalar version returns a dict when the color is already dark
+  expected: list = []
+  for c in TestConst.COLORS:
+    dark = RgbColor.make_background_color_dark(c)
+
+    if (isinstance(dark, dict)):
+      dark = RgbColor.get_int_from_rgb_dict(dark)
+
+    expected.append(dark)
+
+  assert colors.make_background_color_dark().tolist() == expected
+
+#_______________________________________________________________________
+def test_rgb_to_ansi256(backend):
+  colors = ColorArray(TestConst.COLORS + [0x000000])
+
+  assert list(colors.rgb_to_ansi256()) ==\
+    [ RgbColor.rgb_to_ansi256(c) for c in TestConst.COLORS + [0x000000] ]
+
+#_______________________________________________________________________
+def test_black_scale_color(backend):
+  scaled = ColorArray([0x000000]).scale_color(
+    lo_cutoff=RgbConst.MIN_CUTOFF_LITE
+    , hi_cutoff=RgbConst.MAX_CUTOFF_LITE)
+
+  assert scaled.tolist() == [0x5f5f5f]
+
+#_______________________________________________________________________
+def test_color_array_err(backend):
+
+  with pytest.raises(ValueError):
+    ColorArray([0x1000000])
+
+  with pytest.raises(ValueError):
+    ColorArray([-1])
+
+  with pytest.raises(TypeError):
+    ColorArray([1.5])
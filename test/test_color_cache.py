@@ -0,0 +1,188 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests that cached RgbColor functions match the uncached ones.
+#_______________________________________________________________________
+
+import random
+
+import pytest
+
+from classes.color_cache import ColorCache
+from classes.color_cache import ColorCacheConst
+from classes.rgb_color import RgbColor
+from classes.rgb_color import RgbConst
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 18
+  SAMPLE_COUNT: int = 300
+
+  # Repeated so that the second pass hits the cache
+  COLORS: list[int] =\
+    2 * random.Random(SEED).sample(range(1, 0x1000000), SAMPLE_COUNT)\
+    + [0x5f5f5f, 0x123456, 0xffffff]
+
+#_______________________________________________________________________
+@pytest.fixture
+def cache():
+  """
+  Enables the cache for one test.
+  """
+
+  ColorCache.enable()
+
+  yield ColorCache
+
+  ColorCache.disable()
+
+#_______________________________________________________________________
+def call_all(color) -> list:
+  """
+  Results of every cached function for one color.
+  """
+
+  return\
+    [ RgbColor.get_rgb_from_hex(color)
+    , RgbColor.rgb_to_ansi256(color)
+    , RgbColor.scale_color(color, 0x10, 0xe0)
+    , RgbColor.scale_color(color, lo_cutoff=0x5f, hi_cutoff=0xd7)
+    , RgbColor.make_background_color_dark(color)
+    , RgbColor.make_color_dark(color)
+    , RgbColor.make_color_lite(color)
+    , RgbColor.make_background_color(color, is_dark=False)
+    , RgbColor.make_foreground_color(color, True)
+    ]
+
+#_______________________________________________________________________
+def test_results_unchanged(cache):
+  cache.disable()
+  expected = [ call_all(c) for c in TestConst.COLORS ]
+
+  cache.enable()
+  assert [ call_all(c) for c in TestConst.COLORS ] == expected
+
+  hex_str = [ f'0x{c:06x}' for c in TestConst.COLORS ]
+  cache.disable()
+  expected = [ RgbColor.rgb_to_ansi256(c) for c in hex_str ]
+
+  cache.enable()
+  assert [ RgbColor.rgb_to_ansi256(c) for c in hex_str ] == expected
+
+  stats = cache.stats()
+
+  assert set(stats) == set(ColorCacheConst.FUNCTION_NAMES)
+  assert stats['rgb_to_ansi256'][ColorCacheConst.HITS] >=\
+    TestConst.SAMPLE_COUNT
+
+#_______________________________________________________________________
+def test_dict_inputs_modified(cache):
+  color = RgbColor.get_rgb_from_hex(0xff8010)
+
+  scaled = RgbColor.scale_color(color, 0x00, 0x80)
+
+  # Dict input is modified and returned, as without the cache
+  assert scaled is color
+  assert color[RgbConst.RED_STR] == 0x80
+
+  # Cached dict results are copies
+  first = RgbColor.get_rgb_from_hex(0x102030)
+  first[RgbConst.RED_STR] = 0
+
+  assert RgbColor.get_rgb_from_hex(0x102030)[RgbConst.RED_STR] == 0x10
+
+#_______________________________________________________________________
+def test_errors_not_cached(cache):
+
+  for _ in range(2):
+    with pytest.raises(ValueError):
+      RgbColor.rgb_to_ansi256(0x1000000)
+
+    with pytest.raises(TypeError):
+      RgbColor.get_rgb_from_hex(1.0)
+
+  assert RgbColor.get_rgb_from_hex(1)[RgbConst.BLU_STR] == 1
+
+#_______________________________________________________________________
+def test_unhashable(cache):
+  cache.disable()
+
+  with pytest.raises(Exception) as expected:
+    RgbColor.rgb_to_ansi256([0x102030])
+
+  cache.enable()
+
+  with pytest.raises(expected.type):
+    RgbColor.rgb_to_ansi256([0x102030])
+
+#_______________________________________________________________________
+def test_outermost_only(cache):
+  RgbColor.make_background_color(0x8040c0, is_dark=True)
+  RgbColor.make_background_color(0x8040c0, is_dark=True)
+
+  stats = cache.stats()
+
+  assert stats['make_background_color'][ColorCacheConst.MISSES] == 1
+  assert stats['make_background_color'][ColorCacheConst.HITS] == 1
+
+  for name in ['make_color_dark', 'scale_color', 'get_rgb_from_hex']:
+    assert stats[name][ColorCacheConst.MISSES] == 0
+    assert stats[name][ColorCacheConst.SIZE] == 0
+
+#_______________________________________________________________________
+def test_eviction():
+  ColorCache.enable(max_size=8)
+
+  for c in range(20):
+    RgbColor.rgb_to_ansi256(c)
+
+  RgbColor.rgb_to_ansi256(19)
+
+  ColorCache.disable()
+
+  counters = ColorCache.stats()['rgb_to_ansi256']
+
+  assert counters ==\
+    { ColorCacheConst.HITS: 1
+    , ColorCacheConst.MISSES: 20
+    , ColorCacheConst.EVICTIONS: 12
+    , ColorCacheConst.SIZE: 8
+    }
+
+  assert 'rgb_to_ansi256' in ColorCache.create_report_str()
+
+#_______________________________________________________________________
+def test_disable_restores():
+  original = RgbColor.scale_color
+
+  ColorCache.enable()
+  assert RgbColor.scale_color is not original
+
+  ColorCache.disable()
+  assert RgbColor.scale_color is original
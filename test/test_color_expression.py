@@ -0,0 +1,165 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for color expressions in input json.
+#_______________________________________________________________________
+
+import pytest
+
+from classes.color_expression import ColorExpression
+from classes.color_space import ColorSpace
+from classes.scheme_types.mintty_scheme import MinttyScheme
+from classes.theme_library import ThemeColors
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  DARK_FILE: str = 'sample-themes/flux-bunny-dark/flux-bunny-dark-input.json'
+
+#_______________________________________________________________________
+def mintty_colors(cfg: dict) -> MinttyScheme:
+  """
+  Parses a theme with a scheme type that reads the cursor color,
+  without rendering it.
+  """
+
+  scheme = MinttyScheme.__new__(MinttyScheme)
+  scheme.init_colors(cfg)
+
+  return scheme
+
+#_______________________________________________________________________
+def test_literal_values_unchanged():
+  cfg = Utils.read_hex_color_json(TestConst.DARK_FILE)
+
+  assert ThemeColors().resolve_expressions(cfg) is cfg
+
+#_______________________________________________________________________
+def test_functions():
+  cfg = Utils.read_hex_color_json(TestConst.DARK_FILE)
+
+  scheme = ThemeColors(cfg)
+
+  red: int = scheme.palette_[1]
+  bg: int = scheme.bg_norm_color_
+  fg: int = scheme.fg_norm_color_
+
+  derived = mintty_colors(dict(cfg,
+    **{ 'cursor-color': 'mix(palette[1], background-color, 0.3)'
+      , 'foreground-color-intense': 'lighten(foreground-color, 10%)'
+      , 'background-color-intense': 'darken(background-color, 0.05)'
+      , 'accent-color-0': 'accent-color-1'
+      , 'accent-color-1': ' mix( #ff0000 , 0x0000ff ) '
+      }))
+
+  assert derived.cursor_color_ == ColorExpression.mix(red, bg, 0.3)
+  assert derived.accent_color0_ == derived.accent_color1_
+
+  assert ColorSpace.rgb_to_oklch(derived.fg_bold_color_)[0] ==\
+    pytest.approx(ColorSpace.rgb_to_oklch(fg)[0] + 0.1, abs=0.01)
+
+  assert ColorSpace.rgb_to_oklch(derived.bg_bold_color_)[0] ==\
+    pytest.approx(ColorSpace.rgb_to_oklch(bg)[0] - 0.05, abs=0.01)
+
+  # Mixing ends in OKLab returns the ends
+  assert ColorExpression.mix(red, bg, 0.0) == red
+  assert ColorExpression.mix(red, bg, 1.0) == bg
+
+#_______________________________________________________________________
+def test_dependency_order():
+  cfg =\
+    { 'background-color': '0x1c1c1c'
+    , 'palette':
+        [ 'palette[1]', 'palette[2]', 'foreground-color', '0x5faf5f' ]
+        + [ '0x808080' ] * 12
+    , 'foreground-color': 'lighten(palette[3], 0.1)'
+    }
+
+  scheme = mintty_colors(cfg)
+
+  assert scheme.palette_[0] == scheme.palette_[1] == scheme.palette_[2]\
+    == scheme.fg_norm_color_ == ColorExpression.lighten(0x5faf5f, 0.1)
+
+  # Input dict is not modified
+  assert cfg['foreground-color'] == 'lighten(palette[3], 0.1)'
+
+#_______________________________________________________________________
+def test_missing_keys_use_defaults():
+  default = ThemeColors()
+
+  scheme = ThemeColors({ 'foreground-color-intense': 'foreground-color' })
+
+  assert scheme.fg_bold_color_ == default.fg_norm_color_
+
+#_______________________________________________________________________
+def test_compile_cache():
+  text = 'mix(palette[4], palette[12], 25%)'
+
+  func, refs = ColorExpression.compile(text)
+
+  assert ColorExpression.compile(text)[0] is func
+  assert refs == { 'palette[4]', 'palette[12]' }
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('value',
+  [ 'mix(palette[1])'
+  , 'lighten(background-color)'
+  , 'lighten(10%, background-color)'
+  , 'blend(palette[1], palette[2])'
+  , 'mix(palette[1], palette[2]'
+  , 'palette[1] palette[2]'
+  , 'palette[x]'
+  , 'unknown-key'
+  , 'palette[40]'
+  , '0.5'
+  , 'cursor-color; rm'
+  , 'lighten(palette[1], 10)'
+  ])
+def test_invalid(value):
+
+  with pytest.raises(ValueError):
+    mintty_colors({ 'cursor-color': value })
+
+#_______________________________________________________________________
+def test_error_messages():
+
+  with pytest.raises(ValueError, match="missing '\\)'"):
+    mintty_colors({ 'cursor-color': 'lighten(palette[1], 10%' })
+
+  with pytest.raises(ValueError, match='fraction or percent'):
+    mintty_colors({ 'cursor-color': 'lighten(palette[1], 10)' })
+
+#_______________________________________________________________________
+def test_circular():
+
+  with pytest.raises(ValueError, match='circular'):
+    ThemeColors(
+      { 'foreground-color': 'lighten(background-color, 0.5)'
+      , 'background-color': 'darken(foreground-color, 0.5)'
+      })
@@ -0,0 +1,150 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for color space conversions.
+#_______________________________________________________________________
+
+import random
+
+import pytest
+
+import classes.color_space as color_space
+
+from classes.color_space import ColorSpace
+from classes.color_space import ColorSpaceConst
+from classes.rgb_color import RgbConst
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 4
+  SAMPLE_COUNT: int = 500
+
+  COLORS: list[int] =\
+    [0x000000, 0xffffff, 0xff0000, 0x00ff00, 0x0000ff, 0x808080]\
+    + random.Random(SEED).sample(range(0x1000000), SAMPLE_COUNT)
+
+  TOLERANCE: float = 1e-9
+
+  # Reference values from Ottosson (2020)
+  OKLAB_WHITE: tuple = (1.0, 0.0, 0.0)
+  OKLAB_RED  : tuple = (0.627955, 0.224863, 0.125846)
+
+#_______________________________________________________________________
+@pytest.fixture
+def with_numpy():
+  if (color_space.np is None):
+    pytest.skip('NumPy not installed')
+
+  return color_space.np
+
+#_______________________________________________________________________
+def test_gamma_table():
+  for v in range(256):
+    assert ColorSpace.GAMMA_TABLE[v] ==\
+      pytest.approx(ColorSpace.srgb_to_linear(v / 255))
+
+    assert round(ColorSpace.linear_to_srgb(ColorSpace.GAMMA_TABLE[v]) * 255)\
+      == v
+
+#_______________________________________________________________________
+def test_oklab_reference():
+  assert ColorSpace.rgb_to_oklab(0xffffff) ==\
+    pytest.approx(TestConst.OKLAB_WHITE, abs=1e-4)
+
+  assert ColorSpace.rgb_to_oklab(0xff0000) ==\
+    pytest.approx(TestConst.OKLAB_RED, abs=1e-4)
+
+#_______________________________________________________________________
+def test_round_trip():
+  for c in TestConst.COLORS:
+    assert ColorSpace.linear_to_rgb(ColorSpace.rgb_to_linear(c)) == c
+    assert ColorSpace.oklab_to_rgb(ColorSpace.rgb_to_oklab(c)) == c
+    assert ColorSpace.oklch_to_rgb(ColorSpace.rgb_to_oklch(c)) == c
+    assert ColorSpace.lab_to_rgb(ColorSpace.rgb_to_lab(c)) == c
+
+#_______________________________________________________________________
+def test_array_matches_scalar(with_numpy):
+  np = with_numpy
+  packed = np.asarray(TestConst.COLORS, dtype=np.uint32)
+
+  for space in ColorSpaceConst.SPACES:
+    converted = ColorSpace.convert_array(packed, space)
+
+    for i, c in enumerate(TestConst.COLORS):
+      expected = ColorSpace.convert(c, space)
+
+      # Hue is undefined for greys
+      if (space == ColorSpaceConst.OKLCH_SPACE and expected[1] < 1e-6):
+        expected = expected[:2]
+
+      assert tuple(converted[i][:len(expected)]) ==\
+        pytest.approx(expected, abs=TestConst.TOLERANCE)
+
+  assert ColorSpace.oklab_to_rgb_array(
+    ColorSpace.rgb_to_oklab_array(packed)).tolist() == TestConst.COLORS
+
+  assert ColorSpace.oklch_to_rgb_array(
+    ColorSpace.rgb_to_oklch_array(packed)).tolist() == TestConst.COLORS
+
+  assert ColorSpace.lab_to_rgb_array(
+    ColorSpace.rgb_to_lab_array(packed)).tolist() == TestConst.COLORS
+
+#_______________________________________________________________________
+def test_out_of_gamut_clipped():
+  assert ColorSpace.oklch_to_rgb((0.5, 1.0, 30.0)) <= 0xffffff
+  assert ColorSpace.oklab_to_rgb((2.0, 0.0, 0.0)) == 0xffffff
+  assert ColorSpace.oklab_to_rgb((-1.0, 0.0, 0.0)) == 0x000000
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_convert_constant(use_numpy, monkeypatch):
+
+  if (not use_numpy):
+    monkeypatch.setattr(color_space, 'np', None)
+    monkeypatch.setattr(ColorSpace, 'constant_cache_', {})
+
+  elif (color_space.np is None):
+    pytest.skip('NumPy not installed')
+
+  greys = RgbConst.ANSI_256_DARK_GREYS
+
+  first = ColorSpace.convert_constant(greys, ColorSpaceConst.OKLAB_SPACE)
+  second = ColorSpace.convert_constant(greys, ColorSpaceConst.OKLAB_SPACE)
+
+  assert first is second
+  assert len(first) == len(greys)
+
+  for i, c in enumerate(greys):
+    assert tuple(first[i]) ==\
+      pytest.approx(ColorSpace.rgb_to_oklab(c), abs=TestConst.TOLERANCE)
+
+#_______________________________________________________________________
+def test_convert_err():
+  with pytest.raises(ValueError):
+    ColorSpace.convert(0x000000, 'hsv')
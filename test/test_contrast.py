@@ -0,0 +1,136 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for WCAG and APCA contrast and the contrast report.
+#_______________________________________________________________________
+
+import random
+
+import pytest
+
+import classes.contrast_report as contrast_report
+
+from classes.contrast import Contrast
+from classes.contrast_report import ContrastReport
+from classes.contrast_report import ContrastReportConst
+from classes.theme_library import ThemeLibrary
+
+#_______________________________________________________________________
+def random_themes(seed: int, count: int) -> list:
+  """
+  Creates (name, dict) theme inputs with random colors.
+  """
+
+  r = random.Random(seed)
+  themes: list = []
+
+  for i in range(count):
+    themes.append((f'theme-{i}'
+      , { 'background-color'         : hex(r.randrange(0x1000000))
+        , 'background-color-intense' : hex(r.randrange(0x1000000))
+        , 'palette'                  :
+          [ hex(r.randrange(0x1000000)) for _ in range(16) ]
+        }))
+
+  return themes
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 6
+  THEME_COUNT: int = 20
+
+  # (text, background, Lc) from the APCA reference implementation
+  APCA_PAIRS: list =\
+  [ (0x888888, 0xffffff,  63.056469930209424)
+  , (0xffffff, 0x888888, -68.54146436644962)
+  , (0x000000, 0xaaaaaa,  58.146262578561334)
+  , (0xaaaaaa, 0x000000, -56.24113336839742)
+  , (0x123456, 0x123456,  0.0)
+  ]
+
+  THEMES: list = random_themes(SEED, THEME_COUNT)
+
+#_______________________________________________________________________
+def test_wcag_contrast():
+  assert Contrast.wcag_contrast(0x000000, 0xffffff) == pytest.approx(21.0)
+  assert Contrast.wcag_contrast(0xffffff, 0x000000) == pytest.approx(21.0)
+  assert Contrast.wcag_contrast(0x777777, 0x777777) == pytest.approx(1.0)
+
+  # #767676 is the lightest grey passing AA on white
+  assert Contrast.wcag_contrast(0x767676, 0xffffff) >= 4.5
+  assert Contrast.wcag_contrast(0x777777, 0xffffff) < 4.5
+
+#_______________________________________________________________________
+def test_apca_contrast():
+  for fg, bg, lc in TestConst.APCA_PAIRS:
+    assert Contrast.apca_contrast(fg, bg) == pytest.approx(lc)
+
+#_______________________________________________________________________
+def test_matrix_matches_scalar():
+  np = pytest.importorskip('numpy')
+
+  library = ThemeLibrary(TestConst.THEMES)
+
+  wcag, apca = ContrastReport.contrast_matrices(library)
+  backgrounds = ContrastReport.backgrounds(library)
+
+  assert wcag.shape == (TestConst.THEME_COUNT, 16
+    , 2 + len(ContrastReportConst.GREYS))
+
+  for t, scheme in enumerate(library.schemes_):
+    wcag_list, apca_list = ContrastReport.contrast_lists(
+      scheme.palette_, backgrounds[t].tolist())
+
+    assert np.allclose(wcag[t], wcag_list)
+    assert np.allclose(apca[t], apca_list)
+
+#_______________________________________________________________________
+def test_summary_fallback(monkeypatch):
+  pytest.importorskip('numpy')
+
+  library = ThemeLibrary(TestConst.THEMES)
+
+  rows = ContrastReport.summary_rows(library, 4.5)
+
+  monkeypatch.setattr(contrast_report, 'np', None)
+
+  for row, expected in zip(ContrastReport.summary_rows(library, 4.5), rows):
+    assert row == pytest.approx(expected)
+
+#_______________________________________________________________________
+def test_chunked_summary(monkeypatch):
+  pytest.importorskip('numpy')
+
+  library = ThemeLibrary(TestConst.THEMES)
+
+  rows = ContrastReport.summary_rows(library, 3.0)
+
+  monkeypatch.setattr(ContrastReportConst, 'CHUNK_THEMES', 3)
+
+  assert ContrastReport.summary_rows(library, 3.0) == rows
@@ -0,0 +1,182 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for the contrast repair solver.
+#_______________________________________________________________________
+
+import argparse
+import json
+import random
+
+import pytest
+
+import classes.contrast_repair as contrast_repair
+
+from classes.color_space import ColorSpace
+from classes.contrast import Contrast
+from classes.contrast_repair import ContrastRepair
+from classes.theme_library import ThemeColors
+from classes.theme_library import ThemeLibrary
+from classes.theme_library import ThemeLibraryConst
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 9
+  SAMPLE_COUNT: int = 200
+
+  MIN_CONTRAST: float = 4.5
+
+  # Lightness steps of the brute force search
+  SCAN_STEPS: int = 400
+
+  BACKGROUNDS: list[int] = [0x000000, 0x1e1e2e, 0x808080, 0xfdf6e3]
+
+#_______________________________________________________________________
+def sample_pairs() -> list[tuple]:
+  rng = random.Random(TestConst.SEED)
+
+  return [ (rng.randrange(0x1000000), rng.choice(TestConst.BACKGROUNDS))
+    for _ in range(TestConst.SAMPLE_COUNT) ]
+
+#_______________________________________________________________________
+def oklab_dist(a: int, b: int) -> float:
+  lab_a = ColorSpace.rgb_to_oklab(a)
+  lab_b = ColorSpace.rgb_to_oklab(b)
+
+  return sum((x - y) ** 2 for x, y in zip(lab_a, lab_b)) ** 0.5
+
+#_______________________________________________________________________
+@pytest.fixture(params=['numpy', 'scalar'])
+def repair(request, monkeypatch):
+  """
+  Repairs colors with the vectorized solver and the scalar fallback.
+  """
+
+  if (request.param == 'scalar'):
+    return lambda colors, bgs, min_contrast:\
+      [ ContrastRepair.repair_color(c, bg, min_contrast)
+        for c, bg in zip(colors, bgs) ]
+
+  if (contrast_repair.np is None):
+    pytest.skip('NumPy not installed')
+
+  return lambda colors, bgs, min_contrast:\
+    ContrastRepair.repair_array(colors, bgs, min_contrast).tolist()
+
+#_______________________________________________________________________
+def test_repaired_colors_pass(repair):
+  pairs = sample_pairs()
+  colors = [ c for c, _ in pairs ]
+  bgs = [ bg for _, bg in pairs ]
+
+  repaired = repair(colors, bgs, TestConst.MIN_CONTRAST)
+
+  for color, bg, fixed in zip(colors, bgs, repaired):
+    if (Contrast.wcag_contrast(color, bg) >= TestConst.MIN_CONTRAST):
+      assert fixed == color
+
+    else:
+      assert Contrast.wcag_contrast(fixed, bg) >= TestConst.MIN_CONTRAST
+
+#_______________________________________________________________________
+def test_repair_is_minimal(repair):
+  pairs = sample_pairs()[:40]
+  colors = [ c for c, _ in pairs ]
+  bgs = [ bg for _, bg in pairs ]
+
+  repaired = repair(colors, bgs, TestConst.MIN_CONTRAST)
+
+  for color, bg, fixed in zip(colors, bgs, repaired):
+    lch = ColorSpace.rgb_to_oklch(color)
+
+    # Brute force scan of every lightness offset
+    scan = [ ContrastRepair.move_lightness(lch, 2 * i / TestConst.SCAN_STEPS - 1)
+      for i in range(TestConst.SCAN_STEPS + 1) ]
+
+    passing = [ c for c in scan
+      if (Contrast.wcag_contrast(c, bg) >= TestConst.MIN_CONTRAST) ]
+
+    if (passing):
+      best = min(oklab_dist(color, c) for c in passing)
+
+      assert oklab_dist(color, fixed) <= best + 0.01
+
+#_______________________________________________________________________
+def test_numpy_matches_scalar():
+  if (contrast_repair.np is None):
+    pytest.skip('NumPy not installed')
+
+  pairs = sample_pairs()
+  colors = [ c for c, _ in pairs ]
+  bgs = [ bg for _, bg in pairs ]
+
+  vector = ContrastRepair.repair_array(colors, bgs, TestConst.MIN_CONTRAST)
+
+  for color, bg, fixed in zip(colors, bgs, vector.tolist()):
+    scalar = ContrastRepair.repair_color(color, bg, TestConst.MIN_CONTRAST)
+
+    assert oklab_dist(scalar, fixed) < 0.01
+
+#_______________________________________________________________________
+def test_run_writes_inputs(tmp_path):
+  rng = random.Random(TestConst.SEED)
+
+  theme_dir = tmp_path / 'themes'
+  (theme_dir / 'nested').mkdir(parents=True)
+
+  for i in range(4):
+    cfg = { 'mode': 'dark'
+      , 'background-color': '0x1e1e2e'
+      , 'palette': [ f'0x{rng.randrange(0x1000000):06x}' for _ in range(16) ]
+      }
+
+    with open(theme_dir / 'nested' / f'theme-{i}.json', 'w') as file:
+      json.dump(cfg, file)
+
+  args = argparse.Namespace(theme_dir=str(theme_dir), file=None
+    , out_dir=str(tmp_path / 'out'), min_contrast=TestConst.MIN_CONTRAST)
+
+  ContrastRepair.run(args)
+
+  out_files = ThemeLibrary.find_theme_files(str(tmp_path / 'out'))
+  assert out_files
+
+  library = ThemeLibrary.from_files(out_files)
+
+  for scheme in library.schemes_:
+    exempt = ThemeLibraryConst.DARK_EXEMPT_SLOTS
+
+    for i in range(ThemeLibraryConst.PALETTE_SIZE):
+      if (i not in exempt):
+        assert Contrast.wcag_contrast(scheme.palette_[i]
+          , scheme.bg_norm_color_) >= TestConst.MIN_CONTRAST
+
+  for file_path in out_files:
+    with open(file_path) as file:
+      ThemeColors(json.load(file))
@@ -0,0 +1,143 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests that the cutoff sweep matches the scalar color derivation.
+#_______________________________________________________________________
+
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from classes.contrast import Contrast
+from classes.cutoff_sweep import CutoffSweep
+from classes.rgb_color import RgbColor
+from classes.theme_library import ThemeLibrary
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 12
+  SAMPLE_COUNT: int = 500
+
+  COLORS: list[int] =\
+    [0x80ff10, 0x804020, 0xffffff, 0x010101, 0x5f5f5f]\
+    + random.Random(SEED).sample(range(1, 0x1000000), SAMPLE_COUNT)
+
+  DARK_CUTOFFS: list[int] = [0x4f, 0x5f]
+  LITE_MINS   : list[int] = [0x5f, 0x6f]
+  LITE_MAXS   : list[int] = [0xd7, 0xe7]
+
+  MIN_CONTRAST: float = 4.5
+
+#_______________________________________________________________________
+def sample_library() -> ThemeLibrary:
+  rng = random.Random(TestConst.SEED)
+  hex_str = lambda: f'0x{rng.randrange(1, 0x1000000):06x}'
+
+  return ThemeLibrary(
+    [ ( f'theme-{t}'
+      , { 'mode': 'dark' if (t % 2) else 'light'
+        , 'background-color': hex_str()
+        , 'foreground-color': hex_str()
+        , 'accent-color-0': hex_str()
+        , 'accent-color-1': hex_str()
+        , 'accent-color-2': hex_str()
+        } )
+      for t in range(8) ])
+
+#_______________________________________________________________________
+def test_scale_grid():
+  colors = np.asarray(TestConst.COLORS, dtype=np.uint32)
+
+  rgb = np.stack([ (colors >> 16) & 0xFF, (colors >> 8) & 0xFF
+    , colors & 0xFF ], axis=-1)
+
+  cutoffs = [(0x00, 0x5f), (0x5f, 0xd7), (0x10, 0xe0)]
+
+  scaled = CutoffSweep.scale_grid(rgb
+    , [ lo for lo, _ in cutoffs ], [ hi for _, hi in cutoffs ])
+
+  for g, (lo, hi) in enumerate(cutoffs):
+    assert scaled[g].tolist() ==\
+      [ RgbColor.scale_color(c, lo, hi) for c in TestConst.COLORS ]
+
+#_______________________________________________________________________
+def test_evaluate_matches_scalar():
+  library = sample_library()
+
+  rows = CutoffSweep.sweep(library, TestConst.DARK_CUTOFFS
+    , TestConst.LITE_MINS, TestConst.LITE_MAXS
+    , min_contrast=TestConst.MIN_CONTRAST, jobs=1)
+
+  assert len(rows) == 8
+
+  for row in rows:
+    dark_max, lite_min, lite_max = row[:3]
+
+    text: list[float] = []
+    key: list[float] = []
+    pair: list[float] = []
+
+    for s in library.schemes_:
+      for accent in [s.accent_color0_, s.accent_color1_, s.accent_color2_]:
+        dark = RgbColor.scale_color(accent, 0, dark_max)
+        lite = RgbColor.scale_color(accent, lite_min, lite_max)
+
+        bg, fg = (dark, lite) if (s.is_dark_) else (lite, dark)
+
+        text.append(Contrast.wcag_contrast(s.fg_norm_color_, bg))
+        key.append(Contrast.wcag_contrast(fg, s.bg_norm_color_))
+        pair.append(Contrast.wcag_contrast(fg, bg))
+
+    passing = lambda v: sum(c >= TestConst.MIN_CONTRAST for c in v) / len(v)
+
+    assert row[3] == pytest.approx(passing(text))
+    assert row[4] == pytest.approx(passing(key))
+    assert row[5] == pytest.approx(passing(pair))
+    assert row[7] == pytest.approx(min(text + key + pair))
+
+  scores = [ row[6] for row in rows ]
+  assert scores == sorted(scores, reverse=True)
+
+#_______________________________________________________________________
+def test_pool_matches_serial():
+  args = ( sample_library(), TestConst.DARK_CUTOFFS
+    , TestConst.LITE_MINS, TestConst.LITE_MAXS )
+
+  assert CutoffSweep.sweep(*args, jobs=1) == CutoffSweep.sweep(*args, jobs=2)
+
+#_______________________________________________________________________
+def test_parse_range():
+  assert CutoffSweep.parse_range('0x10:0x30:0x10') == [0x10, 0x20, 0x30]
+  assert CutoffSweep.parse_range('95') == [95]
+
+  for text in ['0x30:0x10', '0:0x100:1', '0:10:0', 'a']:
+    with pytest.raises(ValueError):
+      CutoffSweep.parse_range(text)
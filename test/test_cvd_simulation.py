@@ -0,0 +1,104 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests that the vectorized color vision deficiency simulation
+#   matches the scalar functions.
+#_______________________________________________________________________
+
+import random
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from classes.color_space import ColorSpace
+from classes.cvd_simulation import CvdSimulation
+from classes.cvd_simulation import CvdSimulationConst
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 10
+  THEME_COUNT: int = 6
+  COLOR_COUNT: int = 19
+
+  COLORS: list[int] =\
+    random.Random(SEED).sample(range(0x1000000), THEME_COUNT * COLOR_COUNT)
+
+#_______________________________________________________________________
+def sample_themes() -> list:
+  n = TestConst.COLOR_COUNT
+
+  return [ TestConst.COLORS[t * n:(t + 1) * n]
+    for t in range(TestConst.THEME_COUNT) ]
+
+#_______________________________________________________________________
+def test_simulate_matches_scalar():
+  Const = CvdSimulationConst
+
+  colors = np.asarray(sample_themes(), dtype=np.uint32)
+
+  simulated = ColorSpace.linear_to_rgb_array(
+    CvdSimulation.simulate_array(colors))
+
+  for d, deficiency in enumerate(Const.DEFICIENCIES):
+    for t, theme in enumerate(sample_themes()):
+      assert simulated[d, t].tolist() ==\
+        [ CvdSimulation.simulate(c, deficiency) for c in theme ]
+
+#_______________________________________________________________________
+def test_greys_unchanged():
+  greys = [ 0x010101 * v for v in range(0, 256, 17) ]
+
+  for deficiency in CvdSimulationConst.DEFICIENCIES:
+    for grey in greys:
+      simulated = CvdSimulation.simulate(grey, deficiency)
+
+      # Matrix rows sum to one, greys stay within rounding
+      for shift in (16, 8, 0):
+        assert abs(((simulated >> shift) & 0xFF) - ((grey >> shift) & 0xFF)) <= 1
+
+#_______________________________________________________________________
+def test_red_green_collapse():
+  colors = [0xcc0000, 0x00aa00] + [0x000000] * (TestConst.COLOR_COUNT - 2)
+
+  pairs = CvdSimulation.collapsed_pairs([colors], 20)[0]
+
+  assert any(p[1:3] == (0, 1) for p in pairs)
+
+#_______________________________________________________________________
+def test_pairs_match_scalar():
+  min_delta_e = CvdSimulationConst.MIN_DELTA_E
+
+  vector = CvdSimulation.collapsed_pairs(sample_themes(), min_delta_e)
+
+  for theme, pairs in zip(sample_themes(), vector):
+    scalar = CvdSimulation.collapsed_pairs_lists(theme, min_delta_e)
+
+    key = lambda p: p[:3]
+    assert sorted(map(key, scalar)) == sorted(map(key, pairs))
@@ -0,0 +1,143 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for the theme generated 256 color palette.
+#_______________________________________________________________________
+
+import pytest
+
+import classes.extended_palette as extended_palette
+
+from classes.color_space import ColorSpace
+from classes.extended_palette import ExtendedPalette
+from classes.scheme_types.xresources_scheme import XresourcesScheme
+from classes.theme_library import ThemeColors
+from classes.theme_library import ThemeLibrary
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  FILES: list[str] =\
+    [ 'sample-themes/flux-bunny-dark/flux-bunny-dark-input.json'
+    , 'sample-themes/flux-bunny-lite/flux-bunny-lite-input.json'
+    ]
+
+  # ANSI 256 indices of the cube corners and their palette slots
+  CORNER_INDICES: dict =\
+    { 16 + 36 * 5: 1
+    , 16 +  6 * 5: 2
+    , 16 +      5: 4
+    , 16 + 36 * 5 + 6 * 5: 3
+    , 16 + 36 * 5 +     5: 5
+    , 16 +  6 * 5 +     5: 6
+    }
+
+#_______________________________________________________________________
+@pytest.fixture(params=['numpy', 'scalar'])
+def backend(request, monkeypatch):
+  """
+  Runs each test with NumPy and with the scalar fallback.
+  """
+
+  if (request.param == 'scalar'):
+    monkeypatch.setattr(extended_palette, 'np', None)
+
+  elif (extended_palette.np is None):
+    pytest.skip('NumPy not installed')
+
+  return request.param
+
+#_______________________________________________________________________
+def sample_schemes() -> list:
+  return\
+    [ ThemeColors(Utils.read_hex_color_json(f)) for f in TestConst.FILES ]\
+    + [ ThemeColors() ]
+
+#_______________________________________________________________________
+def test_corners(backend):
+  for scheme in sample_schemes():
+    palette = ExtendedPalette.extended_palette(scheme)
+
+    assert len(palette) == 256
+    assert palette[:16] == list(scheme.palette_[:16])
+    assert palette[16] == scheme.bg_norm_color_
+    assert palette[231] == scheme.fg_norm_color_
+
+    for index, slot in TestConst.CORNER_INDICES.items():
+      assert palette[index] == scheme.palette_[slot]
+
+#_______________________________________________________________________
+def test_grey_ramp(backend):
+  for scheme in sample_schemes():
+    palette = ExtendedPalette.extended_palette(scheme)
+
+    lightness = [ ColorSpace.rgb_to_oklab(c)[0] for c in palette[232:] ]
+
+    bg = ColorSpace.rgb_to_oklab(scheme.bg_norm_color_)[0]
+    fg = ColorSpace.rgb_to_oklab(scheme.fg_norm_color_)[0]
+
+    if (bg > fg):
+      lightness.reverse()
+
+    assert lightness == sorted(lightness)
+
+#_______________________________________________________________________
+def test_array_matches_scalar():
+  pytest.importorskip('numpy')
+
+  schemes = sample_schemes()
+
+  batch = ExtendedPalette.extended_palettes(schemes)
+
+  for scheme, palette in zip(schemes, batch):
+    assert palette[16:] ==\
+      ExtendedPalette.generate_list(ExtendedPalette.corners(scheme))
+
+#_______________________________________________________________________
+def test_tokens(tmp_path):
+  library = ThemeLibrary.from_files(TestConst.FILES)
+
+  maps = library.replacement_maps(XresourcesScheme)
+
+  for scheme, mappy in zip(library.schemes_, maps):
+    palette = ExtendedPalette.extended_palette(scheme)
+
+    assert mappy['ANSI_016'] == f'{palette[16]:06x}'
+    assert mappy['ANSI_255'] == f'{palette[255]:06x}'
+
+  cfg = Utils.read_hex_color_json(TestConst.FILES[0])
+
+  scheme = XresourcesScheme(str(tmp_path), cfg)
+  scheme.write_file()
+
+  with open(scheme.out_file_path_) as file:
+    text = file.read()
+
+  assert 'ANSI_' not in text
+  assert f'*.color255: #{scheme.extended_palette_[255]:06x}' in text
@@ -0,0 +1,100 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for themes created from images.
+#_______________________________________________________________________
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from classes.color_space import ColorSpace
+from classes.contrast import Contrast
+from classes.image_palette import ImagePalette
+from classes.theme_library import ThemeColors
+from classes.theme_library import ThemeLibraryConst
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 14
+
+  # Dark blue dominated image with orange and green areas
+  COLORS: list[int] = [0x101830, 0xe07020, 0x30a040]
+  COUNTS: list[int] = [6000, 2500, 1500]
+
+  MIN_CONTRAST: float = 4.5
+
+#_______________________________________________________________________
+def sample_pixels():
+  rng = np.random.default_rng(TestConst.SEED)
+
+  pixels = np.concatenate(
+    [ np.tile([(c >> 16) & 0xFF, (c >> 8) & 0xFF, c & 0xFF], (n, 1))
+      for c, n in zip(TestConst.COLORS, TestConst.COUNTS) ])
+
+  noise = rng.integers(-4, 5, pixels.shape)
+
+  return np.clip(pixels + noise, 0, 255).astype(np.uint8)
+
+#_______________________________________________________________________
+def test_kmeans_finds_clusters():
+  pixels = sample_pixels().astype(np.uint32)
+  packed = (pixels[:, 0] << 16) | (pixels[:, 1] << 8) | pixels[:, 2]
+
+  centers, counts = ImagePalette.kmeans(
+    ColorSpace.rgb_to_oklab_array(packed), clusters=3)
+
+  assert sorted(counts.tolist()) == sorted(TestConst.COUNTS)
+
+  for color in TestConst.COLORS:
+    lab = np.asarray(ColorSpace.rgb_to_oklab(color))
+    assert np.sqrt(((centers - lab) ** 2).sum(axis=1)).min() < 0.01
+
+#_______________________________________________________________________
+def test_theme_from_samples():
+  cfg = ImagePalette.from_samples(sample_pixels(), 'image'
+    , TestConst.MIN_CONTRAST)
+
+  scheme = ThemeColors(cfg)
+
+  assert scheme.is_dark_
+
+  for i in range(ThemeLibraryConst.PALETTE_SIZE):
+    if (i not in ThemeLibraryConst.DARK_EXEMPT_SLOTS):
+      assert Contrast.wcag_contrast(scheme.palette_[i]
+        , scheme.bg_norm_color_) >= TestConst.MIN_CONTRAST
+
+  # Red and green slots take the hues of the orange and green areas
+  hue = lambda c: ColorSpace.rgb_to_oklch(c)[2]
+
+  assert ImagePalette.hue_distance(
+    hue(scheme.palette_[1]), hue(TestConst.COLORS[1])) < 5
+
+  assert ImagePalette.hue_distance(
+    hue(scheme.palette_[2]), hue(TestConst.COLORS[2])) < 5
@@ -0,0 +1,238 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests that the streaming image readers decode the sampled pixels
+#   of PNG and PPM files exactly.
+#_______________________________________________________________________
+
+import struct
+import zlib
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from classes.image_reader import ImageReader
+from classes.image_reader import ImageReaderConst
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 13
+
+  WIDTH : int = 37
+  HEIGHT: int = 300
+
+  # Small enough that rows and columns are subsampled
+  MAX_SAMPLES: int = 400
+
+#_______________________________________________________________________
+def filter_row(filter_type: int, row: bytes, prev: bytes, bpp: int) -> bytes:
+  """
+  Applies a PNG row filter, the inverse of ImageReader.unfilter.
+  """
+
+  out = bytearray(len(row))
+
+  for i in range(len(row)):
+    a = row[i - bpp] if (i >= bpp) else 0
+    b = prev[i]
+    c = prev[i - bpp] if (i >= bpp) else 0
+
+    if (filter_type == ImageReaderConst.FILTER_SUB):
+      pred = a
+
+    elif (filter_type == ImageReaderConst.FILTER_UP):
+      pred = b
+
+    elif (filter_type == ImageReaderConst.FILTER_AVG):
+      pred = (a + b) >> 1
+
+    elif (filter_type == ImageReaderConst.FILTER_PAETH):
+      p = a + b - c
+      pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+      pred = a if (pa <= pb and pa <= pc) else (b if (pb <= pc) else c)
+
+    else:
+      pred = 0
+
+    out[i] = (row[i] - pred) & 0xFF
+
+  return bytes(out)
+
+#_______________________________________________________________________
+def write_png(file_path, rows: list, width: int, depth: int
+  , color_type: int, bpp: int, palette: bytes = None) -> None:
+  """
+  Writes a PNG with the filter type of each row cycling through all
+  five, split over several IDAT chunks.
+  """
+
+  def chunk(chunk_type: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + chunk_type + data\
+      + struct.pack('>I', zlib.crc32(chunk_type + data))
+
+  prev = bytes(len(rows[0]))
+  data = bytearray()
+
+  for y, row in enumerate(rows):
+    filter_type = y % 5
+    data += bytes([filter_type]) + filter_row(filter_type, row, prev, bpp)
+    prev = row
+
+  compressed = zlib.compress(bytes(data))
+  third = len(compressed) // 3 + 1
+
+  out = ImageReaderConst.PNG_SIGNATURE + chunk(b'IHDR'
+    , struct.pack('>IIBBBBB', width, len(rows), depth, color_type, 0, 0, 0))
+
+  if (palette is not None):
+    out += chunk(b'PLTE', palette)
+
+  for i in range(0, len(compressed), third):
+    out += chunk(b'IDAT', compressed[i:i + third])
+
+  out += chunk(b'IEND', b'')
+
+  with open(file_path, 'wb') as file:
+    file.write(out)
+
+#_______________________________________________________________________
+def expected_samples(rgb):
+  """
+  Pixels the readers keep from an (H, W, 3) image.
+  """
+
+  height, width = rgb.shape[:2]
+
+  stride = ImageReader.stride(width, height, TestConst.MAX_SAMPLES)
+
+  return rgb[::stride, ::stride].reshape(-1, 3)
+
+#_______________________________________________________________________
+def random_image(channels: int, dtype=np.uint8):
+  rng = np.random.default_rng(TestConst.SEED)
+
+  return rng.integers(0, np.iinfo(dtype).max + 1
+    , (TestConst.HEIGHT, TestConst.WIDTH, channels), dtype=dtype)
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('color_type, channels'
+  , [ (ImageReaderConst.RGB, 3)
+    , (ImageReaderConst.RGB_ALPHA, 4)
+    , (ImageReaderConst.GREY, 1)
+    , (ImageReaderConst.GREY_ALPHA, 2)
+    ])
+def test_png_8_bit(tmp_path, color_type, channels):
+  image = random_image(channels)
+
+  file_path = tmp_path / 'image.png'
+  write_png(file_path, [ r.tobytes() for r in image ]
+    , TestConst.WIDTH, 8, color_type, channels)
+
+  rgb = image[..., :3] if (channels >= 3) else np.repeat(image[..., :1], 3, 2)
+
+  samples = ImageReader.read(str(file_path), TestConst.MAX_SAMPLES)
+
+  assert samples.tolist() == expected_samples(rgb).tolist()
+
+#_______________________________________________________________________
+def test_png_16_bit(tmp_path):
+  image = random_image(3, np.uint16)
+
+  file_path = tmp_path / 'image.png'
+  write_png(file_path, [ r.astype('>u2').tobytes() for r in image ]
+    , TestConst.WIDTH, 16, ImageReaderConst.RGB, 6)
+
+  samples = ImageReader.read(str(file_path), TestConst.MAX_SAMPLES)
+
+  assert samples.tolist() == expected_samples(image >> 8).tolist()
+
+#_______________________________________________________________________
+def test_png_indexed(tmp_path):
+  rng = np.random.default_rng(TestConst.SEED)
+
+  palette = rng.integers(0, 256, (16, 3), dtype=np.uint8)
+  indices = rng.integers(0, 16, (TestConst.HEIGHT, TestConst.WIDTH))
+
+  # Two 4 bit indices per byte, rows padded to whole bytes
+  padded = np.zeros((TestConst.HEIGHT, TestConst.WIDTH + 1), dtype=np.uint8)
+  padded[:, :TestConst.WIDTH] = indices
+  rows = [ bytes((r[0::2] << 4) | r[1::2]) for r in padded ]
+
+  file_path = tmp_path / 'image.png'
+  write_png(file_path, rows, TestConst.WIDTH, 4, ImageReaderConst.INDEXED, 1
+    , palette.tobytes())
+
+  samples = ImageReader.read(str(file_path), TestConst.MAX_SAMPLES)
+
+  assert samples.tolist() == expected_samples(palette[indices]).tolist()
+
+#_______________________________________________________________________
+def test_unfilter_block_matches_rows():
+  rng = np.random.default_rng(TestConst.SEED)
+
+  for bpp in [1, 3, 4]:
+    raw = rng.integers(0, 256, (40, 12 * bpp), dtype=np.uint8)
+    filters = rng.integers(0, 5, 40).astype(np.uint8)
+    prev = rng.integers(0, 256, 12 * bpp, dtype=np.uint8).tobytes()
+
+    block = ImageReader.unfilter_block(filters, raw, prev, bpp)
+
+    for r in range(len(raw)):
+      prev = bytes(ImageReader.unfilter(int(filters[r])
+        , bytearray(raw[r].tobytes()), bytearray(prev), bpp))
+
+      assert block[r].tobytes() == prev
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('max_val', [255, 100, 1023])
+def test_ppm(tmp_path, max_val):
+  rng = np.random.default_rng(TestConst.SEED)
+
+  image = rng.integers(0, max_val + 1, (TestConst.HEIGHT, TestConst.WIDTH, 3))
+  dtype = np.uint8 if (max_val < 256) else np.dtype('>u2')
+
+  file_path = tmp_path / 'image.ppm'
+
+  with open(file_path, 'wb') as file:
+    file.write(b'P6\n# comment\n%d %d\n%d\n'
+      % (TestConst.WIDTH, TestConst.HEIGHT, max_val))
+    file.write(image.astype(dtype).tobytes())
+
+  samples = ImageReader.read(str(file_path), TestConst.MAX_SAMPLES)
+
+  assert samples.tolist() == expected_samples(image * 255 // max_val).tolist()
+
+#_______________________________________________________________________
+def test_invalid_image(tmp_path):
+  file_path = tmp_path / 'image.ppm'
+  file_path.write_bytes(b'P3\n1 1\n255\n0 0 0\n')
+
+  with pytest.raises(ValueError):
+    ImageReader.read(str(file_path))
@@ -0,0 +1,130 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for nearest color search and perceptual color differences.
+#_______________________________________________________________________
+
+import random
+
+import pytest
+
+import classes.nearest_color_index as nearest_color_index
+
+from classes.ansi256_colors import Ansi256Colors
+from classes.color_space import ColorSpace
+from classes.nearest_color_index import NearestColorIndex
+from classes.nearest_color_index import NearestColorIndexConst
+from classes.rgb_color import RgbConst
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 16
+  SAMPLE_COUNT: int = 300
+
+  QUERIES: list[int] =\
+    random.Random(SEED).sample(range(0x1000000), SAMPLE_COUNT)
+
+  # Reference pairs from Sharma, Wu and Dalal (2005)
+  DELTA_E_2000_PAIRS: list =\
+  [ ((50.0000, 2.6772, -79.7751), (50.0000, 0.0000, -82.7485), 2.0425)
+  , ((50.0000, 2.5000,   0.0000), (50.0000, 0.0000,  -2.5000), 4.3065)
+  , ((50.0000, 2.5000,   0.0000), (73.0000, 25.000, -18.0000), 27.1492)
+  , ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644)
+  ]
+
+#_______________________________________________________________________
+def brute_force(palette: list[int], metric: str, rgb_color: int) -> int:
+  """
+  Linear scan reference using the scalar conversions.
+  """
+
+  pt = NearestColorIndex.to_metric_space(rgb_color, metric)
+  pts = [ NearestColorIndex.to_metric_space(c, metric) for c in palette ]
+
+  if (metric == NearestColorIndexConst.CIEDE2000_METRIC):
+    dist = [ ColorSpace.delta_e_2000(pt, p) for p in pts ]
+  else:
+    dist = [ sum((pt[i] - p[i]) ** 2 for i in range(3)) for p in pts ]
+
+  return dist.index(min(dist))
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('metric', NearestColorIndexConst.METRICS)
+@pytest.mark.parametrize('palette',
+  [ Ansi256Colors.rgb_list
+  , RgbConst.DEFAULT_RGB_INT_LIST
+  ])
+def test_query_array(metric, palette):
+  pytest.importorskip('numpy')
+
+  index = NearestColorIndex(palette, metric)
+  result = index.query_array(TestConst.QUERIES)
+
+  for i in range(len(TestConst.QUERIES)):
+    expected: int = brute_force(palette, metric, TestConst.QUERIES[i])
+    assert palette[result[i]] == palette[expected]
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('metric', NearestColorIndexConst.METRICS)
+def test_query_fallback(metric, monkeypatch):
+  monkeypatch.setattr(nearest_color_index, 'np', None)
+
+  palette: list[int] = RgbConst.DEFAULT_RGB_INT_LIST
+  index = NearestColorIndex(palette, metric)
+
+  for rgb_color in TestConst.QUERIES[:100]:
+    assert index.query(rgb_color) == brute_force(palette, metric, rgb_color)
+
+#_______________________________________________________________________
+def test_palette_colors_map_to_themselves():
+  index = NearestColorIndex(Ansi256Colors.rgb_list[16:], 'oklab')
+
+  assert index.nearest_colors(Ansi256Colors.rgb_list[16:]).tolist() ==\
+    Ansi256Colors.rgb_list[16:]
+
+#_______________________________________________________________________
+def test_delta_e_2000():
+  np = pytest.importorskip('numpy')
+
+  for lab1, lab2, expected in TestConst.DELTA_E_2000_PAIRS:
+    assert ColorSpace.delta_e_2000(lab1, lab2) == pytest.approx(
+      expected, abs=1e-4)
+
+    assert ColorSpace.delta_e_2000_array(
+      np.asarray(lab1), np.asarray(lab2)) == pytest.approx(
+      expected, abs=1e-4)
+
+#_______________________________________________________________________
+def test_index_err():
+
+  with pytest.raises(ValueError):
+    NearestColorIndex(RgbConst.DEFAULT_RGB_INT_LIST, 'manhattan')
+
+  with pytest.raises(ValueError):
+    NearestColorIndex([])
@@ -0,0 +1,96 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for the palette optimizer.
+#_______________________________________________________________________
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from classes.palette_optimizer import PaletteOptimizer
+from classes.palette_optimizer import PaletteOptimizerConst
+from classes.theme_library import ThemeColors
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED_FILE: str = 'sample-themes/flux-bunny-dark/flux-bunny-dark-input.json'
+
+  ITERATIONS: int = 150
+
+#_______________________________________________________________________
+@pytest.fixture
+def optimizer():
+  return PaletteOptimizer(Utils.read_hex_color_json(TestConst.SEED_FILE))
+
+#_______________________________________________________________________
+def test_score_improves(optimizer):
+  colors = optimizer.optimize(restarts=1, iterations=TestConst.ITERATIONS)
+
+  seed_score = optimizer.score(optimizer.seed_colors_[None, :])[0]
+  best_score = optimizer.score(colors[None, :])[0]
+
+  assert best_score < seed_score
+
+#_______________________________________________________________________
+def test_pool_matches_serial(optimizer):
+  serial = optimizer.optimize(restarts=2
+    , iterations=TestConst.ITERATIONS, jobs=1)
+
+  pooled = optimizer.optimize(restarts=2
+    , iterations=TestConst.ITERATIONS, jobs=2)
+
+  assert serial.tolist() == pooled.tolist()
+
+#_______________________________________________________________________
+def test_polish_reverts_noise(optimizer):
+  Const = PaletteOptimizerConst
+
+  colors = optimizer.optimize(restarts=1, iterations=TestConst.ITERATIONS)
+
+  # Nudge a color that has no constraint to meet, polish reverts it
+  noisy = colors.copy()
+  noisy[Const.FG_BOLD] ^= 0x010101
+
+  assert optimizer.polish(noisy)[Const.FG_BOLD] ==\
+    optimizer.seed_colors_[Const.FG_BOLD]
+
+#_______________________________________________________________________
+def test_json_accepted(optimizer):
+  Const = PaletteOptimizerConst
+
+  colors = optimizer.optimize(restarts=1, iterations=TestConst.ITERATIONS)
+
+  scheme = ThemeColors(optimizer.to_json_dict(colors))
+
+  assert scheme.name_ == optimizer.scheme_.name_
+  assert scheme.bg_norm_color_ == colors[Const.BG_NORM]
+  assert scheme.accent_color2_ == colors[Const.ACCENTS[2]]
+  assert scheme.palette_ == colors[Const.PALETTE].tolist()
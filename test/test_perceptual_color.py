@@ -0,0 +1,113 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for hue preserving background and foreground derivation.
+#_______________________________________________________________________
+
+import random
+
+import pytest
+
+import classes.perceptual_color as perceptual_color
+
+from classes.color_space import ColorSpace
+from classes.perceptual_color import PerceptualColor
+from classes.rgb_color import RgbConst
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SEED: int = 5
+  SAMPLE_COUNT: int = 300
+
+  COLORS: list[int] =\
+    [ RgbConst.DEF_ACCENT0
+    , RgbConst.DEF_ACCENT1
+    , RgbConst.DEF_ACCENT2
+    , 0x000000
+    , 0xffffff
+    , 0xff0000
+    ]\
+    + random.Random(SEED).sample(range(0x1000000), SAMPLE_COUNT)
+
+  # Allowed hue drift in degrees from rounding to 8 bit channels
+  HUE_TOLERANCE: float = 3.0
+
+  # Allowed lightness overshoot from rounding to 8 bit channels
+  LIGHTNESS_TOLERANCE: float = 0.01
+
+#_______________________________________________________________________
+@pytest.fixture(params=['numpy', 'scalar'])
+def backend(request, monkeypatch):
+  if (request.param == 'scalar'):
+    monkeypatch.setattr(perceptual_color, 'np', None)
+
+  elif (perceptual_color.np is None):
+    pytest.skip('NumPy not installed')
+
+  return request.param
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('is_dark', [True, False])
+def test_batch_matches_scalar(backend, is_dark):
+  assert PerceptualColor.make_background_colors(
+    TestConst.COLORS, is_dark).tolist() ==\
+    [ PerceptualColor.make_background_color(c, is_dark)
+      for c in TestConst.COLORS ]
+
+  assert PerceptualColor.make_foreground_colors(
+    TestConst.COLORS, is_dark).tolist() ==\
+    [ PerceptualColor.make_foreground_color(c, is_dark)
+      for c in TestConst.COLORS ]
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('lightness_range'
+  , [PerceptualColor.DARK_RANGE, PerceptualColor.LITE_RANGE])
+def test_lightness_and_hue(lightness_range):
+  lo, hi = lightness_range
+
+  for c in TestConst.COLORS:
+    l_in, c_in, h_in = ColorSpace.rgb_to_oklch(c)
+    l_out, c_out, h_out =\
+      ColorSpace.rgb_to_oklch(PerceptualColor.fit_lightness(c, lightness_range))
+
+    assert lo - TestConst.LIGHTNESS_TOLERANCE <= l_out
+    assert l_out <= hi + TestConst.LIGHTNESS_TOLERANCE
+
+    # Hue is only meaningful for colors that keep some chroma
+    if (c_in > 0.05 and c_out > 0.05):
+      drift: float = abs((h_out - h_in + 180) % 360 - 180)
+      assert drift < TestConst.HUE_TOLERANCE
+
+#_______________________________________________________________________
+def test_in_range_unchanged():
+  dark = RgbConst.DEF_BG_NORM
+  lite = RgbConst.DEF_FG_NORM
+
+  assert PerceptualColor.make_background_color(dark, is_dark=True) == dark
+  assert PerceptualColor.make_foreground_color(lite, is_dark=True) == lite
@@ -0,0 +1,117 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for the single pass template compiler and its disk cache.
+#_______________________________________________________________________
+
+import os
+
+import pytest
+
+from classes.scheme_types.vim_scheme import VimScheme
+from classes.scheme_types.vscode_scheme import VsCodeScheme
+from classes.template_compiler import TemplateCompiler
+
+#_______________________________________________________________________
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+  """
+  Compiles into an empty cache.
+  """
+
+  monkeypatch.setattr(TemplateCompiler, 'cache_dir_', str(tmp_path))
+  monkeypatch.setattr(TemplateCompiler, 'compiled_', {})
+
+  return tmp_path
+
+#_______________________________________________________________________
+def test_longest_match(cache_dir):
+  template = TemplateCompiler.compile('A AB ABC xABCx', ['A', 'AB', 'ABC'])
+
+  assert template.slots_ == ('A', 'AB', 'ABC', 'ABC')
+  assert template.render({'A': '1', 'AB': '2', 'ABC': '3'}) == '1 2 3 x3x'
+
+  # Missing values are left as is
+  assert template.render({'A': '1'}) == '1 AB ABC xABCx'
+
+#_______________________________________________________________________
+def test_no_tokens(cache_dir):
+  template = TemplateCompiler.compile('plain text', [])
+
+  assert template.slots_ == ()
+  assert template.render({}) == 'plain text'
+
+#_______________________________________________________________________
+def test_matches_replace(cache_dir, tmp_path):
+
+  for SchemeType in [VimScheme, VsCodeScheme]:
+    scheme = SchemeType(str(tmp_path))
+
+    with open(SchemeType.TEMPLATE_PATH, 'r') as file:
+      text: str = file.read()
+
+    for key, value in scheme.str_replace_map.items():
+      text = text.replace(key, value)
+
+    assert scheme.color_scheme_str_ == text
+
+#_______________________________________________________________________
+def test_disk_cache(cache_dir):
+  text: str = 'color BG__NORM FG__NORM'
+  tokens: list[str] = ['BG__NORM', 'FG__NORM']
+
+  first = TemplateCompiler.compile(text, tokens)
+
+  files: list[str] = os.listdir(cache_dir)
+  assert len(files) == 1
+
+  # Read back from disk once the memory cache is empty
+  TemplateCompiler.clear()
+  second = TemplateCompiler.compile(text, tokens)
+
+  assert second is not first
+  assert second.parts_ == first.parts_
+
+  # Same tokens in a different order share the cache entry
+  assert TemplateCompiler.compile(text, tokens[::-1]) is second
+
+#_______________________________________________________________________
+def test_invalid_cache_file(cache_dir):
+  text: str = 'color BG__NORM'
+  tokens: list[str] = ['BG__NORM']
+
+  TemplateCompiler.compile(text, tokens)
+  TemplateCompiler.clear()
+
+  file_path: str = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+
+  for contents in ['not json', '["a", "OTHER", "b"]', '["a", "b"]']:
+    with open(file_path, 'w') as file:
+      file.write(contents)
+
+    template = TemplateCompiler.compile(text, tokens)
+    TemplateCompiler.clear()
+
+    assert template.parts_ == ('color ', 'BG__NORM', '')
@@ -0,0 +1,206 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for color modifiers in templates.
+#_______________________________________________________________________
+
+import pytest
+
+from classes.color_expression import ColorExpression
+from classes.rgb_color import RgbColor
+from classes.scheme_types.base_scheme import ColorScheme
+from classes.scheme_types.vscode_scheme import VsCodeScheme
+from classes.template_compiler import TemplateCompiler
+from classes.template_modifier import TemplateModifier
+from classes.theme_inheritance import ThemeInheritance
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  THEME_PATH: str = 'sample-themes/demo/input.json'
+
+  TEMPLATE: str =\
+    'a #{{YEL_BOLD | alpha(38%)}}\n'\
+    'b #{{YEL_BOLD|alpha(0.380)}}\n'\
+    'c #{{BLU_NORM | mix(0.85)}}\n'\
+    'd #{{RED_NORM | lighten(0.1)}}\n'\
+    'e {{FG__NORM | darken(.2) | ansi}}\n'\
+    'f #{{BLU_NORM | mix(0.5, RED_NORM)}}\n'\
+    'g #{{BG__NORM}} #BG__NORM\n'
+
+  TOKENS: set = {'YEL_BOLD', 'BLU_NORM', 'RED_NORM', 'BG__NORM'
+    , 'NAME', 'BG__CLI_NORM'}
+
+  # Defined by the exporter but not hex colors
+  NON_COLOR: list[str] =\
+    [ '{{NAME | lighten(0.1)}}'
+    , '{{BG__CLI_NORM | alpha(50%)}}'
+    , '{{BLU_NORM | mix(0.5, NAME)}}'
+    ]
+
+  INVALID: list[str] =\
+    [ '{{NOPE}}'
+    , '{{BLU_NORM | glow}}'
+    , '{{BLU_NORM | ansi | alpha(1)}}'
+    , '{{BLU_NORM | alpha(2)}}'
+    , '{{BLU_NORM | alpha}}'
+    , '{{BLU_NORM | lighten(a)}}'
+    , '{{BLU_NORM | mix(0.5, NOPE)}}'
+    , '{{BLU_NORM | mix(0.5, RED_NORM, 1)}}'
+    , *NON_COLOR
+    ]
+
+#_______________________________________________________________________
+@pytest.fixture
+def scheme_type(tmp_path, monkeypatch):
+  """
+  VS Code scheme rendering the test template, with an empty compile
+  cache.
+  """
+
+  monkeypatch.setattr(TemplateCompiler, 'cache_dir_', str(tmp_path))
+  monkeypatch.setattr(TemplateCompiler, 'compiled_', {})
+
+  path = tmp_path / 'template.txt'
+  path.write_text(TestConst.TEMPLATE)
+
+  return type('ModifierScheme', (VsCodeScheme,)
+    , {'TEMPLATE_PATH': str(path)})
+
+#_______________________________________________________________________
+def test_canonical():
+  canonical, token, chain =\
+    TemplateModifier.parse('{{ BLU_NORM|mix(85%) | lighten(.10) }}'
+      , TestConst.TOKENS)
+
+  assert canonical == 'BLU_NORM|mix(0.85,BG__NORM)|lighten(0.1)'
+  assert token == 'BLU_NORM'
+  assert TemplateModifier.from_slot(canonical) == (token, chain)
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('text', TestConst.INVALID)
+def test_invalid(text):
+
+  with pytest.raises(ValueError):
+    TemplateModifier.parse(text, TestConst.TOKENS)
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('text', TestConst.NON_COLOR)
+def test_non_color(text):
+  slot: str = text[2:-2].replace(' ', '')
+
+  with pytest.raises(ValueError, match='non color token'):
+    TemplateModifier.from_slot(slot, TestConst.TOKENS)
+
+  with pytest.raises(ValueError, match='non color token'):
+    TemplateCompiler.compile(f'x {text} y', TestConst.TOKENS)
+
+  assert TemplateModifier.is_color_token('KEY_BG_0')
+  assert TemplateModifier.is_color_token('ANSI_016')
+  assert not TemplateModifier.is_color_token('ANSI_16_X')
+
+#_______________________________________________________________________
+def test_render(scheme_type, tmp_path):
+  scheme = scheme_type(str(tmp_path)
+    , ThemeInheritance.read_theme(TestConst.THEME_PATH))
+
+  palette: list[int] = scheme.palette_
+  bg: int = scheme.bg_norm_color_
+
+  ansi: int = RgbColor.rgb_to_ansi256(
+    ColorExpression.darken(scheme.fg_norm_color_, 0.2))
+
+  expected: str =\
+    f'a #{palette[11]:06x}61\n'\
+    f'b #{palette[11]:06x}61\n'\
+    f'c #{ColorExpression.mix(palette[4], bg, 0.85):06x}\n'\
+    f'd #{ColorExpression.lighten(palette[1], 0.1):06x}\n'\
+    f'e {ansi}\n'\
+    f'f #{ColorExpression.mix(palette[4], palette[1], 0.5):06x}\n'\
+    f'g #{bg:06x} #{bg:06x}\n'
+
+  assert scheme.color_scheme_str_ == expected
+
+  # Equal expressions share one slot name
+  assert len(scheme.template_.modifiers_) == 5
+
+#_______________________________________________________________________
+def test_shared_per_theme(scheme_type, tmp_path, monkeypatch):
+  context = ColorScheme.create_context(
+    ThemeInheritance.read_theme(TestConst.THEME_PATH))
+
+  calls: list = []
+  apply = TemplateModifier.apply
+
+  def counting(chain, color, colors):
+    calls.append(chain)
+    return apply(chain, color, colors)
+
+  monkeypatch.setattr(TemplateModifier, 'apply', counting)
+
+  first = scheme_type(str(tmp_path), context)
+  second = scheme_type(str(tmp_path), context)
+
+  assert first.color_scheme_str_ == second.color_scheme_str_
+  assert len(calls) == 5
+
+#_______________________________________________________________________
+def test_update_colors(scheme_type, tmp_path, monkeypatch):
+  cfg: dict = ThemeInheritance.read_theme(TestConst.THEME_PATH)
+  update: dict = {ColorScheme.PALETTE: {'11': '0xe0c040'}}
+
+  scheme = scheme_type(str(tmp_path), cfg)
+
+  calls: list = []
+  apply = TemplateModifier.apply
+
+  def counting(chain, color, colors):
+    calls.append(chain)
+    return apply(chain, color, colors)
+
+  monkeypatch.setattr(TemplateModifier, 'apply', counting)
+
+  assert scheme.update_colors(update)
+
+  # Only the YEL_BOLD expression is computed again
+  assert calls == [(('alpha', (0.38,)),)]
+
+  assert scheme.color_scheme_str_ == scheme_type(str(tmp_path)
+    , ThemeInheritance.merge(cfg, update)).color_scheme_str_
+
+#_______________________________________________________________________
+def test_disk_cache(scheme_type, tmp_path):
+  tokens: set = TestConst.TOKENS | {'FG__NORM'}
+
+  first = TemplateCompiler.compile(TestConst.TEMPLATE, tokens)
+  TemplateCompiler.clear()
+  second = TemplateCompiler.compile(TestConst.TEMPLATE, tokens)
+
+  assert second is not first
+  assert second.parts_ == first.parts_
+  assert second.modifiers_ == first.modifiers_
@@ -0,0 +1,119 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for the process wide template cache.
+#_______________________________________________________________________
+
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from classes.scheme_types.vim_scheme import VimScheme
+from classes.template_compiler import TemplateCompiler
+from classes.template_registry import TemplateRegistry
+from classes.template_registry import TemplateRegistryConst as Const
+
+#_______________________________________________________________________
+@pytest.fixture
+def template_path(tmp_path, monkeypatch):
+  """
+  Template file in an empty registry and compile cache.
+  """
+
+  monkeypatch.setattr(TemplateCompiler, 'cache_dir_', str(tmp_path))
+  monkeypatch.setattr(TemplateCompiler, 'compiled_', {})
+  monkeypatch.setattr(TemplateRegistry, 'entries_', {})
+  monkeypatch.setattr(TemplateRegistry, 'stats_', dict.fromkeys(
+    [Const.HITS, Const.LOADS, Const.RELOADS], 0))
+
+  path = tmp_path / 'template.txt'
+  path.write_text('bg BG__NORM')
+
+  return str(path)
+
+#_______________________________________________________________________
+def test_loaded_once(template_path):
+
+  for i in range(5):
+    assert TemplateRegistry.load(template_path) == 'bg BG__NORM'
+
+  stats: dict = TemplateRegistry.stats()
+
+  assert stats[Const.LOADS] == 1
+  assert stats[Const.HITS] == 4
+  assert stats[Const.RELOADS] == 0
+  assert stats['size'] == 1
+
+#_______________________________________________________________________
+def test_reload(template_path):
+  first = TemplateRegistry.compile(template_path, ['BG__NORM'])
+  assert TemplateRegistry.compile(template_path, ['BG__NORM']) is first
+
+  with open(template_path, 'w') as file:
+    file.write('background BG__NORM')
+
+  # Changed size is enough even if mtime has coarse resolution
+  second = TemplateRegistry.compile(template_path, ['BG__NORM'])
+
+  assert second.render({'BG__NORM': '000000'}) == 'background 000000'
+  assert TemplateRegistry.stats()[Const.RELOADS] == 1
+
+  # Same size, newer mtime
+  with open(template_path, 'w') as file:
+    file.write('foreground BG__NORM')
+
+  stat = os.stat(template_path)
+  os.utime(template_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+  assert TemplateRegistry.load(template_path) == 'foreground BG__NORM'
+  assert TemplateRegistry.stats()[Const.RELOADS] == 2
+
+#_______________________________________________________________________
+def test_threads(template_path):
+
+  def render(i: int) -> str:
+    template = TemplateRegistry.compile(template_path, ['BG__NORM'])
+    return template.render({'BG__NORM': f'{i:06x}'})
+
+  with ThreadPoolExecutor(max_workers=8) as pool:
+    results: list[str] = list(pool.map(render, range(200)))
+
+  assert results == [ f'bg {i:06x}' for i in range(200) ]
+
+  stats: dict = TemplateRegistry.stats()
+
+  assert stats[Const.LOADS] == 1
+  assert stats[Const.HITS] == 199
+
+#_______________________________________________________________________
+def test_schemes_share_template(template_path, tmp_path):
+  VimScheme(str(tmp_path))
+  loads: int = TemplateRegistry.stats()[Const.LOADS]
+
+  VimScheme(str(tmp_path))
+
+  assert TemplateRegistry.stats()[Const.LOADS] == loads
@@ -0,0 +1,132 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for input json that extends a base theme.
+#_______________________________________________________________________
+
+import json
+import os
+
+import pytest
+
+from classes.theme_inheritance import ThemeInheritance
+from classes.theme_library import ThemeLibrary
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  DARK_FILE: str = 'sample-themes/flux-bunny-dark/flux-bunny-dark-input.json'
+
+  VARIANT_COUNT: int = 50
+
+#_______________________________________________________________________
+def write_json(file_path, cfg) -> str:
+  with open(file_path, 'w') as file:
+    json.dump(cfg, file)
+
+  return str(file_path)
+
+#_______________________________________________________________________
+def make_variants(tmp_path) -> list[str]:
+  """
+  Writes a copy of the dark theme as a base, a middle layer and
+  variants of the middle layer.
+  """
+
+  write_json(tmp_path / 'base.json', Utils.read_hex_color_json(TestConst.DARK_FILE))
+
+  (tmp_path / 'layers').mkdir()
+
+  write_json(tmp_path / 'layers' / 'middle.json'
+    , { 'extends': '../base.json', 'accent-color-0': '0x5f87af' })
+
+  return\
+    [ write_json(tmp_path / 'layers' / f'variant-{i}.json'
+      , { 'extends': 'middle.json'
+        , 'name': f'variant {i}'
+        , 'palette': { '1': f'0x{i:06x}' }
+        })
+      for i in range(TestConst.VARIANT_COUNT) ]
+
+#_______________________________________________________________________
+def test_overrides(tmp_path):
+  base = Utils.read_hex_color_json(TestConst.DARK_FILE)
+
+  cfg = ThemeInheritance.read_theme(make_variants(tmp_path)[3])
+
+  assert 'extends' not in cfg
+  assert cfg['name'] == 'variant 3'
+  assert cfg['accent-color-0'] == '0x5f87af'
+  assert cfg['background-color'] == base['background-color']
+  assert cfg['palette'] == base['palette'][:1] + ['0x000003'] + base['palette'][2:]
+
+#_______________________________________________________________________
+def test_base_resolved_once(tmp_path):
+  paths = make_variants(tmp_path)
+
+  ThemeInheritance.resolved_.clear()
+
+  library = ThemeLibrary.from_files(paths)
+
+  assert len(library) == TestConst.VARIANT_COUNT
+  assert library.schemes_[7].palette_[1] == 7
+
+  # One entry per variant plus the shared middle layer
+  assert len(ThemeInheritance.resolved_) == TestConst.VARIANT_COUNT + 1
+
+  # Read copies may be modified without changing the cache
+  cfg = ThemeInheritance.read_theme(paths[0])
+  cfg['palette'][0] = '0xffffff'
+
+  assert ThemeInheritance.read_theme(paths[0])['palette'][0] != '0xffffff'
+
+#_______________________________________________________________________
+def test_edited_base(tmp_path):
+  paths = make_variants(tmp_path)
+
+  assert ThemeInheritance.read_theme(paths[0])['accent-color-0'] == '0x5f87af'
+
+  write_json(tmp_path / 'layers' / 'middle.json'
+    , { 'extends': '../base.json', 'accent-color-0': '0xaf875f' })
+
+  assert ThemeInheritance.read_theme(paths[0])['accent-color-0'] == '0xaf875f'
+
+#_______________________________________________________________________
+def test_errors(tmp_path):
+  loop_a = write_json(tmp_path / 'a.json', { 'extends': 'b.json' })
+  write_json(tmp_path / 'b.json', { 'extends': 'a.json' })
+
+  with pytest.raises(ValueError, match='circular'):
+    ThemeInheritance.read_theme(loop_a)
+
+  bad_index = write_json(tmp_path / 'bad-index.json'
+    , { 'extends': os.path.abspath(TestConst.DARK_FILE), 'palette': { '16': '0x000000' } })
+
+  with pytest.raises(ValueError):
+    ThemeInheritance.read_theme(bad_index)
@@ -0,0 +1,122 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for the OKLab theme interpolator.
+#_______________________________________________________________________
+
+import os
+
+import pytest
+
+import classes.theme_interpolator as theme_interpolator
+
+from classes.color_space import ColorSpace
+from classes.scheme_types.gnome_scheme import GnomeScheme
+from classes.scheme_types.vim_scheme import VimScheme
+from classes.theme_interpolator import ThemeInterpolator
+from classes.theme_library import ThemeColors
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  DARK_FILE: str = 'sample-themes/flux-bunny-dark/flux-bunny-dark-input.json'
+  LITE_FILE: str = 'sample-themes/flux-bunny-lite/flux-bunny-lite-input.json'
+
+  STEPS: int = 7
+
+#_______________________________________________________________________
+@pytest.fixture(params=['numpy', 'scalar'])
+def backend(request, monkeypatch):
+  """
+  Runs each test with NumPy and with the scalar fallback.
+  """
+
+  if (request.param == 'scalar'):
+    monkeypatch.setattr(theme_interpolator, 'np', None)
+
+  elif (theme_interpolator.np is None):
+    pytest.skip('NumPy not installed')
+
+  return request.param
+
+#_______________________________________________________________________
+def test_same_theme_unchanged(backend):
+  cfg = Utils.read_hex_color_json(TestConst.DARK_FILE)
+
+  colors = ThemeInterpolator.theme_colors(cfg)
+
+  for blended in ThemeInterpolator.make_configs(cfg, cfg, TestConst.STEPS):
+    assert ThemeInterpolator.theme_colors(blended) == colors
+
+#_______________________________________________________________________
+def test_lightness_monotonic(backend):
+  dark = Utils.read_hex_color_json(TestConst.DARK_FILE)
+  lite = Utils.read_hex_color_json(TestConst.LITE_FILE)
+
+  cfgs = ThemeInterpolator.make_configs(dark, lite, TestConst.STEPS)
+
+  lightness = [ ColorSpace.rgb_to_oklab(ThemeColors(c).bg_norm_color_)[0]
+    for c in [dark] + cfgs + [lite] ]
+
+  assert lightness == sorted(lightness)
+
+  modes = [ ThemeColors(c).is_dark_ for c in cfgs ]
+
+  assert modes[0] and not modes[-1]
+
+#_______________________________________________________________________
+def test_numpy_matches_scalar():
+  if (theme_interpolator.np is None):
+    pytest.skip('NumPy not installed')
+
+  start = ThemeInterpolator.theme_colors(
+    Utils.read_hex_color_json(TestConst.DARK_FILE))
+  end = ThemeInterpolator.theme_colors(
+    Utils.read_hex_color_json(TestConst.LITE_FILE))
+
+  assert ThemeInterpolator.blend(start, end, TestConst.STEPS).tolist() ==\
+    ThemeInterpolator.blend_lists(start, end, TestConst.STEPS)
+
+#_______________________________________________________________________
+def test_render(tmp_path):
+  dark = Utils.read_hex_color_json(TestConst.DARK_FILE)
+  lite = Utils.read_hex_color_json(TestConst.LITE_FILE)
+
+  cfgs = ThemeInterpolator.make_configs(dark, lite, 2)
+
+  theme_dirs = ThemeInterpolator.render(cfgs
+    , [GnomeScheme, VimScheme], str(tmp_path))
+
+  assert len(theme_dirs) == 2
+
+  for theme_dir in theme_dirs:
+    name = os.path.basename(theme_dir)
+
+    for ext in ['-input.json', '.dconf', '.vim']:
+      assert os.path.isfile(os.path.join(theme_dir, f'{name}{ext}'))
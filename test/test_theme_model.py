@@ -0,0 +1,114 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests that a theme is parsed once and shared by every scheme type.
+#_______________________________________________________________________
+
+import pytest
+
+from classes.scheme_types.base_scheme import ColorScheme
+from classes.scheme_types.gnome_scheme import GnomeScheme
+from classes.scheme_types.mintty_scheme import MinttyScheme
+from classes.scheme_types.vim_scheme import VimScheme
+from classes.scheme_types.vscode_scheme import VsCodeScheme
+from classes.scheme_types.vscode_term_scheme import VsCodeTermScheme
+from classes.scheme_types.xresources_scheme import XresourcesScheme
+from classes.theme_model import RenderContext
+from classes.theme_model import RenderContextConst
+from classes.theme_model import ThemeModel
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  SCHEME_TYPES: list =\
+    [ GnomeScheme
+    , MinttyScheme
+    , VimScheme
+    , VsCodeScheme
+    , VsCodeTermScheme
+    , XresourcesScheme
+    ]
+
+#_______________________________________________________________________
+def sample_cfg() -> dict:
+  return\
+    { ColorScheme.NAME: 'test-theme'
+    , ColorScheme.BG_NORM_KEY: '0x202020'
+    , ColorScheme.FG_NORM_KEY: '0xd0d0d0'
+    , ColorScheme.CURSOR_COLOR: '0xff8010'
+    , ColorScheme.PALETTE:
+      [ f'0x{(0x101010 * (i + 1)) ^ 0x0b1520:06x}' for i in range(15) ]
+      + ['0xfafafa']
+    }
+
+#_______________________________________________________________________
+def test_model_immutable():
+  model = ColorScheme.create_context(sample_cfg()).model_
+
+  assert model == ColorScheme.create_context(sample_cfg()).model_
+  assert hash(model) == hash(ColorScheme.create_context(sample_cfg()).model_)
+  assert model.cursor_color == 0xff8010
+  assert len(model.palette) == 16
+
+  with pytest.raises(AttributeError):
+    model.bg_norm_color = 0
+
+#_______________________________________________________________________
+def test_context_shared(tmp_path, monkeypatch):
+  context = ColorScheme.create_context(sample_cfg())
+
+  labels: list[str] = []
+  make_base_token = RenderContext.make_base_token
+
+  def counting(self, label):
+    labels.append(label)
+    return make_base_token(self, label)
+
+  monkeypatch.setattr(RenderContext, 'make_base_token', counting)
+
+  for SchemeType in TestConst.SCHEME_TYPES:
+    scheme = SchemeType(str(tmp_path), context)
+    assert scheme.context_ is context
+
+  # Each color is formatted once for all scheme types
+  assert sorted(labels) == sorted(RenderContextConst.BASE_SOURCES)
+
+#_______________________________________________________________________
+def test_context_matches_dict(tmp_path):
+  context = ColorScheme.create_context(sample_cfg())
+
+  for SchemeType in TestConst.SCHEME_TYPES:
+    assert SchemeType(str(tmp_path), context).color_scheme_str_ ==\
+      SchemeType(str(tmp_path), sample_cfg()).color_scheme_str_
+
+#_______________________________________________________________________
+def test_default_context():
+  model: ThemeModel = ColorScheme.create_context().model_
+
+  assert model == ColorScheme.create_context(None).model_
+  assert len(model.palette) == 16
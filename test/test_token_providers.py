@@ -0,0 +1,100 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests that template tokens are only computed when referenced.
+#_______________________________________________________________________
+
+import pytest
+
+from classes.rgb_color import RgbColor
+from classes.scheme_types.vim_scheme import VimScheme
+from classes.scheme_types.vscode_scheme import VsCodeScheme
+
+#_______________________________________________________________________
+def fail(*args, **kwargs):
+  raise AssertionError('provider should not run')
+
+#_______________________________________________________________________
+def scheme_type(SchemeType: type, template_path: str) -> type:
+  """
+  Scheme type rendering a different template.
+  """
+
+  return type(f'Custom{SchemeType.__name__}', (SchemeType,)
+    , {'TEMPLATE_PATH': template_path})
+
+#_______________________________________________________________________
+@pytest.fixture
+def template_path(tmp_path):
+  path = tmp_path / 'template.txt'
+  path.write_text('bg #BG__NORM fg #FG__NORM')
+
+  return str(path)
+
+#_______________________________________________________________________
+def test_vim_cli_lazy(template_path, tmp_path, monkeypatch):
+  monkeypatch.setattr(RgbColor, 'rgb_to_ansi256', fail)
+
+  scheme = scheme_type(VimScheme, template_path)(str(tmp_path))
+
+  assert scheme.color_scheme_str_ ==\
+    f'bg #{scheme.bg_norm_color_:06x} fg #{scheme.fg_norm_color_:06x}'
+  assert set(scheme.str_replace_map) == {'BG__NORM', 'FG__NORM'}
+
+#_______________________________________________________________________
+def test_vscode_key_lazy(template_path, tmp_path, monkeypatch):
+  monkeypatch.setattr(VsCodeScheme, 'make_key_colors', fail)
+
+  scheme = scheme_type(VsCodeScheme, template_path)(str(tmp_path))
+
+  assert scheme.color_scheme_str_ ==\
+    f'bg #{scheme.bg_norm_color_:06x} fg #{scheme.fg_norm_color_:06x}'
+
+#_______________________________________________________________________
+def test_many_unused_tokens(template_path, tmp_path):
+
+  class ShadeScheme(scheme_type(VsCodeScheme, template_path)):
+    def token_providers(self) -> dict:
+      providers: dict = super().token_providers()
+
+      for i in range(500):
+        providers[f'SHADE_{i:03d}'] = fail
+
+      return providers
+
+  scheme = ShadeScheme(str(tmp_path))
+
+  assert 'SHADE_000' in scheme.token_providers_
+  assert set(scheme.str_replace_map) == {'BG__NORM', 'FG__NORM'}
+
+#_______________________________________________________________________
+def test_all_tokens(tmp_path):
+  scheme = VimScheme(str(tmp_path))
+  scheme.populate_replacement_map()
+
+  assert set(scheme.str_replace_map) == set(scheme.token_providers_)
+  assert scheme.str_replace_map['BG__CLI_NORM'] ==\
+    str(RgbColor.rgb_to_ansi256(scheme.bg_norm_color_))
+  assert scheme.str_replace_map['LITE_OR_DARK'] in ['dark', 'light']
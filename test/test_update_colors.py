@@ -0,0 +1,225 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests that incremental color updates match a full render.
+#_______________________________________________________________________
+
+import pytest
+
+from classes.scheme_types.base_scheme import ColorScheme
+from classes.scheme_types.gnome_scheme import GnomeScheme
+from classes.scheme_types.mintty_scheme import MinttyScheme
+from classes.scheme_types.vim_scheme import VimScheme
+from classes.scheme_types.vscode_scheme import VsCodeScheme
+from classes.scheme_types.vscode_term_scheme import VsCodeTermScheme
+from classes.scheme_types.xresources_scheme import XresourcesScheme
+from classes.theme_inheritance import ThemeInheritance
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  THEME_PATH: str = 'sample-themes/demo/input.json'
+
+  SCHEME_TYPES: list =\
+    [ GnomeScheme
+    , MinttyScheme
+    , VimScheme
+    , VsCodeScheme
+    , VsCodeTermScheme
+    , XresourcesScheme
+    ]
+
+  UPDATES: list =\
+    [ {ColorScheme.PALETTE: {'3': '0xc0a030'}}
+    , {ColorScheme.BG_NORM_KEY: '0x101418'}
+    , {ColorScheme.KEY_BG1_KEY: '0x3080e0'}
+    , {ColorScheme.FG_BOLD_KEY: 'lighten(palette[7], 0.1)'}
+    ]
+
+  # Colors computed from other colors by expressions
+  EXPRESSIONS: dict =\
+    { ColorScheme.FG_BOLD_KEY : 'lighten(palette[7], 0.1)'
+    , ColorScheme.CURSOR_COLOR: 'accent-color-0'
+    }
+
+  EXPRESSION_UPDATES: list =\
+    [ {ColorScheme.PALETTE: {7: '0x808080'}}
+    , {ColorScheme.KEY_BG0_KEY: '0xe06020'}
+    ]
+
+#_______________________________________________________________________
+def updated_cfg(update: dict) -> dict:
+  """
+  Theme input with an update applied, for a full render.
+  """
+
+  cfg: dict = ThemeInheritance.read_theme(TestConst.THEME_PATH)
+
+  return ThemeInheritance.merge(cfg, update)
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('SchemeType', TestConst.SCHEME_TYPES)
+@pytest.mark.parametrize('update', TestConst.UPDATES)
+def test_matches_render(SchemeType, update, tmp_path):
+  scheme = SchemeType(str(tmp_path)
+    , ThemeInheritance.read_theme(TestConst.THEME_PATH))
+
+  scheme.write_file()
+  assert not scheme.dirty_
+
+  changed: bool = scheme.update_colors(update)
+  expected = SchemeType(str(tmp_path), updated_cfg(update))
+
+  assert scheme.color_scheme_str_ == expected.color_scheme_str_
+  assert scheme.dirty_ == changed
+
+  # Applying the same colors again changes nothing
+  assert not scheme.update_colors(update)
+
+#_______________________________________________________________________
+def test_only_dependants(tmp_path):
+  scheme = VimScheme(str(tmp_path)
+    , ThemeInheritance.read_theme(TestConst.THEME_PATH))
+
+  calls: list[str] = []
+
+  for name, provider in scheme.token_providers_.items():
+    scheme.token_providers_[name] =\
+      lambda name=name, provider=provider: calls.append(name) or provider()
+
+  assert scheme.update_colors({ColorScheme.PALETTE: {'1': '0xe03030'}})
+
+  assert sorted(calls) == ['RED_CLI_NORM', 'RED_NORM']
+
+#_______________________________________________________________________
+def test_shared_update(tmp_path):
+  cfg: dict = ThemeInheritance.read_theme(TestConst.THEME_PATH)
+  update: dict = {ColorScheme.PALETTE: {'4': '0x4070f0'}}
+
+  context = ColorScheme.create_context(cfg)
+  schemes: list =\
+    [ SchemeType(str(tmp_path), context)
+      for SchemeType in TestConst.SCHEME_TYPES ]
+
+  for scheme in schemes:
+    scheme.write_file()
+
+  new_context = ColorScheme.update_context(context, update)
+
+  for scheme in schemes:
+    assert scheme.update_colors(new_context)
+    assert scheme.write_file_if_dirty()
+    assert not scheme.write_file_if_dirty()
+
+  # The old context is unchanged
+  assert context.model_.palette[4] != 0x4070f0
+  assert new_context.model_.palette[4] == 0x4070f0
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('update', TestConst.UPDATES[:3])
+def test_model_updated_directly(update, monkeypatch):
+  cfg: dict = ThemeInheritance.read_theme(TestConst.THEME_PATH)
+  context = ColorScheme.create_context(cfg)
+
+  expected = ColorScheme.create_context(ThemeInheritance.merge(cfg, update))
+
+  # Colors without expressions are set without parsing the input
+  monkeypatch.setattr(ColorScheme, 'create_context', None)
+
+  updated = ColorScheme.update_context(context, update)
+
+  assert updated.model_ == expected.model_
+  assert updated.cfg_ == expected.cfg_
+
+#_______________________________________________________________________
+def test_not_referenced(tmp_path):
+  scheme = VsCodeScheme(str(tmp_path)
+    , ThemeInheritance.read_theme(TestConst.THEME_PATH))
+
+  # No VS Code template slot uses the cursor color
+  assert not scheme.update_colors({ColorScheme.CURSOR_COLOR: '0x123456'})
+  assert scheme.cursor_color_ == 0x123456
+
+#_______________________________________________________________________
+def expression_cfg() -> dict:
+  """
+  Theme input with colors computed by expressions.
+  """
+
+  return ThemeInheritance.merge(
+    ThemeInheritance.read_theme(TestConst.THEME_PATH)
+    , TestConst.EXPRESSIONS)
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('SchemeType', TestConst.SCHEME_TYPES)
+@pytest.mark.parametrize('update', TestConst.EXPRESSION_UPDATES)
+def test_expressions_reevaluated(SchemeType, update, tmp_path):
+  scheme = SchemeType(str(tmp_path), expression_cfg())
+
+  scheme.update_colors(update)
+  expected = SchemeType(str(tmp_path)
+    , ThemeInheritance.merge(expression_cfg(), update))
+
+  assert scheme.color_scheme_str_ == expected.color_scheme_str_
+  assert scheme.fg_bold_color_ == expected.fg_bold_color_
+  assert scheme.cursor_color_ == expected.cursor_color_
+
+#_______________________________________________________________________
+def test_cterm_snap(tmp_path):
+  cfg: dict = ThemeInheritance.read_theme(TestConst.THEME_PATH)
+  update: dict = {VimScheme.CTERM_SNAP: True}
+
+  scheme = VimScheme(str(tmp_path), cfg)
+
+  assert scheme.update_colors(update)
+  assert scheme.cterm_snap_
+
+  assert scheme.color_scheme_str_ ==\
+    VimScheme(str(tmp_path), dict(cfg, **update)).color_scheme_str_
+
+#_______________________________________________________________________
+@pytest.mark.parametrize('SchemeType', TestConst.SCHEME_TYPES)
+def test_rename(SchemeType, tmp_path):
+  cfg: dict = ThemeInheritance.read_theme(TestConst.THEME_PATH)
+  update: dict = {ColorScheme.NAME: 'Renamed Theme'}
+
+  scheme = SchemeType(str(tmp_path), cfg)
+  scheme.write_file()
+
+  assert scheme.update_colors(update)
+  assert scheme.dirty_
+
+  expected = SchemeType(str(tmp_path), ThemeInheritance.merge(cfg, update))
+
+  assert scheme.out_file_name_ == expected.out_file_name_
+  assert scheme.out_file_path_ == expected.out_file_path_
+  assert scheme.color_scheme_str_ == expected.color_scheme_str_
+
+  assert scheme.write_file_if_dirty()
+  assert (tmp_path / expected.out_file_name_).read_text() ==\
+    expected.color_scheme_str_
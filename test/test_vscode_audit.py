@@ -0,0 +1,171 @@
+#_______________________________________________________________________
+#_______________________________________________________________________
+#        _   __   _   _ _   _   _   _         _
+#   |   |_| | _  | | | V | | | | / |_/ |_| | /
+#   |__ | | |__| |_| |   | |_| | \ |   | | | \_
+#    _  _         _ ___  _       _ ___   _                    / /
+#   /  | | |\ |  \   |  | / | | /   |   \                    (^^)
+#   \_ |_| | \| _/   |  | \ |_| \_  |  _/                    (____)o
+#_______________________________________________________________________
+#
+#-----------------------------------------------------------------------
+#   Copyright 2026, Rebecca Rashkin
+#   -------------------------------
+#   This code may be copied, redistributed, transformed, or built
+#   upon in any format for educational, non-commercial purposes.
+#
+#   Please give me appropriate credit should you choose to modify this
+#   code. Thank you :)
+#-----------------------------------------------------------------------
+#
+#_______________________________________________________________________
+#   //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\  //\^.^/\\
+#_______________________________________________________________________
+#_______________________________________________________________________
+#   DESCRIPTION
+#   Tests for the VS Code template contrast audit.
+#_______________________________________________________________________
+
+import pytest
+
+import classes.vscode_audit as vscode_audit
+
+from classes.color_expression import ColorExpression
+from classes.contrast import Contrast
+from classes.rgb_color import RgbConst
+from classes.scheme_types.vscode_scheme import VsCodeScheme
+from classes.theme_library import ThemeLibrary
+from classes.vscode_audit import VsCodeAudit
+from classes.vscode_audit import VsCodeAuditConst
+from classes.vscode_audit import VsCodeAuditTable
+from utilities.color_scheme_utils import GeneralUtils as Utils
+
+#_______________________________________________________________________
+class TestConst:
+  """
+  Contains constants used in tests.
+  """
+
+  TOKENS: list[str] = ['BG__NORM', 'FG__NORM', 'KEY_BG_0', 'KEY_BG_01']
+
+  TEMPLATE: dict =\
+  { 'editor.background'         : '#BG__NORM'
+  , 'editor.foreground'         : '#FG__NORM'
+  , 'tab.activeBackground'      : '#KEY_BG_0'
+  , 'tab.activeForeground'      : '#FG__NORM80'
+  , 'list.hoverBackground'      : '#KEY_BG_0140'
+  , 'list.hoverForeground'      : '#ff0000'
+  , 'panel.foreground'          : '#FG__NORM'
+  , 'sideBar.foreground'        : 'not a color'
+  , 'input.background'          : '#{{BG__NORM | mix(0.5, FG__NORM)}}'
+  , 'input.foreground'          : '#{{FG__NORM | darken(0.2) | alpha(60%)}}'
+  , 'badge.foreground'          : '#{{FG__NORM | ansi}}'
+  }
+
+  THEME_FILES: list[str] =\
+    [ 'sample-themes/flux-bunny-dark/flux-bunny-dark-input.json'
+    , 'sample-themes/flux-bunny-lite/flux-bunny-lite-input.json'
+    , 'sample-themes/demo/input.json'
+    ]
+
+#_______________________________________________________________________
+def test_parse_jsonc():
+  text: str = '{ "a": "x//y" // comment\n, "b": [1, 2, /* c */ ], }'
+
+  assert Utils.parse_jsonc(text) == {'a': 'x//y', 'b': [1, 2]}
+
+#_______________________________________________________________________
+def test_expand_pairs():
+  keys: list[str] = list(TestConst.TEMPLATE)
+
+  pairs = VsCodeAudit.expand_pairs(keys, VsCodeAuditConst.PAIRS)
+  paired: dict = { fg: bg for fg, bg, _ in pairs }
+
+  assert paired['editor.foreground'] == 'editor.background'
+  assert paired['tab.activeForeground'] == 'tab.activeBackground'
+  assert paired['list.hoverForeground'] == 'list.hoverBackground'
+
+  # Background key does not exist
+  assert 'panel.foreground' not in paired
+
+#_______________________________________________________________________
+def test_slots():
+  table = VsCodeAuditTable(TestConst.TEMPLATE, TestConst.TOKENS)
+  slots: dict = table.key_slots_
+
+  assert 'sideBar.foreground' not in slots
+
+  # Identical values share a slot
+  assert slots['editor.foreground'] == slots['panel.foreground']
+
+  # Longest token wins, remainder is alpha
+  hover: int = slots['list.hoverBackground']
+  assert table.slot_tokens_[hover] == 'KEY_BG_01'
+  assert table.slot_alphas_[hover] == pytest.approx(0x40 / 255)
+
+  red: int = slots['list.hoverForeground']
+  assert table.slot_tokens_[red] is None
+  assert table.slot_literals_[red] == 0xff0000
+
+#_______________________________________________________________________
+def test_modifier_slots():
+  table = VsCodeAuditTable(TestConst.TEMPLATE, TestConst.TOKENS)
+  slots: dict = table.key_slots_
+
+  # ansi does not give a color
+  assert 'badge.foreground' not in slots
+
+  fg: int = slots['input.foreground']
+  assert table.slot_tokens_[fg] == 'FG__NORM'
+  assert table.slot_alphas_[fg] == pytest.approx(0.6)
+
+  replacement_map: dict =\
+    { 'BG__NORM': '000000', 'FG__NORM': 'ffffff'
+    , 'KEY_BG_0': '000000', 'KEY_BG_01': '000000' }
+
+  colors: list[int] = table.resolve(replacement_map)
+
+  assert colors[slots['input.background']] ==\
+    ColorExpression.mix(0x000000, 0xffffff, 0.5)
+
+  assert colors[fg] == ColorExpression.darken(0xffffff, 0.2)
+
+#_______________________________________________________________________
+def test_composite():
+  assert VsCodeAudit.composite(0xffffff, 1.0, 0x000000) == 0xffffff
+  assert VsCodeAudit.composite(0xffffff, 0.0, 0x123456) == 0x123456
+  assert VsCodeAudit.composite(0xff0000, 0.5, 0x0000ff) == 0x800080
+
+#_______________________________________________________________________
+def test_audit_default_theme():
+  table, contrast = VsCodeAudit.audit(ThemeLibrary())
+
+  p: int = table.pairs_.index(
+    ('terminal.foreground', 'terminal.background', VsCodeAuditConst.TEXT))
+
+  assert contrast[0][p] == pytest.approx(
+    Contrast.wcag_contrast(RgbConst.DEF_FG_NORM, RgbConst.DEF_BG_NORM))
+
+#_______________________________________________________________________
+def test_table_compiled_once():
+  tokens: list[str] = list(ThemeLibrary().replacement_maps(VsCodeScheme)[0])
+
+  first = VsCodeAudit.get_table(VsCodeScheme.TEMPLATE_PATH, tokens)
+  second = VsCodeAudit.get_table(VsCodeScheme.TEMPLATE_PATH, tokens)
+
+  assert first is second
+
+#_______________________________________________________________________
+def test_array_matches_scalar(monkeypatch):
+  pytest.importorskip('numpy')
+
+  library = ThemeLibrary.from_files(TestConst.THEME_FILES)
+
+  _, contrast = VsCodeAudit.audit(library)
+
+  monkeypatch.setattr(vscode_audit, 'np', None)
+
+  _, expected = VsCodeAudit.audit(library)
+
+  for row, expected_row in zip(contrast, expected):
+    assert list(row) == pytest.approx(expected_row)
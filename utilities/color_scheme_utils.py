@@ -4,6 +4,8 @@
 #_______________________________________________________________________
 
 import json
+import os
+import re
 
 from flux_bunny_utils.string_utils import StringUtils
 
@@ -13,6 +15,39 @@ class GeneralUtils:
 
   MAX_COLOR: int = 0xFFFFFF
 
+  CACHE_DIR_ENV : str = 'COLOR_SCHEME_CACHE_DIR'
+  CACHE_DIR_NAME: str = 'color-scheme-exporter'
+
+  # Strings are matched first so comment markers inside them are kept
+  JSONC_STR: str = r'("(?:\\.|[^"\\])*")'
+
+  JSONC_COMMENT_RE = re.compile(JSONC_STR + r'|//[^\n]*|/\*.*?\*/', re.S)
+  JSONC_COMMA_RE   = re.compile(JSONC_STR + r'|,(?=\s*[}\]])')
+
+  #_____________________________________________________________________
+  def get_cache_dir() -> str:
+    """
+    Returns the directory used for generated cache files, creating it
+    if needed. The COLOR_SCHEME_CACHE_DIR environment variable takes
+    precedence over XDG_CACHE_HOME and ~/.cache.
+
+    Returns
+    Absolute path to cache directory
+    """
+
+    cache_dir: str = os.environ.get(GeneralUtils.CACHE_DIR_ENV, '')
+
+    if (not cache_dir):
+      xdg_dir: str = os.environ.get('XDG_CACHE_HOME'
+        , os.path.join(os.path.expanduser('~'), '.cache'))
+
+      cache_dir = os.path.join(xdg_dir, GeneralUtils.CACHE_DIR_NAME)
+
+    cache_dir = os.path.abspath(cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    return cache_dir
+
   #_____________________________________________________________________
   def str_list_to_hex_list(l: list[str]) -> list[int]:
     """
@@ -87,6 +122,26 @@ class GeneralUtils:
       file_dict: dict = json.load(file)
       return file_dict
 
+  #_____________________________________________________________________
+  def parse_jsonc(text: str):
+    """
+    Parses json with comments and trailing commas, the format used by
+    VS Code settings and theme files.
+
+    Parameters
+    text - json text, may contain // and /* */ comments
+
+    Returns
+    Parsed json object
+    """
+
+    keep_str = lambda m: m.group(1) or ''
+
+    text = GeneralUtils.JSONC_COMMENT_RE.sub(keep_str, text)
+    text = GeneralUtils.JSONC_COMMA_RE.sub(keep_str, text)
+
+    return json.loads(text)
+
   #_____________________________________________________________________
   def construct_color_print_str(text: str
     , fg_red: int